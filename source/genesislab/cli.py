@@ -0,0 +1,446 @@
+# Copyright 2025 genesis_lab Developers (https://github.com/Atticlmr/genesis_lab)
+#
+# Licensed under the Apache License, Version 2.0 , January 2004
+
+"""Command-line interface of genesis_lab.
+
+The ``genesis-lab`` command gives a single entry point to the registered tasks:
+
+.. code-block:: bash
+
+    genesis-lab list-tasks
+    genesis-lab train --task Genesis-Cartpole-Direct-v0 --num_envs 4096
+    genesis-lab play --task Genesis-Cartpole-Direct-v0 --checkpoint logs/model_100.pt
+    genesis-lab bench-env --task Genesis-Cartpole-v0 --num_envs 4096 --num_steps 500
+    genesis-lab bench-math --num 4096 65536
+
+The benchmark commands print the same tables on every machine, so that the performance of the environments and
+of the math utilities can be compared across machines and commits.
+
+Genesis, torch and the task modules are only imported by the commands that need them, so that the startup of the
+command line and ``list-tasks`` stay fast.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import time
+from collections.abc import Callable, Sequence
+from typing import Any
+
+"""
+Helpers.
+"""
+
+
+def _init_genesis(device: str, seed: int | None = None):
+    """Initialize Genesis with the backend of the device, if it was not done before."""
+    import genesis as gs
+
+    if not gs._initialized:
+        gs.init(backend=gs.gpu if device == "gpu" else gs.cpu, seed=seed, logging_level="warning")
+
+
+def _make_env(task: str, num_envs: int | None, seed: int | None, device: str):
+    """Create the environment of a registered task and return the unwrapped environment."""
+    import gymnasium as gym
+
+    import genesislab_tasks  # noqa: F401
+    from genesislab_tasks.utils import parse_env_cfg
+
+    _init_genesis(device, seed)
+    env_cfg = parse_env_cfg(task, num_envs=num_envs, seed=seed)
+    env = gym.make(task, cfg=env_cfg)
+    return env.unwrapped
+
+
+def _synchronize(device) -> None:
+    """Wait for the kernels queued on a CUDA device, so that the host timings include them."""
+    import torch
+
+    if torch.device(device).type == "cuda":
+        torch.cuda.synchronize(device)
+
+
+def _percentile(sorted_values: Sequence[float], q: float) -> float:
+    """Percentile of sorted values, with linear interpolation between the closest ranks."""
+    if len(sorted_values) == 0:
+        return float("nan")
+    position = (len(sorted_values) - 1) * q / 100.0
+    lower = int(position)
+    upper = min(lower + 1, len(sorted_values) - 1)
+    return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * (position - lower)
+
+
+class _SectionTimer:
+    """Measure the time spent in methods of the environment by wrapping them on the instances.
+
+    The wrappers are set as instance attributes, so that the calls made by the environment through ``self`` are
+    timed without changing the classes. The sections may be nested, e.g. the reset of the environments calls the
+    reset events.
+    """
+
+    def __init__(self, device):
+        self._device = device
+        self.times: dict[str, float] = {}
+        self.calls: dict[str, int] = {}
+        self._patched: list[tuple[Any, str]] = []
+
+    def wrap(self, label: str, obj: Any, method_name: str):
+        """Time the calls to ``obj.method_name`` under the given label."""
+        if obj is None or not hasattr(obj, method_name):
+            return
+        method = getattr(obj, method_name)
+        self.times[label] = 0.0
+        self.calls[label] = 0
+
+        def timed(*args, **kwargs):
+            _synchronize(self._device)
+            start_time = time.perf_counter()
+            result = method(*args, **kwargs)
+            _synchronize(self._device)
+            self.times[label] += time.perf_counter() - start_time
+            self.calls[label] += 1
+            return result
+
+        setattr(obj, method_name, timed)
+        self._patched.append((obj, method_name))
+
+    def restore(self):
+        """Remove the wrappers from the instances."""
+        for obj, method_name in self._patched:
+            delattr(obj, method_name)
+        self._patched.clear()
+
+
+def _wrap_env_sections(env, timer: _SectionTimer):
+    """Wrap the stages of the step of a manager-based or a direct environment."""
+    from genesislab.envs import ManagerBasedRLEnv
+
+    timer.wrap("scene.step", env.scene, "step")
+    if isinstance(env, ManagerBasedRLEnv):
+        timer.wrap("action_manager.process_action", env.action_manager, "process_action")
+        timer.wrap("action_manager.apply_action", env.action_manager, "apply_action")
+        timer.wrap("termination_manager.compute", env.termination_manager, "compute")
+        timer.wrap("reward_manager.compute", env.reward_manager, "compute")
+        timer.wrap("event_manager.apply", env.event_manager, "apply")
+        timer.wrap("command_manager.compute", env.command_manager, "compute")
+        timer.wrap("observation_manager.compute", env.observation_manager, "compute")
+    else:
+        timer.wrap("_pre_physics_step", env, "_pre_physics_step")
+        timer.wrap("_apply_action", env, "_apply_action")
+        timer.wrap("_get_dones", env, "_get_dones")
+        timer.wrap("_get_rewards", env, "_get_rewards")
+        timer.wrap("_get_observations", env, "_get_observations")
+        if env.event_manager is not None:
+            timer.wrap("event_manager.apply", env.event_manager, "apply")
+    timer.wrap("_reset_idx", env, "_reset_idx")
+
+
+"""
+Commands.
+"""
+
+
+def list_tasks(args: argparse.Namespace) -> int:
+    """Print the registered tasks and their entry points."""
+    import gymnasium as gym
+
+    import genesislab_tasks  # noqa: F401
+    from genesislab_tasks.utils import get_task_names
+
+    names = get_task_names(args.pattern)
+    if len(names) == 0:
+        print("No registered task matches the pattern.")
+        return 1
+    width = max(len(name) for name in names)
+    print(f"{'Task':<{width}}  Entry point")
+    for name in names:
+        entry_point = gym.spec(name).entry_point
+        print(f"{name:<{width}}  {entry_point if isinstance(entry_point, str) else entry_point.__name__}")
+    return 0
+
+
+def bench_env(args: argparse.Namespace) -> int:
+    """Step a registered task headless and print its throughput, its step times and their breakdown."""
+    import torch
+
+    env = _make_env(args.task, args.num_envs, args.seed, args.device)
+    num_envs = env.num_envs
+    action_dim = env.single_action_space.shape[0]
+    actions = torch.zeros(num_envs, action_dim, device=env.device)
+
+    def sample_actions():
+        if args.actions == "random":
+            actions.uniform_(-1.0, 1.0)
+        return actions
+
+    env.reset()
+    for _ in range(args.num_warmup_steps):
+        env.step(sample_actions())
+
+    # -- throughput and step times
+    step_times = []
+    _synchronize(env.device)
+    total_start_time = time.perf_counter()
+    for _ in range(args.num_steps):
+        start_time = time.perf_counter()
+        env.step(sample_actions())
+        _synchronize(env.device)
+        step_times.append(time.perf_counter() - start_time)
+    total_time = time.perf_counter() - total_start_time
+    step_times.sort()
+
+    print(f"Task: {args.task} | num_envs: {num_envs} | device: {env.device} | steps: {args.num_steps}")
+    print(f"env steps/s: {num_envs * args.num_steps / total_time:,.0f}")
+    print(f"step time (ms): mean {1000.0 * total_time / args.num_steps:.3f}", end="")
+    for q in (50, 90, 99):
+        print(f" | p{q} {1000.0 * _percentile(step_times, q):.3f}", end="")
+    print(f" | max {1000.0 * step_times[-1]:.3f}")
+
+    # -- breakdown of the step (measured separately, since timing the sections synchronizes the device)
+    if args.breakdown_steps > 0:
+        timer = _SectionTimer(env.device)
+        _wrap_env_sections(env, timer)
+        reward_manager = getattr(env, "reward_manager", None)
+        if reward_manager is not None:
+            reward_manager.timing_enabled = True
+            reward_manager.reset_timings()
+        start_time = time.perf_counter()
+        for _ in range(args.breakdown_steps):
+            env.step(sample_actions())
+        step_time = (time.perf_counter() - start_time) / args.breakdown_steps
+        timer.restore()
+
+        print(f"\nBreakdown over {args.breakdown_steps} steps (sections may be nested):")
+        print(f"{'Section':<34} {'calls/step':>10} {'ms/step':>10} {'% of step':>10}")
+        for label, section_time in timer.times.items():
+            calls = timer.calls[label] / args.breakdown_steps
+            ms_per_step = 1000.0 * section_time / args.breakdown_steps
+            print(f"{label:<34} {calls:>10.2f} {ms_per_step:>10.3f} {ms_per_step / (10.0 * step_time):>9.1f}%")
+        if reward_manager is not None:
+            reward_manager.timing_enabled = False
+            print(f"\n{'Reward term':<34} {'ms/call':>10}")
+            for name, term_time in reward_manager.term_timings.items():
+                print(f"{name:<34} {term_time:>10.4f}")
+
+    env.close()
+    return 0
+
+
+def bench_math(args: argparse.Namespace) -> int:
+    """Time the batched math utilities for several batch sizes and print the time per call."""
+    import torch
+
+    import genesislab.utils.math as math_utils
+
+    device = torch.device(args.device)
+
+    def make_inputs(num: int) -> dict[str, torch.Tensor]:
+        return {
+            "q1": math_utils.random_orientation(num, str(device)),
+            "q2": math_utils.random_orientation(num, str(device)),
+            "v": torch.randn(num, 3, device=device),
+            "t1": torch.randn(num, 3, device=device),
+            "t2": torch.randn(num, 3, device=device),
+            "p1": torch.randn(num, 7, device=device),
+            "p2": torch.randn(num, 7, device=device),
+            "tau": torch.linspace(0.0, 1.0, 4, device=device),
+            "m1": math_utils.make_pose(
+                torch.randn(num, 3, device=device),
+                math_utils.matrix_from_quat(math_utils.random_orientation(num, str(device))),
+            ),
+            "m2": torch.eye(4, device=device).repeat(num, 4, 1, 1),
+        }
+
+    functions: dict[str, Callable[[dict[str, torch.Tensor]], Any]] = {
+        "quat_mul": lambda x: math_utils.quat_mul(x["q1"], x["q2"]),
+        "quat_apply": lambda x: math_utils.quat_apply(x["q1"], x["v"]),
+        "quat_apply_inverse": lambda x: math_utils.quat_apply_inverse(x["q1"], x["v"]),
+        "quat_error_magnitude": lambda x: math_utils.quat_error_magnitude(x["q1"], x["q2"]),
+        "matrix_from_quat": lambda x: math_utils.matrix_from_quat(x["q1"]),
+        "axis_angle_from_quat": lambda x: math_utils.axis_angle_from_quat(x["q1"]),
+        "combine_frame_transforms": lambda x: math_utils.combine_frame_transforms(x["t1"], x["q1"], x["t2"], x["q2"]),
+        "subtract_frame_transforms": lambda x: math_utils.subtract_frame_transforms(
+            x["t1"], x["q1"], x["t2"], x["q2"]
+        ),
+        "random_orientation": lambda x: math_utils.random_orientation(x["q1"].shape[0], str(device)),
+        "interpolate_trajectories": lambda x: math_utils.interpolate_trajectories(x["p1"], x["p2"], x["tau"], 0.02),
+        "interpolate_poses_batched": lambda x: math_utils.interpolate_poses_batched(x["m1"], x["m2"][:, 0], 2),
+        "transform_poses_from_frame_A_to_frame_B": lambda x: math_utils.transform_poses_from_frame_A_to_frame_B(
+            x["m2"], x["m1"], x["m2"][:, 0]
+        ),
+    }
+    if args.functions:
+        unknown = set(args.functions) - set(functions)
+        if unknown:
+            print(f"Unknown functions: {sorted(unknown)}. Available functions: {sorted(functions)}.")
+            return 1
+        functions = {name: functions[name] for name in args.functions}
+
+    print(f"device: {device} | iterations: {args.num_iterations}")
+    header = "".join(f"{f'N={num} (us)':>16}" for num in args.num)
+    print(f"{'Function':<40}{header}")
+    for name, func in functions.items():
+        row = f"{name:<40}"
+        for num in args.num:
+            inputs = make_inputs(num)
+            for _ in range(args.num_warmup_iterations):
+                func(inputs)
+            _synchronize(device)
+            start_time = time.perf_counter()
+            for _ in range(args.num_iterations):
+                func(inputs)
+            _synchronize(device)
+            row += f"{1e6 * (time.perf_counter() - start_time) / args.num_iterations:>16.2f}"
+        print(row)
+    return 0
+
+
+def _load_runner():
+    """Import the on-policy runner of genesislab_rl used by the ``train`` and ``play`` commands."""
+    try:
+        from genesislab_rl.ppo import OnPolicyRunner, PPOCfg
+    except ImportError as e:
+        raise SystemExit(
+            f"The 'train' and 'play' commands require the PPO runner of genesislab_rl, which could not be imported: {e}"
+        ) from e
+    return OnPolicyRunner, PPOCfg
+
+
+def _load_agent_cfg(task: str, default_cls):
+    """Load the PPO configuration registered for the task, or the default configuration."""
+    from genesislab_tasks.utils import load_cfg_from_registry
+
+    try:
+        return load_cfg_from_registry(task, "ppo_cfg_entry_point")
+    except ValueError:
+        return default_cls()
+
+
+def train(args: argparse.Namespace) -> int:
+    """Train a policy on a registered task with PPO."""
+    OnPolicyRunner, PPOCfg = _load_runner()
+    env = _make_env(args.task, args.num_envs, args.seed, args.device)
+    agent_cfg = _load_agent_cfg(args.task, PPOCfg)
+    if args.max_iterations is not None:
+        agent_cfg.max_iterations = args.max_iterations
+    log_dir = os.path.join(args.log_dir, args.task, time.strftime("%Y-%m-%d_%H-%M-%S"))
+    runner = OnPolicyRunner(env, agent_cfg, log_dir=log_dir, device=str(env.device))
+    if args.checkpoint is not None:
+        runner.load(args.checkpoint)
+    runner.learn(num_learning_iterations=agent_cfg.max_iterations, init_at_random_ep_len=True)
+    env.close()
+    return 0
+
+
+def play(args: argparse.Namespace) -> int:
+    """Run a trained policy on a registered task."""
+    import torch
+
+    OnPolicyRunner, PPOCfg = _load_runner()
+    env = _make_env(args.task, args.num_envs, args.seed, args.device)
+    agent_cfg = _load_agent_cfg(args.task, PPOCfg)
+    runner = OnPolicyRunner(env, agent_cfg, log_dir=None, device=str(env.device))
+    runner.load(args.checkpoint)
+    policy = runner.get_inference_policy()
+    # step through the wrapper of the runner, which clips the actions as in training
+    vec_env = runner.env
+
+    obs, _ = vec_env.reset()
+    episode_returns = torch.zeros(env.num_envs, device=env.device)
+    finished_returns = []
+    with torch.inference_mode():
+        for _ in range(args.num_steps):
+            obs, rewards, dones, _ = vec_env.step(policy(obs))
+            episode_returns += rewards
+            finished_returns.append(episode_returns[dones].cpu())
+            episode_returns[dones] = 0.0
+    finished_returns = torch.cat(finished_returns)
+    if len(finished_returns) > 0:
+        print(f"episodes: {len(finished_returns)} | mean return: {finished_returns.mean().item():.3f}")
+    else:
+        print("No episode finished.")
+    env.close()
+    return 0
+
+
+"""
+Entry point.
+"""
+
+
+def _add_env_args(parser: argparse.ArgumentParser, num_envs: int | None = None):
+    parser.add_argument("--task", type=str, required=True, help="Name of the registered task.")
+    parser.add_argument("--num_envs", type=int, default=num_envs, help="Number of environments.")
+    parser.add_argument("--seed", type=int, default=None, help="Seed of the environment.")
+    parser.add_argument("--device", type=str, default="cpu", choices=["cpu", "gpu"], help="Genesis backend.")
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Create the parser of the command line."""
+    parser = argparse.ArgumentParser(prog="genesis-lab", description="Train, run and benchmark genesis_lab tasks.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    # train
+    train_parser = subparsers.add_parser("train", help="Train a policy on a task with PPO.")
+    _add_env_args(train_parser)
+    train_parser.add_argument("--max_iterations", type=int, default=None, help="Number of learning iterations.")
+    train_parser.add_argument("--log_dir", type=str, default="logs", help="Root directory of the logs.")
+    train_parser.add_argument("--checkpoint", type=str, default=None, help="Checkpoint to resume from.")
+    train_parser.set_defaults(func=train)
+
+    # play
+    play_parser = subparsers.add_parser("play", help="Run a trained policy on a task.")
+    _add_env_args(play_parser, num_envs=16)
+    play_parser.add_argument("--checkpoint", type=str, required=True, help="Checkpoint of the policy.")
+    play_parser.add_argument("--num_steps", type=int, default=1000, help="Number of environment steps.")
+    play_parser.set_defaults(func=play)
+
+    # list-tasks
+    list_parser = subparsers.add_parser("list-tasks", help="List the registered tasks.")
+    list_parser.add_argument("pattern", type=str, nargs="?", default=None, help="Wildcard pattern, e.g. '*Anymal*'.")
+    list_parser.set_defaults(func=list_tasks)
+
+    # bench-env
+    bench_env_parser = subparsers.add_parser("bench-env", help="Benchmark the stepping of a task headless.")
+    _add_env_args(bench_env_parser)
+    bench_env_parser.add_argument("--num_steps", type=int, default=500, help="Number of measured steps.")
+    bench_env_parser.add_argument("--num_warmup_steps", type=int, default=50, help="Number of warm-up steps.")
+    bench_env_parser.add_argument(
+        "--breakdown_steps", type=int, default=100, help="Number of steps of the per-section breakdown (0 to skip)."
+    )
+    bench_env_parser.add_argument(
+        "--actions", type=str, default="random", choices=["random", "zero"], help="Actions applied to the task."
+    )
+    bench_env_parser.set_defaults(func=bench_env)
+
+    # bench-math
+    bench_math_parser = subparsers.add_parser("bench-math", help="Benchmark the batched math utilities.")
+    bench_math_parser.add_argument("--num", type=int, nargs="+", default=[1024, 16384, 262144], help="Batch sizes.")
+    bench_math_parser.add_argument("--num_iterations", type=int, default=100, help="Number of measured calls.")
+    bench_math_parser.add_argument("--num_warmup_iterations", type=int, default=10, help="Number of warm-up calls.")
+    bench_math_parser.add_argument("--device", type=str, default="cpu", help="Torch device, e.g. 'cpu' or 'cuda:0'.")
+    bench_math_parser.add_argument("--functions", type=str, nargs="*", default=None, help="Functions to benchmark.")
+    bench_math_parser.set_defaults(func=bench_math)
+
+    return parser
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Run the command line.
+
+    Args:
+        argv: The arguments of the command line. Defaults to None, in which case :data:`sys.argv` is used.
+
+    Returns:
+        The exit code of the command.
+    """
+    args = build_parser().parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
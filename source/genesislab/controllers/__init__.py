@@ -0,0 +1,8 @@
+# Copyright 2025 genesis_lab Developers (https://github.com/Atticlmr/genesis_lab)
+#
+# Licensed under the Apache License, Version 2.0 , January 2004
+
+"""Sub-package with the batched controllers for the robots."""
+
+from .differential_ik import DifferentialIKController
+from .differential_ik_cfg import DifferentialIKControllerCfg
@@ -0,0 +1,160 @@
+# Copyright 2025 genesis_lab Developers (https://github.com/Atticlmr/genesis_lab)
+#
+# Licensed under the Apache License, Version 2.0 , January 2004
+
+"""Batched differential inverse kinematics controller."""
+
+from __future__ import annotations
+
+import torch
+
+from genesislab.utils.math import apply_delta_pose, compute_pose_error
+
+from .differential_ik_cfg import DifferentialIKControllerCfg
+
+
+class DifferentialIKController:
+    r"""Differential inverse kinematics (IK) controller for all the environment instances.
+
+    The controller computes the change in joint positions that yields the desired change in the pose of a body
+    with the damped least-squares (DLS) method:
+
+    .. math::
+
+        \Delta \mathbf{q} = \mathbf{J}^T (\mathbf{J} \mathbf{J}^T + \lambda^2 \mathbf{I})^{-1} \mathbf{e}
+
+    where :math:`\mathbf{J}` is the ``(task_dim, num_joints)`` Jacobian of the body and :math:`\mathbf{e}` is the
+    pose error. The systems of all the environments are solved in one call of :func:`torch.linalg.solve` on a batch
+    of ``(task_dim, task_dim)`` matrices, so the cost grows linearly with the number of environments. The workspace
+    tensors are allocated once and reused at every call.
+
+    The controller does not assume a specific robot: the caller provides the pose and the Jacobian of the body,
+    both in the same frame (the world frame for the Jacobians returned by Genesis).
+    """
+
+    def __init__(self, cfg: DifferentialIKControllerCfg, num_envs: int, device: torch.device | str):
+        """Initialize the controller.
+
+        Args:
+            cfg: The configuration for the controller.
+            num_envs: The number of environments.
+            device: The device to use for computations.
+        """
+        self.cfg = cfg
+        self.num_envs = num_envs
+        self._device = device
+        # desired pose of the body
+        self.ee_pos_des = torch.zeros(num_envs, 3, device=device)
+        self.ee_quat_des = torch.zeros(num_envs, 4, device=device)
+        self.ee_quat_des[:, 0] = 1.0
+        # workspace of the damped least-squares solve
+        task_dim = 3 if cfg.command_type == "position" else 6
+        self._damping_eye = (cfg.damping**2) * torch.eye(task_dim, device=device)
+        self._jjt = torch.zeros(num_envs, task_dim, task_dim, device=device)
+        self._pose_error = torch.zeros(num_envs, task_dim, 1, device=device)
+        self._solution = torch.zeros_like(self._pose_error)
+        # allocated on the first call, once the number of joints is known
+        self._delta_joint_pos: torch.Tensor | None = None
+        self._joint_pos_des: torch.Tensor | None = None
+
+    """
+    Properties.
+    """
+
+    @property
+    def action_dim(self) -> int:
+        """Dimension of the controller's input command."""
+        if self.cfg.command_type == "position":
+            return 3  # (x, y, z)
+        elif self.cfg.command_type == "pose" and self.cfg.use_relative_mode:
+            return 6  # (dx, dy, dz, droll, dpitch, dyaw)
+        else:
+            return 7  # (x, y, z, qw, qx, qy, qz)
+
+    """
+    Operations.
+    """
+
+    def reset(self, env_ids: torch.Tensor | None = None):
+        """Reset the desired pose of the given environments to the identity.
+
+        Args:
+            env_ids: The environment indices to reset. Defaults to None (all instances).
+        """
+        ids = slice(None) if env_ids is None else env_ids
+        self.ee_pos_des[ids] = 0.0
+        self.ee_quat_des[ids] = torch.tensor([1.0, 0.0, 0.0, 0.0], device=self._device)
+
+    def set_command(
+        self, command: torch.Tensor, ee_pos: torch.Tensor | None = None, ee_quat: torch.Tensor | None = None
+    ):
+        """Set the target end-effector pose command.
+
+        Args:
+            command: The input command. Shape is (num_envs, action_dim).
+            ee_pos: The current end-effector position. Shape is (num_envs, 3).
+                Required in relative mode and for position commands.
+            ee_quat: The current end-effector orientation (w, x, y, z). Shape is (num_envs, 4).
+                Required in relative mode and for position commands.
+
+        Raises:
+            ValueError: If the current end-effector pose is required but not provided.
+        """
+        if self.cfg.command_type == "position":
+            if ee_quat is None:
+                raise ValueError("The current end-effector orientation is required for position commands.")
+            if self.cfg.use_relative_mode:
+                if ee_pos is None:
+                    raise ValueError("The current end-effector position is required in relative mode.")
+                torch.add(ee_pos, command, out=self.ee_pos_des)
+            else:
+                self.ee_pos_des.copy_(command)
+            self.ee_quat_des.copy_(ee_quat)
+        elif self.cfg.use_relative_mode:
+            if ee_pos is None or ee_quat is None:
+                raise ValueError("The current end-effector pose is required in relative mode.")
+            ee_pos_des, ee_quat_des = apply_delta_pose(ee_pos, ee_quat, command)
+            self.ee_pos_des.copy_(ee_pos_des)
+            self.ee_quat_des.copy_(ee_quat_des)
+        else:
+            self.ee_pos_des.copy_(command[:, 0:3])
+            self.ee_quat_des.copy_(command[:, 3:7])
+
+    def compute(
+        self, ee_pos: torch.Tensor, ee_quat: torch.Tensor, jacobian: torch.Tensor, joint_pos: torch.Tensor
+    ) -> torch.Tensor:
+        """Computes the target joint positions that will yield the desired end-effector pose.
+
+        Args:
+            ee_pos: The current end-effector position. Shape is (num_envs, 3).
+            ee_quat: The current end-effector orientation (w, x, y, z). Shape is (num_envs, 4).
+            jacobian: The geometric Jacobian of the end-effector, with the linear rows first.
+                Shape is (num_envs, 6, num_joints).
+            joint_pos: The current joint positions. Shape is (num_envs, num_joints).
+
+        Returns:
+            The target joint positions. Shape is (num_envs, num_joints). The tensor is a buffer of the controller
+            and is overwritten by the next call.
+        """
+        # compute the pose error
+        if self.cfg.command_type == "position":
+            torch.sub(self.ee_pos_des, ee_pos, out=self._pose_error[:, :, 0])
+            jacobian = jacobian[:, 0:3]
+        else:
+            pos_error, axis_angle_error = compute_pose_error(
+                ee_pos, ee_quat, self.ee_pos_des, self.ee_quat_des, rot_error_type="axis_angle"
+            )
+            self._pose_error[:, 0:3, 0] = pos_error
+            self._pose_error[:, 3:6, 0] = axis_angle_error
+        # allocate the joint-space buffers on the first call
+        if self._delta_joint_pos is None or self._delta_joint_pos.shape[1] != joint_pos.shape[1]:
+            self._delta_joint_pos = torch.zeros(self.num_envs, joint_pos.shape[1], 1, device=self._device)
+            self._joint_pos_des = torch.zeros(self.num_envs, joint_pos.shape[1], device=self._device)
+        # solve (J J^T + lambda^2 I) x = e for all environments at once, then dq = J^T x
+        jacobian_t = jacobian.transpose(1, 2)
+        torch.bmm(jacobian, jacobian_t, out=self._jjt)
+        self._jjt.add_(self._damping_eye)
+        torch.linalg.solve(self._jjt, self._pose_error, out=self._solution)
+        torch.bmm(jacobian_t, self._solution, out=self._delta_joint_pos)
+        # return the desired joint positions
+        return torch.add(joint_pos, self._delta_joint_pos[:, :, 0], out=self._joint_pos_des)
@@ -0,0 +1,32 @@
+# Copyright 2025 genesis_lab Developers (https://github.com/Atticlmr/genesis_lab)
+#
+# Licensed under the Apache License, Version 2.0 , January 2004
+
+"""Configuration for the differential inverse kinematics controller."""
+
+from __future__ import annotations
+
+from dataclasses import MISSING, dataclass
+from typing import Literal
+
+
+@dataclass(kw_only=True)
+class DifferentialIKControllerCfg:
+    """Configuration for the batched differential inverse kinematics controller."""
+
+    command_type: Literal["position", "pose"] = MISSING
+    """Type of task-space command to control the articulation's body.
+
+    If "position", then the controller only controls the position of the articulation's body.
+    Otherwise, the controller controls the pose of the articulation's body.
+    """
+
+    use_relative_mode: bool = False
+    """Whether to use relative mode for the controller. Defaults to False.
+
+    If True, then the controller treats the input command as a delta change in the position/pose.
+    Otherwise, the controller treats the input command as the absolute position/pose.
+    """
+
+    damping: float = 0.01
+    """The damping coefficient :math:`\\lambda` of the damped least-squares solution. Defaults to 0.01."""
@@ -0,0 +1,20 @@
+# Copyright 2025 genesis_lab Developers (https://github.com/Atticlmr/genesis_lab)
+#
+# Licensed under the Apache License, Version 2.0 , January 2004
+
+"""Sub-package with the teleoperation devices.
+
+The devices handle their input on a background thread and publish the last command into a shared tensor, which the
+environment reads at each step with :meth:`DeviceBase.advance` without waiting for the input. The keyboard devices
+receive the keys of the Genesis viewer, and the gamepad devices read a Linux joystick device. In headless tests,
+the hardware is replaced with a scripted stream of :class:`DeviceEvent` objects.
+
+The XR device of :mod:`genesislab.devices.openxr` delivers the tracked poses of the hands and controllers of the
+operator through a ring buffer sampled by interpolation, and replays recorded pose streams in place of the hardware.
+"""
+
+from .device_base import DeviceBase, DeviceEvent, SharedCommand
+from .device_base_cfg import DeviceBaseCfg
+from .gamepad import Se2Gamepad, Se2GamepadCfg, Se3Gamepad, Se3GamepadCfg
+from .keyboard import Se2Keyboard, Se2KeyboardCfg, Se3Keyboard, Se3KeyboardCfg
+from .openxr import OpenXRDevice, OpenXRDeviceCfg
@@ -0,0 +1,270 @@
+# Copyright 2025 genesis_lab Developers (https://github.com/Atticlmr/genesis_lab)
+#
+# Licensed under the Apache License, Version 2.0 , January 2004
+
+"""Base class of the teleoperation devices, which handle their input on a background thread."""
+
+from __future__ import annotations
+
+import queue
+import threading
+import time
+import torch
+from abc import ABC
+from collections.abc import Callable, Iterable, Mapping, Sequence
+from dataclasses import dataclass
+
+from .device_base_cfg import DeviceBaseCfg
+
+_RESET_EVENT = "__reset__"
+"""The name of the event queued by :meth:`DeviceBase.reset`."""
+
+
+@dataclass
+class DeviceEvent:
+    """An input event of a device, e.g. a key press or a move of a gamepad stick."""
+
+    name: str
+    """The name of the input, e.g. ``"W"`` for a key or ``"LEFT_STICK_X"`` for a gamepad axis."""
+
+    value: float = 1.0
+    """The value of the input: 1.0 for a pressed key or button and 0.0 for a released one, or the position of an
+    axis in [-1, 1]. Defaults to 1.0."""
+
+    delay: float = 0.0
+    """The time to wait before the event is applied, after the previous event (in s). Defaults to 0.0.
+
+    This is used by the scripted event streams to replay input with its timing.
+    """
+
+
+class SharedCommand:
+    """A command tensor written by one thread and read by another without locks.
+
+    The command is kept in a preallocated host buffer guarded by a sequence counter (a seqlock): the writer makes the
+    counter odd while it writes and even once it is done, and the reader copies the buffer again if the counter was
+    odd or changed during its copy. The reader therefore never waits for the writer, and always gets a command that
+    was published as a whole.
+
+    Only one thread may write the command.
+    """
+
+    def __init__(self, size: int, device: str | torch.device = "cpu"):
+        """Initialize the command to zeros.
+
+        Args:
+            size: The size of the command.
+            device: The device of the tensor returned by :meth:`read`. Defaults to "cpu".
+        """
+        self._buffer = torch.zeros(size)
+        self._snapshot = torch.zeros(size)
+        self._output = torch.zeros(size, device=device)
+        self._sequence = 0
+
+    def write(self, command: torch.Tensor):
+        """Publish a new command. This must only be called by the writer thread."""
+        self._sequence += 1
+        self._buffer.copy_(command)
+        self._sequence += 1
+
+    def read(self) -> torch.Tensor:
+        """Returns: The last published command, in a tensor which is overwritten by the next read."""
+        while True:
+            sequence = self._sequence
+            if sequence % 2 == 0:
+                self._snapshot.copy_(self._buffer)
+                if self._sequence == sequence:
+                    break
+            # the writer is publishing a command, let it finish
+            time.sleep(0)
+        return self._output.copy_(self._snapshot)
+
+
+class DeviceBase(ABC):
+    """Base class of the teleoperation devices.
+
+    The input of a device is handled on a background thread, so that it never stalls the simulation loop. The
+    inputs, whether received from the hardware or injected with :meth:`inject_events`, are queued as
+    :class:`DeviceEvent` objects. The background thread applies them in order, updates the value of each input, and
+    publishes the command computed from the values into a :class:`SharedCommand`. The environment reads the last
+    published command with :meth:`advance` at each step, without any lock.
+
+    The command is the sum of the bindings of the inputs, scaled by their values: a binding maps the name of an input
+    to its contribution to the command for a unit value. Headless tests replace the hardware with a scripted stream
+    of events given to :meth:`inject_events`.
+    """
+
+    cfg: DeviceBaseCfg
+    """The configuration of the device."""
+
+    def __init__(self, cfg: DeviceBaseCfg, bindings: Mapping[str, Sequence[float]]):
+        """Initialize the device and start its background thread.
+
+        The subclasses must set up the state used by their event handlers before calling this method.
+
+        Args:
+            cfg: The configuration of the device.
+            bindings: The contribution of each input to the command, for a unit value.
+        """
+        self.cfg = cfg
+        self._bindings = {name: torch.tensor(binding, dtype=torch.float) for name, binding in bindings.items()}
+        self._command_dim = len(next(iter(self._bindings.values())))
+        # state of the inputs, only accessed by the background thread
+        self._values: dict[str, float] = {}
+        self._callbacks: dict[str, Callable[[], None]] = {}
+        self._command = SharedCommand(self._command_dim, cfg.sim_device)
+        # the initial command, e.g. an open gripper, is published before any input is received
+        self._command.write(self._compute_command())
+        # the queue holds the events and the markers used to wait for them
+        self._events: queue.SimpleQueue[DeviceEvent | threading.Event | None] = queue.SimpleQueue()
+        self._stop = threading.Event()
+        self._error: BaseException | None = None
+        self._thread = threading.Thread(target=self._run, name=self.__class__.__name__, daemon=True)
+        self._thread.start()
+
+    def __enter__(self) -> DeviceBase:
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def __str__(self) -> str:
+        """Returns: A string representation of the device."""
+        msg = f"{self.__class__.__name__}:\n"
+        msg += f"\tcommand size: {self._command_dim}\n"
+        msg += f"\tinputs      : {list(self._bindings)}"
+        return msg
+
+    """
+    Operations.
+    """
+
+    def advance(self) -> torch.Tensor:
+        """Returns the last command published by the background thread, without waiting for it.
+
+        Returns:
+            The command, on :attr:`DeviceBaseCfg.sim_device`. The tensor is overwritten by the next call.
+        """
+        self._check_error()
+        return self._command.read()
+
+    def reset(self):
+        """Release all the inputs, which restores the initial command once the pending events are applied."""
+        self._events.put(DeviceEvent(_RESET_EVENT))
+
+    def add_callback(self, name: str, func: Callable[[], None]):
+        """Add a function called when an input is pressed.
+
+        The function is called on the background thread, so it should only set flags read by the simulation loop.
+
+        Args:
+            name: The name of the input.
+            func: The function to call.
+        """
+        self._callbacks[name] = func
+
+    def inject_events(self, events: Iterable[DeviceEvent]):
+        """Queue a stream of events, which are applied by the background thread as if they came from the hardware.
+
+        Args:
+            events: The events, in order.
+        """
+        for event in events:
+            self._events.put(event)
+
+    def wait_for_events(self, timeout: float | None = None) -> bool:
+        """Wait until the queued events are applied and their command is published.
+
+        Args:
+            timeout: The maximum time to wait (in s). Defaults to None, in which case there is no limit.
+
+        Returns:
+            Whether the events were applied before the timeout.
+        """
+        marker = threading.Event()
+        self._events.put(marker)
+        is_done = marker.wait(timeout)
+        self._check_error()
+        return is_done
+
+    def close(self):
+        """Stop the background thread."""
+        if not self._thread.is_alive():
+            return
+        self._stop.set()
+        self._events.put(None)
+        self._thread.join()
+
+    """
+    Implementation specific.
+    """
+
+    def _poll_hardware(self):
+        """Read the pending input of the hardware and queue it as events.
+
+        This is called by the background thread between the events. The devices whose input is received through
+        callbacks, e.g. the keyboard, do not need to implement it.
+        """
+        pass
+
+    def _on_press(self, name: str):
+        """Handle the press of an input, on the background thread."""
+        pass
+
+    def _on_reset(self):
+        """Reset the state of the device, on the background thread."""
+        pass
+
+    def _compute_command(self) -> torch.Tensor:
+        """Returns: The command computed from the values of the inputs."""
+        command = torch.zeros(self._command_dim)
+        for name, value in self._values.items():
+            if value != 0.0 and name in self._bindings:
+                command += value * self._bindings[name]
+        return command
+
+    """
+    Helper functions - Background thread.
+    """
+
+    def _run(self):
+        try:
+            while not self._stop.is_set():
+                self._poll_hardware()
+                try:
+                    item = self._events.get(timeout=self.cfg.poll_period)
+                except queue.Empty:
+                    continue
+                # apply all the pending events before polling the hardware again
+                while item is not None:
+                    if isinstance(item, threading.Event):
+                        item.set()
+                    else:
+                        if item.delay > 0.0 and self._stop.wait(item.delay):
+                            return
+                        self._apply_event(item)
+                        self._command.write(self._compute_command())
+                    try:
+                        item = self._events.get_nowait()
+                    except queue.Empty:
+                        break
+        except BaseException as e:
+            self._error = e
+
+    def _apply_event(self, event: DeviceEvent):
+        if event.name == _RESET_EVENT:
+            self._values.clear()
+            self._on_reset()
+            return
+        is_press = self._values.get(event.name, 0.0) == 0.0 and event.value != 0.0
+        self._values[event.name] = event.value
+        if is_press:
+            self._on_press(event.name)
+            if event.name in self._callbacks:
+                self._callbacks[event.name]()
+
+    def _check_error(self):
+        """Raise the error of the background thread in the calling thread."""
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise RuntimeError("The input thread of the device failed.") from error
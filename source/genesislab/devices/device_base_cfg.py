@@ -0,0 +1,21 @@
+# Copyright 2025 genesis_lab Developers (https://github.com/Atticlmr/genesis_lab)
+#
+# Licensed under the Apache License, Version 2.0 , January 2004
+
+"""Configuration for the teleoperation devices."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+
+@dataclass(kw_only=True)
+class DeviceBaseCfg:
+    """Base configuration for the teleoperation devices."""
+
+    sim_device: str = "cpu"
+    """The device of the command tensor read by the environment. Defaults to "cpu"."""
+
+    poll_period: float = 0.005
+    """The period at which the background thread polls the hardware when no event is pending (in s).
+    Defaults to 0.005."""
@@ -0,0 +1,10 @@
+# Copyright 2025 genesis_lab Developers (https://github.com/Atticlmr/genesis_lab)
+#
+# Licensed under the Apache License, Version 2.0 , January 2004
+
+"""Sub-package with the gamepad devices, which read a Linux joystick device."""
+
+from .gamepad_base import GamepadBase
+from .gamepad_cfg import GamepadCfg, Se2GamepadCfg, Se3GamepadCfg
+from .se2_gamepad import Se2Gamepad
+from .se3_gamepad import Se3Gamepad
@@ -0,0 +1,84 @@
+# Copyright 2025 genesis_lab Developers (https://github.com/Atticlmr/genesis_lab)
+#
+# Licensed under the Apache License, Version 2.0 , January 2004
+
+"""Base class of the gamepad devices, which read a Linux joystick device."""
+
+from __future__ import annotations
+
+import os
+import struct
+from collections.abc import Mapping, Sequence
+
+from ..device_base import DeviceBase, DeviceEvent
+from .gamepad_cfg import GamepadCfg
+
+_JS_EVENT = struct.Struct("IhBB")
+"""The layout of the events of the Linux joystick API: time (in ms), value, type and number."""
+
+_JS_EVENT_BUTTON = 0x01
+_JS_EVENT_AXIS = 0x02
+_JS_EVENT_INIT = 0x80
+
+
+class GamepadBase(DeviceBase):
+    """Base class of the gamepad devices.
+
+    The background thread of the device reads the events of the joystick device (see :attr:`GamepadCfg.device_path`)
+    without blocking, between the events it applies. The axes are normalized to [-1, 1] and named after
+    :attr:`GamepadCfg.axis_names`, and the buttons are named after :attr:`GamepadCfg.button_names`. Without a joystick
+    device, e.g. in headless tests, the events are injected with :meth:`inject_events`.
+    """
+
+    cfg: GamepadCfg
+    """The configuration of the device."""
+
+    def __init__(self, cfg: GamepadCfg, bindings: Mapping[str, Sequence[float]]):
+        """Open the joystick device and start the background thread.
+
+        Args:
+            cfg: The configuration of the device.
+            bindings: The contribution of each input to the command, for a unit value.
+
+        Raises:
+            FileNotFoundError: If the joystick device does not exist.
+        """
+        self._axis_names = set(cfg.axis_names.values())
+        self._fd = None
+        if cfg.device_path is not None:
+            self._fd = os.open(cfg.device_path, os.O_RDONLY | os.O_NONBLOCK)
+        super().__init__(cfg, bindings)
+
+    def close(self):
+        super().close()
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+    """
+    Implementation.
+    """
+
+    def _poll_hardware(self):
+        if self._fd is None:
+            return
+        try:
+            buffer = os.read(self._fd, 64 * _JS_EVENT.size)
+        except BlockingIOError:
+            return
+        for _, value, event_type, number in _JS_EVENT.iter_unpack(buffer):
+            event_type &= ~_JS_EVENT_INIT
+            if event_type == _JS_EVENT_AXIS and number in self.cfg.axis_names:
+                self._events.put(DeviceEvent(self.cfg.axis_names[number], value / 32767.0))
+            elif event_type == _JS_EVENT_BUTTON and number in self.cfg.button_names:
+                self._events.put(DeviceEvent(self.cfg.button_names[number], float(value)))
+
+    def _apply_event(self, event: DeviceEvent):
+        if event.name in self._axis_names and abs(event.value) < self.cfg.dead_zone:
+            event = DeviceEvent(event.name, 0.0)
+        super()._apply_event(event)
+
+    def _on_press(self, name: str):
+        if name == self.cfg.reset_button:
+            self._values.clear()
+            self._on_reset()
@@ -0,0 +1,91 @@
+# Copyright 2025 genesis_lab Developers (https://github.com/Atticlmr/genesis_lab)
+#
+# Licensed under the Apache License, Version 2.0 , January 2004
+
+"""Configurations for the gamepad devices."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+
+from ..device_base_cfg import DeviceBaseCfg
+
+
+@dataclass(kw_only=True)
+class GamepadCfg(DeviceBaseCfg):
+    """Base configuration for the gamepad devices.
+
+    The default names of the axes and buttons follow the layout of an Xbox controller with the Linux joystick driver.
+    """
+
+    device_path: str | None = "/dev/input/js0"
+    """The path of the joystick device. Defaults to "/dev/input/js0".
+
+    If None, no hardware is read, and the events are injected with
+    :meth:`~genesislab.devices.DeviceBase.inject_events`.
+    """
+
+    dead_zone: float = 0.01
+    """The absolute value of the axes below which they are zeroed. Defaults to 0.01."""
+
+    axis_names: dict[int, str] = field(
+        default_factory=lambda: {
+            0: "LEFT_STICK_X",
+            1: "LEFT_STICK_Y",
+            2: "LEFT_TRIGGER",
+            3: "RIGHT_STICK_X",
+            4: "RIGHT_STICK_Y",
+            5: "RIGHT_TRIGGER",
+            6: "DPAD_X",
+            7: "DPAD_Y",
+        }
+    )
+    """The names of the axes of the joystick device, by axis number. The vertical axes are positive downwards."""
+
+    button_names: dict[int, str] = field(
+        default_factory=lambda: {
+            0: "A",
+            1: "B",
+            2: "X",
+            3: "Y",
+            4: "LEFT_BUMPER",
+            5: "RIGHT_BUMPER",
+            6: "BACK",
+            7: "START",
+            8: "GUIDE",
+            9: "LEFT_STICK",
+            10: "RIGHT_STICK",
+        }
+    )
+    """The names of the buttons of the joystick device, by button number."""
+
+    reset_button: str | None = "B"
+    """The button releasing all the inputs of the device. Defaults to "B"."""
+
+
+@dataclass(kw_only=True)
+class Se2GamepadCfg(GamepadCfg):
+    """Configuration for the SE(2) gamepad device."""
+
+    v_x_sensitivity: float = 1.0
+    """The forward velocity commanded by a fully tilted stick (in m/s). Defaults to 1.0."""
+
+    v_y_sensitivity: float = 1.0
+    """The lateral velocity commanded by a fully tilted stick (in m/s). Defaults to 1.0."""
+
+    omega_z_sensitivity: float = 1.0
+    """The yaw rate commanded by a fully tilted stick (in rad/s). Defaults to 1.0."""
+
+
+@dataclass(kw_only=True)
+class Se3GamepadCfg(GamepadCfg):
+    """Configuration for the SE(3) gamepad device."""
+
+    pos_sensitivity: float = 1.0
+    """The displacement commanded by a fully tilted stick. Defaults to 1.0."""
+
+    rot_sensitivity: float = 1.6
+    """The rotation commanded by a fully tilted stick or a pressed direction pad. Defaults to 1.6."""
+
+    gripper_button: str = "X"
+    """The button toggling the gripper. Defaults to "X"."""
@@ -0,0 +1,41 @@
+# Copyright 2025 genesis_lab Developers (https://github.com/Atticlmr/genesis_lab)
+#
+# Licensed under the Apache License, Version 2.0 , January 2004
+
+"""Gamepad device commanding a planar velocity."""
+
+from __future__ import annotations
+
+from .gamepad_base import GamepadBase
+from .gamepad_cfg import Se2GamepadCfg
+
+
+class Se2Gamepad(GamepadBase):
+    r"""A gamepad device commanding a planar velocity :math:`(v_x, v_y, \omega_z)` in the base frame.
+
+    ====================== ==========================================
+    Command                Input
+    ====================== ==========================================
+    Move along x-axis      Left stick up (+ve) / down (-ve)
+    Move along y-axis      Left stick left (+ve) / right (-ve)
+    Rotate along z-axis    Right stick left (+ve) / right (-ve)
+    ====================== ==========================================
+
+    The reset button (B by default) releases all the inputs.
+    """
+
+    cfg: Se2GamepadCfg
+    """The configuration of the device."""
+
+    def __init__(self, cfg: Se2GamepadCfg):
+        """Open the joystick device and start the background thread.
+
+        Args:
+            cfg: The configuration of the device.
+        """
+        bindings = {
+            "LEFT_STICK_Y": (-cfg.v_x_sensitivity, 0.0, 0.0),
+            "LEFT_STICK_X": (0.0, -cfg.v_y_sensitivity, 0.0),
+            "RIGHT_STICK_X": (0.0, 0.0, -cfg.omega_z_sensitivity),
+        }
+        super().__init__(cfg, bindings)
@@ -0,0 +1,79 @@
+# Copyright 2025 genesis_lab Developers (https://github.com/Atticlmr/genesis_lab)
+#
+# Licensed under the Apache License, Version 2.0 , January 2004
+
+"""Gamepad device commanding a displacement of an end-effector and its gripper."""
+
+from __future__ import annotations
+
+import torch
+
+from genesislab.utils.math import axis_angle_from_quat, quat_from_euler_xyz
+
+from .gamepad_base import GamepadBase
+from .gamepad_cfg import Se3GamepadCfg
+
+
+class Se3Gamepad(GamepadBase):
+    """A gamepad device commanding a displacement of an end-effector and the state of its gripper.
+
+    The command is the position displacement, the rotation displacement as an axis-angle vector, and the gripper
+    command, which is 1.0 to open the gripper and -1.0 to close it.
+
+    ============================== ==========================================
+    Command                        Input
+    ============================== ==========================================
+    Toggle gripper (open/close)    X button
+    Move along x-axis              Left stick up (+ve) / down (-ve)
+    Move along y-axis              Left stick left (+ve) / right (-ve)
+    Move along z-axis              Right stick up (+ve) / down (-ve)
+    Rotate along x-axis            Direction pad right (+ve) / left (-ve)
+    Rotate along y-axis            Direction pad up (+ve) / down (-ve)
+    Rotate along z-axis            Right stick left (+ve) / right (-ve)
+    ============================== ==========================================
+
+    The reset button (B by default) releases all the inputs and opens the gripper.
+    """
+
+    cfg: Se3GamepadCfg
+    """The configuration of the device."""
+
+    def __init__(self, cfg: Se3GamepadCfg):
+        """Open the joystick device and start the background thread.
+
+        Args:
+            cfg: The configuration of the device.
+        """
+        self._gripper_command = 1.0
+        pos, rot = cfg.pos_sensitivity, cfg.rot_sensitivity
+        bindings = {}
+        for axis, (name, scale) in enumerate((
+            ("LEFT_STICK_Y", -pos),
+            ("LEFT_STICK_X", -pos),
+            ("RIGHT_STICK_Y", -pos),
+            ("DPAD_X", rot),
+            ("DPAD_Y", -rot),
+            ("RIGHT_STICK_X", -rot),
+        )):
+            bindings[name] = [scale if i == axis else 0.0 for i in range(7)]
+        super().__init__(cfg, bindings)
+
+    """
+    Implementation.
+    """
+
+    def _on_press(self, name: str):
+        super()._on_press(name)
+        if name == self.cfg.gripper_button:
+            self._gripper_command = -self._gripper_command
+
+    def _on_reset(self):
+        self._gripper_command = 1.0
+
+    def _compute_command(self) -> torch.Tensor:
+        command = super()._compute_command()
+        # the roll, pitch and yaw displacements are converted into an axis-angle vector
+        roll, pitch, yaw = command[3:6]
+        command[3:6] = axis_angle_from_quat(quat_from_euler_xyz(roll, pitch, yaw))
+        command[6] = self._gripper_command
+        return command
@@ -0,0 +1,10 @@
+# Copyright 2025 genesis_lab Developers (https://github.com/Atticlmr/genesis_lab)
+#
+# Licensed under the Apache License, Version 2.0 , January 2004
+
+"""Sub-package with the keyboard devices, which receive the keys of the Genesis viewer."""
+
+from .keyboard_base import KeyboardBase
+from .keyboard_cfg import KeyboardCfg, Se2KeyboardCfg, Se3KeyboardCfg
+from .se2_keyboard import Se2Keyboard
+from .se3_keyboard import Se3Keyboard
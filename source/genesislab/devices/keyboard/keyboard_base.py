@@ -0,0 +1,82 @@
+# Copyright 2025 genesis_lab Developers (https://github.com/Atticlmr/genesis_lab)
+#
+# Licensed under the Apache License, Version 2.0 , January 2004
+
+"""Base class of the keyboard devices, which receive the keys of the Genesis viewer."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import TYPE_CHECKING
+
+from genesis.vis.keybindings import Key, KeyAction, Keybind
+
+from ..device_base import DeviceBase, DeviceEvent
+
+if TYPE_CHECKING:
+    import genesis as gs
+
+    from .keyboard_cfg import KeyboardCfg
+
+
+class KeyboardBase(DeviceBase):
+    """Base class of the keyboard devices.
+
+    The keys are named after the members of :class:`genesis.vis.keybindings.Key`, e.g. ``"W"``, ``"UP"`` or
+    ``"NUM_8"``. Once the device is bound to the viewer of the scene with :meth:`bind_viewer`, the press and release
+    of its keys are queued as events by the callbacks of the viewer, and applied by the background thread of the
+    device. Without a viewer, e.g. in headless tests, the key events are injected with :meth:`inject_events`.
+    """
+
+    cfg: KeyboardCfg
+    """The configuration of the device."""
+
+    _viewer: gs.Viewer | None = None
+    """The viewer whose keys are received, if any."""
+
+    def bind_viewer(self, viewer: gs.Viewer):
+        """Receive the keys of the device from a viewer.
+
+        The keybinds of the device replace the default keybinds of the viewer on the same keys.
+
+        Args:
+            viewer: The viewer of the scene, once built.
+        """
+        self._viewer = viewer
+        self._register_keys(self._key_names())
+
+    def add_callback(self, name: str, func: Callable[[], None]):
+        super().add_callback(name, func)
+        if self._viewer is not None:
+            self._register_keys([name])
+
+    """
+    Implementation.
+    """
+
+    def _key_names(self) -> list[str]:
+        """Returns: The names of the keys received from the viewer."""
+        names = [*self._bindings, *self._callbacks]
+        if self.cfg.reset_key is not None:
+            names.append(self.cfg.reset_key)
+        return names
+
+    def _on_press(self, name: str):
+        if name == self.cfg.reset_key:
+            self._values.clear()
+            self._on_reset()
+
+    def _register_keys(self, names: list[str]):
+        keybinds = []
+        for name in dict.fromkeys(names):
+            for action, value in ((KeyAction.PRESS, 1.0), (KeyAction.RELEASE, 0.0)):
+                keybinds.append(
+                    Keybind(
+                        f"{self.__class__.__name__}_{name}_{action}",
+                        Key[name],
+                        action,
+                        callback=self._events.put,
+                        args=(DeviceEvent(name, value),),
+                    )
+                )
+        self._viewer.register_keybinds(*keybinds, overwrite=True)
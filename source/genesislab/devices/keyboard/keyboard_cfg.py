@@ -0,0 +1,47 @@
+# Copyright 2025 genesis_lab Developers (https://github.com/Atticlmr/genesis_lab)
+#
+# Licensed under the Apache License, Version 2.0 , January 2004
+
+"""Configurations for the keyboard devices."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from ..device_base_cfg import DeviceBaseCfg
+
+
+@dataclass(kw_only=True)
+class KeyboardCfg(DeviceBaseCfg):
+    """Base configuration for the keyboard devices."""
+
+    reset_key: str | None = "L"
+    """The key releasing all the inputs of the device. Defaults to "L"."""
+
+
+@dataclass(kw_only=True)
+class Se2KeyboardCfg(KeyboardCfg):
+    """Configuration for the SE(2) keyboard device."""
+
+    v_x_sensitivity: float = 0.8
+    """The forward velocity commanded by a key (in m/s). Defaults to 0.8."""
+
+    v_y_sensitivity: float = 0.4
+    """The lateral velocity commanded by a key (in m/s). Defaults to 0.4."""
+
+    omega_z_sensitivity: float = 1.0
+    """The yaw rate commanded by a key (in rad/s). Defaults to 1.0."""
+
+
+@dataclass(kw_only=True)
+class Se3KeyboardCfg(KeyboardCfg):
+    """Configuration for the SE(3) keyboard device."""
+
+    pos_sensitivity: float = 0.4
+    """The displacement commanded by a key. Defaults to 0.4."""
+
+    rot_sensitivity: float = 0.8
+    """The rotation commanded by a key. Defaults to 0.8."""
+
+    gripper_key: str = "K"
+    """The key toggling the gripper. Defaults to "K"."""
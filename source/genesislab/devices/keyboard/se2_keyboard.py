@@ -0,0 +1,49 @@
+# Copyright 2025 genesis_lab Developers (https://github.com/Atticlmr/genesis_lab)
+#
+# Licensed under the Apache License, Version 2.0 , January 2004
+
+"""Keyboard device commanding a planar velocity."""
+
+from __future__ import annotations
+
+from .keyboard_base import KeyboardBase
+from .keyboard_cfg import Se2KeyboardCfg
+
+
+class Se2Keyboard(KeyboardBase):
+    r"""A keyboard device commanding a planar velocity :math:`(v_x, v_y, \omega_z)` in the base frame.
+
+    The keys held down add up:
+
+    ====================== ========================= ========================
+    Command                Key (+ve axis)            Key (-ve axis)
+    ====================== ========================= ========================
+    Move along x-axis      Numpad 8 / Arrow Up       Numpad 2 / Arrow Down
+    Move along y-axis      Numpad 4 / Arrow Left     Numpad 6 / Arrow Right
+    Rotate along z-axis    Numpad 7 / Z              Numpad 9 / X
+    ====================== ========================= ========================
+
+    The reset key (L by default) releases all the keys.
+    """
+
+    cfg: Se2KeyboardCfg
+    """The configuration of the device."""
+
+    def __init__(self, cfg: Se2KeyboardCfg):
+        """Initialize the device and start its background thread.
+
+        Args:
+            cfg: The configuration of the device.
+        """
+        v_x, v_y, omega_z = cfg.v_x_sensitivity, cfg.v_y_sensitivity, cfg.omega_z_sensitivity
+        bindings = {}
+        for keys, binding in (
+            (("NUM_8", "UP"), (v_x, 0.0, 0.0)),
+            (("NUM_2", "DOWN"), (-v_x, 0.0, 0.0)),
+            (("NUM_4", "LEFT"), (0.0, v_y, 0.0)),
+            (("NUM_6", "RIGHT"), (0.0, -v_y, 0.0)),
+            (("NUM_7", "Z"), (0.0, 0.0, omega_z)),
+            (("NUM_9", "X"), (0.0, 0.0, -omega_z)),
+        ):
+            bindings.update(dict.fromkeys(keys, binding))
+        super().__init__(cfg, bindings)
@@ -0,0 +1,79 @@
+# Copyright 2025 genesis_lab Developers (https://github.com/Atticlmr/genesis_lab)
+#
+# Licensed under the Apache License, Version 2.0 , January 2004
+
+"""Keyboard device commanding a displacement of an end-effector and its gripper."""
+
+from __future__ import annotations
+
+import torch
+
+from genesislab.utils.math import axis_angle_from_quat, quat_from_euler_xyz
+
+from .keyboard_base import KeyboardBase
+from .keyboard_cfg import Se3KeyboardCfg
+
+
+class Se3Keyboard(KeyboardBase):
+    """A keyboard device commanding a displacement of an end-effector and the state of its gripper.
+
+    The command is the position displacement, the rotation displacement as an axis-angle vector, and the gripper
+    command, which is 1.0 to open the gripper and -1.0 to close it. The keys held down add up:
+
+    ============================== ================= =================
+    Command                        Key (+ve axis)    Key (-ve axis)
+    ============================== ================= =================
+    Toggle gripper (open/close)    K
+    Move along x-axis              W                 S
+    Move along y-axis              A                 D
+    Move along z-axis              Q                 E
+    Rotate along x-axis            Z                 X
+    Rotate along y-axis            T                 G
+    Rotate along z-axis            C                 V
+    ============================== ================= =================
+
+    The reset key (L by default) releases all the keys and opens the gripper.
+    """
+
+    cfg: Se3KeyboardCfg
+    """The configuration of the device."""
+
+    def __init__(self, cfg: Se3KeyboardCfg):
+        """Initialize the device and start its background thread.
+
+        Args:
+            cfg: The configuration of the device.
+        """
+        self._gripper_command = 1.0
+        pos, rot = cfg.pos_sensitivity, cfg.rot_sensitivity
+        bindings = {}
+        for axis, (positive_key, negative_key) in enumerate((("W", "S"), ("A", "D"), ("Q", "E"))):
+            bindings[positive_key] = [pos if i == axis else 0.0 for i in range(7)]
+            bindings[negative_key] = [-pos if i == axis else 0.0 for i in range(7)]
+        for axis, (positive_key, negative_key) in enumerate((("Z", "X"), ("T", "G"), ("C", "V")), start=3):
+            bindings[positive_key] = [rot if i == axis else 0.0 for i in range(7)]
+            bindings[negative_key] = [-rot if i == axis else 0.0 for i in range(7)]
+        super().__init__(cfg, bindings)
+
+    """
+    Implementation.
+    """
+
+    def _key_names(self) -> list[str]:
+        return [*super()._key_names(), self.cfg.gripper_key]
+
+    def _on_press(self, name: str):
+        super()._on_press(name)
+        if name == self.cfg.gripper_key:
+            self._gripper_command = -self._gripper_command
+
+    def _on_reset(self):
+        self._gripper_command = 1.0
+
+    def _compute_command(self) -> torch.Tensor:
+        command = super()._compute_command()
+        # the roll, pitch and yaw displacements are converted into an axis-angle vector
+        roll, pitch, yaw = command[3:6]
+        command[3:6] = axis_angle_from_quat(quat_from_euler_xyz(roll, pitch, yaw))
+        command[6] = self._gripper_command
+        return command
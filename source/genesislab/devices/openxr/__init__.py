@@ -0,0 +1,21 @@
+# Copyright 2025 genesis_lab Developers (https://github.com/Atticlmr/genesis_lab)
+#
+# Licensed under the Apache License, Version 2.0 , January 2004
+
+"""Sub-package with the XR device, which delivers the tracked poses of the hands and controllers of the operator.
+
+The poses are buffered in a lock-free ring buffer, sampled by interpolation at the time of the simulation step, and
+retargeted into robot commands in batch. A replay backend pushes recorded pose streams in place of the hardware.
+"""
+
+from .openxr_device import OpenXRDevice
+from .openxr_device_cfg import OpenXRDeviceCfg, PoseReplayCfg
+from .pose_buffer import PoseRingBuffer
+from .pose_stream import load_pose_stream, save_pose_stream
+from .retargeter_cfg import (
+    GripperRetargeterCfg,
+    JointDistanceRetargeterCfg,
+    RetargeterBaseCfg,
+    Se3AbsRetargeterCfg,
+)
+from .retargeters import GripperRetargeter, JointDistanceRetargeter, RetargeterBase, Se3AbsRetargeter
@@ -0,0 +1,221 @@
+# Copyright 2025 genesis_lab Developers (https://github.com/Atticlmr/genesis_lab)
+#
+# Licensed under the Apache License, Version 2.0 , January 2004
+
+"""XR device delivering the tracked poses of the hands and controllers of the operator."""
+
+from __future__ import annotations
+
+import threading
+import time
+import torch
+
+from .openxr_device_cfg import OpenXRDeviceCfg
+from .pose_buffer import PoseRingBuffer
+from .pose_stream import load_pose_stream
+
+
+class OpenXRDevice:
+    """An XR teleoperation device delivering the tracked poses of the hands and controllers of the operator.
+
+    The poses of all the tracked frames are pushed as samples into a :class:`PoseRingBuffer` by a single source
+    thread, at the rate of the tracking, and read by the simulation loop without locks. The loop samples the poses at
+    the time of its step by interpolating the buffered samples, which decouples the rates of the tracking and of the
+    simulation. The source is either a live XR runtime, which calls :meth:`push_poses` from its thread, or the replay
+    of a recorded stream (see :attr:`OpenXRDeviceCfg.replay`), which runs on a background thread of the device, so
+    that the teleoperation pipeline can be load-tested and tested without hardware.
+
+    The sampled poses are retargeted into robot commands by the retargeters of :attr:`OpenXRDeviceCfg.retargeters`,
+    for a whole batch of samples at once. The clock of the device is :func:`time.perf_counter`.
+    """
+
+    def __init__(self, cfg: OpenXRDeviceCfg):
+        """Initialize the device and start the replay, if any.
+
+        Args:
+            cfg: The configuration of the device.
+
+        Raises:
+            ValueError: If a replayed stream has no sample.
+            ValueError: If a replayed stream does not contain all the tracked frames.
+        """
+        self.cfg = cfg
+        self.device = torch.device(cfg.sim_device)
+        self._buffer = PoseRingBuffer(cfg.buffer_size, len(cfg.frame_names))
+        self._retargeters = [
+            retargeter_cfg.class_type(retargeter_cfg, cfg.frame_names, self.device)
+            for retargeter_cfg in cfg.retargeters
+        ]
+        # the buffer is only cleared by the source thread, before its next sample
+        self._reset_requested = False
+        self._stop = threading.Event()
+        self._replay_done = threading.Event()
+        self._error: BaseException | None = None
+        self._thread = None
+        if cfg.replay is not None:
+            timestamps, poses, frame_names = load_pose_stream(cfg.replay.file_path)
+            if len(timestamps) == 0:
+                raise ValueError(f"The recorded stream '{cfg.replay.file_path}' has no sample.")
+            missing = [name for name in cfg.frame_names if name not in frame_names]
+            if missing:
+                raise ValueError(f"The frames {missing} are not in the recorded stream '{cfg.replay.file_path}'.")
+            frame_ids = [frame_names.index(name) for name in cfg.frame_names]
+            poses = torch.from_numpy(poses[:, frame_ids])
+            self._thread = threading.Thread(
+                target=self._run_replay, args=(timestamps, poses), name="OpenXRDeviceReplay", daemon=True
+            )
+            self._thread.start()
+
+    def __enter__(self) -> OpenXRDevice:
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def __str__(self) -> str:
+        """Returns: A string representation of the device."""
+        msg = f"XR device ({'replay' if self.cfg.replay is not None else 'live'}):\n"
+        msg += f"\ttracked frames: {self.frame_names}\n"
+        msg += f"\tbuffer size   : {self.cfg.buffer_size}\n"
+        msg += f"\tretargeters   : {[type(retargeter).__name__ for retargeter in self._retargeters]}"
+        return msg
+
+    """
+    Properties.
+    """
+
+    @property
+    def frame_names(self) -> list[str]:
+        """The names of the tracked frames, in the order of the poses."""
+        return self.cfg.frame_names
+
+    @property
+    def action_dim(self) -> int:
+        """The size of the retargeted command."""
+        return sum(retargeter.action_dim for retargeter in self._retargeters)
+
+    @property
+    def buffer(self) -> PoseRingBuffer:
+        """The buffer of the tracked poses."""
+        return self._buffer
+
+    """
+    Operations.
+    """
+
+    def push_poses(self, poses: torch.Tensor, timestamp: float | None = None):
+        """Push a sample of the live source. This must only be called by the thread of the source.
+
+        Args:
+            poses: The positions and orientations (w, x, y, z) of the tracked frames. Shape is (num_frames, 7).
+            timestamp: The time of the sample on the clock of the device (in s). Defaults to None, in which case the
+                current time is used.
+        """
+        if self._reset_requested:
+            self._buffer.clear()
+            self._reset_requested = False
+        self._buffer.push(poses, time.perf_counter() if timestamp is None else timestamp)
+
+    def sample(self, timestamps: torch.Tensor) -> torch.Tensor:
+        """Sample the tracked poses at a batch of times.
+
+        Args:
+            timestamps: The times on the clock of the device (in s). Shape is (batch_size,).
+
+        Returns:
+            The positions and orientations (w, x, y, z) of the tracked frames. Shape is (batch_size, num_frames, 7).
+        """
+        self._check_error()
+        return self._buffer.sample(timestamps).to(self.device)
+
+    def retarget(self, poses: torch.Tensor) -> torch.Tensor:
+        """Retarget a batch of tracked poses with all the retargeters.
+
+        Args:
+            poses: The positions and orientations (w, x, y, z) of the tracked frames. Shape is
+                (batch_size, num_frames, 7).
+
+        Returns:
+            The concatenated commands of the retargeters. Shape is (batch_size, action_dim).
+        """
+        return torch.cat([retargeter.retarget(poses) for retargeter in self._retargeters], dim=-1)
+
+    def advance(self) -> torch.Tensor:
+        """Returns the command of the tracked poses at the current time minus the interpolation delay.
+
+        Returns:
+            The retargeted command, with shape (action_dim,), or the tracked poses, with shape (num_frames, 7), if
+            the device has no retargeter.
+        """
+        timestamps = torch.tensor([time.perf_counter() - self.cfg.interpolation_delay], dtype=torch.float64)
+        poses = self.sample(timestamps)
+        if not self._retargeters:
+            return poses[0]
+        return self.retarget(poses)[0]
+
+    def reset(self):
+        """Discard the buffered poses before the next sample, and restart the running replay, if any."""
+        self._reset_requested = True
+
+    def wait_for_replay(self, timeout: float | None = None) -> bool:
+        """Wait until the replayed stream has been pushed entirely.
+
+        Args:
+            timeout: The maximum time to wait (in s). Defaults to None, in which case there is no limit.
+
+        Returns:
+            Whether the replay ended before the timeout. A looped replay never ends.
+        """
+        is_done = self._replay_done.wait(timeout)
+        self._check_error()
+        return is_done
+
+    def close(self):
+        """Stop the replay, if any."""
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+
+    """
+    Helper functions - Replay thread.
+    """
+
+    def _run_replay(self, timestamps, poses: torch.Tensor):
+        try:
+            speed = self.cfg.replay.speed
+            # the time between the end of the stream and its start when it is looped
+            period = (timestamps[-1] - timestamps[0]) / max(len(timestamps) - 1, 1)
+            start = time.perf_counter()
+            while True:
+                for timestamp, sample_poses in zip(timestamps, poses):
+                    if self._reset_requested:
+                        break
+                    # the samples are stamped with their scheduled time, even if they are pushed late
+                    scheduled_time = start + (timestamp - timestamps[0]) / speed
+                    delay = scheduled_time - time.perf_counter()
+                    if delay > 0.0 and self._stop.wait(delay):
+                        return
+                    if self._stop.is_set():
+                        return
+                    self._buffer.push(sample_poses, scheduled_time)
+                else:
+                    if not self.cfg.replay.loop:
+                        break
+                    start = scheduled_time + period / speed
+                    continue
+                # restart the stream from its first sample
+                self._buffer.clear()
+                self._reset_requested = False
+                start = time.perf_counter()
+        except BaseException as e:
+            self._error = e
+        finally:
+            self._replay_done.set()
+
+    def _check_error(self):
+        """Raise the error of the replay thread in the calling thread."""
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise RuntimeError("The replay thread of the XR device failed.") from error
@@ -0,0 +1,58 @@
+# Copyright 2025 genesis_lab Developers (https://github.com/Atticlmr/genesis_lab)
+#
+# Licensed under the Apache License, Version 2.0 , January 2004
+
+"""Configuration for the XR device."""
+
+from __future__ import annotations
+
+from dataclasses import MISSING, dataclass, field
+
+from .retargeter_cfg import RetargeterBaseCfg
+
+
+@dataclass(kw_only=True)
+class PoseReplayCfg:
+    """Configuration for the replay of a recorded pose stream."""
+
+    file_path: str = MISSING
+    """The path of the file of the stream, written by :func:`~genesislab.devices.openxr.save_pose_stream`."""
+
+    speed: float = 1.0
+    """The speed of the replay relative to the recording. Defaults to 1.0.
+
+    Higher speeds push the samples at a higher rate, to load-test the pipeline.
+    """
+
+    loop: bool = False
+    """Whether the stream is replayed in a loop. Defaults to False."""
+
+
+@dataclass(kw_only=True)
+class OpenXRDeviceCfg:
+    """Configuration for the XR device."""
+
+    frame_names: list[str] = field(default_factory=lambda: ["head", "left_hand", "right_hand"])
+    """The names of the tracked frames, in the order of the poses. Defaults to the head and the two hands."""
+
+    buffer_size: int = 512
+    """The number of samples kept in the pose buffer. Defaults to 512."""
+
+    interpolation_delay: float = 0.02
+    """The delay of the poses returned by :meth:`~genesislab.devices.openxr.OpenXRDevice.advance` (in s).
+    Defaults to 0.02.
+
+    The poses are interpolated at the current time minus the delay, so that the samples around this time have
+    already been received when the stream is jittery.
+    """
+
+    sim_device: str = "cpu"
+    """The device of the commands read by the environment. Defaults to "cpu"."""
+
+    retargeters: list[RetargeterBaseCfg] = field(default_factory=list)
+    """The retargeters of the poses, whose commands are concatenated in order. Defaults to none, in which case the
+    poses are returned."""
+
+    replay: PoseReplayCfg | None = None
+    """The recorded stream replayed in place of the hardware. Defaults to None, in which case the poses are pushed
+    by the live source of the device."""
@@ -0,0 +1,135 @@
+# Copyright 2025 genesis_lab Developers (https://github.com/Atticlmr/genesis_lab)
+#
+# Licensed under the Apache License, Version 2.0 , January 2004
+
+"""Ring buffer of tracked poses, sampled at arbitrary times by interpolation."""
+
+from __future__ import annotations
+
+import time
+import torch
+
+
+class PoseRingBuffer:
+    """A ring buffer of the poses of tracked frames, written by one thread and read by another without locks.
+
+    The poses of all the frames of a sample are written into the slot of a preallocated
+    ``(capacity, num_frames, 7)`` host buffer, with their timestamp, and the sample is published by incrementing the
+    number of written samples. A reader searches the times among the newest half of the samples, copies the two
+    samples around each time, and checks that the writer did not wrap around onto the searched slots meanwhile, so
+    that the reader never waits for the writer.
+
+    The poses are sampled at any batch of times at once: the two samples around each time are interpolated, linearly
+    for the positions and spherically for the orientations. The times outside of the buffered samples are clamped to
+    the oldest or newest sample.
+    """
+
+    def __init__(self, capacity: int, num_frames: int):
+        """Initialize the buffer.
+
+        Args:
+            capacity: The maximum number of buffered samples.
+            num_frames: The number of tracked frames of a sample.
+
+        Raises:
+            ValueError: If the capacity is lower than 4.
+        """
+        if capacity < 4:
+            raise ValueError(f"The capacity of the pose buffer must be at least 4. Received: {capacity}.")
+        self.capacity = capacity
+        self.num_frames = num_frames
+        self._poses = torch.zeros(capacity, num_frames, 7)
+        self._timestamps = torch.zeros(capacity, dtype=torch.float64)
+        self._count = 0
+
+    def __len__(self) -> int:
+        """Returns: The number of buffered samples."""
+        return min(self._count, self.capacity)
+
+    """
+    Operations.
+    """
+
+    def push(self, poses: torch.Tensor, timestamp: float):
+        """Publish a sample. This must only be called by the writer thread.
+
+        Args:
+            poses: The positions and orientations (w, x, y, z) of the frames. Shape is (num_frames, 7).
+            timestamp: The time of the sample (in s), greater than the time of the previous sample.
+        """
+        slot = self._count % self.capacity
+        self._poses[slot] = poses
+        self._timestamps[slot] = timestamp
+        self._count += 1
+
+    def clear(self):
+        """Discard the buffered samples. This must only be called by the writer thread or when it is stopped."""
+        self._count = 0
+
+    def sample(self, timestamps: torch.Tensor) -> torch.Tensor:
+        """Sample the poses of the frames at the given times.
+
+        Args:
+            timestamps: The times of the samples (in s). Shape is (batch_size,).
+
+        Returns:
+            The interpolated positions and orientations (w, x, y, z) of the frames. Shape is
+            (batch_size, num_frames, 7).
+
+        Raises:
+            RuntimeError: If no sample was received.
+        """
+        timestamps = timestamps.to(torch.float64)
+        while True:
+            count = self._count
+            if count == 0:
+                raise RuntimeError("No pose was received by the pose buffer.")
+            # the two samples around each time, searched among the newest half of the samples
+            oldest = count - min(count, self.capacity // 2)
+            slots = torch.arange(oldest, count) % self.capacity
+            sample_timestamps = self._timestamps[slots]
+            upper = torch.searchsorted(sample_timestamps, timestamps, right=True).clamp_max(len(slots) - 1)
+            lower = (upper - 1).clamp_min(0)
+            poses0, poses1 = self._poses[slots[lower]], self._poses[slots[upper]]
+            # the copy is valid if the writer did not start to overwrite its oldest slot meanwhile
+            if self._count - oldest < self.capacity:
+                break
+            time.sleep(0)
+        t0, t1 = sample_timestamps[lower], sample_timestamps[upper]
+        alpha = torch.where(t1 > t0, (timestamps - t0) / (t1 - t0), 0.0).clamp(0.0, 1.0).float().view(-1, 1, 1)
+        pos = torch.lerp(poses0[..., :3], poses1[..., :3], alpha)
+        return torch.cat((pos, _quat_slerp(poses0[..., 3:], poses1[..., 3:], alpha)), dim=-1)
+
+    def latest(self) -> tuple[torch.Tensor, float]:
+        """Returns: The poses of the frames of the newest sample, with shape (num_frames, 7), and its time (in s).
+
+        Raises:
+            RuntimeError: If no sample was received.
+        """
+        while True:
+            count = self._count
+            if count == 0:
+                raise RuntimeError("No pose was received by the pose buffer.")
+            slot = (count - 1) % self.capacity
+            poses, timestamp = self._poses[slot].clone(), self._timestamps[slot].item()
+            if self._count - (count - 1) < self.capacity:
+                return poses, timestamp
+            time.sleep(0)
+
+
+def _quat_slerp(q0: torch.Tensor, q1: torch.Tensor, alpha: torch.Tensor) -> torch.Tensor:
+    """Spherical interpolation of batches of quaternions along the shortest rotation between them.
+
+    Unlike :func:`genesislab.utils.math.quat_slerp`, the quaternions are processed in batch. Shapes of the quaternions
+    are (..., 4), and the shape of the interpolation factors broadcasts to (..., 1).
+    """
+    dot = (q0 * q1).sum(dim=-1, keepdim=True)
+    q1 = torch.where(dot < 0.0, -q1, q1)
+    angle = torch.acos(dot.abs().clamp_max(1.0))
+    sin_angle = torch.sin(angle)
+    # linear interpolation for the nearly identical orientations
+    is_small = sin_angle < 1.0e-6
+    sin_angle = torch.where(is_small, 1.0, sin_angle)
+    w0 = torch.where(is_small, 1.0 - alpha, torch.sin((1.0 - alpha) * angle) / sin_angle)
+    w1 = torch.where(is_small, alpha, torch.sin(alpha * angle) / sin_angle)
+    return w0 * q0 + w1 * q1
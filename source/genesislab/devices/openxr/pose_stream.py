@@ -0,0 +1,53 @@
+# Copyright 2025 genesis_lab Developers (https://github.com/Atticlmr/genesis_lab)
+#
+# Licensed under the Apache License, Version 2.0 , January 2004
+
+"""Reading and writing of the recorded pose streams of the XR devices."""
+
+from __future__ import annotations
+
+import h5py
+import json
+import numpy as np
+from collections.abc import Sequence
+
+
+def save_pose_stream(file_path: str, timestamps: np.ndarray, poses: np.ndarray, frame_names: Sequence[str]):
+    """Write a stream of tracked poses into an HDF5 file.
+
+    The file holds the datasets ``timestamps`` and ``poses``, and the names of the frames in the attribute
+    ``frame_names``.
+
+    Args:
+        file_path: The path of the file, which is overwritten.
+        timestamps: The increasing times of the samples (in s). Shape is (num_samples,).
+        poses: The positions and orientations (w, x, y, z) of the frames. Shape is (num_samples, num_frames, 7).
+        frame_names: The names of the frames.
+
+    Raises:
+        ValueError: If the shapes of the timestamps, poses and frame names do not match.
+    """
+    timestamps, poses = np.asarray(timestamps, dtype=np.float64), np.asarray(poses, dtype=np.float32)
+    if poses.shape != (len(timestamps), len(frame_names), 7):
+        raise ValueError(
+            f"Expected poses of shape {(len(timestamps), len(frame_names), 7)} for {len(timestamps)} timestamps and"
+            f" {len(frame_names)} frames. Received: {poses.shape}."
+        )
+    with h5py.File(file_path, "w") as file:
+        file.create_dataset("timestamps", data=timestamps)
+        file.create_dataset("poses", data=poses, chunks=(min(len(poses), 1024), len(frame_names), 7))
+        file.attrs["frame_names"] = json.dumps(list(frame_names))
+
+
+def load_pose_stream(file_path: str) -> tuple[np.ndarray, np.ndarray, list[str]]:
+    """Read a stream of tracked poses written by :func:`save_pose_stream`.
+
+    Args:
+        file_path: The path of the file.
+
+    Returns:
+        The times of the samples, with shape (num_samples,), the poses of the frames, with shape
+        (num_samples, num_frames, 7), and the names of the frames.
+    """
+    with h5py.File(file_path, "r") as file:
+        return file["timestamps"][()], file["poses"][()], json.loads(file.attrs["frame_names"])
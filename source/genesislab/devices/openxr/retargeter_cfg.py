@@ -0,0 +1,87 @@
+# Copyright 2025 genesis_lab Developers (https://github.com/Atticlmr/genesis_lab)
+#
+# Licensed under the Apache License, Version 2.0 , January 2004
+
+"""Configurations for the retargeters of the XR devices."""
+
+from __future__ import annotations
+
+from dataclasses import MISSING, dataclass
+
+from . import retargeters
+
+
+@dataclass(kw_only=True)
+class RetargeterBaseCfg:
+    """Base configuration for the retargeters."""
+
+    class_type: type = MISSING
+    """The retargeter class to instantiate."""
+
+
+@dataclass(kw_only=True)
+class Se3AbsRetargeterCfg(RetargeterBaseCfg):
+    """Configuration for the retargeter of a tracked frame into an absolute end-effector pose."""
+
+    class_type: type = retargeters.Se3AbsRetargeter
+
+    frame_name: str = "right_hand"
+    """The name of the tracked frame. Defaults to "right_hand"."""
+
+    origin_pos: tuple[float, float, float] = (0.0, 0.0, 0.0)
+    """The position of the origin of the tracking space in the robot base frame (in m). Defaults to (0.0, 0.0, 0.0)."""
+
+    origin_quat: tuple[float, float, float, float] = (1.0, 0.0, 0.0, 0.0)
+    """The orientation of the tracking space in the robot base frame in (w, x, y, z).
+    Defaults to (1.0, 0.0, 0.0, 0.0)."""
+
+    offset_pos: tuple[float, float, float] = (0.0, 0.0, 0.0)
+    """The position of the end-effector in the tracked frame (in m). Defaults to (0.0, 0.0, 0.0)."""
+
+    offset_quat: tuple[float, float, float, float] = (1.0, 0.0, 0.0, 0.0)
+    """The orientation of the end-effector in the tracked frame in (w, x, y, z). Defaults to (1.0, 0.0, 0.0, 0.0)."""
+
+    use_orientation: bool = True
+    """Whether the orientation is retargeted. Defaults to True.
+
+    If False, only the position is returned, as expected by the "position" commands of the differential IK controller.
+    """
+
+
+@dataclass(kw_only=True)
+class GripperRetargeterCfg(RetargeterBaseCfg):
+    """Configuration for the retargeter of a pinch into a gripper command."""
+
+    class_type: type = retargeters.GripperRetargeter
+
+    thumb_frame_name: str = "right_thumb_tip"
+    """The name of the tracked frame of the thumb tip. Defaults to "right_thumb_tip"."""
+
+    index_frame_name: str = "right_index_tip"
+    """The name of the tracked frame of the index tip. Defaults to "right_index_tip"."""
+
+    close_distance: float = 0.03
+    """The distance between the tips below which the gripper is closed (in m). Defaults to 0.03."""
+
+
+@dataclass(kw_only=True)
+class JointDistanceRetargeterCfg(RetargeterBaseCfg):
+    """Configuration for the retargeter of distances between tracked frames into joint positions.
+
+    Each joint is driven by the distance between two tracked frames, e.g. the finger joints of a hand by the distance
+    between the finger tips and the wrist, which is mapped linearly from :attr:`distance_range` to
+    :attr:`joint_range`.
+    """
+
+    class_type: type = retargeters.JointDistanceRetargeter
+
+    joint_frames: dict[str, tuple[str, str]] = MISSING
+    """The names of the two tracked frames driving each joint, by joint name. The joint positions are returned in the
+    order of the dictionary."""
+
+    distance_range: tuple[float, float] = (0.02, 0.1)
+    """The distances mapped to the lower and upper joint positions (in m). Defaults to (0.02, 0.1)."""
+
+    joint_range: tuple[float, float] = (1.0, 0.0)
+    """The joint positions at the lower and upper distances. Defaults to (1.0, 0.0), i.e. the joints are closed when
+    the frames are close."""
@@ -0,0 +1,165 @@
+# Copyright 2025 genesis_lab Developers (https://github.com/Atticlmr/genesis_lab)
+#
+# Licensed under the Apache License, Version 2.0 , January 2004
+
+"""Retargeters of the tracked poses of the XR devices into robot commands.
+
+The retargeters process a batch of samples at once, e.g. the poses sampled at the times of several steps or for
+several environments, with tensor operations over the batch and over the retargeted joints.
+"""
+
+from __future__ import annotations
+
+import torch
+from abc import ABC, abstractmethod
+from collections.abc import Sequence
+from typing import TYPE_CHECKING
+
+from genesislab.utils.math import combine_frame_transforms
+
+if TYPE_CHECKING:
+    from .retargeter_cfg import (
+        GripperRetargeterCfg,
+        JointDistanceRetargeterCfg,
+        RetargeterBaseCfg,
+        Se3AbsRetargeterCfg,
+    )
+
+
+class RetargeterBase(ABC):
+    """Base class of the retargeters."""
+
+    def __init__(self, cfg: RetargeterBaseCfg, frame_names: Sequence[str], device: str | torch.device = "cpu"):
+        """Initialize the retargeter.
+
+        Args:
+            cfg: The configuration of the retargeter.
+            frame_names: The names of the tracked frames of the device, in the order of its poses.
+            device: The device of the retargeted commands. Defaults to "cpu".
+        """
+        self.cfg = cfg
+        self.device = torch.device(device)
+        self._frame_names = list(frame_names)
+
+    @property
+    @abstractmethod
+    def action_dim(self) -> int:
+        """The size of the retargeted command."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def retarget(self, poses: torch.Tensor) -> torch.Tensor:
+        """Retarget a batch of tracked poses.
+
+        Args:
+            poses: The positions and orientations (w, x, y, z) of the tracked frames. Shape is
+                (batch_size, num_frames, 7).
+
+        Returns:
+            The retargeted commands. Shape is (batch_size, action_dim).
+        """
+        raise NotImplementedError
+
+    def _frame_index(self, name: str) -> int:
+        """Returns: The index of a tracked frame in the poses.
+
+        Raises:
+            ValueError: If the device does not track the frame.
+        """
+        if name not in self._frame_names:
+            raise ValueError(f"The frame '{name}' is not tracked by the device. Available frames: {self._frame_names}.")
+        return self._frame_names.index(name)
+
+
+class Se3AbsRetargeter(RetargeterBase):
+    """Retargets a tracked frame into an absolute end-effector pose in the robot base frame.
+
+    The command is the position and orientation (w, x, y, z) of the end-effector, or only its position if
+    :attr:`Se3AbsRetargeterCfg.use_orientation` is False, as expected by the absolute commands of the
+    :class:`~genesislab.controllers.DifferentialIKController`, which solves the joint positions of all the environments
+    at once.
+    """
+
+    cfg: Se3AbsRetargeterCfg
+
+    def __init__(self, cfg: Se3AbsRetargeterCfg, frame_names: Sequence[str], device: str | torch.device = "cpu"):
+        super().__init__(cfg, frame_names, device)
+        self._index = self._frame_index(cfg.frame_name)
+        self._origin_pos = torch.tensor([cfg.origin_pos], device=self.device)
+        self._origin_quat = torch.tensor([cfg.origin_quat], device=self.device)
+        self._offset_pos = torch.tensor([cfg.offset_pos], device=self.device)
+        self._offset_quat = torch.tensor([cfg.offset_quat], device=self.device)
+
+    @property
+    def action_dim(self) -> int:
+        return 7 if self.cfg.use_orientation else 3
+
+    def retarget(self, poses: torch.Tensor) -> torch.Tensor:
+        frame_pose = poses[:, self._index]
+        batch_size = len(poses)
+        # end-effector in the tracking space, then in the robot base frame
+        pos, quat = combine_frame_transforms(
+            frame_pose[:, :3],
+            frame_pose[:, 3:],
+            self._offset_pos.expand(batch_size, 3),
+            self._offset_quat.expand(batch_size, 4),
+        )
+        pos, quat = combine_frame_transforms(
+            self._origin_pos.expand(batch_size, 3), self._origin_quat.expand(batch_size, 4), pos, quat
+        )
+        if not self.cfg.use_orientation:
+            return pos
+        return torch.cat((pos, quat), dim=-1)
+
+
+class GripperRetargeter(RetargeterBase):
+    """Retargets the pinch of the thumb and index tips into a gripper command.
+
+    The command is -1.0 to close the gripper, when the tips are closer than
+    :attr:`GripperRetargeterCfg.close_distance`, and 1.0 to open it.
+    """
+
+    cfg: GripperRetargeterCfg
+
+    def __init__(self, cfg: GripperRetargeterCfg, frame_names: Sequence[str], device: str | torch.device = "cpu"):
+        super().__init__(cfg, frame_names, device)
+        self._thumb_index = self._frame_index(cfg.thumb_frame_name)
+        self._index_index = self._frame_index(cfg.index_frame_name)
+
+    @property
+    def action_dim(self) -> int:
+        return 1
+
+    def retarget(self, poses: torch.Tensor) -> torch.Tensor:
+        distance = torch.linalg.norm(poses[:, self._thumb_index, :3] - poses[:, self._index_index, :3], dim=-1)
+        return torch.where(distance < self.cfg.close_distance, -1.0, 1.0).unsqueeze(-1)
+
+
+class JointDistanceRetargeter(RetargeterBase):
+    """Retargets the distances between pairs of tracked frames into joint positions.
+
+    The distances of all the joints are computed at once by gathering the two frames of every joint, and mapped
+    linearly, with clamping, from :attr:`JointDistanceRetargeterCfg.distance_range` to
+    :attr:`JointDistanceRetargeterCfg.joint_range`.
+    """
+
+    cfg: JointDistanceRetargeterCfg
+
+    def __init__(
+        self, cfg: JointDistanceRetargeterCfg, frame_names: Sequence[str], device: str | torch.device = "cpu"
+    ):
+        super().__init__(cfg, frame_names, device)
+        self.joint_names = list(cfg.joint_frames)
+        frames = list(cfg.joint_frames.values())
+        self._first_ids = torch.tensor([self._frame_index(a) for a, _ in frames], device=self.device)
+        self._second_ids = torch.tensor([self._frame_index(b) for _, b in frames], device=self.device)
+
+    @property
+    def action_dim(self) -> int:
+        return len(self.joint_names)
+
+    def retarget(self, poses: torch.Tensor) -> torch.Tensor:
+        distance = torch.linalg.norm(poses[:, self._first_ids, :3] - poses[:, self._second_ids, :3], dim=-1)
+        (d_lower, d_upper), (q_lower, q_upper) = self.cfg.distance_range, self.cfg.joint_range
+        ratio = ((distance - d_lower) / (d_upper - d_lower)).clamp(0.0, 1.0)
+        return q_lower + ratio * (q_upper - q_lower)
@@ -0,0 +1,19 @@
+# Copyright 2025 genesis_lab Developers (https://github.com/Atticlmr/genesis_lab)
+#
+# Licensed under the Apache License, Version 2.0 , January 2004
+
+"""Sub-package for environment definitions.
+
+The manager-based workflow composes an environment from a scene and a set of managers that handle the
+actions, observations, rewards, terminations, events and commands of the task. The direct workflow implements
+the task logic in a single class that operates on all the environment instances at once.
+"""
+
+from .common import VecEnvObs, VecEnvStepReturn
+from .direct_rl_env import DirectRLEnv
+from .direct_rl_env_cfg import DirectRLEnvCfg
+from .env_state import EnvState
+from .manager_based_rl_env import ManagerBasedRLEnv
+from .manager_based_rl_env_cfg import ManagerBasedRLEnvCfg
+from .scene import InteractiveScene
+from .scene_cfg import EntityCfg, InteractiveSceneCfg, SimCfg
@@ -0,0 +1,29 @@
+# Copyright 2025 genesis_lab Developers (https://github.com/Atticlmr/genesis_lab)
+#
+# Licensed under the Apache License, Version 2.0 , January 2004
+
+"""Common type aliases shared by the environments."""
+
+from __future__ import annotations
+
+import torch
+from typing import Dict, Tuple
+
+VecEnvObs = Dict[str, torch.Tensor | Dict[str, torch.Tensor]]
+"""Observation returned by the environment.
+
+It is a dictionary mapping the observation group names to either a tensor of shape (num_envs, group_dim)
+or, if the terms of the group are not concatenated, a dictionary of term tensors.
+"""
+
+VecEnvStepReturn = Tuple[VecEnvObs, torch.Tensor, torch.Tensor, torch.Tensor, dict]
+"""The environment signals processed at the end of each step.
+
+The tuple contains batched information for each sub-environment. The information is stored in the following order:
+
+1. **Observations**: The observations from the environment.
+2. **Rewards**: The rewards from the environment.
+3. **Terminated Dones**: Whether the environment reached a terminal state, such as task success or robot falling.
+4. **Timeout Dones**: Whether the environment reached a timeout state, such as end of max episode length.
+5. **Extras**: A dictionary containing additional information from the environment.
+"""
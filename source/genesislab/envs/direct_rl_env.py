@@ -0,0 +1,438 @@
+# Copyright 2025 genesis_lab Developers (https://github.com/Atticlmr/genesis_lab)
+#
+# Licensed under the Apache License, Version 2.0 , January 2004
+
+"""Direct reinforcement learning environment."""
+
+from __future__ import annotations
+
+import gymnasium as gym
+import math
+import numpy as np
+import torch
+from abc import abstractmethod
+from collections.abc import Sequence
+from typing import Any, ClassVar
+
+import genesis as gs
+
+from .common import VecEnvObs, VecEnvStepReturn
+from .direct_rl_env_cfg import DirectRLEnvCfg
+from .env_state import EnvState, strip_prefix
+from .managers import EventManager
+from .scene import InteractiveScene
+
+
+class DirectRLEnv(gym.Env):
+    """The superclass for the direct workflow to design environments.
+
+    This class implements the core functionality for reinforcement learning (RL) environments. It is designed
+    to be used with any RL library. The class is designed to be used with vectorized environments, i.e., the
+    environment is expected to be run in parallel with multiple sub-environments in a single batched Genesis scene.
+
+    The task logic is implemented by the subclass through the following methods, which operate on all the
+    sub-environments at once (or on the index tensor of the sub-environments to reset):
+
+    * :meth:`_setup_scene`: add entities to the scene before it is built.
+    * :meth:`_pre_physics_step`: process the actions once per environment step.
+    * :meth:`_apply_action`: apply the processed actions at every physics step.
+    * :meth:`_get_observations`, :meth:`_get_rewards`, :meth:`_get_dones`: compute the MDP signals.
+    * :meth:`_reset_idx`: reset the given sub-environments.
+
+    Subclasses are expected to preallocate their buffers in ``__init__`` (after calling the base class) and to write
+    into them in place, so that no Python loop over the sub-environments is needed.
+    """
+
+    is_vector_env: ClassVar[bool] = True
+    """Whether the environment is a vectorized environment."""
+
+    metadata: ClassVar[dict[str, Any]] = {"render_modes": [None]}
+    """Metadata for the environment."""
+
+    cfg: DirectRLEnvCfg
+    """Configuration for the environment."""
+
+    def __init__(self, cfg: DirectRLEnvCfg, render_mode: str | None = None, **kwargs):
+        """Initialize the environment.
+
+        Args:
+            cfg: The configuration for the environment.
+            render_mode: The render mode for the environment. Defaults to None.
+
+        Raises:
+            ValueError: If the decimation is not a positive integer.
+        """
+        if cfg.decimation < 1:
+            raise ValueError(f"Decimation must be a positive integer. Received: {cfg.decimation}.")
+        # store inputs to class
+        self.cfg = cfg
+        self.render_mode = render_mode
+
+        # initialize genesis if it was not done by the launcher
+        if not gs._initialized:
+            backend = gs.gpu if cfg.sim.backend == "gpu" else gs.cpu
+            gs.init(backend=backend, seed=cfg.seed, logging_level="warning")
+        # set the seed of the environment
+        if cfg.seed is not None:
+            self.seed(cfg.seed)
+
+        # create the scene, let the task add its entities and build it
+        self.scene = InteractiveScene(cfg.scene, cfg.sim)
+        self._setup_scene()
+        self.scene.build()
+
+        # create the event manager, if events are configured
+        self.event_manager = EventManager(cfg.events, self) if cfg.events else None
+
+        # counters and buffers of the environment
+        self.common_step_counter = 0
+        self.episode_length_buf = torch.zeros(self.num_envs, device=self.device, dtype=torch.long)
+        self.reset_terminated = torch.zeros(self.num_envs, device=self.device, dtype=torch.bool)
+        self.reset_time_outs = torch.zeros_like(self.reset_terminated)
+        self.reset_buf = torch.zeros_like(self.reset_terminated)
+        # extra information passed to the agent, with the values logged during the last step under "log"
+        self.extras: dict[str, Any] = {"log": {}}
+
+        # set up the spaces
+        self._configure_gym_env_spaces()
+
+        # apply the startup events
+        if self.event_manager is not None:
+            self.event_manager.apply(mode="startup")
+
+    """
+    Properties.
+    """
+
+    @property
+    def num_envs(self) -> int:
+        """The number of instances of the environment that are running."""
+        return self.scene.num_envs
+
+    @property
+    def device(self) -> torch.device:
+        """The device on which the environment is running."""
+        return self.scene.device
+
+    @property
+    def physics_dt(self) -> float:
+        """The physics time-step (in s)."""
+        return self.cfg.sim.dt
+
+    @property
+    def step_dt(self) -> float:
+        """The environment stepping time-step (in s)."""
+        return self.cfg.sim.dt * self.cfg.decimation
+
+    @property
+    def max_episode_length_s(self) -> float:
+        """Maximum episode length in seconds."""
+        return self.cfg.episode_length_s
+
+    @property
+    def max_episode_length(self) -> int:
+        """The maximum episode length in steps adjusted from s."""
+        return math.ceil(self.max_episode_length_s / self.step_dt)
+
+    """
+    Operations.
+    """
+
+    def reset(
+        self, seed: int | None = None, env_ids: torch.Tensor | None = None, options: dict[str, Any] | None = None
+    ) -> tuple[VecEnvObs, dict]:
+        """Resets the specified environments and returns observations.
+
+        Args:
+            seed: The seed to use for randomization. Defaults to None, in which case the seed is not set.
+            env_ids: The environment ids to reset. Defaults to None, in which case all environments are reset.
+            options: Additional information to specify how the environment is reset. Defaults to None.
+
+                Note:
+                    This argument is used for compatibility with Gymnasium environment definition.
+
+        Returns:
+            A tuple containing the observations and extras.
+        """
+        if env_ids is None:
+            env_ids = torch.arange(self.num_envs, dtype=torch.long, device=self.device)
+        # set the seed
+        if seed is not None:
+            self.seed(seed)
+        # the values logged in the previous step are not reported again
+        self.extras["log"] = {}
+        # reset state of scene
+        self._reset_idx(env_ids)
+        # return observations
+        return self._get_observations(), self.extras
+
+    def step(self, action: torch.Tensor) -> VecEnvStepReturn:
+        """Execute one time-step of the environment's dynamics.
+
+        The environment steps forward at a fixed time-step, while the physics simulation is decimated at a
+        lower time-step. This is to ensure that the simulation is stable. These two time-steps can be configured
+        independently using the :attr:`DirectRLEnvCfg.decimation` (number of simulation steps per environment step)
+        and the :attr:`SimCfg.dt` (physics time-step). Based on these parameters, the environment time-step is
+        computed as the product of the two.
+
+        This function performs the following steps:
+
+        1. Pre-process the actions before stepping through the physics.
+        2. Apply the actions to the simulator and step through the physics in a decimated manner.
+        3. Compute the reward and done signals.
+        4. Reset environments that have terminated or reached the maximum episode length.
+        5. Apply interval events if they are enabled.
+        6. Compute observations.
+
+        Args:
+            action: The actions to apply on the environment. Shape is (num_envs, action_dim).
+
+        Returns:
+            A tuple containing the observations, rewards, resets (terminated and truncated) and extras.
+        """
+        # the values logged in the previous step are not reported again
+        self.extras["log"] = {}
+
+        # process actions
+        self._pre_physics_step(action.to(self.device))
+
+        # perform physics stepping
+        for _ in range(self.cfg.decimation):
+            # set actions into the simulator
+            self._apply_action()
+            # simulate
+            self.scene.step()
+
+        # post-step:
+        # -- update env counters (used for curriculum generation)
+        self.episode_length_buf += 1
+        self.common_step_counter += 1
+        # -- check terminations
+        terminated, time_outs = self._get_dones()
+        self.reset_terminated.copy_(terminated)
+        self.reset_time_outs.copy_(time_outs)
+        torch.logical_or(self.reset_terminated, self.reset_time_outs, out=self.reset_buf)
+        # -- reward computation
+        self.reward_buf = self._get_rewards()
+
+        # -- reset envs that terminated/timed-out and log the episode information
+        reset_env_ids = self.reset_buf.nonzero().squeeze(-1)
+        if len(reset_env_ids) > 0:
+            self._reset_idx(reset_env_ids)
+
+        # -- apply events that are due in each environment
+        if self.event_manager is not None:
+            self.event_manager.apply(mode="interval", dt=self.step_dt)
+
+        # -- compute observations
+        self.obs_buf = self._get_observations()
+
+        # return observations, rewards, resets and extras
+        return self.obs_buf, self.reward_buf, self.reset_terminated, self.reset_time_outs, self.extras
+
+    @staticmethod
+    def seed(seed: int = -1) -> int:
+        """Set the seed for the environment.
+
+        Args:
+            seed: The seed for random generator. Defaults to -1, in which case a random seed is drawn.
+
+        Returns:
+            The seed used for random generator.
+        """
+        if seed == -1:
+            seed = np.random.randint(0, 10_000)
+        np.random.seed(seed)
+        torch.manual_seed(seed)
+        return seed
+
+    def save_state(self, env_ids: torch.Tensor | None = None) -> EnvState:
+        """Save the state of the given environments into a host snapshot.
+
+        The snapshot holds the generalized coordinates and velocities of the scene entities, the state of the
+        stateful sensors, the episode length, the interval timers of the event manager and the buffers returned by
+        :meth:`_get_state_buffers`.
+
+        Args:
+            env_ids: The environment ids to save. Defaults to None, in which case all environments are saved.
+
+        Returns:
+            The snapshot of the state of the environments.
+        """
+        if env_ids is None:
+            env_ids = torch.arange(self.num_envs, dtype=torch.long, device=self.device)
+        tensors = {f"scene/{name}": value for name, value in self.scene.get_state(env_ids).items()}
+        tensors["episode_length_buf"] = self.episode_length_buf[env_ids]
+        if self.event_manager is not None:
+            for name, value in self.event_manager.get_state(env_ids).items():
+                tensors[f"event_manager/{name}"] = value
+        for name, buffer in self._get_state_buffers().items():
+            tensors[f"task/{name}"] = buffer[env_ids]
+        return EnvState(env_ids, tensors)
+
+    def load_state(
+        self, state: EnvState, env_ids: torch.Tensor | None = None, rows: torch.Tensor | None = None
+    ) -> VecEnvObs:
+        """Restore the state of environments from a snapshot and return their observations.
+
+        Only the given environments are written, the others keep stepping from their current state. The rows of the
+        snapshot can be written into other environments than the ones they were saved from, e.g. to reset
+        environments to curated start states.
+
+        Args:
+            state: The snapshot returned by :meth:`save_state`.
+            env_ids: The environment ids to restore. Defaults to None, in which case the saved environments are
+                restored.
+            rows: The rows of the snapshot to write into the environments. Defaults to None, in which case the rows
+                saved from the environments are used.
+
+        Returns:
+            The observations of the environments.
+        """
+        if env_ids is None:
+            env_ids = state.env_ids
+        env_ids = env_ids.to(self.device, dtype=torch.long)
+        if rows is None:
+            rows = state.rows_of(env_ids)
+        tensors = state.read(rows, self.device)
+        self.scene.set_state(strip_prefix(tensors, "scene"), env_ids)
+        self.episode_length_buf[env_ids] = tensors["episode_length_buf"]
+        if self.event_manager is not None:
+            self.event_manager.set_state(strip_prefix(tensors, "event_manager"), env_ids)
+        for name, buffer in self._get_state_buffers().items():
+            buffer[env_ids] = tensors[f"task/{name}"]
+        return self._get_observations()
+
+    def close(self):
+        """Cleanup for the environment."""
+        if not getattr(self, "_is_closed", False):
+            self.event_manager = None
+            self._is_closed = True
+
+    """
+    Helper functions.
+    """
+
+    def _configure_gym_env_spaces(self):
+        """Configure the action and observation spaces for the Gym environment."""
+        # observation space (unbounded since we don't impose any limits)
+        self.single_observation_space = gym.spaces.Dict()
+        self.single_observation_space["policy"] = gym.spaces.Box(
+            low=-np.inf, high=np.inf, shape=(self.cfg.observation_space,)
+        )
+        if self.cfg.state_space > 0:
+            self.single_observation_space["critic"] = gym.spaces.Box(
+                low=-np.inf, high=np.inf, shape=(self.cfg.state_space,)
+            )
+        # action space (unbounded since we don't impose any limits)
+        self.single_action_space = gym.spaces.Box(low=-np.inf, high=np.inf, shape=(self.cfg.action_space,))
+
+        # batch the spaces for vectorized environments
+        self.observation_space = gym.vector.utils.batch_space(self.single_observation_space, self.num_envs)
+        self.action_space = gym.vector.utils.batch_space(self.single_action_space, self.num_envs)
+
+    def _reset_idx(self, env_ids: torch.Tensor):
+        """Reset environments based on specified indices.
+
+        Subclasses should call this method before writing the state of the sub-environments.
+
+        Args:
+            env_ids: List of environment ids which must be reset.
+        """
+        # apply events such as randomization for environments that need a reset
+        if self.event_manager is not None:
+            self.event_manager.apply(mode="reset", env_ids=env_ids)
+            self.event_manager.reset(env_ids)
+        # reset the sensors
+        self.scene.reset(env_ids)
+        # reset the episode length buffer
+        self.episode_length_buf[env_ids] = 0
+
+    def _log_episodic_sums(self, env_ids: torch.Tensor, episode_sums: torch.Tensor, names: Sequence[str]):
+        """Log the average episodic sums of the reset environments per second and clear them.
+
+        The sums are logged in :attr:`extras` under ``"log"`` as ``"Episode_Reward/<name>"``.
+
+        Args:
+            env_ids: The environment ids that are reset.
+            episode_sums: The sums of the terms over the episodes. Shape is (num_envs, len(names)).
+            names: The names of the terms, in the order of the columns of ``episode_sums``.
+        """
+        episodic_sum_avg = torch.mean(episode_sums[env_ids], dim=0) / self.max_episode_length_s
+        log = self.extras["log"]
+        for index, name in enumerate(names):
+            log[f"Episode_Reward/{name}"] = episodic_sum_avg[index]
+        episode_sums[env_ids] = 0.0
+
+    """
+    Implementation-specific functions.
+    """
+
+    def _setup_scene(self):
+        """Setup the scene for the environment.
+
+        This function is responsible for adding the entities that are not part of the scene configuration to the
+        scene, before the scene is built. By default, it does nothing.
+        """
+        pass
+
+    def _get_state_buffers(self) -> dict[str, torch.Tensor]:
+        """Returns the per-environment buffers of the task that are saved and restored with the scene state.
+
+        Tasks that carry buffers from one step to the next (e.g. the last actions, the targets or the joint state
+        read once per step) should return them, so that :meth:`load_state` resumes the episodes exactly.
+        By default, there are no such buffers.
+
+        Returns:
+            The buffers of the task, by name. Shapes are (num_envs, ...).
+        """
+        return {}
+
+    @abstractmethod
+    def _pre_physics_step(self, actions: torch.Tensor):
+        """Pre-process actions before stepping through the physics.
+
+        This function is responsible for pre-processing the actions before stepping through the physics.
+        It is called before the physics stepping (which is decimated).
+
+        Args:
+            actions: The actions to apply on the environment. Shape is (num_envs, action_dim).
+        """
+        raise NotImplementedError(f"Please implement the '_pre_physics_step' method for {self.__class__.__name__}.")
+
+    @abstractmethod
+    def _apply_action(self):
+        """Apply actions to the simulator.
+
+        This function is responsible for applying the actions to the simulator. It is called at each
+        physics time-step.
+        """
+        raise NotImplementedError(f"Please implement the '_apply_action' method for {self.__class__.__name__}.")
+
+    @abstractmethod
+    def _get_observations(self) -> VecEnvObs:
+        """Compute and return the observations for the environment.
+
+        Returns:
+            The observations for the environment.
+        """
+        raise NotImplementedError(f"Please implement the '_get_observations' method for {self.__class__.__name__}.")
+
+    @abstractmethod
+    def _get_rewards(self) -> torch.Tensor:
+        """Compute and return the rewards for the environment.
+
+        Returns:
+            The rewards for the environment. Shape is (num_envs,).
+        """
+        raise NotImplementedError(f"Please implement the '_get_rewards' method for {self.__class__.__name__}.")
+
+    @abstractmethod
+    def _get_dones(self) -> tuple[torch.Tensor, torch.Tensor]:
+        """Compute and return the done flags for the environment.
+
+        Returns:
+            A tuple containing the done flags for termination and time-out.
+            Shape of individual tensors is (num_envs,).
+        """
+        raise NotImplementedError(f"Please implement the '_get_dones' method for {self.__class__.__name__}.")
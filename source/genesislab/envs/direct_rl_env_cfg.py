@@ -0,0 +1,61 @@
+# Copyright 2025 genesis_lab Developers (https://github.com/Atticlmr/genesis_lab)
+#
+# Licensed under the Apache License, Version 2.0 , January 2004
+
+"""Configuration for the direct reinforcement learning environment."""
+
+from __future__ import annotations
+
+from dataclasses import MISSING, dataclass, field
+
+from .managers import EventTermCfg
+from .scene_cfg import InteractiveSceneCfg, SimCfg
+
+
+@dataclass(kw_only=True)
+class DirectRLEnvCfg:
+    """Configuration for a reinforcement learning environment with the direct workflow.
+
+    Please refer to the :class:`genesislab.envs.direct_rl_env.DirectRLEnv` class for more details.
+    """
+
+    seed: int | None = None
+    """The seed for the random number generator. Defaults to None, in which case the seed is not set."""
+
+    decimation: int = MISSING
+    """Number of control action updates @ sim dt per policy dt.
+
+    For instance, if the simulation dt is 0.01s and the policy dt is 0.1s, then the decimation is 10.
+    """
+
+    episode_length_s: float = MISSING
+    """Duration of an episode (in seconds).
+
+    Based on the decimation rate and physics time step, the episode length is calculated as:
+
+    .. code-block:: python
+
+        episode_length_steps = ceil(episode_length_s / (decimation * sim.dt))
+    """
+
+    sim: SimCfg = field(default_factory=SimCfg)
+    """Physics simulation configuration. Default is SimCfg()."""
+
+    scene: InteractiveSceneCfg = MISSING
+    """Scene settings."""
+
+    action_space: int = MISSING
+    """Dimension of the action space of a single environment instance."""
+
+    observation_space: int = MISSING
+    """Dimension of the policy observation space of a single environment instance."""
+
+    state_space: int = 0
+    """Dimension of the critic state space of a single environment instance. Defaults to 0.
+
+    If positive, the observations returned by the environment contain a "critic" group.
+    """
+
+    events: dict[str, EventTermCfg] = field(default_factory=dict)
+    """Event settings, keyed by the event term name. Defaults to an empty dict, in which case no event manager
+    is created."""
@@ -0,0 +1,142 @@
+# Copyright 2025 genesis_lab Developers (https://github.com/Atticlmr/genesis_lab)
+#
+# Licensed under the Apache License, Version 2.0 , January 2004
+
+"""Snapshot of the state of a subset of the environment instances."""
+
+from __future__ import annotations
+
+import math
+import torch
+from collections.abc import Iterator
+
+
+class EnvState:
+    """A snapshot of the simulation and buffer state of a subset of the environment instances.
+
+    The snapshot is created by :meth:`~genesislab.envs.DirectRLEnv.save_state` (or the method of the
+    :class:`~genesislab.envs.ManagerBasedRLEnv`) and holds one row per saved environment. The tensors of the
+    snapshot are packed by data type into one ``(num_rows, num_columns)`` host tensor each, so that saving and
+    restoring moves a few contiguous blocks between the simulation device and the host instead of one small tensor
+    per buffer. If the simulation runs on a CUDA device, the host tensors are pinned.
+
+    The environments never write into a snapshot: restoring copies the selected rows to the device, so that the
+    same snapshot can be restored any number of times, e.g. as a set of curated start states, into any subset
+    of the environments.
+    """
+
+    def __init__(self, env_ids: torch.Tensor, tensors: dict[str, torch.Tensor]):
+        """Pack the state of the environments into host memory.
+
+        Args:
+            env_ids: The environments the rows of the tensors were read from. Shape is (num_rows,).
+            tensors: The tensors of the state, by name. Shapes are (num_rows, ...).
+
+        Raises:
+            ValueError: If a tensor does not have one row per environment.
+        """
+        num_rows = len(env_ids)
+        self.env_ids = env_ids.to("cpu", dtype=torch.long)
+        """The environments the state was saved from. Shape is (num_rows,)."""
+        # layout of the tensors in the packed blocks: (dtype, first column, last column, trailing shape)
+        self._layout: dict[str, tuple[torch.dtype, int, int, tuple[int, ...]]] = {}
+        groups: dict[torch.dtype, list[torch.Tensor]] = {}
+        columns: dict[torch.dtype, int] = {}
+        for name, tensor in tensors.items():
+            if tensor.shape[0] != num_rows:
+                raise ValueError(
+                    f"The state tensor '{name}' has {tensor.shape[0]} rows, but {num_rows} environments were saved."
+                )
+            shape = tuple(tensor.shape[1:])
+            start = columns.get(tensor.dtype, 0)
+            columns[tensor.dtype] = start + math.prod(shape)
+            self._layout[name] = (tensor.dtype, start, columns[tensor.dtype], shape)
+            groups.setdefault(tensor.dtype, []).append(tensor.reshape(num_rows, -1))
+        # one copy to the host per data type
+        self._blocks: dict[torch.dtype, torch.Tensor] = {}
+        device = next(iter(tensors.values())).device if tensors else torch.device("cpu")
+        pin_memory = device.type == "cuda"
+        for dtype, parts in groups.items():
+            block = torch.empty((num_rows, columns[dtype]), dtype=dtype, pin_memory=pin_memory)
+            block.copy_(torch.cat(parts, dim=1), non_blocking=pin_memory)
+            self._blocks[dtype] = block
+        if pin_memory:
+            torch.cuda.current_stream(device).synchronize()
+        # row of each saved environment
+        self._env_rows = torch.full((int(self.env_ids.max()) + 1 if num_rows > 0 else 0,), -1, dtype=torch.long)
+        self._env_rows[self.env_ids] = torch.arange(num_rows)
+
+    def __len__(self) -> int:
+        return len(self.env_ids)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._layout
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._layout)
+
+    """
+    Properties.
+    """
+
+    @property
+    def keys(self) -> list[str]:
+        """The names of the tensors of the state."""
+        return list(self._layout)
+
+    @property
+    def nbytes(self) -> int:
+        """The size of the snapshot in host memory (in bytes)."""
+        return sum(block.nbytes for block in self._blocks.values())
+
+    """
+    Operations.
+    """
+
+    def rows_of(self, env_ids: torch.Tensor) -> torch.Tensor:
+        """Returns the rows of the state saved from the given environments.
+
+        Args:
+            env_ids: The environment indices. Shape is (num_envs,).
+
+        Returns:
+            The rows of the snapshot. Shape is (num_envs,).
+
+        Raises:
+            KeyError: If the state of one of the environments was not saved.
+        """
+        env_ids = env_ids.to("cpu", dtype=torch.long)
+        valid = env_ids < len(self._env_rows)
+        rows = torch.full_like(env_ids, -1)
+        rows[valid] = self._env_rows[env_ids[valid]]
+        if (rows < 0).any():
+            missing = env_ids[rows < 0].tolist()
+            raise KeyError(f"The state of the environments {missing} is not in the snapshot.")
+        return rows
+
+    def read(self, rows: torch.Tensor | None = None, device: str | torch.device = "cpu") -> dict[str, torch.Tensor]:
+        """Copy rows of the state to a device.
+
+        Args:
+            rows: The rows to read. Defaults to None, in which case all the rows are read.
+            device: The device of the returned tensors. Defaults to "cpu".
+
+        Returns:
+            The tensors of the state, by name. Shapes are (num_rows, ...).
+        """
+        blocks = {}
+        for dtype, block in self._blocks.items():
+            if rows is not None:
+                block = block.index_select(0, rows.to("cpu", dtype=torch.long))
+            blocks[dtype] = block.to(device, non_blocking=block.is_pinned())
+        num_rows = len(self) if rows is None else len(rows)
+        return {
+            name: blocks[dtype][:, start:stop].view(num_rows, *shape)
+            for name, (dtype, start, stop, shape) in self._layout.items()
+        }
+
+
+def strip_prefix(tensors: dict[str, torch.Tensor], prefix: str) -> dict[str, torch.Tensor]:
+    """Returns the tensors whose names start with ``"{prefix}/"``, by name without the prefix."""
+    start = len(prefix) + 1
+    return {name[start:]: tensor for name, tensor in tensors.items() if name.startswith(prefix + "/")}
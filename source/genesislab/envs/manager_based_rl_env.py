@@ -0,0 +1,409 @@
+# Copyright 2025 genesis_lab Developers (https://github.com/Atticlmr/genesis_lab)
+#
+# Licensed under the Apache License, Version 2.0 , January 2004
+
+"""Manager-based reinforcement learning environment."""
+
+from __future__ import annotations
+
+import gymnasium as gym
+import math
+import numpy as np
+import torch
+from typing import Any, ClassVar
+
+import genesis as gs
+
+from .common import VecEnvObs, VecEnvStepReturn
+from .env_state import EnvState, strip_prefix
+from .manager_based_rl_env_cfg import ManagerBasedRLEnvCfg
+from .managers import (
+    ActionManager,
+    CommandManager,
+    EventManager,
+    ManagerBase,
+    ObservationManager,
+    RewardManager,
+    TerminationManager,
+)
+from .scene import InteractiveScene
+
+
+class ManagerBasedRLEnv(gym.Env):
+    """The superclass for the manager-based workflow reinforcement learning-based environments.
+
+    The environment is vectorized: all instances are simulated in one batched Genesis scene and every signal
+    is returned as a batched tensor on the simulation device. The environment is composed of the following
+    managers:
+
+    * :class:`CommandManager`: generates the goal commands of the task.
+    * :class:`ActionManager`: processes the actions and applies them to the scene entities.
+    * :class:`ObservationManager`: computes the observations of each group.
+    * :class:`EventManager`: applies the startup and reset events.
+    * :class:`TerminationManager`: computes the termination and time-out signals.
+    * :class:`RewardManager`: computes the weighted reward.
+
+    Each manager preallocates its ``(num_envs, dim)`` buffers when it is created and writes into them in
+    place at every step. The observation and reward tensors returned by :meth:`step` are therefore the
+    managers' buffers and are overwritten by the next call; clone them if they have to be kept.
+
+    Environments that need to be reset are handled by the environment itself: at the end of :meth:`step`,
+    the instances that terminated or timed out are reset and the returned observations are the first
+    observations of the new episodes.
+    """
+
+    is_vector_env: ClassVar[bool] = True
+    """Whether the environment is a vectorized environment."""
+
+    metadata: ClassVar[dict[str, Any]] = {"render_modes": [None]}
+    """Metadata for the environment."""
+
+    cfg: ManagerBasedRLEnvCfg
+    """Configuration for the environment."""
+
+    def __init__(self, cfg: ManagerBasedRLEnvCfg, render_mode: str | None = None, **kwargs):
+        """Initialize the environment.
+
+        Args:
+            cfg: The configuration for the environment.
+            render_mode: The render mode for the environment. Defaults to None.
+
+        Raises:
+            ValueError: If the decimation is not a positive integer.
+        """
+        if cfg.decimation < 1:
+            raise ValueError(f"Decimation must be a positive integer. Received: {cfg.decimation}.")
+        # store inputs to class
+        self.cfg = cfg
+        self.render_mode = render_mode
+
+        # initialize genesis if it was not done by the launcher
+        if not gs._initialized:
+            backend = gs.gpu if cfg.sim.backend == "gpu" else gs.cpu
+            gs.init(backend=backend, seed=cfg.seed, logging_level="warning")
+        # set the seed of the environment
+        if cfg.seed is not None:
+            self.seed(cfg.seed)
+
+        # create and build the scene
+        self.scene = InteractiveScene(cfg.scene, cfg.sim)
+        self.scene.build()
+
+        # counters and buffers of the environment
+        self.common_step_counter = 0
+        self.episode_length_buf = torch.zeros(self.num_envs, device=self.device, dtype=torch.long)
+        # extra information passed to the agent
+        self.extras: dict[str, Any] = {"log": {}}
+
+        # load the managers and apply the startup events
+        self.load_managers()
+        self._is_closed = False
+        # set up the spaces
+        self._configure_gym_env_spaces()
+
+    def __del__(self):
+        """Cleanup for the environment."""
+        self.close()
+
+    """
+    Properties.
+    """
+
+    @property
+    def num_envs(self) -> int:
+        """The number of instances of the environment that are running."""
+        return self.scene.num_envs
+
+    @property
+    def device(self) -> torch.device:
+        """The device on which the environment is running."""
+        return self.scene.device
+
+    @property
+    def physics_dt(self) -> float:
+        """The physics time-step (in s)."""
+        return self.cfg.sim.dt
+
+    @property
+    def step_dt(self) -> float:
+        """The environment stepping time-step (in s)."""
+        return self.cfg.sim.dt * self.cfg.decimation
+
+    @property
+    def max_episode_length_s(self) -> float:
+        """Maximum episode length in seconds."""
+        return self.cfg.episode_length_s
+
+    @property
+    def max_episode_length(self) -> int:
+        """Maximum episode length in environment steps."""
+        return math.ceil(self.max_episode_length_s / self.step_dt)
+
+    """
+    Operations - Setup.
+    """
+
+    def load_managers(self):
+        """Load the managers for the environment.
+
+        The command and action managers are created first, since the observation terms may read the commands
+        and the last actions when their dimensions are resolved.
+        """
+        self.command_manager = CommandManager(self.cfg.commands, self)
+        self.action_manager = ActionManager(self.cfg.actions, self)
+        self.observation_manager = ObservationManager(self.cfg.observations, self)
+        self.event_manager = EventManager(self.cfg.events, self)
+        self.termination_manager = TerminationManager(self.cfg.terminations, self)
+        self.reward_manager = RewardManager(self.cfg.rewards, self)
+        # apply the startup events
+        self.event_manager.apply(mode="startup")
+
+    """
+    Operations - MDP.
+    """
+
+    def reset(
+        self, seed: int | None = None, env_ids: torch.Tensor | None = None, options: dict[str, Any] | None = None
+    ) -> tuple[VecEnvObs, dict]:
+        """Resets the specified environments and returns observations.
+
+        Args:
+            seed: The seed to use for randomization. Defaults to None, in which case the seed is not set.
+            env_ids: The environment ids to reset. Defaults to None, in which case all environments are reset.
+            options: Additional information to specify how the environment is reset. Defaults to None.
+
+                Note:
+                    This argument is used for compatibility with Gymnasium environment definition.
+
+        Returns:
+            A tuple containing the observations and extras.
+        """
+        if env_ids is None:
+            env_ids = torch.arange(self.num_envs, dtype=torch.long, device=self.device)
+        # set the seed
+        if seed is not None:
+            self.seed(seed)
+        # the values logged in the previous step are not reported again
+        self.extras["log"] = {}
+        # reset state of scene
+        self._reset_idx(env_ids)
+        # compute observations
+        self.obs_buf = self.observation_manager.compute()
+        # return observations
+        return self.obs_buf, self.extras
+
+    def step(self, action: torch.Tensor) -> VecEnvStepReturn:
+        """Execute one time-step of the environment's dynamics and reset terminated environments.
+
+        Unlike the :class:`gymnasium.Env` class, the environment processes the actions of all instances and
+        the managers write the results into their preallocated buffers:
+
+        1. Process the actions.
+        2. Perform physics stepping.
+        3. Compute the reward and done signals.
+        4. Reset environments that have terminated or reached the maximum episode length.
+        5. Apply the interval events.
+        6. Compute the commands and observations.
+
+        Args:
+            action: The actions to apply on the environment. Shape is (num_envs, action_dim).
+
+        Returns:
+            A tuple containing the observations, rewards, resets (terminated and truncated) and extras.
+        """
+        # the values logged in the previous step are not reported again
+        self.extras["log"] = {}
+
+        # process actions
+        self.action_manager.process_action(action.to(self.device))
+
+        # perform physics stepping
+        for _ in range(self.cfg.decimation):
+            # set actions into the simulator
+            self.action_manager.apply_action()
+            # simulate
+            self.scene.step()
+
+        # post-step:
+        # -- update env counters (used for curriculum generation)
+        self.episode_length_buf += 1
+        self.common_step_counter += 1
+        # -- check terminations
+        self.reset_buf = self.termination_manager.compute()
+        self.reset_terminated = self.termination_manager.terminated
+        self.reset_time_outs = self.termination_manager.time_outs
+        # -- reward computation
+        self.reward_buf = self.reward_manager.compute(dt=self.step_dt)
+
+        # -- reset envs that terminated/timed-out and log the episode information
+        reset_env_ids = self.reset_buf.nonzero().squeeze(-1)
+        if len(reset_env_ids) > 0:
+            self._reset_idx(reset_env_ids)
+
+        # -- apply events that are due in each environment
+        self.event_manager.apply(mode="interval", dt=self.step_dt)
+        # -- update command
+        self.command_manager.compute(dt=self.step_dt)
+        # -- compute observations
+        self.obs_buf = self.observation_manager.compute()
+
+        # return observations, rewards, resets and extras
+        return self.obs_buf, self.reward_buf, self.reset_terminated, self.reset_time_outs, self.extras
+
+    @staticmethod
+    def seed(seed: int = -1) -> int:
+        """Set the seed for the environment.
+
+        Args:
+            seed: The seed for random generator. Defaults to -1, in which case a random seed is drawn.
+
+        Returns:
+            The seed used for random generator.
+        """
+        if seed == -1:
+            seed = np.random.randint(0, 10_000)
+        np.random.seed(seed)
+        torch.manual_seed(seed)
+        return seed
+
+    def save_state(self, env_ids: torch.Tensor | None = None) -> EnvState:
+        """Save the state of the given environments into a host snapshot.
+
+        The snapshot holds the generalized coordinates and velocities of the scene entities, the state of the
+        stateful sensors, the episode length and the state of the managers (see :meth:`ManagerBase.get_state`), such
+        as the last actions, the commands, the observation history and the interval timers.
+
+        Args:
+            env_ids: The environment ids to save. Defaults to None, in which case all environments are saved.
+
+        Returns:
+            The snapshot of the state of the environments.
+        """
+        if env_ids is None:
+            env_ids = torch.arange(self.num_envs, dtype=torch.long, device=self.device)
+        tensors = {f"scene/{name}": value for name, value in self.scene.get_state(env_ids).items()}
+        tensors["episode_length_buf"] = self.episode_length_buf[env_ids]
+        for manager_name, manager in self._get_managers().items():
+            for name, value in manager.get_state(env_ids).items():
+                tensors[f"{manager_name}/{name}"] = value
+        return EnvState(env_ids, tensors)
+
+    def load_state(
+        self, state: EnvState, env_ids: torch.Tensor | None = None, rows: torch.Tensor | None = None
+    ) -> VecEnvObs:
+        """Restore the state of environments from a snapshot and return their observations.
+
+        Only the given environments are written, the others keep stepping from their current state. The rows of the
+        snapshot can be written into other environments than the ones they were saved from, e.g. to reset
+        environments to curated start states. The returned observations are the ones computed at the step the state
+        was saved at, so that the next call to :meth:`step` continues the episodes as if they were not interrupted.
+
+        Args:
+            state: The snapshot returned by :meth:`save_state`.
+            env_ids: The environment ids to restore. Defaults to None, in which case the saved environments are
+                restored.
+            rows: The rows of the snapshot to write into the environments. Defaults to None, in which case the rows
+                saved from the environments are used.
+
+        Returns:
+            The observations of the environments.
+        """
+        if env_ids is None:
+            env_ids = state.env_ids
+        env_ids = env_ids.to(self.device, dtype=torch.long)
+        if rows is None:
+            rows = state.rows_of(env_ids)
+        tensors = state.read(rows, self.device)
+        self.scene.set_state(strip_prefix(tensors, "scene"), env_ids)
+        self.episode_length_buf[env_ids] = tensors["episode_length_buf"]
+        for manager_name, manager in self._get_managers().items():
+            manager.set_state(strip_prefix(tensors, manager_name), env_ids)
+        self.obs_buf = self.observation_manager.group_obs_buf
+        return self.obs_buf
+
+    def close(self):
+        """Cleanup for the environment."""
+        if not getattr(self, "_is_closed", True):
+            # destructor is order-sensitive
+            del self.command_manager
+            del self.reward_manager
+            del self.termination_manager
+            del self.action_manager
+            del self.observation_manager
+            del self.event_manager
+            del self.scene
+        self._is_closed = True
+
+    """
+    Helper functions.
+    """
+
+    def _configure_gym_env_spaces(self):
+        """Configure the action and observation spaces for the Gym environment."""
+        # observation space (unbounded since we don't impose any limits)
+        self.single_observation_space = gym.spaces.Dict()
+        for group_name, group_term_names in self.observation_manager.active_terms.items():
+            has_concatenated_obs = self.observation_manager.group_obs_concatenate[group_name]
+            group_dim = self.observation_manager.group_obs_dim[group_name]
+            if has_concatenated_obs:
+                self.single_observation_space[group_name] = gym.spaces.Box(low=-np.inf, high=np.inf, shape=group_dim)
+            else:
+                self.single_observation_space[group_name] = gym.spaces.Dict({
+                    term_name: gym.spaces.Box(low=-np.inf, high=np.inf, shape=term_dim)
+                    for term_name, term_dim in zip(group_term_names, group_dim)
+                })
+        # action space (unbounded since we don't impose any limits)
+        action_dim = self.action_manager.total_action_dim
+        self.single_action_space = gym.spaces.Box(low=-np.inf, high=np.inf, shape=(action_dim,))
+
+        # batch the spaces for vectorized environments
+        self.observation_space = gym.vector.utils.batch_space(self.single_observation_space, self.num_envs)
+        self.action_space = gym.vector.utils.batch_space(self.single_action_space, self.num_envs)
+
+    def _get_managers(self) -> dict[str, ManagerBase]:
+        """Returns the managers of the environment, by attribute name."""
+        return {
+            "command_manager": self.command_manager,
+            "action_manager": self.action_manager,
+            "observation_manager": self.observation_manager,
+            "event_manager": self.event_manager,
+            "termination_manager": self.termination_manager,
+            "reward_manager": self.reward_manager,
+        }
+
+    def _reset_idx(self, env_ids: torch.Tensor):
+        """Reset environments based on specified indices.
+
+        Args:
+            env_ids: List of environment ids which must be reset.
+        """
+        # apply events such as randomization for environments that need a reset
+        self.event_manager.apply(mode="reset", env_ids=env_ids)
+        # reset the sensors
+        self.scene.reset(env_ids)
+
+        # iterate over all managers and reset them
+        # this returns a dictionary of information which is added to the log of the current step
+        # note: This is order-sensitive! Certain things need be reset before others.
+        log = self.extras["log"]
+        # -- observation manager
+        info = self.observation_manager.reset(env_ids)
+        log.update(info)
+        # -- action manager
+        info = self.action_manager.reset(env_ids)
+        log.update(info)
+        # -- rewards manager
+        info = self.reward_manager.reset(env_ids)
+        log.update(info)
+        # -- command manager
+        info = self.command_manager.reset(env_ids)
+        log.update(info)
+        # -- event manager
+        info = self.event_manager.reset(env_ids)
+        log.update(info)
+        # -- termination manager
+        info = self.termination_manager.reset(env_ids)
+        log.update(info)
+
+        # reset the episode length buffer
+        self.episode_length_buf[env_ids] = 0
@@ -0,0 +1,71 @@
+# Copyright 2025 genesis_lab Developers (https://github.com/Atticlmr/genesis_lab)
+#
+# Licensed under the Apache License, Version 2.0 , January 2004
+
+"""Configuration for the manager-based reinforcement learning environment."""
+
+from __future__ import annotations
+
+from dataclasses import MISSING, dataclass, field
+
+from .managers import (
+    ActionTermCfg,
+    CommandTermCfg,
+    EventTermCfg,
+    ObservationGroupCfg,
+    RewardTermCfg,
+    TerminationTermCfg,
+)
+from .scene_cfg import InteractiveSceneCfg, SimCfg
+
+
+@dataclass(kw_only=True)
+class ManagerBasedRLEnvCfg:
+    """Configuration for a reinforcement learning environment with the manager-based workflow.
+
+    The manager configurations are dictionaries that map the term (or group) names to their configurations.
+    A term can be disabled by setting its configuration to None.
+    """
+
+    seed: int | None = None
+    """The seed for the random number generator. Defaults to None, in which case the seed is not set."""
+
+    decimation: int = MISSING
+    """Number of control action updates @ sim dt per policy dt.
+
+    For instance, if the simulation dt is 0.01s and the policy dt is 0.1s, then the decimation is 10.
+    """
+
+    episode_length_s: float = MISSING
+    """Duration of an episode (in seconds).
+
+    Based on the decimation rate and physics time step, the episode length is calculated as:
+
+    .. code-block:: python
+
+        episode_length_steps = ceil(episode_length_s / (decimation * sim.dt))
+    """
+
+    sim: SimCfg = field(default_factory=SimCfg)
+    """Physics simulation configuration. Default is SimCfg()."""
+
+    scene: InteractiveSceneCfg = MISSING
+    """Scene settings."""
+
+    observations: dict[str, ObservationGroupCfg] = MISSING
+    """Observation space settings, keyed by the observation group name."""
+
+    actions: dict[str, ActionTermCfg] = MISSING
+    """Action space settings, keyed by the action term name."""
+
+    rewards: dict[str, RewardTermCfg] = MISSING
+    """Reward settings, keyed by the reward term name."""
+
+    terminations: dict[str, TerminationTermCfg] = MISSING
+    """Termination settings, keyed by the termination term name."""
+
+    events: dict[str, EventTermCfg] = field(default_factory=dict)
+    """Event settings, keyed by the event term name. Defaults to an empty dict."""
+
+    commands: dict[str, CommandTermCfg] = field(default_factory=dict)
+    """Command settings, keyed by the command term name. Defaults to an empty dict."""
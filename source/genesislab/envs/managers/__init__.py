@@ -0,0 +1,29 @@
+# Copyright 2025 genesis_lab Developers (https://github.com/Atticlmr/genesis_lab)
+#
+# Licensed under the Apache License, Version 2.0 , January 2004
+
+"""Sub-module for environment managers.
+
+The managers are used to handle various aspects of the environment such as randomization events, curriculum,
+and observations. Each manager implements a specific functionality for the environment. The managers are
+designed to be modular and can be easily extended to support new functionality.
+"""
+
+from .action_manager import ActionManager, ActionTerm
+from .command_manager import CommandManager, CommandTerm
+from .event_manager import EventManager
+from .manager_base import ManagerBase, ManagerTermBase
+from .manager_term_cfg import (
+    ActionTermCfg,
+    CommandTermCfg,
+    EventTermCfg,
+    ManagerTermBaseCfg,
+    ObservationGroupCfg,
+    ObservationTermCfg,
+    RewardTermCfg,
+    TerminationTermCfg,
+)
+from .observation_manager import ObservationManager
+from .reward_manager import RewardManager
+from .scene_entity_cfg import SceneEntityCfg
+from .termination_manager import TerminationManager
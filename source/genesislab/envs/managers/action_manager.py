@@ -0,0 +1,299 @@
+# Copyright 2025 genesis_lab Developers (https://github.com/Atticlmr/genesis_lab)
+#
+# Licensed under the Apache License, Version 2.0 , January 2004
+
+"""Action manager for processing actions sent to the environment."""
+
+from __future__ import annotations
+
+import torch
+from abc import abstractmethod
+from collections.abc import Sequence
+from typing import TYPE_CHECKING
+
+from .manager_base import ManagerBase, ManagerTermBase
+from .manager_term_cfg import ActionTermCfg
+
+if TYPE_CHECKING:
+    from genesislab.envs import ManagerBasedRLEnv
+
+
+class ActionTerm(ManagerTermBase):
+    """Base class for action terms.
+
+    The action term is responsible for processing the raw actions sent to the environment
+    and applying them to the entity managed by the term. The action term is comprised of two
+    operations:
+
+    * Processing of actions: This operation is performed once per **environment step** and
+      is responsible for pre-processing the raw actions sent to the environment.
+    * Applying actions: This operation is performed once per **simulation step** and is
+      responsible for applying the processed actions to the entity managed by the term.
+
+    Action terms should allocate their raw and processed action buffers once and write into them in place.
+    """
+
+    def __init__(self, cfg: ActionTermCfg, env: ManagerBasedRLEnv):
+        """Initialize the action term.
+
+        Args:
+            cfg: The configuration object.
+            env: The environment instance.
+        """
+        # call the base class constructor
+        super().__init__(cfg, env)
+        # parse config to obtain asset to which the term is applied
+        self._asset = self._env.scene[self.cfg.asset_name]
+
+    """
+    Properties.
+    """
+
+    @property
+    @abstractmethod
+    def action_dim(self) -> int:
+        """Dimension of the action term."""
+        raise NotImplementedError
+
+    @property
+    @abstractmethod
+    def raw_actions(self) -> torch.Tensor:
+        """The input/raw actions sent to the term."""
+        raise NotImplementedError
+
+    @property
+    @abstractmethod
+    def processed_actions(self) -> torch.Tensor:
+        """The actions computed by the term after applying any processing."""
+        raise NotImplementedError
+
+    """
+    Operations.
+    """
+
+    def get_state_buffers(self) -> dict[str, torch.Tensor]:
+        return {"raw_actions": self.raw_actions, "processed_actions": self.processed_actions}
+
+    @abstractmethod
+    def process_actions(self, actions: torch.Tensor):
+        """Processes the actions sent to the environment.
+
+        Note:
+            This function is called once per environment step by the manager.
+
+        Args:
+            actions: The actions to process. This is a view into the action buffer of the manager.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def apply_actions(self):
+        """Applies the actions to the entity managed by the term.
+
+        Note:
+            This is called at every simulation step by the manager.
+        """
+        raise NotImplementedError
+
+
+class ActionManager(ManagerBase):
+    """Manager for processing and applying actions for a given world.
+
+    The action manager handles the interpretation and application of user-defined
+    actions on a given world. It is comprised of different action terms that decide
+    the dimension of the expected actions.
+
+    The action manager performs operations at two stages:
+
+    * processing of actions: It splits the input actions to each term and performs any
+      pre-processing needed. This should be called once at every environment step.
+    * apply actions: This operation typically sets the processed actions into the entities in the
+      scene (such as robots). It should be called before every simulation step.
+
+    The incoming actions are copied into a preallocated ``(num_envs, total_action_dim)`` buffer and each
+    term receives a view of its own slice, so that no new tensors are created when splitting the actions.
+    """
+
+    def __init__(self, cfg: dict[str, ActionTermCfg], env: ManagerBasedRLEnv):
+        """Initialize the action manager.
+
+        Args:
+            cfg: The configuration object, mapping the term names to the action term configurations.
+            env: The environment instance.
+
+        Raises:
+            ValueError: If the configuration is None.
+        """
+        # check if config is None
+        if cfg is None:
+            raise ValueError("Action manager configuration is None. Please provide a valid configuration.")
+
+        # call the base class constructor (this prepares the terms)
+        super().__init__(cfg, env)
+        # create buffers to store actions
+        self._action = torch.zeros((self.num_envs, self.total_action_dim), device=self.device)
+        self._prev_action = torch.zeros_like(self._action)
+        # views of the action buffer for each term
+        self._term_action_views: list[torch.Tensor] = []
+        idx = 0
+        for term in self._terms.values():
+            self._term_action_views.append(self._action[:, idx : idx + term.action_dim])
+            idx += term.action_dim
+
+    def __str__(self) -> str:
+        """Returns: A string representation for action manager."""
+        msg = f"<ActionManager> contains {len(self._term_names)} active terms.\n"
+        msg += f"Total action dimension: {self.total_action_dim}\n"
+        for index, (name, term) in enumerate(self._terms.items()):
+            msg += f"\t[{index}] {name}: {term.action_dim}\n"
+        return msg
+
+    """
+    Properties.
+    """
+
+    @property
+    def total_action_dim(self) -> int:
+        """Total dimension of actions."""
+        return sum(self.action_term_dim)
+
+    @property
+    def active_terms(self) -> list[str]:
+        """Name of active action terms."""
+        return self._term_names
+
+    @property
+    def action_term_dim(self) -> list[int]:
+        """Shape of each action term."""
+        return [term.action_dim for term in self._terms.values()]
+
+    @property
+    def action(self) -> torch.Tensor:
+        """The actions sent to the environment. Shape is (num_envs, total_action_dim)."""
+        return self._action
+
+    @property
+    def prev_action(self) -> torch.Tensor:
+        """The previous actions sent to the environment. Shape is (num_envs, total_action_dim)."""
+        return self._prev_action
+
+    """
+    Operations.
+    """
+
+    def reset(self, env_ids: torch.Tensor | None = None) -> dict[str, torch.Tensor]:
+        """Resets the action history.
+
+        Args:
+            env_ids: The environment ids. Defaults to None, in which case
+                all environments are considered.
+
+        Returns:
+            An empty dictionary.
+        """
+        # resolve environment ids
+        ids = slice(None) if env_ids is None else env_ids
+        # reset the action history
+        self._prev_action[ids] = 0.0
+        self._action[ids] = 0.0
+        # reset all action terms
+        for term in self._terms.values():
+            term.reset(env_ids=env_ids)
+        # nothing to log here
+        return {}
+
+    def get_state_buffers(self) -> dict[str, torch.Tensor]:
+        buffers = {"action": self._action, "prev_action": self._prev_action}
+        for term_name, term in self._terms.items():
+            for name, buffer in term.get_state_buffers().items():
+                buffers[f"{term_name}/{name}"] = buffer
+        return buffers
+
+    def process_action(self, action: torch.Tensor):
+        """Processes the actions sent to the environment.
+
+        Note:
+            This function should be called once per environment step.
+
+        Args:
+            action: The actions to process.
+
+        Raises:
+            ValueError: If the action dimension does not match the expected dimension.
+        """
+        # check if action dimension is valid
+        if self.total_action_dim != action.shape[1]:
+            raise ValueError(f"Invalid action shape, expected: {self.total_action_dim}, received: {action.shape[1]}.")
+        # store the input actions
+        self._prev_action.copy_(self._action)
+        self._action.copy_(action)
+
+        # split the actions and apply to each tensor
+        for term, term_actions in zip(self._terms.values(), self._term_action_views):
+            term.process_actions(term_actions)
+
+    def apply_action(self) -> None:
+        """Applies the actions to the environment/simulation.
+
+        Note:
+            This should be called at every simulation step.
+        """
+        for term in self._terms.values():
+            term.apply_actions()
+
+    def get_term(self, name: str) -> ActionTerm:
+        """Returns the action term with the specified name.
+
+        Args:
+            name: The name of the action term.
+
+        Returns:
+            The action term with the specified name.
+        """
+        return self._terms[name]
+
+    def get_active_iterable_terms(self, env_idx: int) -> Sequence[tuple[str, Sequence[float]]]:
+        """Returns the active terms as iterable sequence of tuples.
+
+        The first element of the tuple is the name of the term and the second element is the raw value(s) of the term.
+
+        Args:
+            env_idx: The specific environment to pull the active terms from.
+
+        Returns:
+            The active terms.
+        """
+        terms = []
+        for name, term_actions in zip(self._term_names, self._term_action_views):
+            terms.append((name, term_actions[env_idx].cpu().tolist()))
+        return terms
+
+    """
+    Helper functions.
+    """
+
+    def _prepare_terms(self):
+        # create buffers to parse and store terms
+        self._term_names: list[str] = list()
+        self._terms: dict[str, ActionTerm] = dict()
+
+        # parse action terms from the config
+        for term_name, term_cfg in self.cfg.items():
+            # check if term config is None
+            if term_cfg is None:
+                continue
+            # check valid type
+            if not isinstance(term_cfg, ActionTermCfg):
+                raise TypeError(
+                    f"Configuration for the term '{term_name}' is not of type ActionTermCfg."
+                    f" Received: '{type(term_cfg)}'."
+                )
+            # create the action term
+            term = term_cfg.class_type(term_cfg, self._env)
+            # sanity check if term is valid type
+            if not isinstance(term, ActionTerm):
+                raise TypeError(f"Returned object for the term '{term_name}' is not of type ActionTerm.")
+            # add term name and parameters
+            self._term_names.append(term_name)
+            self._terms[term_name] = term
+
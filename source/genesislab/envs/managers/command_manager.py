@@ -0,0 +1,309 @@
+# Copyright 2025 genesis_lab Developers (https://github.com/Atticlmr/genesis_lab)
+#
+# Licensed under the Apache License, Version 2.0 , January 2004
+
+"""Command manager for generating and updating commands."""
+
+from __future__ import annotations
+
+import torch
+from abc import abstractmethod
+from collections.abc import Sequence
+from typing import TYPE_CHECKING
+
+from .manager_base import ManagerBase, ManagerTermBase
+from .manager_term_cfg import CommandTermCfg
+
+if TYPE_CHECKING:
+    from genesislab.envs import ManagerBasedRLEnv
+
+
+class CommandTerm(ManagerTermBase):
+    """The base class for implementing a command term.
+
+    A command term is used to generate commands for goal-conditioned tasks. For example,
+    in the case of a goal-conditioned navigation task, the command term can be used to
+    generate a target position for the robot to navigate to.
+
+    It implements a resampling mechanism that allows the command to be resampled at a fixed
+    frequency. The resampling frequency can be specified in the configuration object.
+    The time left before resampling is kept per environment in a device tensor, so only the
+    environments whose timer expired are resampled.
+    """
+
+    def __init__(self, cfg: CommandTermCfg, env: ManagerBasedRLEnv):
+        """Initialize the command generator class.
+
+        Args:
+            cfg: The configuration parameters for the command generator.
+            env: The environment object.
+        """
+        super().__init__(cfg, env)
+
+        # create buffers to store the command
+        # -- metrics that can be used for logging
+        self.metrics = dict()
+        # -- time left before resampling
+        self.time_left = torch.zeros(self.num_envs, device=self.device)
+        # -- counter for the number of times the command has been resampled within the current episode
+        self.command_counter = torch.zeros(self.num_envs, device=self.device, dtype=torch.long)
+
+    """
+    Properties
+    """
+
+    @property
+    @abstractmethod
+    def command(self) -> torch.Tensor:
+        """The command tensor. Shape is (num_envs, command_dim)."""
+        raise NotImplementedError
+
+    """
+    Operations.
+    """
+
+    def reset(self, env_ids: torch.Tensor | None = None) -> dict[str, torch.Tensor]:
+        """Reset the command generator and log metrics.
+
+        This function resets the command counter and resamples the command. It should be called
+        at the beginning of each episode.
+
+        Args:
+            env_ids: The list of environment IDs to reset. Defaults to None.
+
+        Returns:
+            A dictionary containing the information to log under the "{name}" key.
+        """
+        # resolve the environment IDs
+        if env_ids is None:
+            env_ids = torch.arange(self.num_envs, device=self.device)
+
+        # add logging metrics
+        extras = {}
+        for metric_name, metric_value in self.metrics.items():
+            # compute the mean metric value
+            extras[metric_name] = torch.mean(metric_value[env_ids])
+            # reset the metric value
+            metric_value[env_ids] = 0.0
+
+        # set the command counter to zero
+        self.command_counter[env_ids] = 0
+        # resample the command
+        self._resample(env_ids)
+
+        return extras
+
+    def get_state_buffers(self) -> dict[str, torch.Tensor]:
+        buffers = {"command": self.command, "time_left": self.time_left, "command_counter": self.command_counter}
+        for metric_name, metric_value in self.metrics.items():
+            buffers[f"metrics/{metric_name}"] = metric_value
+        return buffers
+
+    def compute(self, dt: float):
+        """Compute the command.
+
+        Args:
+            dt: The time step passed since the last call to compute.
+        """
+        # update the metrics based on current state
+        self._update_metrics()
+        # reduce the time left before resampling
+        self.time_left -= dt
+        # resample the command if necessary
+        resample_env_ids = (self.time_left <= 0.0).nonzero().flatten()
+        if len(resample_env_ids) > 0:
+            self._resample(resample_env_ids)
+        # update the command
+        self._update_command()
+
+    """
+    Helper functions.
+    """
+
+    def _resample(self, env_ids: torch.Tensor):
+        """Resample the command.
+
+        This function resamples the command and time for which the command is applied for the
+        specified environment indices.
+
+        Args:
+            env_ids: The list of environment IDs to resample.
+        """
+        if len(env_ids) != 0:
+            # resample the time left before resampling
+            self.time_left[env_ids] = self.time_left[env_ids].uniform_(*self.cfg.resampling_time_range)
+            # resample the command
+            self._resample_command(env_ids)
+            # increment the command counter
+            self.command_counter[env_ids] += 1
+
+    """
+    Implementation specific functions.
+    """
+
+    @abstractmethod
+    def _update_metrics(self):
+        """Update the metrics based on the current state."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def _resample_command(self, env_ids: torch.Tensor):
+        """Resample the command for the specified environments."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def _update_command(self):
+        """Update the command based on the current state."""
+        raise NotImplementedError
+
+
+class CommandManager(ManagerBase):
+    """Manager for generating commands.
+
+    The command manager is used to generate commands for an agent to execute. It makes it convenient to switch
+    between different command generation strategies within the same environment. For instance, in an environment
+    consisting of a quadrupedal robot, the command to it could be a velocity command or position command.
+    By keeping the command generation logic separate from the environment, it is easy to switch between different
+    command generation strategies.
+
+    The command terms are implemented as classes that inherit from the :class:`CommandTerm` class.
+    Each command generator term should also have a corresponding configuration class that inherits from the
+    :class:`CommandTermCfg` class.
+    """
+
+    def __init__(self, cfg: dict[str, CommandTermCfg], env: ManagerBasedRLEnv):
+        """Initialize the command manager.
+
+        Args:
+            cfg: The configuration object, mapping the term names to the command term configurations.
+            env: The environment instance.
+        """
+        # create buffers to parse and store terms
+        self._terms: dict[str, CommandTerm] = dict()
+
+        # call the base class constructor (this prepares the terms)
+        super().__init__(cfg, env)
+
+    def __str__(self) -> str:
+        """Returns: A string representation for the command manager."""
+        msg = f"<CommandManager> contains {len(self._terms.values())} active terms.\n"
+        for index, (name, term) in enumerate(self._terms.items()):
+            msg += f"\t[{index}] {name}: {term.__class__.__name__}\n"
+        return msg
+
+    """
+    Properties.
+    """
+
+    @property
+    def active_terms(self) -> list[str]:
+        """Name of active command terms."""
+        return list(self._terms.keys())
+
+    """
+    Operations.
+    """
+
+    def get_active_iterable_terms(self, env_idx: int) -> Sequence[tuple[str, Sequence[float]]]:
+        """Returns the active terms as iterable sequence of tuples.
+
+        The first element of the tuple is the name of the term and the second element is the raw value(s) of the term.
+
+        Args:
+            env_idx: The specific environment to pull the active terms from.
+
+        Returns:
+            The active terms.
+        """
+        terms = []
+        for name, term in self._terms.items():
+            terms.append((name, term.command[env_idx].cpu().tolist()))
+        return terms
+
+    def reset(self, env_ids: torch.Tensor | None = None) -> dict[str, torch.Tensor]:
+        """Reset the command terms and log their metrics.
+
+        This function resets the command counter and resamples the command for each term. It should be called
+        at the beginning of each episode.
+
+        Args:
+            env_ids: The list of environment IDs to reset. Defaults to None.
+
+        Returns:
+            A dictionary containing the information to log under the "Metrics/{term_name}/{metric_name}" key.
+        """
+        extras = {}
+        for name, term in self._terms.items():
+            # reset the command term
+            metrics = term.reset(env_ids=env_ids)
+            # store the metrics under the term's name
+            for metric_name, metric_value in metrics.items():
+                extras[f"Metrics/{name}/{metric_name}"] = metric_value
+        # return logged information
+        return extras
+
+    def get_state_buffers(self) -> dict[str, torch.Tensor]:
+        buffers = {}
+        for term_name, term in self._terms.items():
+            for name, buffer in term.get_state_buffers().items():
+                buffers[f"{term_name}/{name}"] = buffer
+        return buffers
+
+    def compute(self, dt: float):
+        """Updates the commands.
+
+        This function calls each command term managed by the class.
+
+        Args:
+            dt: The time-step interval of the environment.
+        """
+        # iterate over all the command terms
+        for term in self._terms.values():
+            # compute term's value
+            term.compute(dt)
+
+    def get_command(self, name: str) -> torch.Tensor:
+        """Returns the command for the specified command term.
+
+        Args:
+            name: The name of the command term.
+
+        Returns:
+            The command tensor of the specified command term.
+        """
+        return self._terms[name].command
+
+    def get_term(self, name: str) -> CommandTerm:
+        """Returns the command term with the specified name.
+
+        Args:
+            name: The name of the command term.
+
+        Returns:
+            The command term with the specified name.
+        """
+        return self._terms[name]
+
+    """
+    Helper functions.
+    """
+
+    def _prepare_terms(self):
+        # iterate over all the terms
+        for term_name, term_cfg in self.cfg.items():
+            # check for non config
+            if term_cfg is None:
+                continue
+            # check for valid config type
+            if not isinstance(term_cfg, CommandTermCfg):
+                raise TypeError(
+                    f"Configuration for the term '{term_name}' is not of type CommandTermCfg."
+                    f" Received: '{type(term_cfg)}'."
+                )
+            # create the command term
+            term = term_cfg.class_type(term_cfg, self._env)
+            # sanity check if term is valid type
+            if not isinstance(term, CommandTerm):
+                raise TypeError(f"Returned object for the term '{term_name}' is not of type CommandTerm.")
+            # add class to dict
+            self._terms[term_name] = term
@@ -0,0 +1,255 @@
+# Copyright 2025 genesis_lab Developers (https://github.com/Atticlmr/genesis_lab)
+#
+# Licensed under the Apache License, Version 2.0 , January 2004
+
+"""Event manager for orchestrating operations based on different simulation events."""
+
+from __future__ import annotations
+
+import torch
+from typing import TYPE_CHECKING
+
+from .manager_base import ManagerBase, ManagerTermBase
+from .manager_term_cfg import EventTermCfg
+
+if TYPE_CHECKING:
+    from genesislab.envs import ManagerBasedRLEnv
+
+
+class EventManager(ManagerBase):
+    """Manager for orchestrating operations based on different simulation events.
+
+    The event manager applies operations to the environment based on different simulation events. For example,
+    changing the masses of objects or their friction coefficients during initialization/ reset, or applying random
+    pushes to the robot at a fixed interval of steps. The user can specify several modes of events to fine-tune the
+    behavior based on when to apply the event.
+
+    The event terms are parsed from a config dictionary containing the manager's settings and each term's
+    parameters. Each event term should instantiate the :class:`EventTermCfg` class.
+
+    Event terms can be grouped by their mode. The mode is a user-defined string that specifies when
+    the event term should be applied. This provides the user complete control over when event
+    terms should be applied.
+
+    For a typical training process, you may want to apply events in the following modes:
+
+    - "startup": Event is applied once at the beginning of the training.
+    - "reset": Event is applied at every reset.
+    - "interval": Event is applied at pre-specified intervals of time.
+
+    Event term functions are called as ``func(env, env_ids, **params)``, where ``env_ids`` is the index tensor of
+    the environments the event applies to, or None for all environments. The terms are expected to write the state
+    of these environments only, through the batched Genesis setters.
+
+    For the "interval" mode, the time left before the next event is kept per environment in a device tensor. At
+    every call, the timers are decremented and the term is applied to the environments whose timer expired, which
+    then sample a new interval.
+    """
+
+    def __init__(self, cfg: dict[str, EventTermCfg], env: ManagerBasedRLEnv):
+        """Initialize the event manager.
+
+        Args:
+            cfg: The configuration object, mapping the term names to the event term configurations.
+            env: An environment object.
+        """
+        super().__init__(cfg, env)
+
+    def __str__(self) -> str:
+        """Returns: A string representation for event manager."""
+        msg = f"<EventManager> contains {len(self._mode_term_names)} active terms.\n"
+        for mode, term_names in self._mode_term_names.items():
+            msg += f"Active Event Terms in Mode: '{mode}'\n"
+            for index, name in enumerate(term_names):
+                msg += f"\t[{index}] {name}\n"
+        return msg
+
+    """
+    Properties.
+    """
+
+    @property
+    def active_terms(self) -> dict[str, list[str]]:
+        """Name of active event terms.
+
+        The keys are the modes of event and the values are the names of the event terms.
+        """
+        return self._mode_term_names
+
+    @property
+    def available_modes(self) -> list[str]:
+        """Modes of events."""
+        return list(self._mode_term_names.keys())
+
+    """
+    Operations.
+    """
+
+    def reset(self, env_ids: torch.Tensor | None = None) -> dict[str, float]:
+        # call all terms that are classes
+        for mode_cfg in self._mode_class_term_cfgs.values():
+            for term_cfg in mode_cfg:
+                term_cfg.func.reset(env_ids=env_ids)
+        # resample the interval timers of the reset environments
+        for index, term_cfg in enumerate(self._mode_term_cfgs.get("interval", [])):
+            if not term_cfg.is_global_time:
+                time_left = self._interval_term_time_left[index]
+                ids = slice(None) if env_ids is None else env_ids
+                time_left[ids] = time_left[ids].uniform_(*term_cfg.interval_range_s)
+        # nothing to log here
+        return {}
+
+    def get_state_buffers(self) -> dict[str, torch.Tensor]:
+        buffers = {}
+        for mode, term_names in self._mode_term_names.items():
+            buffers.update(self._get_class_term_state_buffers(term_names, self._mode_term_cfgs[mode]))
+        # the per-environment interval timers (the global timers are not states of the environments)
+        for name, term_cfg, time_left in zip(
+            self._mode_term_names.get("interval", []),
+            self._mode_term_cfgs.get("interval", []),
+            self._interval_term_time_left,
+        ):
+            if not term_cfg.is_global_time:
+                buffers[f"{name}/time_left"] = time_left
+        return buffers
+
+    def apply(self, mode: str, env_ids: torch.Tensor | None = None, dt: float | None = None):
+        """Calls each event term in the specified mode.
+
+        For the "interval" mode, the environment indices are determined from the interval timers of each term and
+        the input ``env_ids`` is ignored.
+
+        Args:
+            mode: The mode of event.
+            env_ids: The indices of the environments to apply the event to.
+                Defaults to None, in which case the event is applied to all environments.
+            dt: The time step of the environment. This is only used for the "interval" mode.
+
+        Raises:
+            ValueError: If the mode is ``"interval"`` and the time step is not provided.
+        """
+        # check if mode is valid
+        if mode not in self._mode_term_names:
+            return
+        if mode == "interval":
+            if dt is None:
+                raise ValueError(
+                    f"Event mode '{mode}' requires the time-step of the environment to be passed to the event manager."
+                )
+            self._apply_interval(dt)
+            return
+        # iterate over all the event terms
+        for term_cfg in self._mode_term_cfgs[mode]:
+            term_cfg.func(self._env, env_ids, **term_cfg.params)
+
+    """
+    Term settings.
+    """
+
+    def set_term_cfg(self, term_name: str, cfg: EventTermCfg):
+        """Sets the configuration of the specified term into the manager.
+
+        The method finds the term by name by searching through all the modes.
+        It then updates the configuration of the term with the first matching name.
+
+        Args:
+            term_name: The name of the event term.
+            cfg: The configuration for the event term.
+
+        Raises:
+            ValueError: If the term name is not found.
+        """
+        term_found = False
+        for mode, terms in self._mode_term_names.items():
+            if term_name in terms:
+                self._mode_term_cfgs[mode][terms.index(term_name)] = cfg
+                term_found = True
+                break
+        if not term_found:
+            raise ValueError(f"Event term '{term_name}' not found.")
+
+    def get_term_cfg(self, term_name: str) -> EventTermCfg:
+        """Gets the configuration for the specified term.
+
+        The method finds the term by name by searching through all the modes.
+        It then returns the configuration of the term with the first matching name.
+
+        Args:
+            term_name: The name of the event term.
+
+        Returns:
+            The configuration of the event term.
+
+        Raises:
+            ValueError: If the term name is not found.
+        """
+        for mode, terms in self._mode_term_names.items():
+            if term_name in terms:
+                return self._mode_term_cfgs[mode][terms.index(term_name)]
+        raise ValueError(f"Event term '{term_name}' not found.")
+
+    """
+    Helper functions.
+    """
+
+    def _apply_interval(self, dt: float):
+        """Applies the interval terms to the environments whose timer expired."""
+        for index, term_cfg in enumerate(self._mode_term_cfgs["interval"]):
+            time_left = self._interval_term_time_left[index]
+            time_left -= dt
+            if term_cfg.is_global_time:
+                # a single timer shared by all the environments
+                if time_left.item() <= 1e-6:
+                    time_left.uniform_(*term_cfg.interval_range_s)
+                    term_cfg.func(self._env, None, **term_cfg.params)
+            else:
+                # check if the interval has passed and sample a new interval
+                valid_env_ids = (time_left <= 1e-6).nonzero().flatten()
+                if len(valid_env_ids) > 0:
+                    time_left[valid_env_ids] = time_left[valid_env_ids].uniform_(*term_cfg.interval_range_s)
+                    # call the event term
+                    term_cfg.func(self._env, valid_env_ids, **term_cfg.params)
+
+    def _prepare_terms(self):
+        # buffer to store the event terms per mode
+        self._mode_term_names: dict[str, list[str]] = dict()
+        self._mode_term_cfgs: dict[str, list[EventTermCfg]] = dict()
+        self._mode_class_term_cfgs: dict[str, list[EventTermCfg]] = dict()
+        # buffer to store the time left for "interval" mode
+        # if interval is global, then it is a single value, otherwise it is one value per environment
+        self._interval_term_time_left: list[torch.Tensor] = list()
+
+        # iterate over all the terms
+        for term_name, term_cfg in self.cfg.items():
+            # check for non config
+            if term_cfg is None:
+                continue
+            # check for valid config type
+            if not isinstance(term_cfg, EventTermCfg):
+                raise TypeError(
+                    f"Configuration for the term '{term_name}' is not of type EventTermCfg."
+                    f" Received: '{type(term_cfg)}'."
+                )
+            # resolve common parameters
+            self._resolve_common_term_cfg(term_name, term_cfg, min_argc=2)
+            # check if the mode is interval and resolve the timer
+            if term_cfg.mode == "interval":
+                if term_cfg.interval_range_s is None:
+                    raise ValueError(
+                        f"Event term '{term_name}' has mode 'interval' but 'interval_range_s' is not specified."
+                    )
+                num_timers = 1 if term_cfg.is_global_time else self.num_envs
+                time_left = torch.empty(num_timers, device=self.device).uniform_(*term_cfg.interval_range_s)
+                self._interval_term_time_left.append(time_left)
+            # check if mode is a new mode
+            if term_cfg.mode not in self._mode_term_names:
+                # add new mode
+                self._mode_term_names[term_cfg.mode] = list()
+                self._mode_term_cfgs[term_cfg.mode] = list()
+                self._mode_class_term_cfgs[term_cfg.mode] = list()
+            # add term name and parameters
+            self._mode_term_names[term_cfg.mode].append(term_name)
+            self._mode_term_cfgs[term_cfg.mode].append(term_cfg)
+            # check if the term is a class
+            if isinstance(term_cfg.func, ManagerTermBase):
+                self._mode_class_term_cfgs[term_cfg.mode].append(term_cfg)
@@ -0,0 +1,317 @@
+# Copyright 2025 genesis_lab Developers (https://github.com/Atticlmr/genesis_lab)
+#
+# Licensed under the Apache License, Version 2.0 , January 2004
+
+"""Base classes for managers and their terms."""
+
+from __future__ import annotations
+
+import copy
+import inspect
+import torch
+from abc import ABC, abstractmethod
+from collections.abc import Sequence
+from typing import TYPE_CHECKING, Any
+
+from genesislab.utils.string import resolve_matching_names
+
+from .manager_term_cfg import ManagerTermBaseCfg
+from .scene_entity_cfg import SceneEntityCfg
+
+if TYPE_CHECKING:
+    from genesislab.envs import ManagerBasedRLEnv
+
+
+class ManagerTermBase(ABC):
+    """Base class for manager terms.
+
+    Manager term implementations can be functions or classes. If the term is a class, it should
+    inherit from this base class and implement the required methods.
+
+    Each manager is implemented as a class that inherits from the :class:`ManagerBase` class. Each manager
+    class should also have a corresponding configuration class that defines the configuration terms for the
+    manager. Each term should be a :class:`ManagerTermBaseCfg` class or its subclass.
+    """
+
+    def __init__(self, cfg: ManagerTermBaseCfg, env: ManagerBasedRLEnv):
+        """Initialize the manager term.
+
+        Args:
+            cfg: The configuration object.
+            env: The environment instance.
+        """
+        # store the inputs
+        self.cfg = cfg
+        self._env = env
+
+    """
+    Properties.
+    """
+
+    @property
+    def num_envs(self) -> int:
+        """Number of environments."""
+        return self._env.num_envs
+
+    @property
+    def device(self) -> torch.device:
+        """Device on which to perform computations."""
+        return self._env.device
+
+    """
+    Operations.
+    """
+
+    def reset(self, env_ids: torch.Tensor | None = None) -> None:
+        """Resets the manager term.
+
+        Args:
+            env_ids: The environment ids. Defaults to None, in which case
+                all environments are considered.
+        """
+        pass
+
+    def get_state_buffers(self) -> dict[str, torch.Tensor]:
+        """Returns the per-environment buffers that the term carries from one step to the next.
+
+        These buffers are saved and restored with the state of the environment (see
+        :meth:`~genesislab.envs.ManagerBasedRLEnv.save_state`). Terms that keep such buffers should override this
+        method.
+
+        Returns:
+            The buffers of the term, by name. Shapes are (num_envs, ...).
+        """
+        return {}
+
+    def __call__(self, *args) -> Any:
+        """Returns the value of the term required by the manager.
+
+        In case of a class implementation, this function is called by the manager
+        to get the value of the term. The arguments passed to this function are
+        the ones specified in the term configuration (see :attr:`ManagerTermBaseCfg.params`).
+
+        .. attention::
+            To be consistent with memory-less implementation of terms with functions, it is
+            recommended to ensure that the returned mutable quantities are cloned before
+            returning them. For instance, if the term returns a tensor, it is recommended
+            to ensure that the returned tensor is a clone of the original tensor. This prevents
+            the manager from storing references to the tensors and altering the original tensors.
+
+        Args:
+            *args: Variable length argument list.
+
+        Returns:
+            The value of the term.
+        """
+        raise NotImplementedError("The method '__call__' should be implemented by the subclass.")
+
+
+class ManagerBase(ABC):
+    """Base class for all managers.
+
+    Managers resolve their terms once at construction and allocate all the buffers they write into. During
+    stepping, the term results are written in place into these buffers.
+    """
+
+    def __init__(self, cfg: dict[str, Any], env: ManagerBasedRLEnv):
+        """Initialize the manager.
+
+        Args:
+            cfg: The configuration object, mapping the term names to the term configurations.
+            env: The environment instance.
+        """
+        # store the inputs
+        self.cfg = copy.deepcopy(cfg)
+        self._env = env
+        # parse config to create terms information
+        self._prepare_terms()
+
+    """
+    Properties.
+    """
+
+    @property
+    def num_envs(self) -> int:
+        """Number of environments."""
+        return self._env.num_envs
+
+    @property
+    def device(self) -> torch.device:
+        """Device on which to perform computations."""
+        return self._env.device
+
+    @property
+    @abstractmethod
+    def active_terms(self) -> list[str] | dict[str, list[str]]:
+        """Name of active terms."""
+        raise NotImplementedError
+
+    """
+    Operations.
+    """
+
+    def reset(self, env_ids: torch.Tensor | None = None) -> dict[str, torch.Tensor]:
+        """Resets the manager and returns logging information for the current time-step.
+
+        Args:
+            env_ids: The environment ids for which to log data.
+                Defaults None, which logs data for all environments.
+
+        Returns:
+            Dictionary containing the logging information.
+        """
+        return {}
+
+    def get_state_buffers(self) -> dict[str, torch.Tensor]:
+        """Returns the per-environment buffers that the manager and its terms carry from one step to the next.
+
+        Returns:
+            The buffers of the manager, by name. Shapes are (num_envs, ...).
+        """
+        return {}
+
+    def get_state(self, env_ids: torch.Tensor | None = None) -> dict[str, torch.Tensor]:
+        """Read the state of the manager for the given environments.
+
+        Args:
+            env_ids: The environment ids. Defaults to None, in which case all environments are considered.
+
+        Returns:
+            A copy of the rows of the state buffers (see :meth:`get_state_buffers`), by name.
+        """
+        if env_ids is None:
+            return {name: buffer.clone() for name, buffer in self.get_state_buffers().items()}
+        return {name: buffer[env_ids] for name, buffer in self.get_state_buffers().items()}
+
+    def set_state(self, state: dict[str, torch.Tensor], env_ids: torch.Tensor | None = None):
+        """Write the state of the manager for the given environments.
+
+        Args:
+            state: The state read by :meth:`get_state`, with one row per environment to write.
+            env_ids: The environment ids. Defaults to None, in which case all environments are considered.
+        """
+        ids = slice(None) if env_ids is None else env_ids
+        for name, buffer in self.get_state_buffers().items():
+            buffer[ids] = state[name]
+
+    def find_terms(self, name_keys: str | Sequence[str]) -> list[str]:
+        """Find terms in the manager based on the names.
+
+        This function searches the manager for terms based on the names. The names can be
+        specified as regular expressions or a list of regular expressions. The search is
+        performed on the active terms in the manager.
+
+        Please check the :meth:`~genesislab.utils.string.resolve_matching_names` function for more
+        information on the name matching.
+
+        Args:
+            name_keys: A regular expression or a list of regular expressions to match the term names.
+
+        Returns:
+            A list of term names that match the input keys.
+        """
+        # resolve search keys
+        if isinstance(self.active_terms, dict):
+            list_of_strings = []
+            for names in self.active_terms.values():
+                list_of_strings.extend(names)
+        else:
+            list_of_strings = self.active_terms
+
+        # return the matching names
+        return resolve_matching_names(name_keys, list_of_strings)[1]
+
+    """
+    Implementation specific.
+    """
+
+    @abstractmethod
+    def _prepare_terms(self):
+        """Prepare terms information from the configuration object."""
+        raise NotImplementedError
+
+    """
+    Helper functions.
+    """
+
+    def _get_class_term_state_buffers(
+        self, term_names: Sequence[str], term_cfgs: Sequence[ManagerTermBaseCfg]
+    ) -> dict[str, torch.Tensor]:
+        """Collect the state buffers of the class terms under the ``"{term_name}/{buffer_name}"`` keys."""
+        buffers = {}
+        for term_name, term_cfg in zip(term_names, term_cfgs):
+            if isinstance(term_cfg.func, ManagerTermBase):
+                for name, buffer in term_cfg.func.get_state_buffers().items():
+                    buffers[f"{term_name}/{name}"] = buffer
+        return buffers
+
+    def _resolve_common_term_cfg(self, term_name: str, term_cfg: ManagerTermBaseCfg, min_argc: int = 1):
+        """Resolve common attributes of the term configuration.
+
+        Usually, called by the :meth:`_prepare_terms` method to resolve common attributes of the term
+        configuration. These include:
+
+        * Resolving the term function and checking if it is callable.
+        * Checking if the term function's arguments are matched by the parameters.
+        * Resolving special attributes of the term configuration like ``asset_cfg``, ``sensor_cfg``, etc.
+        * Initializing the term if it is a class.
+
+        Args:
+            term_name: The name of the term.
+            term_cfg: The term configuration.
+            min_argc: The minimum number of arguments required by the term function to be called correctly
+                by the manager.
+
+        Raises:
+            TypeError: If the term configuration is not of type :class:`ManagerTermBaseCfg`.
+            ValueError: If the scene entity defined in the term configuration does not exist.
+            AttributeError: If the term function is not callable.
+            ValueError: If the term function's arguments are not matched by the parameters.
+        """
+        # check if the term is a valid term config
+        if not isinstance(term_cfg, ManagerTermBaseCfg):
+            raise TypeError(
+                f"Configuration for the term '{term_name}' is not of type ManagerTermBaseCfg."
+                f" Received: '{type(term_cfg)}'."
+            )
+        # iterate over all the entities and parse the joint and body names
+        for key, value in term_cfg.params.items():
+            if isinstance(value, SceneEntityCfg):
+                # load the entity
+                try:
+                    value.resolve(self._env.scene)
+                except (KeyError, ValueError) as e:
+                    raise ValueError(f"Error while parsing '{term_name}:{key}'. {e}") from e
+        # get the corresponding function or functional class
+        if inspect.isclass(term_cfg.func):
+            if not issubclass(term_cfg.func, ManagerTermBase):
+                raise TypeError(
+                    f"Configuration for the term '{term_name}' is not of type ManagerTermBase."
+                    f" Received: '{type(term_cfg.func)}'."
+                )
+            func_static = term_cfg.func.__call__
+            min_argc += 1  # forward by 1 to account for 'self' argument
+        else:
+            func_static = term_cfg.func
+        # check if function is callable
+        if not callable(func_static):
+            raise AttributeError(f"The term '{term_name}' is not callable. Received: {term_cfg.func}")
+
+        # check if the term is a class of valid type
+        if inspect.isclass(term_cfg.func):
+            # initialize the term if it is a class
+            term_cfg.func = term_cfg.func(cfg=term_cfg, env=self._env)
+
+        # check statically if the term's arguments are matched by params
+        term_params = list(term_cfg.params.keys())
+        args = inspect.signature(func_static).parameters
+        args_with_defaults = [arg for arg in args if args[arg].default is not inspect.Parameter.empty]
+        args_without_defaults = [arg for arg in args if args[arg].default is inspect.Parameter.empty]
+        args = args_without_defaults + args_with_defaults
+        # ignore the leading arguments passed by the manager (e.g. env and env_ids)
+        if len(args) > min_argc:
+            if set(args[min_argc:]) != set(term_params + args_with_defaults):
+                raise ValueError(
+                    f"The term '{term_name}' expects mandatory parameters: {args_without_defaults[min_argc:]}"
+                    f" and optional parameters: {args_with_defaults}, but received: {term_params}."
+                )
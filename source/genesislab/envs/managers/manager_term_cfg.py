@@ -0,0 +1,229 @@
+# Copyright 2025 genesis_lab Developers (https://github.com/Atticlmr/genesis_lab)
+#
+# Licensed under the Apache License, Version 2.0 , January 2004
+
+"""Configuration terms for different managers."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import MISSING, dataclass, field
+from typing import TYPE_CHECKING, Any, Literal
+
+from genesislab.utils.noise import NoiseCfg
+
+from .scene_entity_cfg import SceneEntityCfg
+
+if TYPE_CHECKING:
+    from .action_manager import ActionTerm
+    from .command_manager import CommandTerm
+
+
+@dataclass(kw_only=True)
+class ManagerTermBaseCfg:
+    """Configuration for a manager term."""
+
+    func: Callable | type = MISSING
+    """The function or class to be called for the term.
+
+    The function must take the environment object as the first argument. The remaining arguments are
+    specified in the :attr:`params` attribute. If a class is provided, it is instantiated with the term
+    configuration and the environment, and the instance is then called like the function.
+    """
+
+    params: dict[str, Any | SceneEntityCfg] = field(default_factory=dict)
+    """The parameters to be passed to the function as keyword arguments. Defaults to an empty dict.
+
+    .. note::
+        If the value is a :class:`SceneEntityCfg` object, the manager will query the scene entity
+        and resolve its joint and body names into indices before the term is called.
+    """
+
+
+"""
+Action manager.
+"""
+
+
+@dataclass(kw_only=True)
+class ActionTermCfg:
+    """Configuration for an action term."""
+
+    class_type: type[ActionTerm] = MISSING
+    """The associated action term class.
+
+    The class should inherit from :class:`genesislab.envs.managers.action_manager.ActionTerm`.
+    """
+
+    asset_name: str = MISSING
+    """The name of the scene entity for which the action term is applied."""
+
+
+"""
+Command manager.
+"""
+
+
+@dataclass(kw_only=True)
+class CommandTermCfg:
+    """Configuration for a command generator term."""
+
+    class_type: type[CommandTerm] = MISSING
+    """The associated command term class to use.
+
+    The class should inherit from :class:`genesislab.envs.managers.command_manager.CommandTerm`.
+    """
+
+    resampling_time_range: tuple[float, float] = MISSING
+    """Time before commands are changed [s]."""
+
+
+"""
+Observation manager.
+"""
+
+
+@dataclass(kw_only=True)
+class ObservationTermCfg(ManagerTermBaseCfg):
+    """Configuration for an observation term.
+
+    The output of the term is processed in the order: noise corruption, clipping and scaling. The processing
+    of all the terms of a group is applied at once on the group buffer (see :class:`ObservationManager`).
+    """
+
+    noise: NoiseCfg | None = None
+    """The additive noise to corrupt the observation with. Defaults to None, in which case no noise is added.
+
+    The noise is only applied if :attr:`ObservationGroupCfg.enable_corruption` is True.
+    """
+
+    clip: tuple[float, float] | None = None
+    """The clipping range for the observation after adding noise. Defaults to None,
+    in which case no clipping is applied."""
+
+    scale: float | None = None
+    """The scale to apply to the observation after clipping. Defaults to None,
+    in which case no scaling is applied (same as setting scale to :obj:`1`)."""
+
+    history_length: int = 0
+    """Number of past observations to store in the observation buffers. Defaults to 0, meaning no history.
+
+    The processed observations are stored in a circular buffer of the given length and returned in order,
+    from the oldest to the latest.
+    """
+
+    flatten_history_dim: bool = True
+    """Whether to flatten the observation history into a single dimension. Defaults to True.
+
+    If False, the term has the shape ``(num_envs, history_length, *obs_dims)``.
+    """
+
+
+@dataclass(kw_only=True)
+class ObservationGroupCfg:
+    """Configuration for an observation group."""
+
+    terms: dict[str, ObservationTermCfg] = field(default_factory=dict)
+    """The observation terms of the group, keyed by their name. Defaults to an empty dict."""
+
+    concatenate_terms: bool = True
+    """Whether to concatenate the observation terms in the group. Defaults to True.
+
+    If true, the observation terms in the group are written into a single ``(num_envs, group_dim)`` buffer.
+    Otherwise, the observations are returned as a dictionary with the term name as the key.
+    """
+
+    enable_corruption: bool = False
+    """Whether to enable the noise corruption of the observation terms in the group. Defaults to False."""
+
+    history_length: int | None = None
+    """Number of past observations to store for all the terms of the group. Defaults to None.
+
+    If None, the :attr:`ObservationTermCfg.history_length` of each term is used. Otherwise, it overrides
+    the history length of all the terms in the group.
+    """
+
+    flatten_history_dim: bool = True
+    """Whether to flatten the history of all the terms of the group. Defaults to True.
+
+    This is only used if :attr:`history_length` is not None.
+    """
+
+    compile: bool = False
+    """Whether to compile the processing of the group with :func:`torch.compile`. Defaults to False.
+
+    This compiles the fused noise, clipping and scaling of the group. The term functions themselves are called
+    eagerly, since they read the simulation state through Genesis.
+    """
+
+
+"""
+Event manager.
+"""
+
+
+@dataclass(kw_only=True)
+class EventTermCfg(ManagerTermBaseCfg):
+    """Configuration for an event term."""
+
+    mode: Literal["startup", "reset", "interval"] = MISSING
+    """The mode in which the event term is applied.
+
+    - ``"startup"``: applied once when the environment is created.
+    - ``"reset"``: applied to the environment instances that are reset.
+    - ``"interval"``: applied to the environment instances whose interval timer expired.
+    """
+
+    interval_range_s: tuple[float, float] | None = None
+    """The range of time in seconds at which the term is applied. Defaults to None.
+
+    Based on this, the interval is sampled uniformly between the specified range for each environment instance.
+    The term is applied on the environment instances where the current time hits the interval time.
+
+    Note:
+        This is only used if the mode is ``"interval"``.
+    """
+
+    is_global_time: bool = False
+    """Whether randomization should be tracked on a per-environment basis. Defaults to False.
+
+    If True, the same interval time is used for all the environment instances.
+    If False, the interval time is sampled independently for each environment instance
+    and the term is applied when the current time hits the interval time for that instance.
+
+    Note:
+        This is only used if the mode is ``"interval"``.
+    """
+
+
+"""
+Reward manager.
+"""
+
+
+@dataclass(kw_only=True)
+class RewardTermCfg(ManagerTermBaseCfg):
+    """Configuration for a reward term."""
+
+    weight: float = MISSING
+    """The weight of the reward term.
+
+    This is multiplied with the reward term's value to compute the final reward.
+    """
+
+
+"""
+Termination manager.
+"""
+
+
+@dataclass(kw_only=True)
+class TerminationTermCfg(ManagerTermBaseCfg):
+    """Configuration for a termination term."""
+
+    time_out: bool = False
+    """Whether the termination term contributes towards episodic timeouts. Defaults to False.
+
+    Note:
+        These usually correspond to tasks that have a fixed time limit.
+    """
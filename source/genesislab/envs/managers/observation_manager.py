@@ -0,0 +1,514 @@
+# Copyright 2025 genesis_lab Developers (https://github.com/Atticlmr/genesis_lab)
+#
+# Licensed under the Apache License, Version 2.0 , January 2004
+
+"""Observation manager for computing observation signals for a given world."""
+
+from __future__ import annotations
+
+import math
+import torch
+from collections.abc import Callable, Sequence
+from typing import TYPE_CHECKING
+
+from genesislab.utils.buffers import CircularBuffer
+from genesislab.utils.noise import GaussianNoiseCfg, UniformNoiseCfg
+
+from .manager_base import ManagerBase, ManagerTermBase
+from .manager_term_cfg import ObservationGroupCfg, ObservationTermCfg
+
+if TYPE_CHECKING:
+    from genesislab.envs import ManagerBasedRLEnv
+
+
+class ObservationManager(ManagerBase):
+    """Manager for computing observation signals for a given world.
+
+    Observations are organized into groups based on their intended usage. This allows having different observation
+    groups for different types of learning such as asymmetric actor-critic and student-teacher training. Each
+    group contains observation terms which contain information about the observation function to call, the noise
+    corruption model to use, and the sensor to retrieve data from.
+
+    Each observation group should inherit from the :class:`ObservationGroupCfg` class. Within each group, each
+    observation term should instantiate the :class:`ObservationTermCfg` class.
+
+    On construction, every term is evaluated once to infer its shape. A flat ``(num_envs, group_dim)`` buffer is then
+    allocated for each group and every term writes its result into a column view of this buffer, which avoids
+    creating a new tensor through concatenation at every step. The per-term noise, clipping and scaling are expanded
+    into per-column tensors, so that the processing of the whole group is one fused in-place operation on the buffer.
+
+    Terms with a history write their processed observation into a :class:`CircularBuffer`, which is then copied in
+    order into the term's view of the group output.
+
+    .. note::
+        The returned observation tensors are the manager's buffers and are overwritten at the next call to
+        :meth:`compute`. Consumers that keep observations across steps (such as rollout storages) must copy them.
+    """
+
+    def __init__(self, cfg: dict[str, ObservationGroupCfg], env: ManagerBasedRLEnv):
+        """Initialize observation manager.
+
+        Args:
+            cfg: The configuration object, mapping the group names to the observation group configurations.
+            env: The environment instance.
+
+        Raises:
+            ValueError: If the configuration is None.
+        """
+        # check that cfg is not None
+        if cfg is None:
+            raise ValueError("Observation manager configuration is None. Please provide a valid configuration.")
+
+        # call the base class constructor (this will parse the terms config)
+        super().__init__(cfg, env)
+
+        # compute combined vector for obs group
+        self._group_obs_dim: dict[str, tuple[int, ...] | list[tuple[int, ...]]] = dict()
+        for group_name, group_term_dims in self._group_obs_term_dim.items():
+            # if terms are concatenated, compute the combined shape into a single tuple
+            # otherwise, keep the list of shapes as is
+            if self._group_obs_concatenate[group_name]:
+                self._group_obs_dim[group_name] = (sum(math.prod(dims) for dims in group_term_dims),)
+            else:
+                self._group_obs_dim[group_name] = group_term_dims
+
+        # allocate the output buffers and the per-term views into them
+        self._prepare_buffers()
+
+    def __str__(self) -> str:
+        """Returns: A string representation for the observation manager."""
+        msg = f"<ObservationManager> contains {len(self._group_obs_term_names)} groups.\n"
+        for group_name, group_dim in self._group_obs_dim.items():
+            msg += f"Active Observation Terms in Group: '{group_name}' (shape: {group_dim})\n"
+            for index, (name, dims) in enumerate(
+                zip(self._group_obs_term_names[group_name], self._group_obs_term_dim[group_name])
+            ):
+                msg += f"\t[{index}] {name}: {tuple(dims)}\n"
+        return msg
+
+    def get_active_iterable_terms(self, env_idx: int) -> Sequence[tuple[str, Sequence[float]]]:
+        """Returns the active terms as iterable sequence of tuples.
+
+        The first element of the tuple is the name of the term and the second element is the raw value(s) of the term.
+
+        Args:
+            env_idx: The specific environment to pull the active terms from.
+
+        Returns:
+            The active terms.
+        """
+        terms = []
+        for group_name, term_views in self._group_obs_term_views.items():
+            for name, view in zip(self._group_obs_term_names[group_name], term_views):
+                terms.append((f"{group_name}-{name}", view[env_idx].flatten().cpu().tolist()))
+        return terms
+
+    """
+    Properties.
+    """
+
+    @property
+    def active_terms(self) -> dict[str, list[str]]:
+        """Name of active observation terms in each group.
+
+        The keys are the group names and the values are the list of observation term names in the group.
+        """
+        return self._group_obs_term_names
+
+    @property
+    def group_obs_dim(self) -> dict[str, tuple[int, ...] | list[tuple[int, ...]]]:
+        """Shape of computed observations in each group.
+
+        The key is the group name and the value is the shape of the observation tensor.
+        If the terms in the group are concatenated, the value is a single tuple representing the
+        shape of the concatenated observation tensor. Otherwise, the value is a list of tuples,
+        where each tuple represents the shape of the observation tensor for a term in the group.
+        """
+        return self._group_obs_dim
+
+    @property
+    def group_obs_term_dim(self) -> dict[str, list[tuple[int, ...]]]:
+        """Shape of individual observation terms in each group.
+
+        The key is the group name and the value is a list of tuples representing the shape of the observation terms
+        in the group. The order of the tuples corresponds to the order of the terms in the group.
+        This matches the order of the terms in the :attr:`active_terms`.
+        """
+        return self._group_obs_term_dim
+
+    @property
+    def group_obs_concatenate(self) -> dict[str, bool]:
+        """Whether the observation terms are concatenated in each group or not.
+
+        The key is the group name and the value is a boolean specifying whether the observation terms in the group
+        are concatenated into a single tensor. If True, the observations are concatenated along the last dimension.
+        """
+        return self._group_obs_concatenate
+
+    @property
+    def group_obs_buf(self) -> dict[str, torch.Tensor | dict[str, torch.Tensor]]:
+        """The output buffers of the groups, which hold the observations of the last call to :meth:`compute`."""
+        return dict(self._group_obs_out)
+
+    """
+    Operations.
+    """
+
+    def reset(self, env_ids: torch.Tensor | None = None) -> dict[str, torch.Tensor]:
+        # call all terms that are classes
+        for group_cfg in self._group_obs_class_term_cfgs.values():
+            for term_cfg in group_cfg:
+                term_cfg.func.reset(env_ids=env_ids)
+        # refill the history of the reset environments at the next computation
+        for group_history in self._group_obs_term_history.values():
+            for history in group_history:
+                if history is not None:
+                    history.reset(batch_ids=env_ids)
+        # nothing to log here
+        return {}
+
+    def get_state_buffers(self) -> dict[str, torch.Tensor]:
+        buffers = {}
+        for group_name, term_names in self._group_obs_term_names.items():
+            buffers.update(self._get_class_term_state_buffers(term_names, self._group_obs_term_cfgs[group_name]))
+            buffers[f"{group_name}/current"] = self._group_obs_current[group_name]
+        return buffers
+
+    def get_state(self, env_ids: torch.Tensor | None = None) -> dict[str, torch.Tensor]:
+        """Read the state of the manager for the given environments.
+
+        In addition to the state buffers, the ordered history of the terms is read.
+
+        Args:
+            env_ids: The environment ids. Defaults to None, in which case all environments are considered.
+
+        Returns:
+            The state of the manager, by name.
+        """
+        state = super().get_state(env_ids)
+        for group_name, term_names in self._group_obs_term_names.items():
+            for term_name, history in zip(term_names, self._group_obs_term_history[group_name]):
+                if history is not None:
+                    state[f"{group_name}/{term_name}/history"] = history.read(env_ids)
+        return state
+
+    def set_state(self, state: dict[str, torch.Tensor], env_ids: torch.Tensor | None = None):
+        """Write the state of the manager for the given environments.
+
+        The outputs of the groups are updated from the written state, so that they hold the observations of the
+        environments at the time the state was read.
+
+        Args:
+            state: The state read by :meth:`get_state`, with one row per environment to write.
+            env_ids: The environment ids. Defaults to None, in which case all environments are considered.
+        """
+        super().set_state(state, env_ids)
+        for group_name, term_names in self._group_obs_term_names.items():
+            if not self._group_obs_has_history[group_name]:
+                continue
+            for term_name, history, current_view, term_view in zip(
+                term_names,
+                self._group_obs_term_history[group_name],
+                self._group_obs_current_views[group_name],
+                self._group_obs_term_views[group_name],
+            ):
+                if history is None:
+                    term_view.copy_(current_view)
+                else:
+                    history.write(state[f"{group_name}/{term_name}/history"], env_ids)
+                    history.read_into(term_view.view(self.num_envs, history.max_length, -1))
+
+    def compute(self) -> dict[str, torch.Tensor | dict[str, torch.Tensor]]:
+        """Compute the observations per group.
+
+        The method computes the observations for all the groups handled by the observation manager.
+        Please check the :meth:`compute_group` on the processing of observations per group.
+
+        Returns:
+            A dictionary with keys as the group names and values as the computed observations.
+            The observations are either concatenated into a single tensor or returned as a dictionary
+            with keys corresponding to the term's name.
+        """
+        # create a buffer for storing obs from all the groups
+        obs_buffer = dict()
+        # iterate over all the terms in each group
+        for group_name in self._group_obs_term_names:
+            obs_buffer[group_name] = self.compute_group(group_name)
+        return obs_buffer
+
+    def compute_group(self, group_name: str) -> torch.Tensor | dict[str, torch.Tensor]:
+        """Computes the observations for a given group.
+
+        The observations for a given group are computed by calling the registered functions for each
+        term in the group. The functions are called in the order of the terms in the group. Each result
+        is written in place into the preallocated view of the term. The following steps are then applied:
+
+        1. Noise, clipping and scaling of all the terms in one fused operation on the group buffer.
+        2. Update of the circular history buffers of the terms, which are copied in order into the output.
+
+        Args:
+            group_name: The name of the group for which to compute the observations.
+
+        Returns:
+            Depending on the group's configuration, the tensors for individual observation terms are
+            concatenated along the last dimension into a single tensor. Otherwise, they are returned as
+            a dictionary with keys corresponding to the term's name.
+
+        Raises:
+            ValueError: If input ``group_name`` is not a valid group handled by the manager.
+        """
+        # check if group name is valid
+        if group_name not in self._group_obs_term_names:
+            raise ValueError(
+                f"Unable to find the group '{group_name}' in the observation manager."
+                f" Available groups are: {list(self._group_obs_term_names.keys())}"
+            )
+        # evaluate terms and write them into their views of the current observations
+        for term_cfg, term_view in zip(self._group_obs_term_cfgs[group_name], self._group_obs_current_views[group_name]):
+            obs = term_cfg.func(self._env, **term_cfg.params)
+            term_view.copy_(obs.reshape(term_view.shape))
+        # apply noise, clipping and scaling to the whole group at once
+        process_args = self._group_obs_process_args[group_name]
+        if process_args is not None:
+            # draw the noise samples of each corrupted term
+            for noise_view, noise_cfg in self._group_obs_noise_views[group_name]:
+                if isinstance(noise_cfg, GaussianNoiseCfg):
+                    noise_view.normal_()
+                else:
+                    noise_view.uniform_()
+            self._group_obs_process_fn[group_name](self._group_obs_current[group_name], *process_args)
+        # update the history buffers and write the ordered history into the output
+        if self._group_obs_has_history[group_name]:
+            for history, current_view, term_view in zip(
+                self._group_obs_term_history[group_name],
+                self._group_obs_current_views[group_name],
+                self._group_obs_term_views[group_name],
+            ):
+                if history is None:
+                    term_view.copy_(current_view)
+                else:
+                    history.append(current_view)
+                    history.read_into(term_view.view(self.num_envs, history.max_length, -1))
+        # return the group buffer
+        return self._group_obs_out[group_name]
+
+    """
+    Helper functions.
+    """
+
+    def _prepare_terms(self):
+        """Prepares a list of observation terms functions."""
+        # create buffers to store information for each observation group
+        self._group_obs_term_names: dict[str, list[str]] = dict()
+        self._group_obs_term_dim: dict[str, list[tuple[int, ...]]] = dict()
+        self._group_obs_term_current_dim: dict[str, list[tuple[int, ...]]] = dict()
+        self._group_obs_term_history_length: dict[str, list[int]] = dict()
+        self._group_obs_term_cfgs: dict[str, list[ObservationTermCfg]] = dict()
+        self._group_obs_class_term_cfgs: dict[str, list[ObservationTermCfg]] = dict()
+        self._group_obs_concatenate: dict[str, bool] = dict()
+
+        # iterate over all the groups
+        for group_name, group_cfg in self.cfg.items():
+            # check for non config
+            if group_cfg is None:
+                continue
+            # check valid type
+            if not isinstance(group_cfg, ObservationGroupCfg):
+                raise TypeError(
+                    f"Observation group '{group_name}' is not of type 'ObservationGroupCfg'."
+                    f" Received: '{type(group_cfg)}'."
+                )
+            # initialize list for the group settings
+            self._group_obs_term_names[group_name] = list()
+            self._group_obs_term_dim[group_name] = list()
+            self._group_obs_term_current_dim[group_name] = list()
+            self._group_obs_term_history_length[group_name] = list()
+            self._group_obs_term_cfgs[group_name] = list()
+            self._group_obs_class_term_cfgs[group_name] = list()
+            # read common config for the group
+            self._group_obs_concatenate[group_name] = group_cfg.concatenate_terms
+            # iterate over all the terms in each group
+            for term_name, term_cfg in group_cfg.terms.items():
+                # skip non-obs settings
+                if term_cfg is None:
+                    continue
+                if not isinstance(term_cfg, ObservationTermCfg):
+                    raise TypeError(
+                        f"Configuration for the term '{term_name}' is not of type ObservationTermCfg."
+                        f" Received: '{type(term_cfg)}'."
+                    )
+                # resolve common terms in the config
+                self._resolve_common_term_cfg(f"{group_name}/{term_name}", term_cfg, min_argc=1)
+                # add term config to list
+                self._group_obs_term_names[group_name].append(term_name)
+                self._group_obs_term_cfgs[group_name].append(term_cfg)
+                # the group history settings override the ones of the terms
+                if group_cfg.history_length is not None:
+                    term_cfg.history_length = group_cfg.history_length
+                    term_cfg.flatten_history_dim = group_cfg.flatten_history_dim
+                # call function the first time to fill up dimensions
+                obs_dims = tuple(term_cfg.func(self._env, **term_cfg.params).shape[1:])
+                self._group_obs_term_current_dim[group_name].append(obs_dims)
+                self._group_obs_term_history_length[group_name].append(term_cfg.history_length)
+                # the history is prepended to the dimensions of the term
+                if term_cfg.history_length > 0:
+                    if term_cfg.flatten_history_dim:
+                        obs_dims = (term_cfg.history_length * math.prod(obs_dims),)
+                    else:
+                        obs_dims = (term_cfg.history_length, *obs_dims)
+                self._group_obs_term_dim[group_name].append(obs_dims)
+                # add term in a separate list if term is a class
+                if isinstance(term_cfg.func, ManagerTermBase):
+                    self._group_obs_class_term_cfgs[group_name].append(term_cfg)
+                    # call reset (in-case above call to get obs dims changed the state)
+                    term_cfg.func.reset()
+
+    def _prepare_buffers(self):
+        """Allocates the buffers of each group and the views of each term into them.
+
+        Every group has a flat buffer for the current observations of its terms, on which the noise, clipping and
+        scaling are applied. If none of the terms has a history, this buffer is also the output of the group.
+        Otherwise, a separate output buffer holds the current observations and the ordered history of the terms.
+        """
+        # output of each group and term views into it
+        self._group_obs_out: dict[str, torch.Tensor | dict[str, torch.Tensor]] = dict()
+        self._group_obs_term_views: dict[str, list[torch.Tensor]] = dict()
+        # current observations of each group and term views into it
+        self._group_obs_current: dict[str, torch.Tensor] = dict()
+        self._group_obs_current_views: dict[str, list[torch.Tensor]] = dict()
+        # history of each term
+        self._group_obs_term_history: dict[str, list[CircularBuffer | None]] = dict()
+        self._group_obs_has_history: dict[str, bool] = dict()
+        # fused processing of each group
+        self._group_obs_noise_views: dict[str, list[tuple[torch.Tensor, UniformNoiseCfg | GaussianNoiseCfg]]] = dict()
+        self._group_obs_process_args: dict[str, tuple[torch.Tensor | None, ...] | None] = dict()
+        self._group_obs_process_fn: dict[str, Callable] = dict()
+
+        for group_name, term_names in self._group_obs_term_names.items():
+            term_cfgs = self._group_obs_term_cfgs[group_name]
+            current_dims = [math.prod(dims) for dims in self._group_obs_term_current_dim[group_name]]
+            history_lengths = self._group_obs_term_history_length[group_name]
+            # -- current observations
+            current_buf = torch.zeros((self.num_envs, sum(current_dims)), device=self.device)
+            current_views = self._split_columns(current_buf, current_dims)
+            # -- output and history
+            has_history = any(length > 0 for length in history_lengths)
+            if has_history:
+                out_dims = [math.prod(dims) for dims in self._group_obs_term_dim[group_name]]
+                out_buf = torch.zeros((self.num_envs, sum(out_dims)), device=self.device)
+                term_views = self._split_columns(out_buf, out_dims)
+                histories = [
+                    CircularBuffer(length, self.num_envs, (dims,), self.device) if length > 0 else None
+                    for length, dims in zip(history_lengths, current_dims)
+                ]
+            else:
+                out_buf = current_buf
+                term_views = current_views
+                histories = [None] * len(term_names)
+            # -- group output: flat buffer or views reshaped to the term dimensions
+            if self._group_obs_concatenate[group_name]:
+                self._group_obs_out[group_name] = out_buf
+            else:
+                self._group_obs_out[group_name] = {
+                    name: view.view(self.num_envs, *dims)
+                    for name, view, dims in zip(term_names, term_views, self._group_obs_term_dim[group_name])
+                }
+            self._group_obs_current[group_name] = current_buf
+            self._group_obs_current_views[group_name] = current_views
+            self._group_obs_term_views[group_name] = term_views
+            self._group_obs_term_history[group_name] = histories
+            self._group_obs_has_history[group_name] = has_history
+            # -- per-column parameters of the fused processing
+            self._prepare_processing(group_name, term_cfgs, current_dims, current_buf)
+
+    def _prepare_processing(
+        self, group_name: str, term_cfgs: list[ObservationTermCfg], term_dims: list[int], current_buf: torch.Tensor
+    ):
+        """Expands the noise, clipping and scaling of the terms of a group into per-column tensors."""
+        group_cfg: ObservationGroupCfg = self.cfg[group_name]
+        num_columns = current_buf.shape[1]
+        # check which operations are needed by the group
+        use_noise = group_cfg.enable_corruption and any(cfg.noise is not None for cfg in term_cfgs)
+        use_clip = any(cfg.clip is not None for cfg in term_cfgs)
+        use_scale = any(cfg.scale is not None for cfg in term_cfgs)
+
+        noise_buf = noise_mean = noise_std = clip_min = clip_max = scale = None
+        noise_views = []
+        if use_noise:
+            noise_buf = torch.zeros_like(current_buf)
+            noise_mean = torch.zeros(num_columns, device=self.device)
+            noise_std = torch.zeros(num_columns, device=self.device)
+        if use_clip:
+            clip_min = torch.full((num_columns,), -math.inf, device=self.device)
+            clip_max = torch.full((num_columns,), math.inf, device=self.device)
+        if use_scale:
+            scale = torch.ones(num_columns, device=self.device)
+
+        idx = 0
+        for term_cfg, dim in zip(term_cfgs, term_dims):
+            columns = slice(idx, idx + dim)
+            idx += dim
+            # noise: both models are an affine transform of a standard sample
+            if use_noise and term_cfg.noise is not None:
+                if isinstance(term_cfg.noise, GaussianNoiseCfg):
+                    noise_mean[columns] = term_cfg.noise.mean
+                    noise_std[columns] = term_cfg.noise.std
+                elif isinstance(term_cfg.noise, UniformNoiseCfg):
+                    noise_mean[columns] = term_cfg.noise.n_min
+                    noise_std[columns] = term_cfg.noise.n_max - term_cfg.noise.n_min
+                else:
+                    raise TypeError(f"Unsupported noise configuration: '{type(term_cfg.noise)}'.")
+                noise_views.append((noise_buf[:, columns], term_cfg.noise))
+            # clipping
+            if term_cfg.clip is not None:
+                clip_min[columns] = term_cfg.clip[0]
+                clip_max[columns] = term_cfg.clip[1]
+            # scaling
+            if term_cfg.scale is not None:
+                scale[columns] = term_cfg.scale
+
+        self._group_obs_noise_views[group_name] = noise_views
+        if use_noise or use_clip or use_scale:
+            self._group_obs_process_args[group_name] = (noise_buf, noise_mean, noise_std, clip_min, clip_max, scale)
+        else:
+            self._group_obs_process_args[group_name] = None
+        self._group_obs_process_fn[group_name] = (
+            torch.compile(_corrupt_clip_scale, dynamic=False) if group_cfg.compile else _corrupt_clip_scale
+        )
+
+    def _split_columns(self, buf: torch.Tensor, dims: list[int]) -> list[torch.Tensor]:
+        """Returns the column views of the buffer with the given widths."""
+        views = []
+        idx = 0
+        for dim in dims:
+            views.append(buf[:, idx : idx + dim])
+            idx += dim
+        return views
+
+
+def _corrupt_clip_scale(
+    obs: torch.Tensor,
+    noise: torch.Tensor | None,
+    noise_mean: torch.Tensor | None,
+    noise_std: torch.Tensor | None,
+    clip_min: torch.Tensor | None,
+    clip_max: torch.Tensor | None,
+    scale: torch.Tensor | None,
+):
+    """Adds the noise, clips and scales the observations in place.
+
+    Args:
+        obs: The observations. Shape is (num_envs, num_columns).
+        noise: The standard noise samples. Shape is (num_envs, num_columns).
+        noise_mean: The offset of the noise per column. Shape is (num_columns,).
+        noise_std: The scale of the noise per column. Shape is (num_columns,).
+        clip_min: The lower clipping bound per column. Shape is (num_columns,).
+        clip_max: The upper clipping bound per column. Shape is (num_columns,).
+        scale: The scale per column. Shape is (num_columns,).
+    """
+    if noise is not None:
+        obs.addcmul_(noise, noise_std).add_(noise_mean)
+    if clip_min is not None:
+        torch.clamp(obs, clip_min, clip_max, out=obs)
+    if scale is not None:
+        obs.mul_(scale)
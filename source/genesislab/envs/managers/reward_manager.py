@@ -0,0 +1,301 @@
+# Copyright 2025 genesis_lab Developers (https://github.com/Atticlmr/genesis_lab)
+#
+# Licensed under the Apache License, Version 2.0 , January 2004
+
+"""Reward manager for computing reward signals for a given world."""
+
+from __future__ import annotations
+
+import time
+import torch
+from collections.abc import Sequence
+from typing import TYPE_CHECKING
+
+from .manager_base import ManagerBase, ManagerTermBase
+from .manager_term_cfg import RewardTermCfg
+
+if TYPE_CHECKING:
+    from genesislab.envs import ManagerBasedRLEnv
+
+
+class RewardManager(ManagerBase):
+    """Manager for computing reward signals for a given world.
+
+    The reward manager computes the total reward as a sum of the weighted reward terms. The reward
+    terms are parsed from a config dictionary containing the reward manager's settings and reward
+    terms configuration.
+
+    The weighted and time-scaled value of every term is written into column ``i`` of a preallocated
+    ``(num_envs, num_terms)`` tensor and the total reward is reduced from it into a preallocated
+    ``(num_envs,)`` buffer. Terms with a zero weight are not called and their column stays zero. The
+    episodic sum of every term is accumulated on the device and only reduced for the environments that are
+    reset, so logging does not synchronize with the device at every step.
+
+    For profiling, the manager can time every term (see :attr:`timing_enabled`). On CUDA devices, the terms are
+    timed with CUDA events, which requires one synchronization per step while the timing is enabled.
+
+    .. note::
+
+        The reward manager multiplies the reward term's ``weight``  with the time-step interval ``dt``
+        of the environment. This is done to ensure that the computed reward terms are balanced with
+        respect to the chosen time-step interval in the environment.
+    """
+
+    def __init__(self, cfg: dict[str, RewardTermCfg], env: ManagerBasedRLEnv):
+        """Initialize the reward manager.
+
+        Args:
+            cfg: The configuration object, mapping the term names to the reward term configurations.
+            env: The environment instance.
+        """
+        # call the base class constructor (this will parse the terms config)
+        super().__init__(cfg, env)
+        # create buffer for managing reward per environment
+        self._reward_buf = torch.zeros(self.num_envs, dtype=torch.float, device=self.device)
+        # buffer which stores the current step reward for each term for each environment
+        self._step_reward = torch.zeros((self.num_envs, len(self._term_names)), dtype=torch.float, device=self.device)
+        # buffer which stores the episodic sum of each term for each environment
+        self._episode_sums = torch.zeros_like(self._step_reward)
+        # per-term timing (disabled by default)
+        self._timing_enabled = False
+        self._term_time_sums = [0.0] * len(self._term_names)
+        self._term_time_counts = [0] * len(self._term_names)
+        self._term_events: list[tuple[torch.cuda.Event, torch.cuda.Event]] | None = None
+
+    def __str__(self) -> str:
+        """Returns: A string representation for reward manager."""
+        msg = f"<RewardManager> contains {len(self._term_names)} active terms.\n"
+        for index, (name, term_cfg) in enumerate(zip(self._term_names, self._term_cfgs)):
+            msg += f"\t[{index}] {name}: weight={term_cfg.weight}\n"
+        return msg
+
+    """
+    Properties.
+    """
+
+    @property
+    def active_terms(self) -> list[str]:
+        """Name of active reward terms."""
+        return self._term_names
+
+    @property
+    def step_reward(self) -> torch.Tensor:
+        """The weighted reward of each term at the current step. Shape is (num_envs, num_terms)."""
+        return self._step_reward
+
+    @property
+    def episode_sums(self) -> torch.Tensor:
+        """The weighted reward of each term summed over the current episode. Shape is (num_envs, num_terms)."""
+        return self._episode_sums
+
+    @property
+    def timing_enabled(self) -> bool:
+        """Whether the computation time of each term is measured. Defaults to False."""
+        return self._timing_enabled
+
+    @timing_enabled.setter
+    def timing_enabled(self, value: bool):
+        self._timing_enabled = value
+        # create the events once, so that no new events are created during stepping
+        if value and self._term_events is None and torch.device(self.device).type == "cuda":
+            self._term_events = [
+                (torch.cuda.Event(enable_timing=True), torch.cuda.Event(enable_timing=True)) for _ in self._term_names
+            ]
+
+    @property
+    def term_timings(self) -> dict[str, float]:
+        """The mean computation time of each term per call (in ms), measured while the timing is enabled.
+
+        Terms that have not been timed yet, for instance because their weight is zero, are reported as 0.0.
+        """
+        return {
+            name: time_sum / count if count > 0 else 0.0
+            for name, time_sum, count in zip(self._term_names, self._term_time_sums, self._term_time_counts)
+        }
+
+    """
+    Operations.
+    """
+
+    def reset(self, env_ids: torch.Tensor | None = None) -> dict[str, torch.Tensor]:
+        """Returns the episodic sum of individual reward terms and resets them.
+
+        The episodic sums of all the terms are averaged over the reset environments in a single reduction.
+        The logged values are device tensors, so no synchronization happens here.
+
+        Args:
+            env_ids: The environment ids for which the episodic sum of
+                individual reward terms is to be returned. Defaults to None, in which case
+                all environments are considered.
+
+        Returns:
+            Dictionary of episodic sum of individual reward terms under the "Episode_Reward/{term_name}" key.
+        """
+        # resolve environment ids
+        ids = slice(None) if env_ids is None else env_ids
+        # average the episodic sums of all the terms over the reset environments
+        episodic_sum_avg = torch.mean(self._episode_sums[ids], dim=0) / self._env.max_episode_length_s
+        extras = {f"Episode_Reward/{name}": episodic_sum_avg[index] for index, name in enumerate(self._term_names)}
+        # reset episodic sum
+        self._episode_sums[ids] = 0.0
+        # reset all the reward terms
+        for term_cfg in self._class_term_cfgs:
+            term_cfg.func.reset(env_ids=env_ids)
+        # return logged information
+        return extras
+
+    def get_state_buffers(self) -> dict[str, torch.Tensor]:
+        buffers = {"episode_sums": self._episode_sums}
+        buffers.update(self._get_class_term_state_buffers(self._term_names, self._term_cfgs))
+        return buffers
+
+    def compute(self, dt: float) -> torch.Tensor:
+        """Computes the reward signal as a weighted sum of individual terms.
+
+        This function calls each reward term managed by the class and adds them to compute the net
+        reward signal.
+
+        Args:
+            dt: The time-step interval of the environment.
+
+        Returns:
+            The net reward signal of shape (num_envs,).
+        """
+        if self._timing_enabled:
+            self._compute_terms_timed(dt)
+        else:
+            # iterate over all the reward terms
+            for term_idx, term_cfg in enumerate(self._term_cfgs):
+                # skip if weight is zero (kind of a micro-optimization)
+                if term_cfg.weight == 0.0:
+                    continue
+                # compute term's value and write it into its column
+                value = term_cfg.func(self._env, **term_cfg.params)
+                torch.mul(value, term_cfg.weight * dt, out=self._step_reward[:, term_idx])
+        # reduce the weighted terms into the net reward
+        torch.sum(self._step_reward, dim=1, out=self._reward_buf)
+        # update episodic sum
+        self._episode_sums += self._step_reward
+        return self._reward_buf
+
+    def reset_timings(self):
+        """Clears the accumulated computation times of the terms."""
+        self._term_time_sums = [0.0] * len(self._term_names)
+        self._term_time_counts = [0] * len(self._term_names)
+
+    """
+    Term settings.
+    """
+
+    def set_term_cfg(self, term_name: str, cfg: RewardTermCfg):
+        """Sets the configuration of the specified term into the manager.
+
+        Args:
+            term_name: The name of the reward term.
+            cfg: The configuration for the reward term.
+
+        Raises:
+            ValueError: If the term name is not found.
+        """
+        if term_name not in self._term_names:
+            raise ValueError(f"Reward term '{term_name}' not found.")
+        # set the configuration
+        term_idx = self._term_names.index(term_name)
+        self._term_cfgs[term_idx] = cfg
+        # terms with zero weight are skipped, so their column has to be cleared once
+        if cfg.weight == 0.0:
+            self._step_reward[:, term_idx] = 0.0
+
+    def get_term_cfg(self, term_name: str) -> RewardTermCfg:
+        """Gets the configuration for the specified term.
+
+        Args:
+            term_name: The name of the reward term.
+
+        Returns:
+            The configuration of the reward term.
+
+        Raises:
+            ValueError: If the term name is not found.
+        """
+        if term_name not in self._term_names:
+            raise ValueError(f"Reward term '{term_name}' not found.")
+        # return the configuration
+        return self._term_cfgs[self._term_names.index(term_name)]
+
+    def get_active_iterable_terms(self, env_idx: int) -> Sequence[tuple[str, Sequence[float]]]:
+        """Returns the active terms as iterable sequence of tuples.
+
+        The first element of the tuple is the name of the term and the second element is the raw value(s) of the term.
+
+        Args:
+            env_idx: The specific environment to pull the active terms from.
+
+        Returns:
+            The active terms.
+        """
+        step_reward = self._step_reward[env_idx].cpu().tolist()
+        return [(name, [value]) for name, value in zip(self._term_names, step_reward)]
+
+    """
+    Helper functions.
+    """
+
+    def _compute_terms_timed(self, dt: float):
+        """Computes the weighted reward terms and measures the time spent in each of them."""
+        for term_idx, term_cfg in enumerate(self._term_cfgs):
+            if term_cfg.weight == 0.0:
+                continue
+            if self._term_events is not None:
+                start_event, end_event = self._term_events[term_idx]
+                start_event.record()
+                value = term_cfg.func(self._env, **term_cfg.params)
+                torch.mul(value, term_cfg.weight * dt, out=self._step_reward[:, term_idx])
+                end_event.record()
+            else:
+                start_time = time.perf_counter()
+                value = term_cfg.func(self._env, **term_cfg.params)
+                torch.mul(value, term_cfg.weight * dt, out=self._step_reward[:, term_idx])
+                self._term_time_sums[term_idx] += (time.perf_counter() - start_time) * 1000.0
+                self._term_time_counts[term_idx] += 1
+        # read the cuda events once all the terms are queued
+        if self._term_events is not None:
+            torch.cuda.synchronize(self.device)
+            for term_idx, term_cfg in enumerate(self._term_cfgs):
+                if term_cfg.weight == 0.0:
+                    continue
+                start_event, end_event = self._term_events[term_idx]
+                self._term_time_sums[term_idx] += start_event.elapsed_time(end_event)
+                self._term_time_counts[term_idx] += 1
+
+    def _prepare_terms(self):
+        # parse reward terms and store their information
+        self._term_names: list[str] = list()
+        self._term_cfgs: list[RewardTermCfg] = list()
+        self._class_term_cfgs: list[RewardTermCfg] = list()
+
+        # iterate over all the terms
+        for term_name, term_cfg in self.cfg.items():
+            # check for non config
+            if term_cfg is None:
+                continue
+            # check for valid config type
+            if not isinstance(term_cfg, RewardTermCfg):
+                raise TypeError(
+                    f"Configuration for the term '{term_name}' is not of type RewardTermCfg."
+                    f" Received: '{type(term_cfg)}'."
+                )
+            # check for valid weight type
+            if not isinstance(term_cfg.weight, (float, int)):
+                raise TypeError(
+                    f"Weight for the term '{term_name}' is not of type float or int."
+                    f" Received: '{type(term_cfg.weight)}'."
+                )
+            # resolve common parameters
+            self._resolve_common_term_cfg(term_name, term_cfg, min_argc=1)
+            # add function to list
+            self._term_names.append(term_name)
+            self._term_cfgs.append(term_cfg)
+            # check if the term is a class
+            if isinstance(term_cfg.func, ManagerTermBase):
+                self._class_term_cfgs.append(term_cfg)
@@ -0,0 +1,95 @@
+# Copyright 2025 genesis_lab Developers (https://github.com/Atticlmr/genesis_lab)
+#
+# Licensed under the Apache License, Version 2.0 , January 2004
+
+"""Configuration for a scene entity that is used by the manager's term."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+from genesislab.sensors import ContactSensor
+from genesislab.utils.string import resolve_matching_names
+
+if TYPE_CHECKING:
+    from genesislab.envs.scene import InteractiveScene
+
+
+@dataclass
+class SceneEntityCfg:
+    """Configuration for a scene entity that is used by the manager's term.
+
+    This class is used to specify the name of the scene entity that is queried from the
+    :class:`InteractiveScene` and passed to the manager's term function. The joint and body names are
+    resolved once into the local DoF, generalized coordinate and link indices of the Genesis entity, so that
+    the term functions can pass them directly to the batched Genesis getters.
+    """
+
+    name: str
+    """The name of the scene entity."""
+
+    joint_names: str | list[str] | None = None
+    """The names of the joints from the scene entity. Defaults to None.
+
+    The names can be either joint names or a regular expression matching the joint names. If None, all
+    joints with at least one DoF are used, except the floating-base joint.
+    """
+
+    joint_ids: list[int] = field(default_factory=list)
+    """The local DoF indices of the joints from the entity. Resolved from :attr:`joint_names`."""
+
+    joint_qpos_ids: list[int] = field(default_factory=list)
+    """The local generalized coordinate indices of the joints from the entity. Resolved from :attr:`joint_names`."""
+
+    body_names: str | list[str] | None = None
+    """The names of the bodies (links) from the entity. Defaults to None, in which case all links are used.
+
+    The names can be either body names or a regular expression matching the body names.
+    """
+
+    body_ids: list[int] = field(default_factory=list)
+    """The local link indices of the bodies from the entity. Resolved from :attr:`body_names`."""
+
+    preserve_order: bool = False
+    """Whether to preserve indices ordering to match with that in the specified joint or body names.
+    Defaults to False."""
+
+    def resolve(self, scene: InteractiveScene):
+        """Resolves the scene entity and converts the joint and body names to indices.
+
+        Args:
+            scene: The interactive scene instance.
+
+        Raises:
+            KeyError: If the scene entity is not found.
+            ValueError: If the joint or body names cannot be matched.
+        """
+        if self.name in scene.sensors:
+            # the bodies of a contact sensor are indexed in the order of its data, other sensors have no bodies
+            sensor = scene[self.name]
+            if isinstance(sensor, ContactSensor):
+                if self.body_names is None:
+                    self.body_ids = list(range(sensor.num_bodies))
+                else:
+                    self.body_ids, _ = sensor.find_bodies(self.body_names, self.preserve_order)
+            return
+        entity = scene[self.name]
+        # -- joints: all joints with DoFs except the floating base (the only joint type with 7 coordinates)
+        joints = [joint for joint in entity.joints if joint.n_dofs > 0 and joint.n_qs != 7]
+        if self.joint_names is None:
+            joint_indices = list(range(len(joints)))
+        else:
+            joint_indices, _ = resolve_matching_names(
+                self.joint_names, [joint.name for joint in joints], self.preserve_order
+            )
+        self.joint_ids = [dof for i in joint_indices for dof in joints[i].dofs_idx_local]
+        self.joint_qpos_ids = [q for i in joint_indices for q in joints[i].qs_idx_local]
+        # -- bodies
+        if self.body_names is None:
+            self.body_ids = list(range(entity.n_links))
+        else:
+            self.body_ids, _ = resolve_matching_names(
+                self.body_names, [link.name for link in entity.links], self.preserve_order
+            )
+
@@ -0,0 +1,248 @@
+# Copyright 2025 genesis_lab Developers (https://github.com/Atticlmr/genesis_lab)
+#
+# Licensed under the Apache License, Version 2.0 , January 2004
+
+"""Termination manager for computing done signals for a given world."""
+
+from __future__ import annotations
+
+import torch
+from collections.abc import Sequence
+from typing import TYPE_CHECKING
+
+from .manager_base import ManagerBase, ManagerTermBase
+from .manager_term_cfg import TerminationTermCfg
+
+if TYPE_CHECKING:
+    from genesislab.envs import ManagerBasedRLEnv
+
+
+class TerminationManager(ManagerBase):
+    """Manager for computing done signals for a given world.
+
+    The termination manager computes the termination signal (also called dones) as a combination
+    of termination terms. Each termination term is a function which takes the environment as an
+    argument and returns a boolean tensor of shape (num_envs,). The termination manager
+    computes the termination signal as the union (logical or) of all the termination terms.
+
+    Following the `Gymnasium API <https://gymnasium.farama.org/tutorials/gymnasium_basics/handling_time_limits/>`_,
+    the termination signal is computed as the logical OR of the following signals:
+
+    * **Time-out**: This signal is set to true if the environment has ended after an externally defined condition
+      (that is outside the scope of a MDP). For example, the environment may be terminated if the episode has
+      timed out (i.e. reached max episode length).
+    * **Terminated**: This signal is set to true if the environment has reached a terminal state defined by the
+      environment. This state may correspond to task success, task failure, robot falling, etc.
+
+    The term results are written into the columns of a preallocated ``(num_envs, num_terms)`` tensor. The
+    time-out terms are ordered first so that the time-out and terminated signals are reduced from column
+    views of this tensor into preallocated buffers.
+    """
+
+    def __init__(self, cfg: dict[str, TerminationTermCfg], env: ManagerBasedRLEnv):
+        """Initializes the termination manager.
+
+        Args:
+            cfg: The configuration object, mapping the term names to the termination term configurations.
+            env: An environment object.
+        """
+        super().__init__(cfg, env)
+        # prepare extra info to store individual termination term information
+        self._term_dones = torch.zeros((self.num_envs, len(self._term_names)), device=self.device, dtype=torch.bool)
+        # time-out terms are stored first, so both signals are reduced from column views of the buffer
+        num_time_outs = sum(term_cfg.time_out for term_cfg in self._term_cfgs)
+        self._time_out_dones = self._term_dones[:, :num_time_outs]
+        self._terminal_dones = self._term_dones[:, num_time_outs:]
+        # create buffer for managing termination per environment
+        self._truncated_buf = torch.zeros(self.num_envs, device=self.device, dtype=torch.bool)
+        self._terminated_buf = torch.zeros_like(self._truncated_buf)
+        self._dones_buf = torch.zeros_like(self._truncated_buf)
+
+    def __str__(self) -> str:
+        """Returns: A string representation for termination manager."""
+        msg = f"<TerminationManager> contains {len(self._term_names)} active terms.\n"
+        for index, (name, term_cfg) in enumerate(zip(self._term_names, self._term_cfgs)):
+            msg += f"\t[{index}] {name}: time_out={term_cfg.time_out}\n"
+        return msg
+
+    """
+    Properties.
+    """
+
+    @property
+    def active_terms(self) -> list[str]:
+        """Name of active termination terms."""
+        return self._term_names
+
+    @property
+    def dones(self) -> torch.Tensor:
+        """The net termination signal. Shape is (num_envs,)."""
+        return self._dones_buf
+
+    @property
+    def time_outs(self) -> torch.Tensor:
+        """The timeout signal (reaching max episode length). Shape is (num_envs,).
+
+        This signal is set to true if the environment has ended after an externally defined condition
+        (that is outside the scope of a MDP). For example, the environment may be terminated if the episode has
+        timed out (i.e. reached max episode length).
+        """
+        return self._truncated_buf
+
+    @property
+    def terminated(self) -> torch.Tensor:
+        """The terminated signal (reaching a terminal state). Shape is (num_envs,).
+
+        This signal is set to true if the environment has reached a terminal state defined by the environment.
+        This state may correspond to task success, task failure, robot falling, etc.
+        """
+        return self._terminated_buf
+
+    """
+    Operations.
+    """
+
+    def reset(self, env_ids: torch.Tensor | None = None) -> dict[str, torch.Tensor]:
+        """Returns the episodic counts of individual termination terms.
+
+        The counts are returned as tensors so that reading them does not synchronize with the device.
+
+        Args:
+            env_ids: The environment ids. Defaults to None, in which case
+                all environments are considered.
+
+        Returns:
+            Dictionary of episodic counts of individual termination terms.
+        """
+        # resolve environment ids
+        ids = slice(None) if env_ids is None else env_ids
+        # add to episode dict
+        extras = {}
+        term_counts = torch.count_nonzero(self._term_dones[ids], dim=0)
+        for term_idx, key in enumerate(self._term_names):
+            extras["Episode_Termination/" + key] = term_counts[term_idx]
+        # reset all the termination terms
+        for term_cfg in self._class_term_cfgs:
+            term_cfg.func.reset(env_ids=env_ids)
+        # return logged information
+        return extras
+
+    def get_state_buffers(self) -> dict[str, torch.Tensor]:
+        buffers = {"term_dones": self._term_dones}
+        buffers.update(self._get_class_term_state_buffers(self._term_names, self._term_cfgs))
+        return buffers
+
+    def compute(self) -> torch.Tensor:
+        """Computes the termination signal as union of individual terms.
+
+        This function calls each termination term managed by the class and performs a logical OR operation
+        to compute the net termination signal.
+
+        Returns:
+            The combined termination signal of shape (num_envs,).
+        """
+        # iterate over all the termination terms
+        for term_idx, term_cfg in enumerate(self._term_cfgs):
+            value = term_cfg.func(self._env, **term_cfg.params)
+            self._term_dones[:, term_idx] = value
+        # reduce the columns into the time-out and terminated signals
+        torch.any(self._time_out_dones, dim=1, out=self._truncated_buf)
+        torch.any(self._terminal_dones, dim=1, out=self._terminated_buf)
+        # return combined termination signal
+        torch.logical_or(self._truncated_buf, self._terminated_buf, out=self._dones_buf)
+        return self._dones_buf
+
+    def get_term(self, name: str) -> torch.Tensor:
+        """Returns the termination term with the specified name.
+
+        Args:
+            name: The name of the termination term.
+
+        Returns:
+            The corresponding termination term value. Shape is (num_envs,).
+        """
+        return self._term_dones[:, self._term_names.index(name)]
+
+    def get_active_iterable_terms(self, env_idx: int) -> Sequence[tuple[str, Sequence[float]]]:
+        """Returns the active terms as iterable sequence of tuples.
+
+        The first element of the tuple is the name of the term and the second element is the raw value(s) of the term.
+
+        Args:
+            env_idx: The specific environment to pull the active terms from.
+
+        Returns:
+            The active terms.
+        """
+        term_dones = self._term_dones[env_idx].float().cpu().tolist()
+        return [(name, [value]) for name, value in zip(self._term_names, term_dones)]
+
+    """
+    Term settings.
+    """
+
+    def set_term_cfg(self, term_name: str, cfg: TerminationTermCfg):
+        """Sets the configuration of the specified term into the manager.
+
+        Args:
+            term_name: The name of the termination term.
+            cfg: The configuration for the termination term.
+
+        Raises:
+            ValueError: If the term name is not found.
+        """
+        if term_name not in self._term_names:
+            raise ValueError(f"Termination term '{term_name}' not found.")
+        # set the configuration
+        self._term_cfgs[self._term_names.index(term_name)] = cfg
+
+    def get_term_cfg(self, term_name: str) -> TerminationTermCfg:
+        """Gets the configuration for the specified term.
+
+        Args:
+            term_name: The name of the termination term.
+
+        Returns:
+            The configuration of the termination term.
+
+        Raises:
+            ValueError: If the term name is not found.
+        """
+        if term_name not in self._term_names:
+            raise ValueError(f"Termination term '{term_name}' not found.")
+        # return the configuration
+        return self._term_cfgs[self._term_names.index(term_name)]
+
+    """
+    Helper functions.
+    """
+
+    def _prepare_terms(self):
+        # parse termination terms and store their information
+        self._term_names: list[str] = list()
+        self._term_cfgs: list[TerminationTermCfg] = list()
+        self._class_term_cfgs: list[TerminationTermCfg] = list()
+
+        # iterate over all the terms
+        for term_name, term_cfg in self.cfg.items():
+            # check for non config
+            if term_cfg is None:
+                continue
+            # check for valid config type
+            if not isinstance(term_cfg, TerminationTermCfg):
+                raise TypeError(
+                    f"Configuration for the term '{term_name}' is not of type TerminationTermCfg."
+                    f" Received: '{type(term_cfg)}'."
+                )
+            # resolve common parameters
+            self._resolve_common_term_cfg(term_name, term_cfg, min_argc=1)
+            # add function to list
+            self._term_names.append(term_name)
+            self._term_cfgs.append(term_cfg)
+            # check if the term is a class
+            if isinstance(term_cfg.func, ManagerTermBase):
+                self._class_term_cfgs.append(term_cfg)
+        # order the time-out terms first (the sort is stable, so the configured order is kept otherwise)
+        order = sorted(range(len(self._term_cfgs)), key=lambda i: not self._term_cfgs[i].time_out)
+        self._term_names = [self._term_names[i] for i in order]
+        self._term_cfgs = [self._term_cfgs[i] for i in order]
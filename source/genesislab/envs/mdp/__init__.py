@@ -0,0 +1,17 @@
+# Copyright 2025 genesis_lab Developers (https://github.com/Atticlmr/genesis_lab)
+#
+# Licensed under the Apache License, Version 2.0 , January 2004
+
+"""Sub-module with implementation of manager terms.
+
+The functions can be provided to different managers that are responsible for the
+different aspects of the MDP. These include the observation, reward, termination,
+actions, events and commands managers.
+"""
+
+from .actions import *
+from .commands import *
+from .events import *
+from .observations import *
+from .rewards import *
+from .terminations import *
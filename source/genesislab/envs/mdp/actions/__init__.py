@@ -0,0 +1,9 @@
+# Copyright 2025 genesis_lab Developers (https://github.com/Atticlmr/genesis_lab)
+#
+# Licensed under the Apache License, Version 2.0 , January 2004
+
+"""Various action terms that can be used in the environment."""
+
+from .actions_cfg import *
+from .joint_actions import *
+from .task_space_actions import *
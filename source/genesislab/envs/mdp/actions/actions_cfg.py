@@ -0,0 +1,88 @@
+# Copyright 2025 genesis_lab Developers (https://github.com/Atticlmr/genesis_lab)
+#
+# Licensed under the Apache License, Version 2.0 , January 2004
+
+"""Configurations for the action terms."""
+
+from __future__ import annotations
+
+from dataclasses import MISSING, dataclass
+
+from genesislab.controllers import DifferentialIKControllerCfg
+from genesislab.envs.managers import ActionTermCfg
+
+from . import joint_actions, task_space_actions
+
+
+@dataclass(kw_only=True)
+class JointActionCfg(ActionTermCfg):
+    """Configuration for the base joint action term.
+
+    See :class:`JointAction` for more details.
+    """
+
+    joint_names: str | list[str] | None = None
+    """List of joint names or regex expressions that the action will be mapped to.
+    Defaults to None, in which case all actuated joints are used."""
+
+    scale: float = 1.0
+    """Scale factor for the action. Defaults to 1.0."""
+
+    offset: float = 0.0
+    """Offset factor for the action. Defaults to 0.0."""
+
+    preserve_order: bool = False
+    """Whether to preserve the order of the joint names in the action output. Defaults to False."""
+
+
+@dataclass(kw_only=True)
+class JointPositionActionCfg(JointActionCfg):
+    """Configuration for the joint position action term.
+
+    See :class:`JointPositionAction` for more details.
+    """
+
+    class_type: type = joint_actions.JointPositionAction
+
+    use_default_offset: bool = True
+    """Whether to use default joint positions configured in the scene as offset. Defaults to True.
+
+    If True, this flag results in overwriting the values of :attr:`offset` to the default joint positions
+    from the scene configuration.
+    """
+
+
+@dataclass(kw_only=True)
+class JointEffortActionCfg(JointActionCfg):
+    """Configuration for the joint effort action term.
+
+    See :class:`JointEffortAction` for more details.
+    """
+
+    class_type: type = joint_actions.JointEffortAction
+
+
+@dataclass(kw_only=True)
+class DifferentialInverseKinematicsActionCfg(ActionTermCfg):
+    """Configuration for the differential inverse kinematics action term.
+
+    See :class:`DifferentialInverseKinematicsAction` for more details.
+    """
+
+    class_type: type = task_space_actions.DifferentialInverseKinematicsAction
+
+    joint_names: str | list[str] = MISSING
+    """List of joint names or regex expressions that the action will be mapped to."""
+
+    body_name: str = MISSING
+    """Name of the body or frame for which IK is performed."""
+
+    body_offset: tuple[float, float, float] | None = None
+    """Position of the controlled point in the frame of the body (in m). Defaults to None,
+    in which case the origin of the body is controlled."""
+
+    scale: float | tuple[float, ...] = 1.0
+    """Scale factor for the action. Defaults to 1.0."""
+
+    controller: DifferentialIKControllerCfg = MISSING
+    """The configuration for the differential IK controller."""
@@ -0,0 +1,119 @@
+# Copyright 2025 genesis_lab Developers (https://github.com/Atticlmr/genesis_lab)
+#
+# Licensed under the Apache License, Version 2.0 , January 2004
+
+"""Action terms that map the actions onto the joints of a Genesis entity."""
+
+from __future__ import annotations
+
+import torch
+from typing import TYPE_CHECKING
+
+from genesislab.envs.managers import ActionTerm, SceneEntityCfg
+
+if TYPE_CHECKING:
+    from genesislab.envs import ManagerBasedRLEnv
+
+    from . import actions_cfg
+
+
+class JointAction(ActionTerm):
+    r"""Base class for joint actions.
+
+    This action term performs pre-processing of the raw actions using affine transformations (scale and offset).
+    These transformations can be configured to be applied to a subset of the entity's joints.
+
+    Mathematically, the action term is defined as:
+
+    .. math::
+
+       \text{action} = \text{offset} + \text{scaling} \times \text{input action}
+
+    where :math:`\text{action}` is the action that is sent to the entity's actuated joints, :math:`\text{offset}`
+    is the offset applied to the input action, :math:`\text{scaling}` is the scaling applied to the input
+    action, and :math:`\text{input action}` is the input action from the user.
+
+    The raw and processed action buffers are allocated once and updated in place at every step.
+    """
+
+    cfg: actions_cfg.JointActionCfg
+    """The configuration of the action term."""
+
+    def __init__(self, cfg: actions_cfg.JointActionCfg, env: ManagerBasedRLEnv) -> None:
+        # initialize the action term
+        super().__init__(cfg, env)
+
+        # resolve the joints over which the action term is applied
+        self._entity_cfg = SceneEntityCfg(
+            cfg.asset_name, joint_names=cfg.joint_names, preserve_order=cfg.preserve_order
+        )
+        self._entity_cfg.resolve(env.scene)
+        self._joint_ids = self._entity_cfg.joint_ids
+        self._num_joints = len(self._joint_ids)
+
+        # create tensors for raw and processed actions
+        self._raw_actions = torch.zeros(self.num_envs, self.action_dim, device=self.device)
+        self._processed_actions = torch.zeros_like(self._raw_actions)
+
+        # parse scale and offset
+        self._scale = float(cfg.scale)
+        self._offset = torch.full((self.num_envs, self.action_dim), float(cfg.offset), device=self.device)
+
+    """
+    Properties.
+    """
+
+    @property
+    def action_dim(self) -> int:
+        return self._num_joints
+
+    @property
+    def raw_actions(self) -> torch.Tensor:
+        return self._raw_actions
+
+    @property
+    def processed_actions(self) -> torch.Tensor:
+        return self._processed_actions
+
+    """
+    Operations.
+    """
+
+    def process_actions(self, actions: torch.Tensor):
+        # store the raw actions
+        self._raw_actions.copy_(actions)
+        # apply the affine transformations
+        torch.mul(self._raw_actions, self._scale, out=self._processed_actions)
+        self._processed_actions.add_(self._offset)
+
+    def reset(self, env_ids: torch.Tensor | None = None) -> None:
+        self._raw_actions[slice(None) if env_ids is None else env_ids] = 0.0
+
+
+class JointPositionAction(JointAction):
+    """Joint action term that applies the processed actions to the entity's joints as position commands."""
+
+    cfg: actions_cfg.JointPositionActionCfg
+    """The configuration of the action term."""
+
+    def __init__(self, cfg: actions_cfg.JointPositionActionCfg, env: ManagerBasedRLEnv):
+        # initialize the action term
+        super().__init__(cfg, env)
+        # use default joint positions as offset
+        if cfg.use_default_offset:
+            self._offset.copy_(env.scene.default_qpos[cfg.asset_name][:, self._entity_cfg.joint_qpos_ids])
+
+    def apply_actions(self):
+        # set position targets
+        self._asset.control_dofs_position(self.processed_actions, dofs_idx_local=self._joint_ids)
+
+
+class JointEffortAction(JointAction):
+    """Joint action term that applies the processed actions to the entity's joints as effort commands."""
+
+    cfg: actions_cfg.JointEffortActionCfg
+    """The configuration of the action term."""
+
+    def apply_actions(self):
+        # set joint effort targets
+        self._asset.control_dofs_force(self.processed_actions, dofs_idx_local=self._joint_ids)
@@ -0,0 +1,139 @@
+# Copyright 2025 genesis_lab Developers (https://github.com/Atticlmr/genesis_lab)
+#
+# Licensed under the Apache License, Version 2.0 , January 2004
+
+"""Action terms that command a body of a Genesis entity in task space."""
+
+from __future__ import annotations
+
+import torch
+from typing import TYPE_CHECKING
+
+from genesislab.controllers import DifferentialIKController
+from genesislab.envs.managers import ActionTerm, SceneEntityCfg
+from genesislab.utils.math import quat_apply
+
+if TYPE_CHECKING:
+    from genesislab.envs import ManagerBasedRLEnv
+
+    from . import actions_cfg
+
+
+class DifferentialInverseKinematicsAction(ActionTerm):
+    r"""Inverse Kinematics action term.
+
+    This action term performs pre-processing of the raw actions using scaling transformation.
+
+    .. math::
+        \text{action} = \text{scaling} \times \text{input action}
+        \text{joint position} = J^{-} \times \text{action}
+
+    where :math:`\text{scaling}` is the scaling applied to the input action, and :math:`\text{input action}`
+    is the input action from the user, :math:`J` is the Jacobian over the entity's actuated joints,
+    and :math:`\text{joint position}` is the desired joint positions that are sent to the entity's
+    joint position controllers.
+
+    The IK is solved once per environment step: the target pose is set from the processed actions, and the joint
+    targets are solved by the batched :class:`DifferentialIKController` with the Jacobian of the current
+    configuration, which is read for all the environments with one Genesis call. The joint targets are written into
+    a preallocated buffer, which the simulation steps of the environment step send to the joint position
+    controllers.
+    """
+
+    cfg: actions_cfg.DifferentialInverseKinematicsActionCfg
+    """The configuration of the action term."""
+
+    def __init__(self, cfg: actions_cfg.DifferentialInverseKinematicsActionCfg, env: ManagerBasedRLEnv):
+        # initialize the action term
+        super().__init__(cfg, env)
+
+        # resolve the joints over which the action term is applied
+        entity_cfg = SceneEntityCfg(cfg.asset_name, joint_names=cfg.joint_names)
+        entity_cfg.resolve(env.scene)
+        self._joint_ids = entity_cfg.joint_ids
+        self._num_joints = len(self._joint_ids)
+        default_joint_pos = env.scene.default_qpos[cfg.asset_name][:, entity_cfg.joint_qpos_ids]
+        self._body = self._asset.get_link(cfg.body_name)
+
+        # offset of the controlled point in the frame of the body
+        self._body_offset = None
+        if cfg.body_offset is not None:
+            self._body_offset = torch.tensor(cfg.body_offset, device=self.device)
+
+        # create the differential IK controller
+        self._ik_controller = DifferentialIKController(cfg=cfg.controller, num_envs=self.num_envs, device=self.device)
+
+        # create tensors for raw and processed actions
+        self._raw_actions = torch.zeros(self.num_envs, self.action_dim, device=self.device)
+        self._processed_actions = torch.zeros_like(self._raw_actions)
+        # joint targets solved at every environment step
+        self._joint_pos_des = default_joint_pos.clone()
+
+        # save the scale as tensors
+        self._scale = torch.zeros(self.action_dim, device=self.device)
+        self._scale[:] = torch.tensor(cfg.scale, device=self.device)
+
+    """
+    Properties.
+    """
+
+    @property
+    def action_dim(self) -> int:
+        return self._ik_controller.action_dim
+
+    @property
+    def raw_actions(self) -> torch.Tensor:
+        return self._raw_actions
+
+    @property
+    def processed_actions(self) -> torch.Tensor:
+        return self._processed_actions
+
+    """
+    Operations.
+    """
+
+    def process_actions(self, actions: torch.Tensor):
+        # store the raw actions
+        self._raw_actions.copy_(actions)
+        torch.mul(self._raw_actions, self._scale, out=self._processed_actions)
+        # obtain quantities from simulation
+        ee_pos_curr, ee_quat_curr = self._compute_frame_pose()
+        # set command into controller
+        self._ik_controller.set_command(self._processed_actions, ee_pos_curr, ee_quat_curr)
+        # solve the IK once per environment step with the Jacobian of the current configuration
+        joint_pos = self._asset.get_dofs_position(self._joint_ids)
+        jacobian = self._compute_frame_jacobian()
+        self._joint_pos_des.copy_(self._ik_controller.compute(ee_pos_curr, ee_quat_curr, jacobian, joint_pos))
+
+    def apply_actions(self):
+        # set the joint position command solved for the environment step
+        self._asset.control_dofs_position(self._joint_pos_des, dofs_idx_local=self._joint_ids)
+
+    def reset(self, env_ids: torch.Tensor | None = None) -> None:
+        self._raw_actions[slice(None) if env_ids is None else env_ids] = 0.0
+
+    """
+    Helper functions.
+    """
+
+    def _compute_frame_pose(self) -> tuple[torch.Tensor, torch.Tensor]:
+        """Computes the pose of the controlled point in the world frame.
+
+        Returns:
+            A tuple of the position (num_envs, 3) and the orientation (w, x, y, z) (num_envs, 4).
+        """
+        ee_pos = self._body.get_pos()
+        ee_quat = self._body.get_quat()
+        if self._body_offset is not None:
+            ee_pos = ee_pos + quat_apply(ee_quat, self._body_offset.expand_as(ee_pos))
+        return ee_pos, ee_quat
+
+    def _compute_frame_jacobian(self) -> torch.Tensor:
+        """Computes the Jacobian of the controlled point over the actuated joints.
+
+        Returns:
+            The Jacobian in the world frame. Shape is (num_envs, 6, num_joints).
+        """
+        jacobian = self._asset.get_jacobian(self._body, local_point=self._body_offset)
+        return jacobian[:, :, self._joint_ids]
@@ -0,0 +1,8 @@
+# Copyright 2025 genesis_lab Developers (https://github.com/Atticlmr/genesis_lab)
+#
+# Licensed under the Apache License, Version 2.0 , January 2004
+
+"""Various command terms that can be used in the environment."""
+
+from .commands_cfg import UniformVelocityCommandCfg
+from .velocity_command import UniformVelocityCommand
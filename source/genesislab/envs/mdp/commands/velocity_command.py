@@ -0,0 +1,122 @@
+# Copyright 2025 genesis_lab Developers (https://github.com/Atticlmr/genesis_lab)
+#
+# Licensed under the Apache License, Version 2.0 , January 2004
+
+"""Sub-module containing command generators for the velocity-based locomotion task."""
+
+from __future__ import annotations
+
+import torch
+from typing import TYPE_CHECKING
+
+import genesislab.utils.math as math_utils
+from genesislab.envs.managers import CommandTerm
+
+if TYPE_CHECKING:
+    from genesislab.envs import ManagerBasedRLEnv
+
+    from .commands_cfg import UniformVelocityCommandCfg
+
+
+class UniformVelocityCommand(CommandTerm):
+    r"""Command generator that generates a velocity command in SE(2) from uniform distribution.
+
+    The command comprises of a linear velocity in x and y direction and an angular velocity around
+    the z-axis. It is given in the robot's base frame.
+
+    Mathematically, the angular velocity is sampled as follows:
+
+    .. math::
+
+        \omega_z \sim \mathcal{U}(\omega_{z,min}, \omega_{z,max})
+
+    Additionally, a fraction of the environments can be sampled to be standing still, in which case the
+    command is set to zero.
+    """
+
+    cfg: UniformVelocityCommandCfg
+    """The configuration of the command generator."""
+
+    def __init__(self, cfg: UniformVelocityCommandCfg, env: ManagerBasedRLEnv):
+        """Initialize the command generator.
+
+        Args:
+            cfg: The configuration of the command generator.
+            env: The environment.
+        """
+        # initialize the base class
+        super().__init__(cfg, env)
+
+        # obtain the robot asset
+        self.robot = env.scene[cfg.asset_name]
+
+        # create buffers to store the command
+        # -- command: x vel, y vel, yaw vel
+        self.vel_command_b = torch.zeros(self.num_envs, 3, device=self.device)
+        self.is_standing_env = torch.zeros(self.num_envs, dtype=torch.bool, device=self.device)
+        # -- metrics
+        self.metrics["error_vel_xy"] = torch.zeros(self.num_envs, device=self.device)
+        self.metrics["error_vel_yaw"] = torch.zeros(self.num_envs, device=self.device)
+
+    def __str__(self) -> str:
+        """Return a string representation of the command generator."""
+        msg = "UniformVelocityCommand:\n"
+        msg += f"\tCommand dimension: {tuple(self.command.shape[1:])}\n"
+        msg += f"\tResampling time range: {self.cfg.resampling_time_range}\n"
+        msg += f"\tStanding probability: {self.cfg.rel_standing_envs}"
+        return msg
+
+    """
+    Properties
+    """
+
+    @property
+    def command(self) -> torch.Tensor:
+        """The desired base velocity command in the base frame. Shape is (num_envs, 3)."""
+        return self.vel_command_b
+
+    """
+    Operations.
+    """
+
+    def get_state_buffers(self) -> dict[str, torch.Tensor]:
+        buffers = super().get_state_buffers()
+        buffers["is_standing_env"] = self.is_standing_env
+        return buffers
+
+    """
+    Implementation specific functions.
+    """
+
+    def _update_metrics(self):
+        # time for which the command was executed
+        max_command_time = self.cfg.resampling_time_range[1]
+        max_command_step = max_command_time / self._env.step_dt
+        # compute the base frame velocities
+        quat = self.robot.get_quat()
+        lin_vel_b = math_utils.quat_apply_inverse(quat, self.robot.get_vel())
+        ang_vel_b = math_utils.quat_apply_inverse(quat, self.robot.get_ang())
+        # logs data
+        self.metrics["error_vel_xy"] += (
+            torch.norm(self.vel_command_b[:, :2] - lin_vel_b[:, :2], dim=-1) / max_command_step
+        )
+        self.metrics["error_vel_yaw"] += torch.abs(self.vel_command_b[:, 2] - ang_vel_b[:, 2]) / max_command_step
+
+    def _resample_command(self, env_ids: torch.Tensor):
+        # sample velocity commands
+        r = torch.empty(len(env_ids), device=self.device)
+        # -- linear velocity - x direction
+        self.vel_command_b[env_ids, 0] = r.uniform_(*self.cfg.ranges.lin_vel_x)
+        # -- linear velocity - y direction
+        self.vel_command_b[env_ids, 1] = r.uniform_(*self.cfg.ranges.lin_vel_y)
+        # -- ang vel yaw - rotation around z
+        self.vel_command_b[env_ids, 2] = r.uniform_(*self.cfg.ranges.ang_vel_z)
+        # update standing envs
+        self.is_standing_env[env_ids] = r.uniform_(0.0, 1.0) <= self.cfg.rel_standing_envs
+
+    def _update_command(self):
+        """Post-processes the velocity command.
+
+        This function sets velocity command to zero for standing environments.
+        """
+        self.vel_command_b.masked_fill_(self.is_standing_env.unsqueeze(-1), 0.0)
@@ -0,0 +1,223 @@
+# Copyright 2025 genesis_lab Developers (https://github.com/Atticlmr/genesis_lab)
+#
+# Licensed under the Apache License, Version 2.0 , January 2004
+
+"""Common functions that can be used to enable different events.
+
+Events include anything related to altering the simulation state. This includes changing the physics
+materials, applying external forces, and resetting the state of the entities.
+
+The functions can be passed to the :class:`genesislab.envs.managers.EventTermCfg` object to enable
+the event introduced by the function. All the functions only write the state of the environments in ``env_ids``
+through the batched Genesis setters, so that environments whose episodes end at different times are reset
+independently.
+"""
+
+from __future__ import annotations
+
+import torch
+from typing import TYPE_CHECKING, Literal
+
+import genesislab.utils.math as math_utils
+from genesislab.envs.managers import EventTermCfg, ManagerTermBase, SceneEntityCfg
+
+if TYPE_CHECKING:
+    from genesislab.envs import ManagerBasedRLEnv
+
+
+"""
+Reset.
+"""
+
+
+def reset_scene_to_default(env: ManagerBasedRLEnv, env_ids: torch.Tensor | None):
+    """Reset the scene to the default state specified in the scene configuration."""
+    env.scene.reset_to_default(env_ids)
+
+
+def reset_root_state_uniform(
+    env: ManagerBasedRLEnv,
+    env_ids: torch.Tensor | None,
+    pose_range: dict[str, tuple[float, float]],
+    velocity_range: dict[str, tuple[float, float]],
+    asset_cfg: SceneEntityCfg = SceneEntityCfg("robot"),
+):
+    """Reset the asset root state to a random position and velocity uniformly within the given ranges.
+
+    This function randomizes the root position and velocity of the asset.
+
+    * It samples the root position from the given ranges and adds them to the default root position, before setting
+      them into the physics simulation.
+    * It samples the root orientation from the given ranges and sets them into the physics simulation.
+    * It samples the root velocity from the given ranges and sets them into the physics simulation.
+
+    The function takes a dictionary of pose and velocity ranges for each axis and rotation. The keys of the
+    dictionary are ``x``, ``y``, ``z``, ``roll``, ``pitch``, and ``yaw``. The values are tuples of the form
+    ``(min, max)``. If the dictionary does not contain a key, the position or velocity is set to zero for that axis.
+
+    Note:
+        The asset must have a floating base, whose first seven generalized coordinates are the root position and
+        the root orientation (w, x, y, z), and whose first six DoFs are the root linear and angular velocities.
+    """
+    asset = env.scene[asset_cfg.name]
+    if env_ids is None:
+        env_ids = torch.arange(env.num_envs, device=env.device)
+    # get default root state
+    default_root_pose = env.scene.default_qpos[asset_cfg.name][env_ids, :7]
+
+    # poses
+    range_list = [pose_range.get(key, (0.0, 0.0)) for key in ["x", "y", "z", "roll", "pitch", "yaw"]]
+    ranges = torch.tensor(range_list, device=env.device)
+    rand_samples = math_utils.sample_uniform(ranges[:, 0], ranges[:, 1], (len(env_ids), 6), device=env.device)
+
+    positions = default_root_pose[:, 0:3] + env.scene.env_origins[env_ids] + rand_samples[:, 0:3]
+    orientations_delta = math_utils.quat_from_euler_xyz(rand_samples[:, 3], rand_samples[:, 4], rand_samples[:, 5])
+    orientations = math_utils.quat_mul(default_root_pose[:, 3:7], orientations_delta)
+    # velocities
+    range_list = [velocity_range.get(key, (0.0, 0.0)) for key in ["x", "y", "z", "roll", "pitch", "yaw"]]
+    ranges = torch.tensor(range_list, device=env.device)
+    velocities = math_utils.sample_uniform(ranges[:, 0], ranges[:, 1], (len(env_ids), 6), device=env.device)
+
+    # set into the physics simulation
+    asset.set_qpos(torch.cat((positions, orientations), dim=-1), qs_idx_local=range(7), envs_idx=env_ids)
+    asset.set_dofs_velocity(velocities, dofs_idx_local=range(6), envs_idx=env_ids)
+
+
+def reset_joints_by_scale(
+    env: ManagerBasedRLEnv,
+    env_ids: torch.Tensor | None,
+    position_range: tuple[float, float],
+    velocity_range: tuple[float, float],
+    asset_cfg: SceneEntityCfg,
+):
+    """Reset the asset joint states by scaling the default position by a random value in the given range.
+
+    This function samples random values from the given ranges and scales the default joint positions with them.
+    The joint velocities are sampled from the velocity range, since the default joint velocities are zero.
+    """
+    asset = env.scene[asset_cfg.name]
+    if env_ids is None:
+        env_ids = torch.arange(env.num_envs, device=env.device)
+    num_joints = len(asset_cfg.joint_ids)
+    # get default joint state and scale it
+    joint_pos = env.scene.default_qpos[asset_cfg.name][env_ids][:, asset_cfg.joint_qpos_ids]
+    joint_pos *= math_utils.sample_uniform(*position_range, (len(env_ids), num_joints), device=env.device)
+    joint_vel = math_utils.sample_uniform(*velocity_range, (len(env_ids), num_joints), device=env.device)
+    # set into the physics simulation
+    asset.set_dofs_position(joint_pos, dofs_idx_local=asset_cfg.joint_ids, envs_idx=env_ids, zero_velocity=False)
+    asset.set_dofs_velocity(joint_vel, dofs_idx_local=asset_cfg.joint_ids, envs_idx=env_ids)
+
+
+def reset_joints_by_offset(
+    env: ManagerBasedRLEnv,
+    env_ids: torch.Tensor | None,
+    position_range: tuple[float, float],
+    velocity_range: tuple[float, float],
+    asset_cfg: SceneEntityCfg,
+):
+    """Reset the asset joint states with offsets around the default position and velocity by the given ranges.
+
+    This function samples random values from the given ranges and biases the default joint positions with them.
+    """
+    asset = env.scene[asset_cfg.name]
+    if env_ids is None:
+        env_ids = torch.arange(env.num_envs, device=env.device)
+    num_joints = len(asset_cfg.joint_ids)
+    # get default joint state and bias it
+    joint_pos = env.scene.default_qpos[asset_cfg.name][env_ids][:, asset_cfg.joint_qpos_ids]
+    joint_pos += math_utils.sample_uniform(*position_range, (len(env_ids), num_joints), device=env.device)
+    joint_vel = math_utils.sample_uniform(*velocity_range, (len(env_ids), num_joints), device=env.device)
+    # set into the physics simulation
+    asset.set_dofs_position(joint_pos, dofs_idx_local=asset_cfg.joint_ids, envs_idx=env_ids, zero_velocity=False)
+    asset.set_dofs_velocity(joint_vel, dofs_idx_local=asset_cfg.joint_ids, envs_idx=env_ids)
+
+
+"""
+Interval.
+"""
+
+
+def push_by_setting_velocity(
+    env: ManagerBasedRLEnv,
+    env_ids: torch.Tensor | None,
+    velocity_range: dict[str, tuple[float, float]],
+    asset_cfg: SceneEntityCfg = SceneEntityCfg("robot"),
+):
+    """Push the asset by setting the root velocity to a random value within the given ranges.
+
+    This creates an effect similar to pushing the asset with a random impulse that changes the asset's velocity.
+    It samples the root velocity from the given ranges and adds it to the current root velocity of the asset.
+
+    The function takes a dictionary of velocity ranges for each axis and rotation. The keys of the dictionary
+    are ``x``, ``y``, ``z``, ``roll``, ``pitch``, and ``yaw``. The values are tuples of the form ``(min, max)``.
+    If the dictionary does not contain a key, the velocity is set to zero for that axis.
+    """
+    asset = env.scene[asset_cfg.name]
+    if env_ids is None:
+        env_ids = torch.arange(env.num_envs, device=env.device)
+    # velocities
+    vel_w = asset.get_dofs_velocity(dofs_idx_local=range(6), envs_idx=env_ids)
+    range_list = [velocity_range.get(key, (0.0, 0.0)) for key in ["x", "y", "z", "roll", "pitch", "yaw"]]
+    ranges = torch.tensor(range_list, device=env.device)
+    vel_w += math_utils.sample_uniform(ranges[:, 0], ranges[:, 1], vel_w.shape, device=env.device)
+    # set the velocities into the physics simulation
+    asset.set_dofs_velocity(vel_w, dofs_idx_local=range(6), envs_idx=env_ids)
+
+
+"""
+Randomization.
+"""
+
+
+class randomize_rigid_body_mass(ManagerTermBase):
+    """Randomize the mass of the bodies by adding, scaling, or setting random values.
+
+    The default masses of the bodies are read once when the term is created, so that repeated scaling or adding
+    does not compound over the resets. The masses of the environments in ``env_ids`` are written with one
+    batched call.
+
+    .. note::
+        Per-environment link masses require the scene to be created with ``batch_links_info=True`` in
+        :attr:`SimCfg.rigid_options`.
+    """
+
+    def __init__(self, cfg: EventTermCfg, env: ManagerBasedRLEnv):
+        """Initialize the term.
+
+        Args:
+            cfg: The configuration of the event term.
+            env: The environment instance.
+        """
+        super().__init__(cfg, env)
+        self.asset_cfg: SceneEntityCfg = cfg.params["asset_cfg"]
+        self.asset = env.scene[self.asset_cfg.name]
+        # default masses of the selected bodies
+        self.default_mass = self.asset.get_links_mass(links_idx_local=self.asset_cfg.body_ids).clone()
+
+    def __call__(
+        self,
+        env: ManagerBasedRLEnv,
+        env_ids: torch.Tensor | None,
+        mass_distribution_params: tuple[float, float],
+        operation: Literal["add", "scale", "abs"],
+        asset_cfg: SceneEntityCfg,
+    ):
+        if env_ids is None:
+            env_ids = torch.arange(env.num_envs, device=env.device)
+        default_mass = self.default_mass[env_ids] if self.default_mass.dim() == 2 else self.default_mass
+        samples = math_utils.sample_uniform(
+            *mass_distribution_params, (len(env_ids), len(asset_cfg.body_ids)), device=env.device
+        )
+        # apply the operation on the default masses
+        if operation == "add":
+            masses = default_mass + samples
+        elif operation == "scale":
+            masses = default_mass * samples
+        elif operation == "abs":
+            masses = samples
+        else:
+            raise ValueError(
+                f"Unknown operation: '{operation}' for mass randomization. Please use 'add', 'scale', or 'abs'."
+            )
+        # set the masses into the physics simulation
+        self.asset.set_links_mass(masses, links_idx_local=asset_cfg.body_ids, envs_idx=env_ids)
@@ -0,0 +1,178 @@
+# Copyright 2025 genesis_lab Developers (https://github.com/Atticlmr/genesis_lab)
+#
+# Licensed under the Apache License, Version 2.0 , January 2004
+
+"""Common functions that can be used to create observation terms.
+
+The functions can be passed to the :class:`genesislab.envs.managers.ObservationTermCfg` object to enable
+the observation introduced by the function.
+"""
+
+from __future__ import annotations
+
+import torch
+from typing import TYPE_CHECKING
+
+import genesislab.utils.math as math_utils
+from genesislab.envs.managers import SceneEntityCfg
+
+if TYPE_CHECKING:
+    from genesislab.envs import ManagerBasedRLEnv
+
+
+"""
+Root state.
+"""
+
+
+def base_pos_z(env: ManagerBasedRLEnv, asset_cfg: SceneEntityCfg = SceneEntityCfg("robot")) -> torch.Tensor:
+    """Root height in the simulation world frame."""
+    asset = env.scene[asset_cfg.name]
+    return asset.get_pos()[:, 2:3]
+
+
+def base_lin_vel(env: ManagerBasedRLEnv, asset_cfg: SceneEntityCfg = SceneEntityCfg("robot")) -> torch.Tensor:
+    """Root linear velocity in the asset's root frame."""
+    asset = env.scene[asset_cfg.name]
+    return math_utils.quat_apply_inverse(asset.get_quat(), asset.get_vel())
+
+
+def base_ang_vel(env: ManagerBasedRLEnv, asset_cfg: SceneEntityCfg = SceneEntityCfg("robot")) -> torch.Tensor:
+    """Root angular velocity in the asset's root frame."""
+    asset = env.scene[asset_cfg.name]
+    return math_utils.quat_apply_inverse(asset.get_quat(), asset.get_ang())
+
+
+def projected_gravity(env: ManagerBasedRLEnv, asset_cfg: SceneEntityCfg = SceneEntityCfg("robot")) -> torch.Tensor:
+    """Gravity projection on the asset's root frame.
+
+    The unit gravity vector (0, 0, -1) is rotated into the root frame in closed form, which is the negated
+    last row of the rotation matrix of the root orientation.
+    """
+    asset = env.scene[asset_cfg.name]
+    w, x, y, z = asset.get_quat().unbind(dim=-1)
+    return torch.stack((2.0 * (w * y - x * z), -2.0 * (y * z + w * x), 2.0 * (x * x + y * y) - 1.0), dim=-1)
+
+
+"""
+Sensors.
+"""
+
+
+def height_scan(env: ManagerBasedRLEnv, sensor_cfg: SceneEntityCfg, offset: float = 0.5) -> torch.Tensor:
+    """Height scan from the given ray-caster sensor.
+
+    The height of the sensor above the hit point of each ray, minus the offset. The rays that miss the terrain
+    return infinite values, which are expected to be clipped by the observation term.
+    """
+    sensor = env.scene[sensor_cfg.name]
+    data = sensor.data
+    return data.pos_w[:, 2:3] - data.ray_hits_w[..., 2] - offset
+
+
+def image(
+    env: ManagerBasedRLEnv, sensor_cfg: SceneEntityCfg, data_type: str = "rgb", normalize: bool = True
+) -> torch.Tensor:
+    """Images of the given data type from the given camera sensor.
+
+    If normalized, the color images are scaled to [0, 1] and the mean of each image is subtracted, and the depth
+    images are returned as is.
+    """
+    sensor = env.scene[sensor_cfg.name]
+    images = sensor.data.output[data_type]
+    if data_type == "rgb":
+        images = images.float()
+        if normalize:
+            images = images / 255.0
+            images = images - images.mean(dim=(1, 2), keepdim=True)
+    return images
+
+
+def imu_ang_vel(env: ManagerBasedRLEnv, sensor_cfg: SceneEntityCfg) -> torch.Tensor:
+    """Angular velocity in the frame of the given IMU sensor."""
+    sensor = env.scene[sensor_cfg.name]
+    return sensor.data.ang_vel_b
+
+
+def imu_lin_acc(env: ManagerBasedRLEnv, sensor_cfg: SceneEntityCfg) -> torch.Tensor:
+    """Linear acceleration, plus the gravity bias, in the frame of the given IMU sensor."""
+    sensor = env.scene[sensor_cfg.name]
+    return sensor.data.lin_acc_b
+
+
+def imu_projected_gravity(env: ManagerBasedRLEnv, sensor_cfg: SceneEntityCfg) -> torch.Tensor:
+    """Gravity projection on the frame of the given IMU sensor."""
+    sensor = env.scene[sensor_cfg.name]
+    return sensor.data.projected_gravity_b
+
+
+def frame_pos_source(env: ManagerBasedRLEnv, sensor_cfg: SceneEntityCfg) -> torch.Tensor:
+    """Positions of the target frames in the source frame of the given frame-transformer sensor.
+
+    The positions of all the target frames are flattened into one vector per environment.
+    """
+    sensor = env.scene[sensor_cfg.name]
+    return sensor.data.target_pos_source.flatten(start_dim=1)
+
+
+"""
+Joint state.
+
+The joint terms take the asset configuration as a mandatory parameter, so that its joint names are resolved
+into indices by the manager.
+"""
+
+
+def joint_pos(env: ManagerBasedRLEnv, asset_cfg: SceneEntityCfg) -> torch.Tensor:
+    """The joint positions of the asset.
+
+    Note: Only the joints configured in :attr:`asset_cfg.joint_ids` will have their positions returned.
+    """
+    asset = env.scene[asset_cfg.name]
+    return asset.get_dofs_position(asset_cfg.joint_ids)
+
+
+def joint_pos_rel(env: ManagerBasedRLEnv, asset_cfg: SceneEntityCfg) -> torch.Tensor:
+    """The joint positions of the asset w.r.t. the default joint positions.
+
+    Note: Only the joints configured in :attr:`asset_cfg.joint_ids` will have their positions returned.
+    """
+    asset = env.scene[asset_cfg.name]
+    default_joint_pos = env.scene.default_qpos[asset_cfg.name][:, asset_cfg.joint_qpos_ids]
+    return asset.get_dofs_position(asset_cfg.joint_ids) - default_joint_pos
+
+
+def joint_vel(env: ManagerBasedRLEnv, asset_cfg: SceneEntityCfg) -> torch.Tensor:
+    """The joint velocities of the asset.
+
+    Note: Only the joints configured in :attr:`asset_cfg.joint_ids` will have their velocities returned.
+    """
+    asset = env.scene[asset_cfg.name]
+    return asset.get_dofs_velocity(asset_cfg.joint_ids)
+
+
+"""
+Actions.
+"""
+
+
+def last_action(env: ManagerBasedRLEnv, action_name: str | None = None) -> torch.Tensor:
+    """The last input action to the environment.
+
+    The name of the action term for which the action is required. If None, the
+    entire action tensor is returned.
+    """
+    if action_name is None:
+        return env.action_manager.action
+    else:
+        return env.action_manager.get_term(action_name).raw_actions
+
+
+"""
+Commands.
+"""
+
+
+def generated_commands(env: ManagerBasedRLEnv, command_name: str) -> torch.Tensor:
+    """The generated command from command term in the command manager with the given name."""
+    return env.command_manager.get_command(command_name)
@@ -0,0 +1,171 @@
+# Copyright 2025 genesis_lab Developers (https://github.com/Atticlmr/genesis_lab)
+#
+# Licensed under the Apache License, Version 2.0 , January 2004
+
+"""Common functions that can be used to enable reward functions.
+
+The functions can be passed to the :class:`genesislab.envs.managers.RewardTermCfg` object to include
+the reward introduced by the function.
+"""
+
+from __future__ import annotations
+
+import torch
+from typing import TYPE_CHECKING
+
+import genesislab.utils.math as math_utils
+from genesislab.envs.managers import SceneEntityCfg
+
+from .observations import projected_gravity
+
+if TYPE_CHECKING:
+    from genesislab.envs import ManagerBasedRLEnv
+
+
+"""
+General.
+"""
+
+
+def is_alive(env: ManagerBasedRLEnv) -> torch.Tensor:
+    """Reward for being alive."""
+    return (~env.termination_manager.terminated).float()
+
+
+def is_terminated(env: ManagerBasedRLEnv) -> torch.Tensor:
+    """Penalize terminated episodes that don't correspond to episodic timeouts."""
+    return env.termination_manager.terminated.float()
+
+
+"""
+Root penalties.
+"""
+
+
+def lin_vel_z_l2(env: ManagerBasedRLEnv, asset_cfg: SceneEntityCfg = SceneEntityCfg("robot")) -> torch.Tensor:
+    """Penalize z-axis base linear velocity using L2 squared kernel."""
+    asset = env.scene[asset_cfg.name]
+    lin_vel_b = math_utils.quat_apply_inverse(asset.get_quat(), asset.get_vel())
+    return torch.square(lin_vel_b[:, 2])
+
+
+def ang_vel_xy_l2(env: ManagerBasedRLEnv, asset_cfg: SceneEntityCfg = SceneEntityCfg("robot")) -> torch.Tensor:
+    """Penalize xy-axis base angular velocity using L2 squared kernel."""
+    asset = env.scene[asset_cfg.name]
+    ang_vel_b = math_utils.quat_apply_inverse(asset.get_quat(), asset.get_ang())
+    return torch.sum(torch.square(ang_vel_b[:, :2]), dim=1)
+
+
+def flat_orientation_l2(env: ManagerBasedRLEnv, asset_cfg: SceneEntityCfg = SceneEntityCfg("robot")) -> torch.Tensor:
+    """Penalize non-flat base orientation using L2 squared kernel.
+
+    This is computed by penalizing the xy-components of the projected gravity vector.
+    """
+    return torch.sum(torch.square(projected_gravity(env, asset_cfg)[:, :2]), dim=1)
+
+
+"""
+Joint penalties.
+"""
+
+
+def joint_vel_l2(env: ManagerBasedRLEnv, asset_cfg: SceneEntityCfg) -> torch.Tensor:
+    """Penalize joint velocities on the articulation using L2 squared kernel.
+
+    NOTE: Only the joints configured in :attr:`asset_cfg.joint_ids` will have their joint velocities
+    contribute to the term.
+    """
+    asset = env.scene[asset_cfg.name]
+    return torch.sum(torch.square(asset.get_dofs_velocity(asset_cfg.joint_ids)), dim=1)
+
+
+def joint_torques_l2(env: ManagerBasedRLEnv, asset_cfg: SceneEntityCfg) -> torch.Tensor:
+    """Penalize joint torques applied on the articulation using L2 squared kernel.
+
+    NOTE: Only the joints configured in :attr:`asset_cfg.joint_ids` will have their joint torques
+    contribute to the term.
+    """
+    asset = env.scene[asset_cfg.name]
+    return torch.sum(torch.square(asset.get_dofs_control_force(asset_cfg.joint_ids)), dim=1)
+
+
+def joint_pos_target_l2(env: ManagerBasedRLEnv, target: float, asset_cfg: SceneEntityCfg) -> torch.Tensor:
+    """Penalize joint position deviation from a target value."""
+    asset = env.scene[asset_cfg.name]
+    # wrap the joint positions to (-pi, pi)
+    joint_pos = math_utils.wrap_to_pi(asset.get_dofs_position(asset_cfg.joint_ids))
+    # compute the reward
+    return torch.sum(torch.square(joint_pos - target), dim=1)
+
+
+"""
+Action penalties.
+"""
+
+
+def action_rate_l2(env: ManagerBasedRLEnv) -> torch.Tensor:
+    """Penalize the rate of change of the actions using L2 squared kernel."""
+    return torch.sum(torch.square(env.action_manager.action - env.action_manager.prev_action), dim=1)
+
+
+def action_l2(env: ManagerBasedRLEnv) -> torch.Tensor:
+    """Penalize the actions using L2 squared kernel."""
+    return torch.sum(torch.square(env.action_manager.action), dim=1)
+
+
+"""
+Contact sensor.
+"""
+
+
+def undesired_contacts(env: ManagerBasedRLEnv, threshold: float, sensor_cfg: SceneEntityCfg) -> torch.Tensor:
+    """Penalize the bodies whose contact force exceeded the threshold over the history of the contact sensor."""
+    contact_sensor = env.scene[sensor_cfg.name]
+    net_forces = contact_sensor.data.net_forces_w_history[:, sensor_cfg.body_ids]
+    is_contact = torch.amax(torch.norm(net_forces, dim=-1), dim=2) > threshold
+    return torch.sum(is_contact, dim=1).float()
+
+
+def feet_air_time(
+    env: ManagerBasedRLEnv, command_name: str, sensor_cfg: SceneEntityCfg, threshold: float
+) -> torch.Tensor:
+    """Reward long steps taken by the feet.
+
+    The reward is the sum of the air times of the feet that made contact in the last step, minus the threshold.
+    This encourages the agent to take steps longer than the threshold. No reward is given for small commands.
+    """
+    contact_sensor = env.scene[sensor_cfg.name]
+    first_contact = contact_sensor.compute_first_contact(env.step_dt)[:, sensor_cfg.body_ids]
+    last_air_time = contact_sensor.data.last_air_time[:, sensor_cfg.body_ids]
+    reward = torch.sum((last_air_time - threshold) * first_contact, dim=1)
+    # no reward for zero command
+    return reward * (torch.norm(env.command_manager.get_command(command_name)[:, :2], dim=1) > 0.1)
+
+
+"""
+Velocity-tracking rewards.
+"""
+
+
+def track_lin_vel_xy_exp(
+    env: ManagerBasedRLEnv, std: float, command_name: str, asset_cfg: SceneEntityCfg = SceneEntityCfg("robot")
+) -> torch.Tensor:
+    """Reward tracking of linear velocity commands (xy axes) using exponential kernel."""
+    asset = env.scene[asset_cfg.name]
+    lin_vel_b = math_utils.quat_apply_inverse(asset.get_quat(), asset.get_vel())
+    # compute the error
+    lin_vel_error = torch.sum(
+        torch.square(env.command_manager.get_command(command_name)[:, :2] - lin_vel_b[:, :2]), dim=1
+    )
+    return torch.exp(-lin_vel_error / std**2)
+
+
+def track_ang_vel_z_exp(
+    env: ManagerBasedRLEnv, std: float, command_name: str, asset_cfg: SceneEntityCfg = SceneEntityCfg("robot")
+) -> torch.Tensor:
+    """Reward tracking of angular velocity commands (yaw) using exponential kernel."""
+    asset = env.scene[asset_cfg.name]
+    ang_vel_b = math_utils.quat_apply_inverse(asset.get_quat(), asset.get_ang())
+    # compute the error
+    ang_vel_error = torch.square(env.command_manager.get_command(command_name)[:, 2] - ang_vel_b[:, 2])
+    return torch.exp(-ang_vel_error / std**2)
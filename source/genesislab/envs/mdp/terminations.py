@@ -0,0 +1,88 @@
+# Copyright 2025 genesis_lab Developers (https://github.com/Atticlmr/genesis_lab)
+#
+# Licensed under the Apache License, Version 2.0 , January 2004
+
+"""Common functions that can be used to activate certain terminations.
+
+The functions can be passed to the :class:`genesislab.envs.managers.TerminationTermCfg` object to enable
+the termination introduced by the function.
+"""
+
+from __future__ import annotations
+
+import torch
+from typing import TYPE_CHECKING
+
+from genesislab.envs.managers import SceneEntityCfg
+
+from .observations import projected_gravity
+
+if TYPE_CHECKING:
+    from genesislab.envs import ManagerBasedRLEnv
+
+
+"""
+MDP terminations.
+"""
+
+
+def time_out(env: ManagerBasedRLEnv) -> torch.Tensor:
+    """Terminate the episode when the episode length exceeds the maximum episode length."""
+    return env.episode_length_buf >= env.max_episode_length
+
+
+"""
+Root terminations.
+"""
+
+
+def bad_orientation(
+    env: ManagerBasedRLEnv, limit_angle: float, asset_cfg: SceneEntityCfg = SceneEntityCfg("robot")
+) -> torch.Tensor:
+    """Terminate when the asset's orientation is too far from the desired orientation limits.
+
+    This is computed by checking the angle between the projected gravity vector and the z-axis.
+    """
+    return torch.acos(-projected_gravity(env, asset_cfg)[:, 2]).abs() > limit_angle
+
+
+def root_height_below_minimum(
+    env: ManagerBasedRLEnv, minimum_height: float, asset_cfg: SceneEntityCfg = SceneEntityCfg("robot")
+) -> torch.Tensor:
+    """Terminate when the asset's root height is below the minimum height.
+
+    Note:
+        This is currently only supported for flat terrains, i.e. the minimum height is in the world frame.
+    """
+    asset = env.scene[asset_cfg.name]
+    return asset.get_pos()[:, 2] < minimum_height
+
+
+"""
+Joint terminations.
+"""
+
+
+def joint_pos_out_of_manual_limit(
+    env: ManagerBasedRLEnv, bounds: tuple[float, float], asset_cfg: SceneEntityCfg
+) -> torch.Tensor:
+    """Terminate when the asset's joint positions are outside of the configured bounds.
+
+    Note:
+        This function is similar to :func:`joint_pos_out_of_limit` but allows the user to specify the bounds manually.
+    """
+    asset = env.scene[asset_cfg.name]
+    joint_pos = asset.get_dofs_position(asset_cfg.joint_ids)
+    return torch.any(torch.logical_or(joint_pos < bounds[0], joint_pos > bounds[1]), dim=1)
+
+
+"""
+Contact sensor.
+"""
+
+
+def illegal_contact(env: ManagerBasedRLEnv, threshold: float, sensor_cfg: SceneEntityCfg) -> torch.Tensor:
+    """Terminate when the contact force on a body exceeded the threshold over the history of the contact sensor."""
+    contact_sensor = env.scene[sensor_cfg.name]
+    net_forces = contact_sensor.data.net_forces_w_history[:, sensor_cfg.body_ids]
+    return torch.any(torch.amax(torch.norm(net_forces, dim=-1), dim=2) > threshold, dim=1)
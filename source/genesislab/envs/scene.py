@@ -0,0 +1,282 @@
+# Copyright 2025 genesis_lab Developers (https://github.com/Atticlmr/genesis_lab)
+#
+# Licensed under the Apache License, Version 2.0 , January 2004
+
+"""Interactive scene wrapping a batched :class:`genesis.Scene`."""
+
+from __future__ import annotations
+
+import torch
+from typing import Any
+
+import genesis as gs
+
+from genesislab.sensors import SensorBase, SensorBaseCfg
+from genesislab.terrains import TerrainImporter
+from genesislab.utils.string import resolve_matching_names_values
+
+from .env_state import strip_prefix
+from .scene_cfg import EntityCfg, InteractiveSceneCfg, SimCfg
+
+
+class InteractiveScene:
+    """A scene that holds the Genesis simulation and the entities of all environment instances.
+
+    All environment instances are simulated in a single batched :class:`genesis.Scene`. Entities are
+    accessed by name through the ``[]`` operator and always return the underlying Genesis entity, so that
+    manager terms can use the batched Genesis getters and setters directly.
+
+    The scene also stores the default generalized coordinates ``(num_envs, n_qs)`` of every entity. These are
+    preallocated at build time and used by the reset events to write states for a subset of environments.
+
+    If a terrain is configured, it is held by a :class:`TerrainImporter` and :attr:`env_origins` is the importer's
+    origin tensor, so that curriculum updates of the importer are seen by the reset events without a copy.
+
+    The sensors are also accessed by name through the ``[]`` operator. Their clocks are advanced after every physics
+    step, and their data is computed when it is read (see :class:`~genesislab.sensors.SensorBase`).
+    """
+
+    def __init__(self, cfg: InteractiveSceneCfg, sim_cfg: SimCfg):
+        """Initialize the scene.
+
+        Args:
+            cfg: The configuration of the scene.
+            sim_cfg: The configuration of the simulation.
+        """
+        self.cfg = cfg
+        self.sim_cfg = sim_cfg
+        # create the genesis scene
+        self.sim = gs.Scene(
+            sim_options=gs.options.SimOptions(dt=sim_cfg.dt, substeps=sim_cfg.substeps, gravity=sim_cfg.gravity),
+            rigid_options=gs.options.RigidOptions(**sim_cfg.rigid_options),
+            vis_options=gs.options.VisOptions(split_envs=True),
+            renderer=getattr(gs.renderers, sim_cfg.renderer)(),
+            show_viewer=sim_cfg.show_viewer,
+        )
+        self._entities: dict[str, Any] = {}
+        self._entity_cfgs: dict[str, EntityCfg] = {}
+        self._sensors: dict[str, SensorBase] = {}
+        # populated when the scene is built
+        self.env_origins: torch.Tensor | None = None
+        self.default_qpos: dict[str, torch.Tensor] = {}
+        # add the terrain
+        self.terrain: TerrainImporter | None = None
+        if cfg.terrain is not None:
+            self.terrain = TerrainImporter(cfg.terrain, self.num_envs, self.device)
+            self.sim.add_entity(self.terrain.create_morph(), name="terrain")
+        # add the entities from the configuration
+        for name, entity_cfg in cfg.entities.items():
+            self.add_entity(name, entity_cfg)
+        # add the sensors, which may refer to the entities
+        for name, sensor_cfg in cfg.sensors.items():
+            self.add_sensor(name, sensor_cfg)
+
+    def __getitem__(self, name: str) -> Any:
+        """Return the Genesis entity or the sensor with the given name."""
+        if name in self._entities:
+            return self._entities[name]
+        if name in self._sensors:
+            return self._sensors[name]
+        raise KeyError(
+            f"Entity or sensor '{name}' not found in the scene. Available entities: {list(self._entities.keys())}."
+            f" Available sensors: {list(self._sensors.keys())}."
+        )
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._entities or name in self._sensors
+
+    """
+    Properties.
+    """
+
+    @property
+    def num_envs(self) -> int:
+        """Number of environment instances."""
+        return self.cfg.num_envs
+
+    @property
+    def device(self) -> torch.device:
+        """Device on which the simulation tensors live."""
+        return gs.device
+
+    @property
+    def physics_dt(self) -> float:
+        """The physics time-step (in s)."""
+        return self.sim_cfg.dt
+
+    @property
+    def is_built(self) -> bool:
+        """Whether the scene has been built."""
+        return self.sim.is_built
+
+    @property
+    def entities(self) -> dict[str, Any]:
+        """The Genesis entities in the scene, keyed by their name."""
+        return self._entities
+
+    @property
+    def sensors(self) -> dict[str, SensorBase]:
+        """The sensors in the scene, keyed by their name."""
+        return self._sensors
+
+    """
+    Operations.
+    """
+
+    def add_entity(self, name: str, cfg: EntityCfg) -> Any:
+        """Add an entity to the scene.
+
+        Args:
+            name: The name of the entity.
+            cfg: The configuration of the entity.
+
+        Returns:
+            The created Genesis entity.
+
+        Raises:
+            RuntimeError: If the scene has already been built.
+            ValueError: If an entity with the same name already exists.
+        """
+        if self.is_built:
+            raise RuntimeError(f"Cannot add entity '{name}' after the scene has been built.")
+        if name in self._entities:
+            raise ValueError(f"Entity '{name}' already exists in the scene.")
+        morph = getattr(gs.morphs, cfg.morph)(**cfg.morph_kwargs)
+        material = None
+        if cfg.material is not None:
+            material = getattr(gs.materials, cfg.material)(**cfg.material_kwargs)
+        entity = self.sim.add_entity(morph, material=material, name=name)
+        self._entities[name] = entity
+        self._entity_cfgs[name] = cfg
+        return entity
+
+    def add_sensor(self, name: str, cfg: SensorBaseCfg) -> SensorBase:
+        """Add a sensor to the scene.
+
+        Args:
+            name: The name of the sensor.
+            cfg: The configuration of the sensor.
+
+        Returns:
+            The created sensor.
+
+        Raises:
+            RuntimeError: If the scene has already been built.
+            ValueError: If a sensor or an entity with the same name already exists.
+        """
+        if self.is_built:
+            raise RuntimeError(f"Cannot add sensor '{name}' after the scene has been built.")
+        if name in self:
+            raise ValueError(f"Sensor '{name}' already exists in the scene.")
+        sensor = cfg.class_type(cfg, self)
+        self._sensors[name] = sensor
+        return sensor
+
+    def build(self):
+        """Build the Genesis scene for all environment instances and allocate the default state buffers."""
+        self.sim.build(n_envs=self.num_envs, env_spacing=self.cfg.env_spacing)
+        # genesis simulates all instances at the same place, the terrain spreads them over its sub-terrains
+        if self.terrain is not None:
+            self.env_origins = self.terrain.env_origins
+        else:
+            self.env_origins = torch.zeros(self.num_envs, 3, device=self.device)
+        for name, entity in self._entities.items():
+            self.default_qpos[name] = self._resolve_default_qpos(entity, self._entity_cfgs[name])
+        for sensor in self._sensors.values():
+            sensor.initialize()
+
+    def step(self):
+        """Step the physics by one time-step and advance the clock of the sensors."""
+        self.sim.step()
+        for sensor in self._sensors.values():
+            sensor.update(self.physics_dt)
+
+    def reset(self, env_ids: torch.Tensor | None = None):
+        """Reset the sensors of the given environments.
+
+        Args:
+            env_ids: The environment indices to reset. Defaults to None (all instances).
+        """
+        for sensor in self._sensors.values():
+            sensor.reset(env_ids)
+
+    def reset_to_default(self, env_ids: torch.Tensor | None = None):
+        """Write the default generalized coordinates of all entities for the given environments.
+
+        The velocities of the entities are zeroed by the Genesis setter.
+
+        Args:
+            env_ids: The environment indices to reset. Defaults to None (all instances).
+        """
+        for name, entity in self._entities.items():
+            default_qpos = self.default_qpos[name]
+            if default_qpos.shape[1] == 0:
+                continue
+            if env_ids is None:
+                entity.set_qpos(default_qpos)
+            else:
+                entity.set_qpos(default_qpos[env_ids], envs_idx=env_ids)
+
+    def get_state(self, env_ids: torch.Tensor | None = None) -> dict[str, torch.Tensor]:
+        """Read the generalized coordinates and velocities of all entities and the state of the stateful sensors
+        for the given environments.
+
+        Args:
+            env_ids: The environment indices to read. Defaults to None (all instances).
+
+        Returns:
+            The ``"{name}/qpos"`` and ``"{name}/qvel"`` tensors of the entities with degrees of freedom, of shapes
+            (num_envs, n_qs) and (num_envs, n_dofs), and the ``"{name}/{buffer_name}"`` tensors of the sensors (see
+            :meth:`SensorBase.get_state_buffers`).
+        """
+        state = {}
+        for name, entity in self._entities.items():
+            if self.default_qpos[name].shape[1] == 0:
+                continue
+            state[f"{name}/qpos"] = entity.get_qpos(envs_idx=env_ids)
+            state[f"{name}/qvel"] = entity.get_dofs_velocity(envs_idx=env_ids)
+        for name, sensor in self._sensors.items():
+            for buffer_name, value in sensor.get_state(env_ids).items():
+                state[f"{name}/{buffer_name}"] = value
+        return state
+
+    def set_state(self, state: dict[str, torch.Tensor], env_ids: torch.Tensor | None = None):
+        """Write the generalized coordinates and velocities of all entities for the given environments.
+
+        The sensors of the environments are reset, since their data no longer matches the state, and the state of
+        the stateful sensors is then restored.
+
+        Args:
+            state: The state read by :meth:`get_state`, with one row per environment to write.
+            env_ids: The environment indices to write. Defaults to None (all instances).
+        """
+        for name, entity in self._entities.items():
+            if self.default_qpos[name].shape[1] == 0:
+                continue
+            entity.set_qpos(state[f"{name}/qpos"], envs_idx=env_ids, zero_velocity=False)
+            entity.set_dofs_velocity(state[f"{name}/qvel"], envs_idx=env_ids)
+        self.reset(env_ids)
+        for name, sensor in self._sensors.items():
+            sensor.set_state(strip_prefix(state, name), env_ids)
+
+    """
+    Helper functions.
+    """
+
+    def _resolve_default_qpos(self, entity: Any, cfg: EntityCfg) -> torch.Tensor:
+        """Build the default generalized coordinates of an entity for all instances."""
+        qpos = torch.as_tensor(entity.init_qpos, dtype=torch.float, device=self.device).clone()
+        if qpos.numel() > 0:
+            # root pose of floating-base entities
+            if len(entity.joints) > 0 and entity.joints[0].type == gs.JOINT_TYPE.FREE:
+                if cfg.init_pos is not None:
+                    qpos[0:3] = torch.tensor(cfg.init_pos, device=self.device)
+                if cfg.init_quat is not None:
+                    qpos[3:7] = torch.tensor(cfg.init_quat, device=self.device)
+            # joint positions of single-dof joints
+            if len(cfg.init_joint_pos) > 0:
+                joints = [joint for joint in entity.joints if joint.n_qs == 1]
+                ids, _, values = resolve_matching_names_values(cfg.init_joint_pos, [joint.name for joint in joints])
+                qs_ids = [joints[i].qs_idx_local[0] for i in ids]
+                qpos[qs_ids] = torch.tensor(values, dtype=torch.float, device=self.device)
+        return qpos.unsqueeze(0).repeat(self.num_envs, 1)
@@ -0,0 +1,109 @@
+# Copyright 2025 genesis_lab Developers (https://github.com/Atticlmr/genesis_lab)
+#
+# Licensed under the Apache License, Version 2.0 , January 2004
+
+"""Configuration classes for the simulation and the interactive scene."""
+
+from __future__ import annotations
+
+from dataclasses import MISSING, dataclass, field
+from typing import Any, Literal
+
+from genesislab.sensors import SensorBaseCfg
+from genesislab.terrains import TerrainImporterCfg
+
+
+@dataclass(kw_only=True)
+class SimCfg:
+    """Configuration for the Genesis simulation."""
+
+    dt: float = 0.005
+    """The physics time-step (in s). Defaults to 0.005."""
+
+    substeps: int = 1
+    """The number of physics sub-steps per time-step. Defaults to 1."""
+
+    gravity: tuple[float, float, float] = (0.0, 0.0, -9.81)
+    """The gravity vector (in m/s^2). Defaults to (0.0, 0.0, -9.81)."""
+
+    backend: Literal["cpu", "gpu"] = "cpu"
+    """The Genesis backend used when Genesis has not been initialized yet. Defaults to "cpu".
+
+    If Genesis is already initialized (for instance, through the :class:`GenesisLauncher`), this value is ignored.
+    """
+
+    show_viewer: bool = False
+    """Whether to open the interactive viewer. Defaults to False."""
+
+    rigid_options: dict[str, Any] = field(default_factory=dict)
+    """Additional keyword arguments forwarded to :class:`genesis.options.RigidOptions`. Defaults to an empty dict."""
+
+    renderer: Literal["Rasterizer", "BatchRenderer"] = "Rasterizer"
+    """The name of the renderer class in :mod:`genesis.renderers` used by the cameras. Defaults to "Rasterizer".
+
+    The cameras render one image per environment. The "BatchRenderer" draws all the environments in a single pass
+    and requires a CUDA device.
+    """
+
+
+@dataclass(kw_only=True)
+class EntityCfg:
+    """Configuration for an entity added to the interactive scene.
+
+    Genesis morphs can only be created after :func:`genesis.init` is called. The morph is therefore described
+    by the name of its class in :mod:`genesis.morphs` and its keyword arguments, and instantiated when the scene
+    is created.
+    """
+
+    morph: str = MISSING
+    """The name of the morph class in :mod:`genesis.morphs`, e.g. "URDF", "MJCF", "Box" or "Plane"."""
+
+    morph_kwargs: dict[str, Any] = field(default_factory=dict)
+    """The keyword arguments used to create the morph. Defaults to an empty dict."""
+
+    material: str | None = None
+    """The name of the material class in :mod:`genesis.materials`, e.g. "Rigid". Defaults to None,
+    in which case the default material is used."""
+
+    material_kwargs: dict[str, Any] = field(default_factory=dict)
+    """The keyword arguments used to create the material. Defaults to an empty dict."""
+
+    init_pos: tuple[float, float, float] | None = None
+    """The default position of the root (in m). Defaults to None, in which case the morph position is used."""
+
+    init_quat: tuple[float, float, float, float] | None = None
+    """The default orientation of the root in (w, x, y, z). Defaults to None,
+    in which case the morph orientation is used."""
+
+    init_joint_pos: dict[str, float] = field(default_factory=dict)
+    """The default joint positions as a mapping from regular expressions over joint names to values.
+    Defaults to an empty dict, in which case the neutral configuration of the entity is used."""
+
+
+@dataclass(kw_only=True)
+class InteractiveSceneCfg:
+    """Configuration for the interactive scene."""
+
+    num_envs: int = MISSING
+    """Number of environment instances handled by the scene."""
+
+    env_spacing: tuple[float, float] = (2.0, 2.0)
+    """Spacing between the environment instances (in m). Defaults to (2.0, 2.0).
+
+    Genesis simulates all instances at the same location, so the spacing is only used for visualization.
+    """
+
+    terrain: TerrainImporterCfg | None = None
+    """The terrain of the scene. Defaults to None, in which case no terrain is added.
+
+    The terrain is added before the entities and determines the origins of the environment instances.
+    """
+
+    entities: dict[str, EntityCfg] = field(default_factory=dict)
+    """The entities to add to the scene, keyed by their name. Defaults to an empty dict."""
+
+    sensors: dict[str, SensorBaseCfg] = field(default_factory=dict)
+    """The sensors to add to the scene, keyed by their name. Defaults to an empty dict.
+
+    The sensors are created after the entities, so that they can refer to them.
+    """
@@ -1 +1,8 @@
-from .visualize import VisualizationMakers
\ No newline at end of file
+# Copyright 2025 genesis_lab Developers (https://github.com/Atticlmr/genesis_lab)
+#
+# Licensed under the Apache License, Version 2.0 , January 2004
+
+"""Sub-package for the visualization markers."""
+
+from .visualization_markers import VisualizationMarkers, VisualizationMarkersCfg
+from .visualize import VisualizationMakers
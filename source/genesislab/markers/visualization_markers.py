@@ -0,0 +1,123 @@
+# Copyright 2025 genesis_lab Developers (https://github.com/Atticlmr/genesis_lab)
+#
+# Licensed under the Apache License, Version 2.0 , January 2004
+
+"""Instanced visualization markers drawn in the Genesis viewer."""
+
+from __future__ import annotations
+
+import torch
+from dataclasses import dataclass
+from typing import Any, Literal
+
+from genesislab.utils.math import matrix_from_quat
+
+
+@dataclass(kw_only=True)
+class VisualizationMarkersCfg:
+    """Configuration for instanced visualization markers."""
+
+    marker_type: Literal["frame", "sphere"] = "frame"
+    """The geometry of the markers. Defaults to "frame".
+
+    Frames show the orientation of the markers, spheres only their position.
+    """
+
+    size: float = 0.05
+    """The length of the frame axes or the radius of the spheres (in m). Defaults to 0.05."""
+
+    color: tuple[float, float, float, float] | None = None
+    """The RGBA color of the markers. Defaults to None, in which case frames use the RGB axis colors and spheres
+    are red."""
+
+    max_instances: int | None = None
+    """The maximum number of markers drawn. Defaults to None, in which case all the markers are drawn."""
+
+
+class VisualizationMarkers:
+    """Markers drawn as a single instanced debug mesh of the Genesis scene.
+
+    All the marker poses are gathered into one ``(num_markers, 4, 4)`` tensor, copied to the host once and drawn with
+    one batched debug call, which the Genesis rasterizer renders as one mesh with many instances. The previous
+    instances are cleared before the new ones are drawn. When the markers are hidden, :meth:`visualize` returns
+    immediately, so tasks can call it unconditionally.
+    """
+
+    def __init__(self, cfg: VisualizationMarkersCfg, scene: Any):
+        """Initialize the markers.
+
+        Args:
+            cfg: The configuration of the markers.
+            scene: The built Genesis scene in which the markers are drawn.
+        """
+        self.cfg = cfg
+        self._scene = scene
+        self._node = None
+        self._is_visible = True
+
+    """
+    Properties.
+    """
+
+    @property
+    def is_visible(self) -> bool:
+        """Whether the markers are drawn."""
+        return self._is_visible
+
+    """
+    Operations.
+    """
+
+    def set_visibility(self, visible: bool):
+        """Show or hide the markers.
+
+        Args:
+            visible: Whether the markers are drawn.
+        """
+        self._is_visible = visible
+        if not visible:
+            self._clear()
+
+    def visualize(self, translations: torch.Tensor, orientations: torch.Tensor | None = None):
+        """Draw the markers at the given poses, replacing the previous ones.
+
+        Args:
+            translations: The positions of the markers in the world frame. Shape is (num_markers, 3).
+            orientations: The orientations (w, x, y, z) of the markers in the world frame. Shape is (num_markers, 4).
+                Defaults to None, in which case the markers are axis-aligned.
+        """
+        if not self._is_visible:
+            return
+        if self.cfg.max_instances is not None:
+            translations = translations[: self.cfg.max_instances]
+            orientations = orientations[: self.cfg.max_instances] if orientations is not None else None
+        self._clear()
+        if self.cfg.marker_type == "sphere":
+            color = self.cfg.color if self.cfg.color is not None else (1.0, 0.0, 0.0, 1.0)
+            self._node = self._scene.draw_debug_spheres(translations.cpu(), radius=self.cfg.size, color=color)
+        else:
+            # build all the transforms on the device and copy them to the host once
+            poses = torch.zeros(translations.shape[0], 4, 4, device=translations.device)
+            poses[:, 3, 3] = 1.0
+            poses[:, :3, 3] = translations
+            if orientations is not None:
+                poses[:, :3, :3] = matrix_from_quat(orientations)
+            else:
+                poses[:, :3, :3] = torch.eye(3, device=translations.device)
+            self._node = self._scene.draw_debug_frames(
+                poses.cpu().numpy(),
+                axis_length=self.cfg.size,
+                origin_size=0.1 * self.cfg.size,
+                axis_radius=0.05 * self.cfg.size,
+                color=self.cfg.color,
+            )
+
+    """
+    Helper functions.
+    """
+
+    def _clear(self):
+        """Remove the previously drawn instances."""
+        if self._node is not None:
+            self._scene.clear_debug_object(self._node)
+            self._node = None
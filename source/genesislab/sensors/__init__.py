@@ -0,0 +1,36 @@
+# Copyright 2025 genesis_lab Developers (https://github.com/Atticlmr/genesis_lab)
+#
+# Licensed under the Apache License, Version 2.0 , January 2004
+
+"""Sub-package with the sensors of the interactive scene.
+
+The sensors are configured in :attr:`~genesislab.envs.InteractiveSceneCfg.sensors` and accessed by name through the
+scene. Their data is computed lazily, for the environments whose last update is older than the update period of
+the sensor, when it is read.
+
+The ray-caster sensor casts a pattern of rays, generated by the functions of :mod:`genesislab.sensors.patterns`,
+against the terrain of the scene. The tiled camera renders the images of all the environments in one call. The
+contact sensor keeps a history of the contact forces on the links of an entity and their air and contact times.
+The inertial measurement unit measures the velocities and the acceleration of a link, and the frame transformer
+expresses the poses of target frames in a source frame.
+"""
+
+from . import patterns
+from .camera_data import CameraData
+from .contact_sensor import ContactSensor
+from .contact_sensor_cfg import ContactSensorCfg
+from .contact_sensor_data import ContactSensorData
+from .frame_transformer import FrameTransformer
+from .frame_transformer_cfg import FrameCfg, FrameTransformerCfg
+from .frame_transformer_data import FrameTransformerData
+from .imu import Imu
+from .imu_cfg import ImuCfg
+from .imu_data import ImuData
+from .patterns_cfg import GridPatternCfg, LidarPatternCfg, PatternBaseCfg
+from .ray_caster import RayCaster
+from .ray_caster_cfg import RayCasterCfg
+from .ray_caster_data import RayCasterData
+from .sensor_base import SensorBase
+from .sensor_base_cfg import SensorBaseCfg
+from .tiled_camera import TiledCamera
+from .tiled_camera_cfg import TiledCameraCfg
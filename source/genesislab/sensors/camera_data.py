@@ -0,0 +1,36 @@
+# Copyright 2025 genesis_lab Developers (https://github.com/Atticlmr/genesis_lab)
+#
+# Licensed under the Apache License, Version 2.0 , January 2004
+
+"""Data container of the camera sensors."""
+
+from __future__ import annotations
+
+import torch
+from dataclasses import dataclass, field
+
+
+@dataclass
+class CameraData:
+    """Data of the camera sensors."""
+
+    pos_w: torch.Tensor = None
+    """The position of the cameras in the world frame. Shape is (num_envs, 3)."""
+
+    quat_w_world: torch.Tensor = None
+    """The orientation of the cameras in (w, x, y, z) in the world frame, with the "world" convention of the camera
+    axes (forward axis +X, up axis +Z). Shape is (num_envs, 4)."""
+
+    quat_w_ros: torch.Tensor = None
+    """The orientation of the cameras in (w, x, y, z) in the world frame, with the "ros" convention of the camera
+    axes (forward axis +Z, up axis -Y). Shape is (num_envs, 4)."""
+
+    intrinsic_matrices: torch.Tensor = None
+    """The intrinsic matrices of the cameras. Shape is (num_envs, 3, 3)."""
+
+    image_shape: tuple[int, int] = None
+    """The shape (height, width) of the images."""
+
+    output: dict[str, torch.Tensor] = field(default_factory=dict)
+    """The images of the cameras, by data type. Shapes are (num_envs, height, width, num_channels), except for the
+    point clouds."""
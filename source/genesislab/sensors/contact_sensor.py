@@ -0,0 +1,212 @@
+# Copyright 2025 genesis_lab Developers (https://github.com/Atticlmr/genesis_lab)
+#
+# Licensed under the Apache License, Version 2.0 , January 2004
+
+"""Contact sensor reading the net contact forces on the links of an entity."""
+
+from __future__ import annotations
+
+import torch
+from typing import TYPE_CHECKING
+
+from genesislab.utils.string import resolve_matching_names
+
+from .contact_sensor_data import ContactSensorData
+from .sensor_base import SensorBase
+
+if TYPE_CHECKING:
+    from genesislab.envs import InteractiveScene
+
+    from .contact_sensor_cfg import ContactSensorCfg
+
+
+class ContactSensor(SensorBase):
+    """A sensor that reads the net contact forces on selected links of an entity.
+
+    The forces of all the outdated environments are read with one batched Genesis call per update and written into
+    the slot of a preallocated ``(num_envs, num_bodies, history_length, 3)`` ring buffer, so that no tensor is
+    allocated or shifted to keep the history. If :attr:`ContactSensorCfg.track_air_time` is enabled, the time spent
+    in the air and in contact by every link is accumulated on the device at each update.
+
+    The rewards and terminations of a step read the same data, so the contacts are queried from Genesis once for all
+    of them.
+    """
+
+    cfg: ContactSensorCfg
+    """The configuration of the sensor."""
+
+    def __init__(self, cfg: ContactSensorCfg, scene: InteractiveScene):
+        """Initialize the sensor.
+
+        Args:
+            cfg: The configuration of the sensor.
+            scene: The scene the sensor is added to.
+
+        Raises:
+            ValueError: If the history length is not positive.
+        """
+        if cfg.history_length < 1:
+            raise ValueError(f"The history length of the sensor must be positive. Received: {cfg.history_length}.")
+        super().__init__(cfg, scene)
+        self._data = ContactSensorData()
+
+    def __str__(self) -> str:
+        """Returns: A string representation of the sensor."""
+        msg = f"Contact sensor @ '{self.cfg.entity_name}':\n"
+        msg += f"\tupdate period (s): {self.cfg.update_period}\n"
+        msg += f"\tnumber of bodies : {self.num_bodies}\n"
+        msg += f"\tbody names       : {self.body_names}\n"
+        msg += f"\thistory length   : {self.cfg.history_length}\n"
+        msg += f"\ttrack air time   : {self.cfg.track_air_time}"
+        return msg
+
+    """
+    Properties.
+    """
+
+    @property
+    def num_bodies(self) -> int:
+        """The number of sensed links."""
+        return len(self._body_names)
+
+    @property
+    def body_names(self) -> list[str]:
+        """The names of the sensed links, in the order of the data."""
+        return self._body_names
+
+    @property
+    def data(self) -> ContactSensorData:
+        """The data of the sensor, updated for the outdated environments."""
+        self._update_outdated_buffers()
+        return self._data
+
+    """
+    Operations.
+    """
+
+    def find_bodies(self, name_keys: str | list[str], preserve_order: bool = False) -> tuple[list[int], list[str]]:
+        """Find the sensed links matching the given names.
+
+        Args:
+            name_keys: A regular expression or a list of regular expressions to match the link names.
+            preserve_order: Whether to preserve the order of the name keys in the output. Defaults to False.
+
+        Returns:
+            The indices of the links in the data of the sensor, and their names.
+        """
+        return resolve_matching_names(name_keys, self._body_names, preserve_order)
+
+    def compute_first_contact(self, dt: float, abs_tol: float = 1.0e-8) -> torch.Tensor:
+        """Returns whether the links made contact within the last ``dt`` seconds.
+
+        Args:
+            dt: The time window (in s), usually the step time of the environment.
+            abs_tol: The tolerance of the comparison. Defaults to 1.0e-8.
+
+        Returns:
+            Whether each link established contact within the time window. Shape is (num_envs, num_bodies).
+
+        Raises:
+            RuntimeError: If the sensor does not track the air time.
+        """
+        if not self.cfg.track_air_time:
+            raise RuntimeError("The contact sensor does not track the air time. Please enable 'track_air_time'.")
+        current_contact_time = self.data.current_contact_time
+        return (current_contact_time > 0.0) & (current_contact_time < dt + abs_tol)
+
+    def compute_first_air(self, dt: float, abs_tol: float = 1.0e-8) -> torch.Tensor:
+        """Returns whether the links broke contact within the last ``dt`` seconds.
+
+        Args:
+            dt: The time window (in s), usually the step time of the environment.
+            abs_tol: The tolerance of the comparison. Defaults to 1.0e-8.
+
+        Returns:
+            Whether each link broke contact within the time window. Shape is (num_envs, num_bodies).
+
+        Raises:
+            RuntimeError: If the sensor does not track the air time.
+        """
+        if not self.cfg.track_air_time:
+            raise RuntimeError("The contact sensor does not track the air time. Please enable 'track_air_time'.")
+        current_air_time = self.data.current_air_time
+        return (current_air_time > 0.0) & (current_air_time < dt + abs_tol)
+
+    def reset(self, env_ids: torch.Tensor | None = None):
+        super().reset(env_ids)
+        ids = slice(None) if env_ids is None else env_ids
+        self._data.net_forces_w[ids] = 0.0
+        self._data.net_forces_w_history[ids] = 0.0
+        self._data.history_head[ids] = 0
+        if self.cfg.track_air_time:
+            self._data.current_air_time[ids] = 0.0
+            self._data.last_air_time[ids] = 0.0
+            self._data.current_contact_time[ids] = 0.0
+            self._data.last_contact_time[ids] = 0.0
+
+    def get_state_buffers(self) -> dict[str, torch.Tensor]:
+        buffers = {
+            **self._get_clock_buffers(),
+            "net_forces_w": self._data.net_forces_w,
+            "net_forces_w_history": self._data.net_forces_w_history,
+            "history_head": self._data.history_head,
+        }
+        if self.cfg.track_air_time:
+            buffers["current_air_time"] = self._data.current_air_time
+            buffers["last_air_time"] = self._data.last_air_time
+            buffers["current_contact_time"] = self._data.current_contact_time
+            buffers["last_contact_time"] = self._data.last_contact_time
+        return buffers
+
+    """
+    Implementation.
+    """
+
+    def _initialize_impl(self):
+        self._entity = self._scene[self.cfg.entity_name]
+        body_ids, self._body_names = resolve_matching_names(
+            self.cfg.body_names, [link.name for link in self._entity.links]
+        )
+        # the forces of all the links are read at once, and only indexed if a subset is sensed
+        self._body_ids = None
+        if len(body_ids) < self._entity.n_links:
+            self._body_ids = torch.tensor(body_ids, dtype=torch.long, device=self.device)
+        # data buffers
+        num_bodies, history_length = len(body_ids), self.cfg.history_length
+        self._data.net_forces_w = torch.zeros(self.num_envs, num_bodies, 3, device=self.device)
+        self._data.net_forces_w_history = torch.zeros(self.num_envs, num_bodies, history_length, 3, device=self.device)
+        self._data.history_head = torch.zeros(self.num_envs, dtype=torch.long, device=self.device)
+        if self.cfg.track_air_time:
+            self._data.current_air_time = torch.zeros(self.num_envs, num_bodies, device=self.device)
+            self._data.last_air_time = torch.zeros_like(self._data.current_air_time)
+            self._data.current_contact_time = torch.zeros_like(self._data.current_air_time)
+            self._data.last_contact_time = torch.zeros_like(self._data.current_air_time)
+
+    def _update_buffers_impl(self, env_ids: torch.Tensor):
+        forces = self._entity.get_links_net_contact_force(envs_idx=env_ids)
+        if self._body_ids is not None:
+            forces = forces[:, self._body_ids]
+        self._data.net_forces_w[env_ids] = forces
+        # write the forces into the next slot of the ring buffer of each environment
+        head = (self._data.history_head[env_ids] + 1) % self.cfg.history_length
+        self._data.history_head[env_ids] = head
+        self._data.net_forces_w_history[env_ids, :, head] = forces
+        if not self.cfg.track_air_time:
+            return
+        # the time elapsed since the last update of the environments, before the base class advances it
+        elapsed_time = (self._timestamp[env_ids] - self._timestamp_last_update[env_ids]).unsqueeze(-1)
+        is_contact = torch.norm(forces, dim=-1) > self.cfg.force_threshold
+        current_air_time = self._data.current_air_time[env_ids]
+        current_contact_time = self._data.current_contact_time[env_ids]
+        is_first_contact = (current_air_time > 0.0) & is_contact
+        is_first_detached = (current_contact_time > 0.0) & ~is_contact
+        # durations of the phases that just ended
+        self._data.last_air_time[env_ids] = torch.where(
+            is_first_contact, current_air_time + elapsed_time, self._data.last_air_time[env_ids]
+        )
+        self._data.last_contact_time[env_ids] = torch.where(
+            is_first_detached, current_contact_time + elapsed_time, self._data.last_contact_time[env_ids]
+        )
+        # durations of the current phases
+        self._data.current_air_time[env_ids] = torch.where(is_contact, 0.0, current_air_time + elapsed_time)
+        self._data.current_contact_time[env_ids] = torch.where(is_contact, current_contact_time + elapsed_time, 0.0)
@@ -0,0 +1,39 @@
+# Copyright 2025 genesis_lab Developers (https://github.com/Atticlmr/genesis_lab)
+#
+# Licensed under the Apache License, Version 2.0 , January 2004
+
+"""Configuration for the contact sensor."""
+
+from __future__ import annotations
+
+from dataclasses import MISSING, dataclass
+
+from .contact_sensor import ContactSensor
+from .sensor_base_cfg import SensorBaseCfg
+
+
+@dataclass(kw_only=True)
+class ContactSensorCfg(SensorBaseCfg):
+    """Configuration for the contact sensor.
+
+    With the default lazy update, the contact forces are read once per environment step, when the sensor is first
+    read. To record the forces of every physics step, set :attr:`lazy_update` to False and :attr:`history_length`
+    to the decimation of the environment.
+    """
+
+    class_type: type = ContactSensor
+
+    entity_name: str = MISSING
+    """The name of the entity whose links are sensed."""
+
+    body_names: str | list[str] = ".*"
+    """The names of the links whose contact forces are read (regular expressions). Defaults to all the links."""
+
+    history_length: int = 1
+    """The number of updates of the contact forces kept in the history. Defaults to 1."""
+
+    track_air_time: bool = False
+    """Whether to track the time spent in the air and in contact by the links. Defaults to False."""
+
+    force_threshold: float = 1.0
+    """The norm of the net contact force above which a link is in contact (in N). Defaults to 1.0."""
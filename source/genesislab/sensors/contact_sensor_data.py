@@ -0,0 +1,55 @@
+# Copyright 2025 genesis_lab Developers (https://github.com/Atticlmr/genesis_lab)
+#
+# Licensed under the Apache License, Version 2.0 , January 2004
+
+"""Data container of the contact sensor."""
+
+from __future__ import annotations
+
+import torch
+from dataclasses import dataclass
+
+
+@dataclass
+class ContactSensorData:
+    """Data of the contact sensor."""
+
+    net_forces_w: torch.Tensor = None
+    """The net contact forces on the links in the world frame, at the last update.
+    Shape is (num_envs, num_bodies, 3)."""
+
+    net_forces_w_history: torch.Tensor = None
+    """The net contact forces on the links in the world frame, over the last updates.
+    Shape is (num_envs, num_bodies, history_length, 3).
+
+    The history is a ring buffer: the frames are not in chronological order along the third dimension, and the last
+    one of each environment is at :attr:`history_head`. Reductions over the history, such as the maximum force, do not
+    depend on the order of the frames.
+    """
+
+    history_head: torch.Tensor = None
+    """The index of the last frame of :attr:`net_forces_w_history` of each environment. Shape is (num_envs,)."""
+
+    current_air_time: torch.Tensor = None
+    """The time spent in the air by the links since their last contact (in s). Shape is (num_envs, num_bodies).
+
+    None if :attr:`ContactSensorCfg.track_air_time` is False.
+    """
+
+    last_air_time: torch.Tensor = None
+    """The duration of the last time spent in the air by the links (in s). Shape is (num_envs, num_bodies).
+
+    None if :attr:`ContactSensorCfg.track_air_time` is False.
+    """
+
+    current_contact_time: torch.Tensor = None
+    """The time spent in contact by the links since their last detachment (in s). Shape is (num_envs, num_bodies).
+
+    None if :attr:`ContactSensorCfg.track_air_time` is False.
+    """
+
+    last_contact_time: torch.Tensor = None
+    """The duration of the last time spent in contact by the links (in s). Shape is (num_envs, num_bodies).
+
+    None if :attr:`ContactSensorCfg.track_air_time` is False.
+    """
@@ -0,0 +1,176 @@
+# Copyright 2025 genesis_lab Developers (https://github.com/Atticlmr/genesis_lab)
+#
+# Licensed under the Apache License, Version 2.0 , January 2004
+
+"""Frame-transformer sensor expressing the poses of target frames in a source frame."""
+
+from __future__ import annotations
+
+import torch
+from typing import TYPE_CHECKING
+
+from genesislab.utils.math import quat_apply, quat_mul, subtract_frame_transforms
+from genesislab.utils.string import resolve_matching_names
+
+from .frame_transformer_data import FrameTransformerData
+from .sensor_base import SensorBase
+
+if TYPE_CHECKING:
+    from genesislab.envs import InteractiveScene
+
+    from .frame_transformer_cfg import FrameTransformerCfg
+
+
+class FrameTransformer(SensorBase):
+    """A sensor that expresses the poses of target frames in a source frame.
+
+    The source and target frames are attached to links of the entities of the scene, with a constant offset. At each
+    update, the poses of the links of all the frames are read with one batched Genesis call per entity, the offsets
+    are applied to all the frames at once, and the target frames are expressed in the source frame with a single
+    :func:`~genesislab.utils.math.subtract_frame_transforms` call over the flattened ``(num_envs * num_targets)``
+    poses.
+
+    The observation terms that need the relative poses of several frames read them from the data of the sensor, so
+    that they are computed once per update instead of once per term.
+    """
+
+    cfg: FrameTransformerCfg
+    """The configuration of the sensor."""
+
+    def __init__(self, cfg: FrameTransformerCfg, scene: InteractiveScene):
+        """Initialize the sensor.
+
+        Args:
+            cfg: The configuration of the sensor.
+            scene: The scene the sensor is added to.
+
+        Raises:
+            ValueError: If there is no target frame, or if the names of the target frames are not unique.
+        """
+        if len(cfg.target_frames) == 0:
+            raise ValueError("The frame transformer requires at least one target frame.")
+        names = [self._frame_name(frame_cfg) for frame_cfg in cfg.target_frames]
+        if len(set(names)) != len(names):
+            raise ValueError(f"The names of the target frames must be unique. Received: {names}.")
+        super().__init__(cfg, scene)
+        self._data = FrameTransformerData()
+        self._target_frame_names = names
+
+    def __str__(self) -> str:
+        """Returns: A string representation of the sensor."""
+        source_cfg = self.cfg.source_frame_cfg
+        msg = f"Frame transformer @ '{source_cfg.entity_name}/{source_cfg.link_name or 'base'}':\n"
+        msg += f"\tupdate period (s): {self.cfg.update_period}\n"
+        msg += f"\tnumber of targets: {self.num_targets}\n"
+        msg += f"\ttarget names     : {self.target_frame_names}"
+        return msg
+
+    """
+    Properties.
+    """
+
+    @property
+    def num_targets(self) -> int:
+        """The number of target frames."""
+        return len(self._target_frame_names)
+
+    @property
+    def target_frame_names(self) -> list[str]:
+        """The names of the target frames, in the order of the data."""
+        return self._target_frame_names
+
+    @property
+    def data(self) -> FrameTransformerData:
+        """The data of the sensor, updated for the outdated environments."""
+        self._update_outdated_buffers()
+        return self._data
+
+    """
+    Operations.
+    """
+
+    def find_frames(self, name_keys: str | list[str], preserve_order: bool = False) -> tuple[list[int], list[str]]:
+        """Find the target frames matching the given names.
+
+        Args:
+            name_keys: A regular expression or a list of regular expressions to match the frame names.
+            preserve_order: Whether to preserve the order of the name keys in the output. Defaults to False.
+
+        Returns:
+            The indices of the target frames in the data of the sensor, and their names.
+        """
+        return resolve_matching_names(name_keys, self._target_frame_names, preserve_order)
+
+    """
+    Implementation.
+    """
+
+    def _initialize_impl(self):
+        # the source frame is the first of the frames, followed by the targets
+        frame_cfgs = [self.cfg.source_frame_cfg, *self.cfg.target_frames]
+        # the links of the frames are grouped by entity, so that their poses are read with one call per entity
+        links_per_entity: dict[str, list[int]] = {}
+        frame_links = []
+        for frame_cfg in frame_cfgs:
+            entity = self._scene[frame_cfg.entity_name]
+            link = entity.base_link if frame_cfg.link_name is None else entity.get_link(frame_cfg.link_name)
+            links_idx_local = links_per_entity.setdefault(frame_cfg.entity_name, [])
+            if link.idx_local not in links_idx_local:
+                links_idx_local.append(link.idx_local)
+            frame_links.append((frame_cfg.entity_name, link.idx_local))
+        self._entity_links = [(self._scene[name], links) for name, links in links_per_entity.items()]
+        # columns of the links of the frames in the concatenation of the links read from the entities
+        link_columns = {}
+        for entity_name, links_idx_local in links_per_entity.items():
+            for link_idx_local in links_idx_local:
+                link_columns[(entity_name, link_idx_local)] = len(link_columns)
+        self._frame_columns = torch.tensor([link_columns[key] for key in frame_links], device=self.device)
+        # offsets of all the frames, applied at once
+        self._offset_pos = torch.tensor([frame_cfg.offset_pos for frame_cfg in frame_cfgs], device=self.device)
+        self._offset_quat = torch.tensor([frame_cfg.offset_quat for frame_cfg in frame_cfgs], device=self.device)
+        # data buffers
+        num_targets = self.num_targets
+        self._data.target_frame_names = self._target_frame_names
+        self._data.target_pos_source = torch.zeros(self.num_envs, num_targets, 3, device=self.device)
+        self._data.target_quat_source = torch.zeros(self.num_envs, num_targets, 4, device=self.device)
+        self._data.target_pos_w = torch.zeros(self.num_envs, num_targets, 3, device=self.device)
+        self._data.target_quat_w = torch.zeros(self.num_envs, num_targets, 4, device=self.device)
+        self._data.source_pos_w = torch.zeros(self.num_envs, 3, device=self.device)
+        self._data.source_quat_w = torch.zeros(self.num_envs, 4, device=self.device)
+
+    def _update_buffers_impl(self, env_ids: torch.Tensor):
+        # poses of the links of all the frames, with one read per entity
+        links_pos, links_quat = [], []
+        for entity, links_idx_local in self._entity_links:
+            links_pos.append(entity.get_links_pos(links_idx_local=links_idx_local, envs_idx=env_ids))
+            links_quat.append(entity.get_links_quat(links_idx_local=links_idx_local, envs_idx=env_ids))
+        links_pos = torch.cat(links_pos, dim=1)[:, self._frame_columns]
+        links_quat = torch.cat(links_quat, dim=1)[:, self._frame_columns]
+        # poses of all the frames in the world frame. Shape is (len(env_ids), 1 + num_targets, 3 / 4)
+        num_frames = self._frame_columns.shape[0]
+        offset_pos = self._offset_pos.expand(len(env_ids), num_frames, 3)
+        offset_quat = self._offset_quat.expand(len(env_ids), num_frames, 4)
+        frames_pos_w = links_pos + quat_apply(links_quat, offset_pos)
+        frames_quat_w = quat_mul(links_quat, offset_quat)
+        source_pos_w, target_pos_w = frames_pos_w[:, 0], frames_pos_w[:, 1:]
+        source_quat_w, target_quat_w = frames_quat_w[:, 0], frames_quat_w[:, 1:]
+        # all the targets are expressed in the source frame at once
+        target_pos_source, target_quat_source = subtract_frame_transforms(
+            source_pos_w.unsqueeze(1).expand_as(target_pos_w).reshape(-1, 3),
+            source_quat_w.unsqueeze(1).expand_as(target_quat_w).reshape(-1, 4),
+            target_pos_w.reshape(-1, 3),
+            target_quat_w.reshape(-1, 4),
+        )
+        self._data.target_pos_source[env_ids] = target_pos_source.view(-1, self.num_targets, 3)
+        self._data.target_quat_source[env_ids] = target_quat_source.view(-1, self.num_targets, 4)
+        self._data.target_pos_w[env_ids] = target_pos_w
+        self._data.target_quat_w[env_ids] = target_quat_w
+        self._data.source_pos_w[env_ids] = source_pos_w
+        self._data.source_quat_w[env_ids] = source_quat_w
+
+    @staticmethod
+    def _frame_name(frame_cfg) -> str:
+        """Returns: The name of a frame in the data of the sensor."""
+        if frame_cfg.name is not None:
+            return frame_cfg.name
+        return frame_cfg.link_name or frame_cfg.entity_name
@@ -0,0 +1,46 @@
+# Copyright 2025 genesis_lab Developers (https://github.com/Atticlmr/genesis_lab)
+#
+# Licensed under the Apache License, Version 2.0 , January 2004
+
+"""Configuration for the frame-transformer sensor."""
+
+from __future__ import annotations
+
+from dataclasses import MISSING, dataclass
+
+from .frame_transformer import FrameTransformer
+from .sensor_base_cfg import SensorBaseCfg
+
+
+@dataclass(kw_only=True)
+class FrameCfg:
+    """Configuration of a frame attached to a link of an entity."""
+
+    entity_name: str = MISSING
+    """The name of the entity the frame is attached to."""
+
+    link_name: str | None = None
+    """The name of the link the frame is attached to. Defaults to None, in which case the base link is used."""
+
+    name: str | None = None
+    """The name of the frame in the data of the sensor. Defaults to None, in which case the name of the link is
+    used."""
+
+    offset_pos: tuple[float, float, float] = (0.0, 0.0, 0.0)
+    """The position of the frame in the frame of the link (in m). Defaults to (0.0, 0.0, 0.0)."""
+
+    offset_quat: tuple[float, float, float, float] = (1.0, 0.0, 0.0, 0.0)
+    """The orientation of the frame in the frame of the link in (w, x, y, z). Defaults to (1.0, 0.0, 0.0, 0.0)."""
+
+
+@dataclass(kw_only=True)
+class FrameTransformerCfg(SensorBaseCfg):
+    """Configuration for the frame-transformer sensor."""
+
+    class_type: type = FrameTransformer
+
+    source_frame_cfg: FrameCfg = MISSING
+    """The frame in which the target frames are expressed."""
+
+    target_frames: list[FrameCfg] = MISSING
+    """The frames whose poses are expressed in the source frame. Their names must be unique."""
@@ -0,0 +1,36 @@
+# Copyright 2025 genesis_lab Developers (https://github.com/Atticlmr/genesis_lab)
+#
+# Licensed under the Apache License, Version 2.0 , January 2004
+
+"""Data container of the frame-transformer sensor."""
+
+from __future__ import annotations
+
+import torch
+from dataclasses import dataclass
+
+
+@dataclass
+class FrameTransformerData:
+    """Data of the frame-transformer sensor."""
+
+    target_frame_names: list[str] = None
+    """The names of the target frames, in the order of the data."""
+
+    target_pos_source: torch.Tensor = None
+    """The position of the target frames in the source frame. Shape is (num_envs, num_targets, 3)."""
+
+    target_quat_source: torch.Tensor = None
+    """The orientation of the target frames in (w, x, y, z) in the source frame. Shape is (num_envs, num_targets, 4)."""
+
+    target_pos_w: torch.Tensor = None
+    """The position of the target frames in the world frame. Shape is (num_envs, num_targets, 3)."""
+
+    target_quat_w: torch.Tensor = None
+    """The orientation of the target frames in (w, x, y, z) in the world frame. Shape is (num_envs, num_targets, 4)."""
+
+    source_pos_w: torch.Tensor = None
+    """The position of the source frame in the world frame. Shape is (num_envs, 3)."""
+
+    source_quat_w: torch.Tensor = None
+    """The orientation of the source frame in (w, x, y, z) in the world frame. Shape is (num_envs, 4)."""
@@ -0,0 +1,135 @@
+# Copyright 2025 genesis_lab Developers (https://github.com/Atticlmr/genesis_lab)
+#
+# Licensed under the Apache License, Version 2.0 , January 2004
+
+"""Inertial measurement unit sensor attached to a link of an entity."""
+
+from __future__ import annotations
+
+import torch
+from typing import TYPE_CHECKING
+
+from genesislab.utils.math import quat_apply, quat_apply_inverse, quat_mul
+
+from .imu_data import ImuData
+from .sensor_base import SensorBase
+
+if TYPE_CHECKING:
+    from genesislab.envs import InteractiveScene
+
+    from .imu_cfg import ImuCfg
+
+
+class Imu(SensorBase):
+    """An inertial measurement unit attached to a link of an entity.
+
+    The sensor measures the velocities, the linear acceleration and the gravity direction at a constant offset from
+    the link. The linear acceleration is the finite difference of the velocity of the sensor between two updates,
+    computed from the velocity of the last update kept on the device, so that no acceleration is read back from the
+    simulation. All the measurements are rotated into the sensor frame with a single batched rotation.
+    """
+
+    cfg: ImuCfg
+    """The configuration of the sensor."""
+
+    def __init__(self, cfg: ImuCfg, scene: InteractiveScene):
+        """Initialize the sensor.
+
+        Args:
+            cfg: The configuration of the sensor.
+            scene: The scene the sensor is added to.
+        """
+        super().__init__(cfg, scene)
+        self._data = ImuData()
+
+    def __str__(self) -> str:
+        """Returns: A string representation of the sensor."""
+        msg = f"IMU @ '{self.cfg.entity_name}/{self.cfg.link_name or 'base'}':\n"
+        msg += f"\tupdate period (s): {self.cfg.update_period}\n"
+        msg += f"\tgravity bias     : {self.cfg.gravity_bias}"
+        return msg
+
+    """
+    Properties.
+    """
+
+    @property
+    def data(self) -> ImuData:
+        """The data of the sensor, updated for the outdated environments."""
+        self._update_outdated_buffers()
+        return self._data
+
+    """
+    Operations.
+    """
+
+    def reset(self, env_ids: torch.Tensor | None = None):
+        super().reset(env_ids)
+        ids = slice(None) if env_ids is None else env_ids
+        # the velocity history of the reset environments is discarded
+        self._has_prev_vel[ids] = False
+        self._data.lin_acc_b[ids] = 0.0
+
+    def get_state_buffers(self) -> dict[str, torch.Tensor]:
+        return {
+            **self._get_clock_buffers(),
+            "prev_lin_vel_w": self._prev_lin_vel_w,
+            "has_prev_vel": self._has_prev_vel,
+            "pos_w": self._data.pos_w,
+            "quat_w": self._data.quat_w,
+            "lin_vel_b": self._data.lin_vel_b,
+            "ang_vel_b": self._data.ang_vel_b,
+            "lin_acc_b": self._data.lin_acc_b,
+            "projected_gravity_b": self._data.projected_gravity_b,
+        }
+
+    """
+    Implementation.
+    """
+
+    def _initialize_impl(self):
+        entity = self._scene[self.cfg.entity_name]
+        self._link = entity.base_link if self.cfg.link_name is None else entity.get_link(self.cfg.link_name)
+        self._offset_pos = torch.tensor(self.cfg.offset_pos, device=self.device).expand(self.num_envs, 3)
+        self._offset_quat = torch.tensor(self.cfg.offset_quat, device=self.device).expand(self.num_envs, 4)
+        self._gravity_bias = torch.tensor(self.cfg.gravity_bias, device=self.device)
+        self._gravity_dir = torch.tensor((0.0, 0.0, -1.0), device=self.device)
+        # linear velocity of the sensor in the world frame at the last update
+        self._prev_lin_vel_w = torch.zeros(self.num_envs, 3, device=self.device)
+        self._has_prev_vel = torch.zeros(self.num_envs, dtype=torch.bool, device=self.device)
+        # data buffers
+        self._data.pos_w = torch.zeros(self.num_envs, 3, device=self.device)
+        self._data.quat_w = torch.zeros(self.num_envs, 4, device=self.device)
+        self._data.lin_vel_b = torch.zeros(self.num_envs, 3, device=self.device)
+        self._data.ang_vel_b = torch.zeros(self.num_envs, 3, device=self.device)
+        self._data.lin_acc_b = torch.zeros(self.num_envs, 3, device=self.device)
+        self._data.projected_gravity_b = torch.zeros(self.num_envs, 3, device=self.device)
+
+    def _update_buffers_impl(self, env_ids: torch.Tensor):
+        link_quat = self._link.get_quat(envs_idx=env_ids)
+        ang_vel_w = self._link.get_ang(envs_idx=env_ids)
+        # pose and velocity of the sensor, which is rigidly attached to the link
+        offset_w = quat_apply(link_quat, self._offset_pos[env_ids])
+        pos_w = self._link.get_pos(envs_idx=env_ids) + offset_w
+        quat_w = quat_mul(link_quat, self._offset_quat[env_ids])
+        lin_vel_w = self._link.get_vel(envs_idx=env_ids) + torch.cross(ang_vel_w, offset_w, dim=-1)
+        # finite difference of the velocity over the time elapsed since the last update, before the base class
+        # advances it
+        elapsed_time = (self._timestamp[env_ids] - self._timestamp_last_update[env_ids]).unsqueeze(-1)
+        is_valid = self._has_prev_vel[env_ids].unsqueeze(-1) & (elapsed_time > 0.0)
+        lin_acc_w = torch.where(
+            is_valid, (lin_vel_w - self._prev_lin_vel_w[env_ids]) / elapsed_time.clamp_min(1.0e-9), 0.0
+        )
+        self._prev_lin_vel_w[env_ids] = lin_vel_w
+        self._has_prev_vel[env_ids] = True
+        # all the measurements are rotated into the sensor frame at once
+        vectors_w = torch.stack(
+            (lin_vel_w, ang_vel_w, lin_acc_w + self._gravity_bias, self._gravity_dir.expand_as(lin_vel_w)), dim=1
+        )
+        vectors_b = quat_apply_inverse(quat_w.unsqueeze(1).expand(-1, 4, 4), vectors_w)
+        self._data.pos_w[env_ids] = pos_w
+        self._data.quat_w[env_ids] = quat_w
+        self._data.lin_vel_b[env_ids] = vectors_b[:, 0]
+        self._data.ang_vel_b[env_ids] = vectors_b[:, 1]
+        self._data.lin_acc_b[env_ids] = vectors_b[:, 2]
+        self._data.projected_gravity_b[env_ids] = vectors_b[:, 3]
@@ -0,0 +1,38 @@
+# Copyright 2025 genesis_lab Developers (https://github.com/Atticlmr/genesis_lab)
+#
+# Licensed under the Apache License, Version 2.0 , January 2004
+
+"""Configuration for the inertial measurement unit sensor."""
+
+from __future__ import annotations
+
+from dataclasses import MISSING, dataclass
+
+from .imu import Imu
+from .sensor_base_cfg import SensorBaseCfg
+
+
+@dataclass(kw_only=True)
+class ImuCfg(SensorBaseCfg):
+    """Configuration for the inertial measurement unit sensor."""
+
+    class_type: type = Imu
+
+    entity_name: str = MISSING
+    """The name of the entity the sensor is attached to."""
+
+    link_name: str | None = None
+    """The name of the link the sensor is attached to. Defaults to None, in which case the base link is used."""
+
+    offset_pos: tuple[float, float, float] = (0.0, 0.0, 0.0)
+    """The position of the sensor in the frame of the link (in m). Defaults to (0.0, 0.0, 0.0)."""
+
+    offset_quat: tuple[float, float, float, float] = (1.0, 0.0, 0.0, 0.0)
+    """The orientation of the sensor in the frame of the link in (w, x, y, z). Defaults to (1.0, 0.0, 0.0, 0.0)."""
+
+    gravity_bias: tuple[float, float, float] = (0.0, 0.0, 9.81)
+    """The acceleration added to the linear acceleration in the world frame (in m/s^2). Defaults to (0.0, 0.0, 9.81).
+
+    The default bias makes the sensor measure the specific force of a real accelerometer, which reads the opposite of
+    the gravity at rest. Set it to zeros to measure the kinematic acceleration.
+    """
@@ -0,0 +1,37 @@
+# Copyright 2025 genesis_lab Developers (https://github.com/Atticlmr/genesis_lab)
+#
+# Licensed under the Apache License, Version 2.0 , January 2004
+
+"""Data container of the inertial measurement unit sensor."""
+
+from __future__ import annotations
+
+import torch
+from dataclasses import dataclass
+
+
+@dataclass
+class ImuData:
+    """Data of the inertial measurement unit sensor."""
+
+    pos_w: torch.Tensor = None
+    """The position of the sensor in the world frame. Shape is (num_envs, 3)."""
+
+    quat_w: torch.Tensor = None
+    """The orientation of the sensor in (w, x, y, z) in the world frame. Shape is (num_envs, 4)."""
+
+    lin_vel_b: torch.Tensor = None
+    """The linear velocity of the sensor in the sensor frame. Shape is (num_envs, 3)."""
+
+    ang_vel_b: torch.Tensor = None
+    """The angular velocity of the sensor in the sensor frame. Shape is (num_envs, 3)."""
+
+    lin_acc_b: torch.Tensor = None
+    """The linear acceleration of the sensor, plus the gravity bias, in the sensor frame. Shape is (num_envs, 3).
+
+    The acceleration is the difference of the velocities of the last two updates over the time elapsed between them.
+    It is zero, apart from the gravity bias, at the first update after a reset.
+    """
+
+    projected_gravity_b: torch.Tensor = None
+    """The unit gravity vector in the sensor frame. Shape is (num_envs, 3)."""
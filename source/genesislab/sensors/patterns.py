@@ -0,0 +1,81 @@
+# Copyright 2025 genesis_lab Developers (https://github.com/Atticlmr/genesis_lab)
+#
+# Licensed under the Apache License, Version 2.0 , January 2004
+
+"""Functions generating the start points and the directions of the rays of ray-casting patterns.
+
+The patterns are generated once, in the frame of the sensor, and rotated to the world frame for all the environments
+at once when the sensor is updated.
+"""
+
+from __future__ import annotations
+
+import math
+import torch
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .patterns_cfg import GridPatternCfg, LidarPatternCfg
+
+
+def grid_pattern(cfg: GridPatternCfg, device: str | torch.device) -> tuple[torch.Tensor, torch.Tensor]:
+    """Parallel rays starting on a regular grid of the x-y plane.
+
+    Args:
+        cfg: The configuration of the pattern.
+        device: The device of the tensors.
+
+    Returns:
+        The start points and the unit directions of the rays. Shapes are (num_rays, 3).
+
+    Raises:
+        ValueError: If the ordering is not "xy" or "yx".
+    """
+    if cfg.ordering not in ("xy", "yx"):
+        raise ValueError(f"The ordering of the grid pattern must be 'xy' or 'yx'. Received: '{cfg.ordering}'.")
+    x = torch.arange(-cfg.size[0] / 2, cfg.size[0] / 2 + 1.0e-9, cfg.resolution, device=device)
+    y = torch.arange(-cfg.size[1] / 2, cfg.size[1] / 2 + 1.0e-9, cfg.resolution, device=device)
+    # with "xy", x changes first
+    if cfg.ordering == "xy":
+        grid_y, grid_x = torch.meshgrid(y, x, indexing="ij")
+    else:
+        grid_x, grid_y = torch.meshgrid(x, y, indexing="ij")
+    ray_starts = torch.zeros(grid_x.numel(), 3, device=device)
+    ray_starts[:, 0] = grid_x.flatten()
+    ray_starts[:, 1] = grid_y.flatten()
+    ray_directions = torch.nn.functional.normalize(torch.tensor(cfg.direction, device=device), dim=0)
+    return ray_starts, ray_directions.expand_as(ray_starts).clone()
+
+
+def lidar_pattern(cfg: LidarPatternCfg, device: str | torch.device) -> tuple[torch.Tensor, torch.Tensor]:
+    """Rays of a rotating LiDAR, starting at the origin of the sensor.
+
+    A full horizontal revolution does not repeat its first ray.
+
+    Args:
+        cfg: The configuration of the pattern.
+        device: The device of the tensors.
+
+    Returns:
+        The start points and the unit directions of the rays, ordered channel by channel for each horizontal angle.
+        Shapes are (num_rays, 3).
+    """
+    vertical_angles = torch.linspace(*cfg.vertical_fov_range, cfg.channels, device=device)
+    # the number of horizontal angles, without repeating the first angle of a full revolution
+    fov = cfg.horizontal_fov_range[1] - cfg.horizontal_fov_range[0]
+    num_horizontal = math.ceil(fov / cfg.horizontal_res)
+    if abs(fov - 360.0) > 1.0e-6:
+        num_horizontal += 1
+    horizontal_angles = cfg.horizontal_fov_range[0] + cfg.horizontal_res * torch.arange(num_horizontal, device=device)
+    vertical_angles, horizontal_angles = torch.meshgrid(
+        torch.deg2rad(vertical_angles), torch.deg2rad(horizontal_angles), indexing="xy"
+    )
+    ray_directions = torch.stack(
+        (
+            torch.cos(vertical_angles) * torch.cos(horizontal_angles),
+            torch.cos(vertical_angles) * torch.sin(horizontal_angles),
+            torch.sin(vertical_angles),
+        ),
+        dim=-1,
+    ).reshape(-1, 3)
+    return torch.zeros_like(ray_directions), ray_directions
@@ -0,0 +1,73 @@
+# Copyright 2025 genesis_lab Developers (https://github.com/Atticlmr/genesis_lab)
+#
+# Licensed under the Apache License, Version 2.0 , January 2004
+
+"""Configuration for the ray-casting patterns."""
+
+from __future__ import annotations
+
+import torch
+from collections.abc import Callable
+from dataclasses import MISSING, dataclass
+from typing import Literal
+
+from . import patterns
+
+
+@dataclass(kw_only=True)
+class PatternBaseCfg:
+    """Base configuration for a ray-casting pattern."""
+
+    func: Callable[[PatternBaseCfg, str | torch.device], tuple[torch.Tensor, torch.Tensor]] = MISSING
+    """The function that generates the pattern.
+
+    The function takes the configuration and the device, and returns the start points and the unit directions of
+    the rays in the frame of the sensor. Shapes are (num_rays, 3).
+    """
+
+
+@dataclass(kw_only=True)
+class GridPatternCfg(PatternBaseCfg):
+    """Configuration for a grid of parallel rays, e.g. a height scanner.
+
+    The rays start on a regular grid of the x-y plane of the sensor, centered on its origin.
+    """
+
+    func: Callable = patterns.grid_pattern
+
+    resolution: float = MISSING
+    """The spacing of the grid (in m)."""
+
+    size: tuple[float, float] = MISSING
+    """The length and the width of the grid (in m), along the x and the y axes."""
+
+    direction: tuple[float, float, float] = (0.0, 0.0, -1.0)
+    """The direction of the rays. Defaults to (0.0, 0.0, -1.0)."""
+
+    ordering: Literal["xy", "yx"] = "xy"
+    """The ordering of the rays. Defaults to "xy".
+
+    With "xy", the x coordinate changes first, i.e. the rays are ordered row by row along the x axis.
+    """
+
+
+@dataclass(kw_only=True)
+class LidarPatternCfg(PatternBaseCfg):
+    """Configuration for a rotating LiDAR with several channels.
+
+    All the rays start at the origin of the sensor.
+    """
+
+    func: Callable = patterns.lidar_pattern
+
+    channels: int = MISSING
+    """The number of vertical channels."""
+
+    vertical_fov_range: tuple[float, float] = MISSING
+    """The vertical field of view (in deg), from the lowest to the highest channel."""
+
+    horizontal_fov_range: tuple[float, float] = (-180.0, 180.0)
+    """The horizontal field of view (in deg). Defaults to (-180.0, 180.0)."""
+
+    horizontal_res: float = MISSING
+    """The horizontal angular resolution (in deg)."""
@@ -0,0 +1,335 @@
+# Copyright 2025 genesis_lab Developers (https://github.com/Atticlmr/genesis_lab)
+#
+# Licensed under the Apache License, Version 2.0 , January 2004
+
+"""Ray-caster sensor against the terrain of the scene."""
+
+from __future__ import annotations
+
+import math
+import torch
+from typing import TYPE_CHECKING
+
+from genesislab.utils.math import quat_apply, quat_apply_yaw
+
+from .ray_caster_data import RayCasterData
+from .sensor_base import SensorBase
+
+if TYPE_CHECKING:
+    from genesislab.envs import InteractiveScene
+
+    from .ray_caster_cfg import RayCasterCfg
+
+
+class RayCaster(SensorBase):
+    """A sensor that casts a pattern of rays from a link against the terrain of the scene.
+
+    The rays are generated once in the frame of the sensor by the pattern (see :mod:`genesislab.sensors.patterns`)
+    and moved with the pose of the link of every environment at each update. All the rays of all the outdated
+    environments are then cast in one batched call:
+
+    * against the height field of a generated terrain with :func:`raycast_height_field`, which traverses the cells of
+      the height field crossed by the rays and intersects the two triangles of each cell, like the collision surface
+      of the Genesis terrain;
+    * against the ground plane ``z = 0`` otherwise, with :func:`raycast_plane`.
+
+    The other entities of the scene are not hit by the rays.
+    """
+
+    cfg: RayCasterCfg
+    """The configuration of the sensor."""
+
+    def __init__(self, cfg: RayCasterCfg, scene: InteractiveScene):
+        """Initialize the sensor.
+
+        Args:
+            cfg: The configuration of the sensor.
+            scene: The scene the sensor is added to.
+        """
+        super().__init__(cfg, scene)
+        self._data = RayCasterData()
+
+    def __str__(self) -> str:
+        """Returns: A string representation of the sensor."""
+        msg = f"Ray-caster @ '{self.cfg.entity_name}/{self.cfg.link_name or 'base'}':\n"
+        msg += f"\tupdate period (s): {self.cfg.update_period}\n"
+        msg += f"\tnumber of rays   : {self.num_rays}\n"
+        msg += f"\ttarget           : {'height field' if self._height_field is not None else 'ground plane'}"
+        return msg
+
+    """
+    Properties.
+    """
+
+    @property
+    def num_rays(self) -> int:
+        """The number of rays of each environment."""
+        return self.ray_starts.shape[0]
+
+    @property
+    def data(self) -> RayCasterData:
+        """The data of the sensor, updated for the outdated environments."""
+        self._update_outdated_buffers()
+        return self._data
+
+    """
+    Implementation.
+    """
+
+    def _initialize_impl(self):
+        entity = self._scene[self.cfg.entity_name]
+        self._link = entity.base_link if self.cfg.link_name is None else entity.get_link(self.cfg.link_name)
+        # rays in the frame of the link
+        ray_starts, ray_directions = self.cfg.pattern_cfg.func(self.cfg.pattern_cfg, self.device)
+        offset_pos = torch.tensor(self.cfg.offset_pos, device=self.device)
+        offset_quat = torch.tensor(self.cfg.offset_quat, device=self.device).expand(ray_starts.shape[0], 4)
+        self.ray_starts = quat_apply(offset_quat, ray_starts) + offset_pos
+        """The start points of the rays in the frame of the link. Shape is (num_rays, 3)."""
+        self.ray_directions = quat_apply(offset_quat, ray_directions)
+        """The unit directions of the rays in the frame of the link. Shape is (num_rays, 3)."""
+        # target of the rays
+        terrain = self._scene.terrain
+        self._height_field = None if terrain is None else terrain.height_field
+        self._height_field_origin = (0.0, 0.0) if terrain is None else terrain.height_field_origin
+        self._height_field_resolution = None if terrain is None else terrain.horizontal_scale
+        if self._height_field is not None:
+            # the height field is static, so its height range and the traversal bound are computed once
+            self._height_range = (self._height_field.min().item(), self._height_field.max().item())
+            self._max_cells = self._compute_max_cells()
+        # data buffers
+        self._data.pos_w = torch.zeros(self.num_envs, 3, device=self.device)
+        self._data.quat_w = torch.zeros(self.num_envs, 4, device=self.device)
+        self._data.quat_w[:, 0] = 1.0
+        self._data.ray_hits_w = torch.zeros(self.num_envs, self.num_rays, 3, device=self.device)
+
+    def _update_buffers_impl(self, env_ids: torch.Tensor):
+        pos_w = self._link.get_pos(envs_idx=env_ids)
+        quat_w = self._link.get_quat(envs_idx=env_ids)
+        self._data.pos_w[env_ids] = pos_w
+        self._data.quat_w[env_ids] = quat_w
+        # move the rays of all the environments with their link
+        num_envs, num_rays = len(env_ids), self.num_rays
+        quat = quat_w.repeat_interleave(num_rays, dim=0)
+        ray_starts = self.ray_starts.repeat(num_envs, 1)
+        ray_directions = self.ray_directions.repeat(num_envs, 1)
+        if self.cfg.attach_yaw_only:
+            ray_starts = quat_apply_yaw(quat, ray_starts)
+        else:
+            ray_starts = quat_apply(quat, ray_starts)
+            ray_directions = quat_apply(quat, ray_directions)
+        ray_starts += pos_w.repeat_interleave(num_rays, dim=0)
+        # cast all the rays at once
+        if self._height_field is not None:
+            hits = raycast_height_field(
+                ray_starts,
+                ray_directions,
+                self._height_field,
+                self._height_field_origin,
+                self._height_field_resolution,
+                self.cfg.max_distance,
+                height_range=self._height_range,
+                max_cells=self._max_cells,
+            )
+        else:
+            hits = raycast_plane(ray_starts, ray_directions, self.cfg.max_distance)
+        self._data.ray_hits_w[env_ids] = hits.view(num_envs, num_rays, 3)
+
+    """
+    Helper functions.
+    """
+
+    def _compute_max_cells(self) -> int:
+        """Returns a bound on the number of cells of the height field crossed by a ray.
+
+        A ray is clipped to the slab between the lowest and the highest vertex, so its run on the x-y plane is bounded
+        by the thickness of the slab divided by the slope of the ray. Since the rays of a yaw-only sensor keep their
+        inclination, the bound is computed from their directions. The rays of the other sensors can be horizontal, so
+        their run is only bounded by the maximum distance and the size of the height field.
+        """
+        num_x, num_y = self._height_field.shape
+        resolution = self._height_field_resolution
+        run = min(self.cfg.max_distance, math.hypot(num_x - 1, num_y - 1) * resolution)
+        if self.cfg.attach_yaw_only:
+            dir_xy = torch.linalg.vector_norm(self.ray_directions[:, :2], dim=-1)
+            dir_z = self.ray_directions[:, 2].abs().clamp_min(1.0e-9)
+            thickness = self._height_range[1] - self._height_range[0]
+            run = min(run, (thickness * dir_xy / dir_z).max().item())
+        return _max_cells_crossed(run, resolution)
+
+
+"""
+Ray casting.
+"""
+
+
+def raycast_plane(ray_starts: torch.Tensor, ray_directions: torch.Tensor, max_distance: float) -> torch.Tensor:
+    """Cast rays against the ground plane ``z = 0`` from above.
+
+    Args:
+        ray_starts: The start points of the rays. Shape is (num_rays, 3).
+        ray_directions: The unit directions of the rays. Shape is (num_rays, 3).
+        max_distance: The maximum distance of the hits from the start points.
+
+    Returns:
+        The hit points. Shape is (num_rays, 3). The coordinates of the rays that miss the plane are infinite.
+    """
+    dir_z = ray_directions[:, 2]
+    t = -ray_starts[:, 2] / torch.where(dir_z < 0.0, dir_z, -1.0)
+    hit = (dir_z < 0.0) & (ray_starts[:, 2] >= 0.0) & (t <= max_distance)
+    return torch.where(hit.unsqueeze(-1), ray_starts + t.unsqueeze(-1) * ray_directions, torch.inf)
+
+
+def raycast_height_field(
+    ray_starts: torch.Tensor,
+    ray_directions: torch.Tensor,
+    heights: torch.Tensor,
+    origin: tuple[float, float],
+    resolution: float,
+    max_distance: float,
+    height_range: tuple[float, float] | None = None,
+    max_cells: int | None = None,
+) -> torch.Tensor:
+    """Cast rays against the triangulated surface of a height field from above.
+
+    Each cell ``[i, i + 1] x [j, j + 1]`` of the height field is split into two triangles along the diagonal from the
+    vertex ``[i + 1, j]`` to the vertex ``[i, j + 1]``, like the terrain mesh of Genesis. The rays are first clipped
+    to the bounding box of the height field, so that only the cells between the lowest and the highest vertex are
+    visited. The cells crossed by the rays are then traversed in lockstep with a 2D digital differential analyzer
+    (DDA): at each iteration, every ray intersects the two triangles of its current cell and moves to the next cell
+    along its projection on the x-y plane. The number of iterations is the largest number of cells crossed by a ray,
+    which is one or two for vertical rays. Given as ``max_cells``, it bounds the traversal without reading the rays
+    on the host.
+
+    Args:
+        ray_starts: The start points of the rays. Shape is (num_rays, 3).
+        ray_directions: The unit directions of the rays. Shape is (num_rays, 3).
+        heights: The heights of the vertices of the height field, indexed as ``[x, y]``. Shape is (num_x, num_y).
+        origin: The position (x, y) of the vertex ``[0, 0]``.
+        resolution: The spacing of the vertices.
+        max_distance: The maximum distance of the hits from the start points.
+        height_range: The lowest and the highest height of the height field. Defaults to None, in which case they are
+            computed from the heights.
+        max_cells: The maximum number of cells crossed by a ray. Defaults to None, in which case it is counted from
+            the entry and exit cells of the rays, which reads them on the host.
+
+    Returns:
+        The hit points. Shape is (num_rays, 3). The coordinates of the rays that miss the surface are infinite.
+    """
+    device = ray_starts.device
+    num_x, num_y = heights.shape
+    # avoid the divisions by zero of the rays parallel to an axis
+    dirs = torch.where(ray_directions.abs() < 1.0e-9, 1.0e-9, ray_directions)
+    inv_dirs = 1.0 / dirs
+    # clip the rays to the bounding box of the height field
+    if height_range is None:
+        height_range = (heights.min().item(), heights.max().item())
+    extent = ((num_x - 1) * resolution, (num_y - 1) * resolution)
+    box_min = torch.tensor((origin[0], origin[1], height_range[0]), device=device)
+    box_max = torch.tensor((origin[0] + extent[0], origin[1] + extent[1], height_range[1]), device=device)
+    t_box_min = (box_min - ray_starts) * inv_dirs
+    t_box_max = (box_max - ray_starts) * inv_dirs
+    t_near = torch.minimum(t_box_min, t_box_max).amax(dim=-1).clamp_min(0.0)
+    t_far = torch.maximum(t_box_min, t_box_max).amin(dim=-1).clamp_max(max_distance)
+    active = t_near <= t_far
+    t_far = torch.where(active, t_far, t_near)
+
+    # cells of the entry points of the rays
+    origin_xy = box_min[:2]
+    start_xy = ray_starts[:, :2]
+    dirs_xy = dirs[:, :2]
+    max_cell = torch.tensor((num_x - 2, num_y - 2), device=device)
+    cell = torch.floor((start_xy + t_near.unsqueeze(-1) * dirs_xy - origin_xy) / resolution).long()
+    cell = torch.minimum(cell.clamp_min(0), max_cell)
+    if max_cells is None:
+        # cells crossed by the rays up to their exit points
+        exit_cell = torch.floor((start_xy + t_far.unsqueeze(-1) * dirs_xy - origin_xy) / resolution).long()
+        exit_cell = torch.minimum(exit_cell.clamp_min(0), max_cell)
+        num_cells = (exit_cell - cell).abs().sum(dim=-1) + 1
+        # one more iteration than the cells crossed, in case rounding skips a cell boundary
+        max_cells = int(num_cells[active].max().item()) + 1 if active.any() else 0
+
+    # DDA: parameters of the next cell boundaries along x and y, and their spacing
+    axis_parallel = ray_directions[:, :2].abs() < 1.0e-9
+    step = torch.where(dirs_xy > 0.0, 1, -1)
+    next_boundary = origin_xy + (cell + (step > 0).long()) * resolution
+    t_next = torch.where(axis_parallel, torch.inf, (next_boundary - start_xy) * inv_dirs[:, :2])
+    t_delta = torch.where(axis_parallel, torch.inf, resolution * inv_dirs[:, :2].abs())
+
+    t_enter = t_near
+    t_hit = torch.full_like(t_near, torch.inf)
+    for _ in range(max_cells):
+        t_exit = torch.minimum(t_next.amin(dim=-1), t_far)
+        t_cell = _intersect_cell(ray_starts, dirs, heights, origin_xy, resolution, cell, t_enter, t_exit)
+        hit = active & (t_cell < torch.inf)
+        t_hit = torch.where(hit, t_cell, t_hit)
+        # move to the next cell along the axis whose boundary is crossed first
+        cross_x = t_next[:, 0] <= t_next[:, 1]
+        cross = torch.stack((cross_x, ~cross_x), dim=-1)
+        cell = cell + torch.where(cross, step, 0)
+        t_next = t_next + torch.where(cross, t_delta, 0.0)
+        t_enter = t_exit
+        active = active & ~hit & (t_enter < t_far) & (cell >= 0).all(dim=-1) & (cell <= max_cell).all(dim=-1)
+        cell = torch.minimum(cell.clamp_min(0), max_cell)
+
+    return torch.where((t_hit < torch.inf).unsqueeze(-1), ray_starts + t_hit.unsqueeze(-1) * ray_directions, torch.inf)
+
+
+def _max_cells_crossed(run: float, resolution: float) -> int:
+    """Returns the maximum number of cells of a grid crossed by a segment.
+
+    Args:
+        run: The length of the segment on the plane of the grid.
+        resolution: The spacing of the grid.
+
+    Returns:
+        The number of cells, with one more cell in case rounding skips a cell boundary.
+    """
+    # a segment crosses at most (|dx| + |dy|) / resolution + 2 cell boundaries, and |dx| + |dy| <= sqrt(2) * run
+    return int(math.sqrt(2.0) * run / resolution) + 4
+
+
+def _intersect_cell(
+    ray_starts: torch.Tensor,
+    ray_directions: torch.Tensor,
+    heights: torch.Tensor,
+    origin_xy: torch.Tensor,
+    resolution: float,
+    cell: torch.Tensor,
+    t_enter: torch.Tensor,
+    t_exit: torch.Tensor,
+) -> torch.Tensor:
+    """Returns the parameter of the first hit of the rays with the two triangles of their cell, or infinity.
+
+    The segment of a ray in a cell is split where it crosses the diagonal of the cell. On each part, the height of the
+    ray above the triangle below it is linear in the parameter of the ray, so a sign change gives the hit exactly.
+    """
+    i, j = cell[:, 0], cell[:, 1]
+    h00, h10 = heights[i, j], heights[i + 1, j]
+    h01, h11 = heights[i, j + 1], heights[i + 1, j + 1]
+    # local coordinates (u, v) in the cell as linear functions u0 + du * t of the parameter of the ray
+    local_start = (ray_starts[:, :2] - origin_xy) / resolution - cell
+    local_dirs = ray_directions[:, :2] / resolution
+    u0, v0 = local_start[:, 0], local_start[:, 1]
+    du, dv = local_dirs[:, 0], local_dirs[:, 1]
+    # parameter of the crossing of the diagonal u + v = 1, within the segment
+    ds = du + dv
+    t_diag = (1.0 - u0 - v0) / torch.where(ds.abs() < 1.0e-12, 1.0e-12, ds)
+    t_mid = torch.where((t_diag > t_enter) & (t_diag < t_exit), t_diag, t_exit)
+
+    def height_above(t: torch.Tensor, upper: torch.Tensor) -> torch.Tensor:
+        # height of the ray above the plane of the lower (u + v <= 1) or the upper triangle of the cell
+        u, v = u0 + du * t, v0 + dv * t
+        lower_z = h00 + u * (h10 - h00) + v * (h01 - h00)
+        upper_z = h11 + (1.0 - u) * (h01 - h11) + (1.0 - v) * (h10 - h11)
+        return ray_starts[:, 2] + ray_directions[:, 2] * t - torch.where(upper, upper_z, lower_z)
+
+    t_hit = torch.full_like(t_enter, torch.inf)
+    # the second part is tested first, so that the hit of the first part overrides it
+    for t_a, t_b in ((t_mid, t_exit), (t_enter, t_mid)):
+        t_c = 0.5 * (t_a + t_b)
+        upper = u0 + du * t_c + v0 + dv * t_c > 1.0
+        f_a, f_b = height_above(t_a, upper), height_above(t_b, upper)
+        crossed = (f_a >= 0.0) & (f_b <= 0.0) & (f_a > f_b)
+        t_cross = t_a + (t_b - t_a) * f_a / torch.where(crossed, f_a - f_b, 1.0)
+        t_hit = torch.where(crossed, t_cross, t_hit)
+    return t_hit
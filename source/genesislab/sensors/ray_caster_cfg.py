@@ -0,0 +1,44 @@
+# Copyright 2025 genesis_lab Developers (https://github.com/Atticlmr/genesis_lab)
+#
+# Licensed under the Apache License, Version 2.0 , January 2004
+
+"""Configuration for the ray-caster sensor."""
+
+from __future__ import annotations
+
+from dataclasses import MISSING, dataclass
+
+from .patterns_cfg import PatternBaseCfg
+from .ray_caster import RayCaster
+from .sensor_base_cfg import SensorBaseCfg
+
+
+@dataclass(kw_only=True)
+class RayCasterCfg(SensorBaseCfg):
+    """Configuration for the ray-caster sensor."""
+
+    class_type: type = RayCaster
+
+    entity_name: str = MISSING
+    """The name of the entity the sensor is attached to."""
+
+    link_name: str | None = None
+    """The name of the link the sensor is attached to. Defaults to None, in which case the base link is used."""
+
+    offset_pos: tuple[float, float, float] = (0.0, 0.0, 0.0)
+    """The position of the sensor in the frame of the link (in m). Defaults to (0.0, 0.0, 0.0)."""
+
+    offset_quat: tuple[float, float, float, float] = (1.0, 0.0, 0.0, 0.0)
+    """The orientation of the sensor in the frame of the link in (w, x, y, z). Defaults to (1.0, 0.0, 0.0, 0.0)."""
+
+    attach_yaw_only: bool = False
+    """Whether the rays only follow the yaw of the link. Defaults to False.
+
+    This is used for height scanners, whose rays should stay vertical when the robot pitches and rolls.
+    """
+
+    pattern_cfg: PatternBaseCfg = MISSING
+    """The pattern of the rays."""
+
+    max_distance: float = 1.0e6
+    """The maximum distance of the hits from the start points of the rays (in m). Defaults to 1.0e6."""
@@ -0,0 +1,27 @@
+# Copyright 2025 genesis_lab Developers (https://github.com/Atticlmr/genesis_lab)
+#
+# Licensed under the Apache License, Version 2.0 , January 2004
+
+"""Data container of the ray-caster sensor."""
+
+from __future__ import annotations
+
+import torch
+from dataclasses import dataclass
+
+
+@dataclass
+class RayCasterData:
+    """Data of the ray-caster sensor."""
+
+    pos_w: torch.Tensor = None
+    """The position of the sensor in the world frame. Shape is (num_envs, 3)."""
+
+    quat_w: torch.Tensor = None
+    """The orientation of the sensor in (w, x, y, z) in the world frame. Shape is (num_envs, 4)."""
+
+    ray_hits_w: torch.Tensor = None
+    """The hit points of the rays in the world frame. Shape is (num_envs, num_rays, 3).
+
+    The coordinates of the rays that do not hit the terrain within the maximum distance are infinite.
+    """
@@ -0,0 +1,213 @@
+# Copyright 2025 genesis_lab Developers (https://github.com/Atticlmr/genesis_lab)
+#
+# Licensed under the Apache License, Version 2.0 , January 2004
+
+"""Base class for the sensors."""
+
+from __future__ import annotations
+
+import torch
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING, Any
+
+from .sensor_base_cfg import SensorBaseCfg
+
+if TYPE_CHECKING:
+    from genesislab.envs import InteractiveScene
+
+
+class SensorBase(ABC):
+    """Base class for the sensors of the interactive scene.
+
+    A sensor holds the data of all the environment instances in preallocated device buffers. The scene advances the
+    clock of the sensors after every physics step (see :meth:`update`), which marks the environments whose last
+    update is older than :attr:`SensorBaseCfg.update_period` as outdated. The data of the outdated environments is
+    recomputed in one batched call to :meth:`_update_buffers_impl` when :attr:`data` is read, so a sensor that is not
+    read on a step costs nothing, and reading it several times in a step computes it once.
+
+    Sensors are created with the scene, before it is built, so that they can add their Genesis objects (e.g.
+    cameras) to the scene. Their buffers are allocated in :meth:`_initialize_impl`, once the scene is built.
+    """
+
+    def __init__(self, cfg: SensorBaseCfg, scene: InteractiveScene):
+        """Initialize the sensor.
+
+        Args:
+            cfg: The configuration of the sensor.
+            scene: The scene the sensor is added to.
+
+        Raises:
+            ValueError: If the update period is negative.
+        """
+        if cfg.update_period < 0.0:
+            raise ValueError(f"The update period of the sensor must be non-negative. Received: {cfg.update_period}.")
+        self.cfg = cfg
+        self._scene = scene
+        self._is_initialized = False
+        # whether some environments may be outdated, to skip the check of the flags when nothing was stepped
+        self._maybe_outdated = False
+        # whether all the environments are outdated, to skip the search of the outdated environments
+        self._all_outdated = False
+
+    """
+    Properties.
+    """
+
+    @property
+    def num_envs(self) -> int:
+        """Number of environment instances."""
+        return self._scene.num_envs
+
+    @property
+    def device(self) -> torch.device:
+        """Device on which the sensor data lives."""
+        return self._scene.device
+
+    @property
+    def is_initialized(self) -> bool:
+        """Whether the buffers of the sensor have been allocated."""
+        return self._is_initialized
+
+    @property
+    @abstractmethod
+    def data(self) -> Any:
+        """The data of the sensor.
+
+        Implementations should call :meth:`_update_outdated_buffers` before returning their data.
+        """
+        raise NotImplementedError
+
+    """
+    Operations.
+    """
+
+    def initialize(self):
+        """Allocate the buffers of the sensor. This is called by the scene once it is built."""
+        self._is_outdated = torch.ones(self.num_envs, dtype=torch.bool, device=self.device)
+        self._timestamp = torch.zeros(self.num_envs, device=self.device)
+        self._timestamp_last_update = torch.zeros_like(self._timestamp)
+        self._all_env_ids = torch.arange(self.num_envs, dtype=torch.long, device=self.device)
+        self._initialize_impl()
+        self._is_initialized = True
+        self._maybe_outdated = True
+        self._all_outdated = True
+
+    def reset(self, env_ids: torch.Tensor | None = None):
+        """Reset the clock of the sensor and mark the environments as outdated.
+
+        Args:
+            env_ids: The environment indices to reset. Defaults to None (all instances).
+        """
+        ids = slice(None) if env_ids is None else env_ids
+        self._timestamp[ids] = 0.0
+        self._timestamp_last_update[ids] = 0.0
+        self._is_outdated[ids] = True
+        self._maybe_outdated = True
+        self._all_outdated = self._all_outdated or env_ids is None
+
+    def update(self, dt: float, force_recompute: bool = False):
+        """Advance the clock of the sensor and mark the environments whose data is due as outdated.
+
+        Args:
+            dt: The time elapsed since the last call (in s).
+            force_recompute: Whether to compute the data of the outdated environments now. Defaults to False.
+        """
+        self._timestamp += dt
+        if self.cfg.update_period <= 0.0:
+            # every environment is due at every step
+            self._is_outdated.fill_(True)
+            self._all_outdated = True
+        else:
+            self._is_outdated |= self._timestamp - self._timestamp_last_update + 1e-6 >= self.cfg.update_period
+        self._maybe_outdated = True
+        if force_recompute or not self.cfg.lazy_update:
+            self._update_outdated_buffers()
+
+    def get_state_buffers(self) -> dict[str, torch.Tensor]:
+        """Returns the per-environment buffers that the sensor carries from one update to the next.
+
+        These buffers are saved and restored with the state of the scene (see
+        :meth:`~genesislab.envs.InteractiveScene.get_state`). The sensors whose data only depends on the current
+        state of the simulation return no buffers: they are reset when a state is restored and recompute their data
+        when it is read. The sensors that integrate their data over time should return their data and internal
+        buffers together with their clock (see :meth:`_get_clock_buffers`).
+
+        Returns:
+            The buffers of the sensor, by name. Shapes are (num_envs, ...).
+        """
+        return {}
+
+    def get_state(self, env_ids: torch.Tensor | None = None) -> dict[str, torch.Tensor]:
+        """Read the state of the sensor for the given environments.
+
+        Args:
+            env_ids: The environment indices to read. Defaults to None (all instances).
+
+        Returns:
+            A copy of the rows of the state buffers (see :meth:`get_state_buffers`), by name.
+        """
+        if env_ids is None:
+            return {name: buffer.clone() for name, buffer in self.get_state_buffers().items()}
+        return {name: buffer[env_ids] for name, buffer in self.get_state_buffers().items()}
+
+    def set_state(self, state: dict[str, torch.Tensor], env_ids: torch.Tensor | None = None):
+        """Write the state of the sensor for the given environments.
+
+        Args:
+            state: The state read by :meth:`get_state`, with one row per environment to write.
+            env_ids: The environment indices to write. Defaults to None (all instances).
+        """
+        buffers = self.get_state_buffers()
+        if not buffers:
+            return
+        ids = slice(None) if env_ids is None else env_ids
+        for name, buffer in buffers.items():
+            buffer[ids] = state[name]
+        # the restored flags are checked one by one
+        self._maybe_outdated = True
+        self._all_outdated = False
+
+    """
+    Implementation specific.
+    """
+
+    @abstractmethod
+    def _initialize_impl(self):
+        """Allocate the data buffers of the sensor, once the scene is built."""
+        raise NotImplementedError(f"Please implement the '_initialize_impl' method for {self.__class__.__name__}.")
+
+    @abstractmethod
+    def _update_buffers_impl(self, env_ids: torch.Tensor):
+        """Compute the data of the given environments and write it into the buffers.
+
+        Args:
+            env_ids: The indices of the outdated environments.
+        """
+        raise NotImplementedError(f"Please implement the '_update_buffers_impl' method for {self.__class__.__name__}.")
+
+    """
+    Helper functions.
+    """
+
+    def _get_clock_buffers(self) -> dict[str, torch.Tensor]:
+        """Returns the buffers of the clock of the sensor, to be included in the state of stateful sensors."""
+        return {
+            "timestamp": self._timestamp,
+            "timestamp_last_update": self._timestamp_last_update,
+            "is_outdated": self._is_outdated,
+        }
+
+    def _update_outdated_buffers(self):
+        """Compute the data of the outdated environments in one batched call."""
+        if not self._maybe_outdated:
+            return
+        if self._all_outdated:
+            env_ids = self._all_env_ids
+        else:
+            env_ids = self._is_outdated.nonzero().squeeze(-1)
+        if len(env_ids) > 0:
+            self._update_buffers_impl(env_ids)
+            self._timestamp_last_update[env_ids] = self._timestamp[env_ids]
+            self._is_outdated[env_ids] = False
+        self._maybe_outdated = False
+        self._all_outdated = False
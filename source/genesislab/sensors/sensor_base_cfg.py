@@ -0,0 +1,34 @@
+# Copyright 2025 genesis_lab Developers (https://github.com/Atticlmr/genesis_lab)
+#
+# Licensed under the Apache License, Version 2.0 , January 2004
+
+"""Configuration for the sensors."""
+
+from __future__ import annotations
+
+from dataclasses import MISSING, dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .sensor_base import SensorBase
+
+
+@dataclass(kw_only=True)
+class SensorBaseCfg:
+    """Configuration for a sensor added to the interactive scene."""
+
+    class_type: type[SensorBase] = MISSING
+    """The associated sensor class.
+
+    The class should inherit from :class:`genesislab.sensors.SensorBase`.
+    """
+
+    update_period: float = 0.0
+    """The period of the updates of the sensor data (in s). Defaults to 0.0, in which case the data is updated
+    at every physics step it is read after."""
+
+    lazy_update: bool = True
+    """Whether to compute the data only when it is read. Defaults to True.
+
+    If False, the data of the outdated environments is computed after every physics step, whether it is read or not.
+    """
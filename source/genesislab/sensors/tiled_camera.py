@@ -0,0 +1,165 @@
+# Copyright 2025 genesis_lab Developers (https://github.com/Atticlmr/genesis_lab)
+#
+# Licensed under the Apache License, Version 2.0 , January 2004
+
+"""Tiled camera sensor rendering the images of all the environments at once."""
+
+from __future__ import annotations
+
+import torch
+from typing import TYPE_CHECKING
+
+from genesislab.utils.math import (
+    convert_camera_frame_orientation_convention,
+    matrix_from_quat,
+    orthogonalize_perspective_depth,
+    quat_apply,
+    quat_mul,
+    transform_points,
+    unproject_depth,
+)
+
+from .camera_data import CameraData
+from .sensor_base import SensorBase
+
+if TYPE_CHECKING:
+    from genesislab.envs import InteractiveScene
+
+    from .tiled_camera_cfg import TiledCameraCfg
+
+
+class TiledCamera(SensorBase):
+    """A camera sensor that renders the images of all the environments in one call.
+
+    The sensor adds a single batched Genesis camera to the scene, which holds one pose per environment. At each
+    update, the poses of all the environments are written at once and the camera is rendered once, which returns the
+    images of all the environments stacked in one ``(num_envs, height, width, num_channels)`` buffer. The depth
+    post-processing (distances to the optical center and point clouds) then runs on the whole buffer on the device of
+    the simulation.
+
+    With the default rasterizer, Genesis draws the environments one after the other within the render call. With the
+    :class:`genesis.renderers.BatchRenderer` (see :attr:`~genesislab.envs.SimCfg.renderer`), all the environments are
+    drawn in a single pass on the GPU, which is the renderer to use for hundreds of cameras.
+    """
+
+    cfg: TiledCameraCfg
+    """The configuration of the sensor."""
+
+    def __init__(self, cfg: TiledCameraCfg, scene: InteractiveScene):
+        """Initialize the sensor and add its camera to the scene.
+
+        Args:
+            cfg: The configuration of the sensor.
+            scene: The scene the sensor is added to.
+
+        Raises:
+            ValueError: If a data type is not supported.
+        """
+        unsupported = set(cfg.data_types) - {"rgb", "depth", "distance_to_camera", "pointcloud"}
+        if unsupported:
+            raise ValueError(f"The data types {sorted(unsupported)} are not supported by the tiled camera.")
+        super().__init__(cfg, scene)
+        self._data = CameraData()
+        self._camera = scene.sim.add_camera(
+            res=(cfg.width, cfg.height), fov=cfg.fov, near=cfg.near, far=cfg.far, GUI=False
+        )
+
+    def __str__(self) -> str:
+        """Returns: A string representation of the sensor."""
+        if self.cfg.entity_name is None:
+            msg = "Tiled camera @ env origins:\n"
+        else:
+            msg = f"Tiled camera @ '{self.cfg.entity_name}/{self.cfg.link_name or 'base'}':\n"
+        msg += f"\tupdate period (s): {self.cfg.update_period}\n"
+        msg += f"\tnumber of cameras: {self.num_envs}\n"
+        msg += f"\timage shape      : {self.image_shape}\n"
+        msg += f"\tdata types       : {self.cfg.data_types}"
+        return msg
+
+    """
+    Properties.
+    """
+
+    @property
+    def image_shape(self) -> tuple[int, int]:
+        """The shape (height, width) of the images."""
+        return (self.cfg.height, self.cfg.width)
+
+    @property
+    def data(self) -> CameraData:
+        """The data of the sensor, updated for the outdated environments."""
+        self._update_outdated_buffers()
+        return self._data
+
+    """
+    Implementation.
+    """
+
+    def _initialize_impl(self):
+        # pose of the camera in the frame of the link, with the opengl convention of genesis
+        self._link = None
+        if self.cfg.entity_name is not None:
+            entity = self._scene[self.cfg.entity_name]
+            self._link = entity.base_link if self.cfg.link_name is None else entity.get_link(self.cfg.link_name)
+        self._offset_pos = torch.tensor(self.cfg.offset_pos, device=self.device).expand(self.num_envs, 3)
+        offset_quat = torch.tensor([self.cfg.offset_quat], device=self.device)
+        offset_quat = convert_camera_frame_orientation_convention(offset_quat, self.cfg.offset_convention, "opengl")
+        self._offset_quat = offset_quat.expand(self.num_envs, 4)
+        self._transforms = torch.eye(4, device=self.device).repeat(self.num_envs, 1, 1)
+        # depth post-processing
+        intrinsics = torch.tensor(self._camera.intrinsics, dtype=torch.float, device=self.device)
+        self._render_rgb = "rgb" in self.cfg.data_types
+        self._render_depth = any(name != "rgb" for name in self.cfg.data_types)
+        # ratio of the distance to the image plane over the distance to the optical center of each pixel
+        ones = torch.ones(self.image_shape, device=self.device)
+        self._orthogonal_ratio = orthogonalize_perspective_depth(ones, intrinsics)
+        # data buffers
+        height, width = self.image_shape
+        self._data.pos_w = torch.zeros(self.num_envs, 3, device=self.device)
+        self._data.quat_w_world = torch.zeros(self.num_envs, 4, device=self.device)
+        self._data.quat_w_ros = torch.zeros(self.num_envs, 4, device=self.device)
+        self._data.intrinsic_matrices = intrinsics.repeat(self.num_envs, 1, 1)
+        self._data.image_shape = self.image_shape
+        for name in self.cfg.data_types:
+            if name == "rgb":
+                buffer = torch.zeros(self.num_envs, height, width, 3, dtype=torch.uint8, device=self.device)
+            elif name == "pointcloud":
+                buffer = torch.zeros(self.num_envs, height * width, 3, device=self.device)
+            else:
+                buffer = torch.zeros(self.num_envs, height, width, 1, device=self.device)
+            self._data.output[name] = buffer
+
+    def _update_buffers_impl(self, env_ids: torch.Tensor):
+        # the genesis camera is posed and rendered for all the environments at once
+        if self._link is None:
+            pos_w = self._scene.env_origins + self._offset_pos
+            quat_w = self._offset_quat
+        else:
+            link_quat = self._link.get_quat()
+            pos_w = self._link.get_pos() + quat_apply(link_quat, self._offset_pos)
+            quat_w = quat_mul(link_quat, self._offset_quat)
+        self._transforms[:, :3, :3] = matrix_from_quat(quat_w)
+        self._transforms[:, :3, 3] = pos_w
+        self._camera.set_pose(transform=self._transforms)
+        rgb, depth, _, _ = self._camera.render(rgb=self._render_rgb, depth=self._render_depth)
+        # only the outdated environments are written, so that the others keep the data of their last update
+        self._data.pos_w[env_ids] = pos_w[env_ids]
+        quat_w = quat_w[env_ids]
+        self._data.quat_w_world[env_ids] = convert_camera_frame_orientation_convention(quat_w, "opengl", "world")
+        self._data.quat_w_ros[env_ids] = convert_camera_frame_orientation_convention(quat_w, "opengl", "ros")
+        if self._render_rgb:
+            self._data.output["rgb"][env_ids] = torch.as_tensor(rgb, device=self.device)[env_ids]
+        if self._render_depth:
+            # distances to the image plane, with the pixels beyond the far plane clipped
+            depth = torch.as_tensor(depth, device=self.device)[env_ids].clamp_max(self.cfg.far)
+            if self.cfg.depth_clipping_behavior == "zero":
+                depth[depth >= self.cfg.far] = 0.0
+            if "depth" in self._data.output:
+                self._data.output["depth"][env_ids] = depth.unsqueeze(-1)
+            if "distance_to_camera" in self._data.output:
+                self._data.output["distance_to_camera"][env_ids] = (depth / self._orthogonal_ratio).unsqueeze(-1)
+            if "pointcloud" in self._data.output:
+                points = unproject_depth(depth, self._data.intrinsic_matrices[env_ids])
+                self._data.output["pointcloud"][env_ids] = transform_points(
+                    points, self._data.pos_w[env_ids], self._data.quat_w_ros[env_ids]
+                )
@@ -0,0 +1,75 @@
+# Copyright 2025 genesis_lab Developers (https://github.com/Atticlmr/genesis_lab)
+#
+# Licensed under the Apache License, Version 2.0 , January 2004
+
+"""Configuration for the tiled camera sensor."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Literal
+
+from .sensor_base_cfg import SensorBaseCfg
+from .tiled_camera import TiledCamera
+
+
+@dataclass(kw_only=True)
+class TiledCameraCfg(SensorBaseCfg):
+    """Configuration for the tiled camera sensor."""
+
+    class_type: type = TiledCamera
+
+    entity_name: str | None = None
+    """The name of the entity the camera is attached to. Defaults to None, in which case the camera is fixed in the
+    frame of the environment origins."""
+
+    link_name: str | None = None
+    """The name of the link the camera is attached to. Defaults to None, in which case the base link is used."""
+
+    offset_pos: tuple[float, float, float] = (0.0, 0.0, 0.0)
+    """The position of the camera in the frame of the link (in m). Defaults to (0.0, 0.0, 0.0)."""
+
+    offset_quat: tuple[float, float, float, float] = (1.0, 0.0, 0.0, 0.0)
+    """The orientation of the camera in the frame of the link in (w, x, y, z). Defaults to (1.0, 0.0, 0.0, 0.0)."""
+
+    offset_convention: Literal["opengl", "ros", "world"] = "world"
+    """The convention of the camera axes in which :attr:`offset_quat` is given. Defaults to "world".
+
+    * ``"opengl"``: forward axis -Z, up axis +Y.
+    * ``"ros"``: forward axis +Z, up axis -Y.
+    * ``"world"``: forward axis +X, up axis +Z.
+    """
+
+    width: int = 64
+    """The width of the images (in pixels). Defaults to 64."""
+
+    height: int = 64
+    """The height of the images (in pixels). Defaults to 64."""
+
+    fov: float = 60.0
+    """The vertical field of view (in degrees). Defaults to 60.0."""
+
+    near: float = 0.05
+    """The distance of the near clipping plane (in m). Defaults to 0.05."""
+
+    far: float = 20.0
+    """The distance of the far clipping plane (in m). Defaults to 20.0."""
+
+    data_types: list[Literal["rgb", "depth", "distance_to_camera", "pointcloud"]] = field(
+        default_factory=lambda: ["rgb"]
+    )
+    """The images to render and compute. Defaults to ``["rgb"]``.
+
+    * ``"rgb"``: the color images. Shape is (num_envs, height, width, 3), of type ``torch.uint8``.
+    * ``"depth"``: the distances to the image plane (in m). Shape is (num_envs, height, width, 1).
+    * ``"distance_to_camera"``: the distances to the optical center (in m). Shape is (num_envs, height, width, 1).
+    * ``"pointcloud"``: the points of the depth images in the world frame (in m). Shape is
+      (num_envs, height * width, 3).
+    """
+
+    depth_clipping_behavior: Literal["max", "zero"] = "max"
+    """The depth of the pixels that see nothing within the far plane. Defaults to "max".
+
+    * ``"max"``: the pixels are set to the far plane distance.
+    * ``"zero"``: the pixels are set to zero.
+    """
@@ -0,0 +1,10 @@
+# Copyright 2025 genesis_lab Developers (https://github.com/Atticlmr/genesis_lab)
+#
+# Licensed under the Apache License, Version 2.0 , January 2004
+
+"""Sub-package with the terrain generators and the terrain importer."""
+
+from .terrain_generator import HF_RESOLUTION, TerrainGenerator
+from .terrain_generator_cfg import SubTerrainCfg, TerrainGeneratorCfg
+from .terrain_importer import TerrainImporter
+from .terrain_importer_cfg import TerrainImporterCfg
@@ -0,0 +1,138 @@
+# Copyright 2025 genesis_lab Developers (https://github.com/Atticlmr/genesis_lab)
+#
+# Licensed under the Apache License, Version 2.0 , January 2004
+
+"""Generator of a grid of height-field sub-terrains."""
+
+from __future__ import annotations
+
+import dataclasses
+import numpy as np
+import trimesh
+
+from .terrain_generator_cfg import SubTerrainCfg, TerrainGeneratorCfg
+
+HF_RESOLUTION = 0.1
+"""The horizontal resolution at which the height-field functions sample the terrain (in m)."""
+
+
+class TerrainGenerator:
+    """Generate a grid of sub-terrains from the height-field functions.
+
+    Every sub-terrain is generated with the :func:`hf_to_mesh`-decorated functions of
+    :mod:`genesislab.terrains.height_field.hf_terrains`. The sub-terrains are stitched into one height field and one
+    triangle mesh, both centered at the world origin. The spawn origin of every sub-terrain is stored in
+    :attr:`terrain_origins`, an array of shape ``(num_rows, num_cols, 3)``, so that the origin of a robot can be
+    gathered from its ``(level, type)`` pair without searching.
+    """
+
+    terrain_origins: np.ndarray
+    """The spawn origins of the sub-terrains (in m). Shape is (num_rows, num_cols, 3)."""
+
+    height_field: np.ndarray
+    """The heights of the whole terrain (in m), indexed as ``[x, y]`` with a resolution of :data:`HF_RESOLUTION`."""
+
+    terrain_mesh: trimesh.Trimesh
+    """The triangle mesh of all the sub-terrains, in the world frame."""
+
+    def __init__(self, cfg: TerrainGeneratorCfg):
+        """Generate the terrain.
+
+        Args:
+            cfg: The configuration of the terrain generator.
+
+        Raises:
+            ValueError: If no sub-terrain is configured.
+        """
+        if len(cfg.sub_terrains) == 0:
+            raise ValueError("The terrain generator requires at least one sub-terrain.")
+        self.cfg = cfg
+        self._rng = np.random.default_rng(cfg.seed)
+        # number of samples of a sub-terrain along x and y
+        self._sub_shape = (int(cfg.size[0] / HF_RESOLUTION), int(cfg.size[1] / HF_RESOLUTION))
+        self._border_pix = int(cfg.border_width / HF_RESOLUTION)
+
+        self.height_field = np.zeros(
+            (
+                cfg.num_rows * self._sub_shape[0] + 2 * self._border_pix,
+                cfg.num_cols * self._sub_shape[1] + 2 * self._border_pix,
+            ),
+            dtype=np.float32,
+        )
+        self.terrain_origins = np.zeros((cfg.num_rows, cfg.num_cols, 3), dtype=np.float32)
+        # the sub-terrains are generated in the grid frame, whose origin is the corner of the border
+        sub_cfgs = list(cfg.sub_terrains.values())
+        proportions = np.array([sub_cfg.proportion for sub_cfg in sub_cfgs], dtype=float)
+        proportions = np.cumsum(proportions / proportions.sum())
+        meshes = []
+        for row in range(cfg.num_rows):
+            for col in range(cfg.num_cols):
+                if cfg.curriculum:
+                    difficulty = (row + self._rng.uniform()) / cfg.num_rows
+                    sub_index = int(np.searchsorted(proportions, col / cfg.num_cols + 1e-3, side="right"))
+                else:
+                    difficulty = self._rng.uniform()
+                    sub_index = int(np.searchsorted(proportions, self._rng.uniform(), side="right"))
+                lower, upper = cfg.difficulty_range
+                difficulty = lower + difficulty * (upper - lower)
+                mesh = self._add_sub_terrain(row, col, sub_cfgs[min(sub_index, len(sub_cfgs) - 1)], difficulty)
+                meshes.append(mesh)
+
+        # center the terrain at the world origin
+        self.offset = -np.array([self.height_field.shape[0], self.height_field.shape[1]]) * HF_RESOLUTION / 2.0
+        self.terrain_origins[..., :2] += self.offset
+        self.terrain_mesh = trimesh.util.concatenate(meshes)
+        self.terrain_mesh.apply_translation((*self.offset, 0.0))
+
+    def __str__(self) -> str:
+        msg = "Terrain Generator:"
+        msg += f"\n\tSeed: {self.cfg.seed}"
+        msg += f"\n\tNumber of rows: {self.cfg.num_rows}"
+        msg += f"\n\tNumber of columns: {self.cfg.num_cols}"
+        msg += f"\n\tSub-terrain size: {self.cfg.size}"
+        msg += f"\n\tSub-terrain types: {list(self.cfg.sub_terrains.keys())}"
+        msg += f"\n\tCurriculum: {self.cfg.curriculum}"
+        return msg
+
+    """
+    Helper functions.
+    """
+
+    def _add_sub_terrain(self, row: int, col: int, sub_cfg: SubTerrainCfg, difficulty: float) -> trimesh.Trimesh:
+        """Generate a sub-terrain and write it into the height field at its grid cell.
+
+        Returns:
+            The mesh of the sub-terrain, in the grid frame.
+        """
+        # resolve the configuration of the sub-terrain for the difficulty
+        overrides = {"size": self.cfg.size, "seed": int(self._rng.integers(0, 2**31 - 1))}
+        for name in sub_cfg.curriculum_ranges:
+            lower, upper = getattr(sub_cfg.cfg, name)
+            value = lower + difficulty * (upper - lower)
+            overrides[name] = (value, value)
+        cfg = dataclasses.replace(sub_cfg.cfg, **overrides)
+        # the function must be called with a keyword argument for the decorator to read the seed
+        meshes, _ = sub_cfg.function(cfg=cfg)
+        mesh = trimesh.util.concatenate(meshes)
+
+        # scatter the vertices into the height field (indexed as [x, y])
+        heights = np.zeros(self._sub_shape, dtype=np.float32)
+        ix = np.clip(np.rint(mesh.vertices[:, 0] / HF_RESOLUTION).astype(int), 0, self._sub_shape[0] - 1)
+        iy = np.clip(np.rint(mesh.vertices[:, 1] / HF_RESOLUTION).astype(int), 0, self._sub_shape[1] - 1)
+        heights[ix, iy] = mesh.vertices[:, 2]
+        start_x = self._border_pix + row * self._sub_shape[0]
+        start_y = self._border_pix + col * self._sub_shape[1]
+        self.height_field[start_x : start_x + self._sub_shape[0], start_y : start_y + self._sub_shape[1]] = heights
+
+        # the origin is the highest point of the patch at the center of the sub-terrain
+        half_patch = max(int(self.cfg.origin_patch_size / HF_RESOLUTION / 2), 1)
+        cx, cy = self._sub_shape[0] // 2, self._sub_shape[1] // 2
+        origin_z = heights[cx - half_patch : cx + half_patch, cy - half_patch : cy + half_patch].max()
+        self.terrain_origins[row, col] = (
+            (start_x + cx) * HF_RESOLUTION,
+            (start_y + cy) * HF_RESOLUTION,
+            origin_z,
+        )
+
+        mesh.apply_translation((start_x * HF_RESOLUTION, start_y * HF_RESOLUTION, 0.0))
+        return mesh
@@ -0,0 +1,75 @@
+# Copyright 2025 genesis_lab Developers (https://github.com/Atticlmr/genesis_lab)
+#
+# Licensed under the Apache License, Version 2.0 , January 2004
+
+"""Configuration classes for the terrain generator."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import MISSING, dataclass, field
+
+from .height_field.hf_terrians_cfg import HfTerrainBaseCfg
+
+
+@dataclass(kw_only=True)
+class SubTerrainCfg:
+    """Configuration for a type of sub-terrain in the terrain grid."""
+
+    function: Callable = MISSING
+    """The height-field function that generates the sub-terrain, e.g. :func:`hf_pyramid_stairs_terrain`.
+
+    The function is called with the keyword argument ``cfg`` and returns the meshes and the origin of the sub-terrain.
+    """
+
+    cfg: HfTerrainBaseCfg = MISSING
+    """The configuration passed to the function. Its ``size`` and ``seed`` are set by the generator."""
+
+    proportion: float = 1.0
+    """The proportion of the columns of the grid that use this sub-terrain. Defaults to 1.0."""
+
+    curriculum_ranges: tuple[str, ...] = ()
+    """The names of the ``(min, max)`` range fields of :attr:`cfg` that are driven by the difficulty.
+
+    For a difficulty ``d`` in [0, 1], each of these ranges is collapsed to the single value ``min + d * (max - min)``.
+    Defaults to an empty tuple, in which case the sub-terrain does not depend on the difficulty.
+    """
+
+
+@dataclass(kw_only=True)
+class TerrainGeneratorCfg:
+    """Configuration for the terrain generator.
+
+    The terrain is a grid of ``(num_rows, num_cols)`` sub-terrains. With the curriculum enabled, the rows are the
+    difficulty levels (increasing along x) and the columns are the sub-terrain types, so that a robot keeps its
+    terrain type and moves through the rows as it gets promoted or demoted.
+    """
+
+    seed: int | None = None
+    """The seed of the random number generator. Defaults to None, in which case the generation is not seeded."""
+
+    curriculum: bool = False
+    """Whether the rows are sorted by increasing difficulty. Defaults to False,
+    in which case the difficulty and the type of every sub-terrain are sampled randomly."""
+
+    size: tuple[float, float] = MISSING
+    """The size of each sub-terrain along x and y (in m)."""
+
+    num_rows: int = 1
+    """Number of rows of sub-terrains (difficulty levels with the curriculum). Defaults to 1."""
+
+    num_cols: int = 1
+    """Number of columns of sub-terrains (terrain types with the curriculum). Defaults to 1."""
+
+    border_width: float = 0.0
+    """The width of the flat border around the grid (in m). Defaults to 0.0."""
+
+    difficulty_range: tuple[float, float] = (0.0, 1.0)
+    """The range of difficulty values spanned by the rows. Defaults to (0.0, 1.0)."""
+
+    origin_patch_size: float = 1.0
+    """The size of the square patch at the center of a sub-terrain whose highest point is the spawn origin (in m).
+    Defaults to 1.0."""
+
+    sub_terrains: dict[str, SubTerrainCfg] = field(default_factory=dict)
+    """The types of sub-terrains, keyed by their name."""
@@ -0,0 +1,157 @@
+# Copyright 2025 genesis_lab Developers (https://github.com/Atticlmr/genesis_lab)
+#
+# Licensed under the Apache License, Version 2.0 , January 2004
+
+"""Importer of the terrain into the interactive scene and its per-environment origins."""
+
+from __future__ import annotations
+
+import numpy as np
+import torch
+from typing import Any
+
+import genesis as gs
+
+from .terrain_generator import HF_RESOLUTION, TerrainGenerator
+from .terrain_importer_cfg import TerrainImporterCfg
+
+
+class TerrainImporter:
+    """Add the terrain to a Genesis scene and keep the terrain level, type and origin of every environment.
+
+    Genesis simulates all the environments in the same world frame without collisions between them, so the
+    environments share a single terrain and are only placed at different origins on it. For generated terrains,
+    the origins of the sub-terrains are stored on the device in :attr:`terrain_origins` of shape
+    ``(num_rows, num_cols, 3)``, and every environment is assigned a level (row) in :attr:`terrain_levels` and a
+    type (column) in :attr:`terrain_types`. The curriculum is updated with :meth:`update_env_origins`, which only
+    uses batched tensor operations on the device.
+    """
+
+    terrain_origins: torch.Tensor | None
+    """The origins of the sub-terrains. Shape is (num_rows, num_cols, 3). None for a plane."""
+
+    env_origins: torch.Tensor
+    """The origins of the environments. Shape is (num_envs, 3)."""
+
+    height_field: torch.Tensor | None
+    """The heights of the vertices of the Genesis terrain (in m), indexed as ``[x, y]`` with a spacing of
+    :attr:`horizontal_scale`. Shape is (num_x, num_y). None for a plane.
+
+    The heights are discretized with the vertical scale of the terrain, like the collision surface of Genesis.
+    """
+
+    horizontal_scale: float
+    """The spacing of the vertices of :attr:`height_field` and of the Genesis terrain (in m)."""
+
+    height_field_origin: tuple[float, float]
+    """The position (x, y) of the vertex ``[0, 0]`` of :attr:`height_field` in the world frame (in m)."""
+
+    def __init__(self, cfg: TerrainImporterCfg, num_envs: int, device: torch.device):
+        """Generate the terrain and assign the environments to it.
+
+        Args:
+            cfg: The configuration of the terrain importer.
+            num_envs: The number of environment instances.
+            device: The device on which the tensors are allocated.
+
+        Raises:
+            ValueError: If the terrain type is "generator" and no generator is configured.
+            ValueError: If the horizontal scale is not a multiple of the generation resolution.
+            ValueError: If the terrain type is not supported.
+        """
+        self.cfg = cfg
+        self.num_envs = num_envs
+        self.device = device
+        self.terrain_generator: TerrainGenerator | None = None
+        self.terrain_origins = None
+        self.terrain_levels: torch.Tensor | None = None
+        self.terrain_types: torch.Tensor | None = None
+        self.env_origins = torch.zeros(num_envs, 3, device=device)
+        self.height_field = None
+        self.height_field_origin = (0.0, 0.0)
+        self.horizontal_scale = HF_RESOLUTION if cfg.horizontal_scale is None else cfg.horizontal_scale
+
+        if cfg.terrain_type == "generator":
+            if cfg.terrain_generator is None:
+                raise ValueError("The terrain generator configuration is required for the terrain type 'generator'.")
+            stride = round(self.horizontal_scale / HF_RESOLUTION)
+            if stride < 1 or abs(stride * HF_RESOLUTION - self.horizontal_scale) > 1.0e-6:
+                raise ValueError(
+                    f"The horizontal scale {self.horizontal_scale} is not a multiple of the generation resolution"
+                    f" {HF_RESOLUTION}."
+                )
+            self.terrain_generator = TerrainGenerator(cfg.terrain_generator)
+            self.terrain_origins = torch.tensor(self.terrain_generator.terrain_origins, device=device)
+            self._configure_env_origins()
+            # the subsampled vertices keep the vertex [0, 0], hence the origin of the height field
+            height_field = self.terrain_generator.height_field[::stride, ::stride]
+            self._height_field_raw = np.rint(height_field / cfg.vertical_scale)
+            self.height_field = torch.tensor(self._height_field_raw * cfg.vertical_scale, dtype=torch.float, device=device)
+            self.height_field_origin = tuple(float(x) for x in self.terrain_generator.offset)
+        elif cfg.terrain_type != "plane":
+            raise ValueError(f"Terrain type '{cfg.terrain_type}' is not supported. Please use 'plane' or 'generator'.")
+
+    """
+    Properties.
+    """
+
+    @property
+    def max_terrain_level(self) -> int:
+        """The number of terrain levels (rows of the grid). It is 1 for a plane."""
+        return 1 if self.terrain_origins is None else self.terrain_origins.shape[0]
+
+    """
+    Operations.
+    """
+
+    def create_morph(self) -> Any:
+        """Create the Genesis morph of the terrain.
+
+        Returns:
+            A :class:`genesis.morphs.Plane` or a :class:`genesis.morphs.Terrain` built from the generated height field.
+        """
+        if self.terrain_generator is None:
+            return gs.morphs.Plane()
+        return gs.morphs.Terrain(
+            height_field=self._height_field_raw,
+            horizontal_scale=self.horizontal_scale,
+            vertical_scale=self.cfg.vertical_scale,
+            pos=(*self.height_field_origin, 0.0),
+        )
+
+    def update_env_origins(self, env_ids: torch.Tensor, move_up: torch.Tensor, move_down: torch.Tensor):
+        """Promote or demote the given environments and gather their new origins.
+
+        Environments that are promoted beyond the last level are sent to a random level, so that the robots keep
+        visiting the whole curriculum. Environments cannot be demoted below the first level.
+
+        Args:
+            env_ids: The environment ids to update.
+            move_up: Whether each environment is promoted. Shape is (len(env_ids),).
+            move_down: Whether each environment is demoted. Shape is (len(env_ids),).
+        """
+        if self.terrain_origins is None:
+            return
+        levels = self.terrain_levels[env_ids] + move_up.long() - move_down.long()
+        levels = torch.where(
+            levels >= self.max_terrain_level,
+            torch.randint_like(levels, self.max_terrain_level),
+            torch.clamp_min(levels, 0),
+        )
+        self.terrain_levels[env_ids] = levels
+        self.env_origins[env_ids] = self.terrain_origins[levels, self.terrain_types[env_ids]]
+
+    """
+    Helper functions.
+    """
+
+    def _configure_env_origins(self):
+        """Spread the environments over the terrain types and the initial levels."""
+        num_rows, num_cols = self.terrain_origins.shape[:2]
+        max_init_level = num_rows - 1 if self.cfg.max_init_terrain_level is None else self.cfg.max_init_terrain_level
+        max_init_level = min(max_init_level, num_rows - 1)
+        self.terrain_levels = torch.randint(0, max_init_level + 1, (self.num_envs,), device=self.device)
+        self.terrain_types = torch.div(
+            torch.arange(self.num_envs, device=self.device), self.num_envs / num_cols, rounding_mode="floor"
+        ).long()
+        self.env_origins[:] = self.terrain_origins[self.terrain_levels, self.terrain_types]
@@ -0,0 +1,43 @@
+# Copyright 2025 genesis_lab Developers (https://github.com/Atticlmr/genesis_lab)
+#
+# Licensed under the Apache License, Version 2.0 , January 2004
+
+"""Configuration for the terrain importer."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Literal
+
+from .terrain_generator_cfg import TerrainGeneratorCfg
+
+
+@dataclass(kw_only=True)
+class TerrainImporterCfg:
+    """Configuration for the terrain importer."""
+
+    terrain_type: Literal["plane", "generator"] = "generator"
+    """The type of terrain. Defaults to "generator".
+
+    * ``"plane"``: an infinite ground plane. All the environments spawn at the world origin.
+    * ``"generator"``: a grid of height-field sub-terrains generated from :attr:`terrain_generator`.
+    """
+
+    terrain_generator: TerrainGeneratorCfg | None = None
+    """The terrain generator configuration. Only used if :attr:`terrain_type` is "generator"."""
+
+    max_init_terrain_level: int | None = None
+    """The maximum initial terrain level of the environments. Defaults to None,
+    in which case the environments are spread over all the levels."""
+
+    horizontal_scale: float | None = None
+    """The spacing of the vertices of the Genesis terrain (in m). Defaults to None, in which case the generated
+    height field is used at its resolution of :data:`~genesislab.terrains.HF_RESOLUTION`.
+
+    Otherwise, it must be a multiple of the generation resolution, and the generated height field is subsampled to it.
+    Genesis pre-computes a signed distance field from the whole terrain mesh when the scene is built, whose time and
+    memory grow with the number of vertices, so large terrains need a coarser collision surface to be built at all.
+    """
+
+    vertical_scale: float = 0.005
+    """The height discretization of the Genesis terrain (in m). Defaults to 0.005."""
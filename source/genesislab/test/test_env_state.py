@@ -0,0 +1,76 @@
+# Copyright 2025 genesis_lab Developers (https://github.com/Atticlmr/genesis_lab)
+#
+# Licensed under the Apache License, Version 2.0 , January 2004
+
+"""Tests of the save and load of the environment state, on all the registered tasks.
+
+A snapshot is saved in the middle of the episodes, a few steps are run, and the snapshot is restored and the same
+steps are replayed: the observations, rewards and dones must match. The warm start of the contact solver of Genesis
+is not part of the snapshot, so the tasks with contacts only match up to a small tolerance, while a buffer of the
+task that is not restored makes the replay diverge.
+
+.. code-block:: bash
+
+    python -m pytest source/genesislab/test/test_env_state.py
+
+"""
+
+from __future__ import annotations
+
+import gymnasium as gym
+import pytest
+import torch
+
+import genesislab_tasks  # noqa: F401
+from genesislab_tasks.utils import parse_env_cfg
+
+NUM_ENVS = 4
+NUM_WARMUP_STEPS = 5
+NUM_REPLAY_STEPS = 10
+# tolerance of the comparisons, for the warm start of the contact solver
+TOLERANCE = {"atol": 1.0e-3, "rtol": 1.0e-3}
+
+TASKS = sorted(task for task in gym.registry if task.startswith("Genesis-"))
+
+
+def _rollout(env, actions: torch.Tensor) -> list:
+    """Step the environment with the given actions, with a fixed seed of the task randomization."""
+    torch.manual_seed(1)
+    transitions = []
+    for step_actions in actions:
+        obs, rewards, terminated, truncated, _ = env.step(step_actions)
+        transitions.append(({name: value.clone() for name, value in obs.items()}, rewards.clone(), terminated, truncated))
+    return transitions
+
+
+@pytest.mark.parametrize("task", TASKS)
+def test_save_load_replay(task: str):
+    env = gym.make(task, cfg=parse_env_cfg(task, num_envs=NUM_ENVS, seed=0)).unwrapped
+    generator = torch.Generator(device=env.device).manual_seed(0)
+    action_shape = (NUM_WARMUP_STEPS + NUM_REPLAY_STEPS, NUM_ENVS, *env.single_action_space.shape)
+    actions = torch.rand(action_shape, generator=generator, device=env.device) * 2.0 - 1.0
+
+    env.reset()
+    for step_actions in actions[:NUM_WARMUP_STEPS]:
+        obs, *_ = env.step(step_actions)
+    saved_obs = {name: value.clone() for name, value in obs.items()}
+    state = env.save_state()
+    expected = _rollout(env, actions[NUM_WARMUP_STEPS:])
+
+    restored_obs = env.load_state(state)
+    for name, value in saved_obs.items():
+        torch.testing.assert_close(restored_obs[name], value, **TOLERANCE)
+    replayed = _rollout(env, actions[NUM_WARMUP_STEPS:])
+    for step, (expected_step, replayed_step) in enumerate(zip(expected, replayed)):
+        expected_obs, expected_rewards, expected_terminated, expected_truncated = expected_step
+        replayed_obs, replayed_rewards, replayed_terminated, replayed_truncated = replayed_step
+        for name, value in expected_obs.items():
+            torch.testing.assert_close(
+                replayed_obs[name], value, **TOLERANCE, msg=lambda msg: f"{name} at step {step}: {msg}"
+            )
+        torch.testing.assert_close(
+            replayed_rewards, expected_rewards, **TOLERANCE, msg=lambda msg: f"rewards at step {step}: {msg}"
+        )
+        assert torch.equal(replayed_terminated, expected_terminated)
+        assert torch.equal(replayed_truncated, expected_truncated)
+    env.close()
@@ -0,0 +1,72 @@
+# Copyright 2025 genesis_lab Developers (https://github.com/Atticlmr/genesis_lab)
+#
+# Licensed under the Apache License, Version 2.0 , January 2004
+
+"""Tests of the bookkeeping of the environment logs by the PPO runner.
+
+.. code-block:: bash
+
+    python -m pytest source/genesislab/test/test_on_policy_runner.py
+
+"""
+
+from __future__ import annotations
+
+import pytest
+import torch
+
+from genesislab_rl import RslRlVecEnvWrapper
+from genesislab_rl.ppo import ActorCriticCfg, OnPolicyRunner, PPOAlgorithmCfg, PPOCfg
+
+NUM_ENVS = 2
+NUM_OBS = 3
+
+
+class _LoggingEnv(RslRlVecEnvWrapper):
+    """Environment returning zero observations and rewards, with the given log at every step."""
+
+    def __init__(self, logs: list[dict[str, float]]):
+        # the wrapped environment is not needed: the wrapper interface is implemented directly
+        self.num_envs = NUM_ENVS
+        self.num_obs = NUM_OBS
+        self.num_privileged_obs = 0
+        self.num_actions = 1
+        self.device = torch.device("cpu")
+        self.clip_actions = None
+        self._obs = {"policy": torch.zeros(NUM_ENVS, NUM_OBS)}
+        self._logs = logs
+        self._num_steps = 0
+
+    def step(self, actions: torch.Tensor) -> tuple[torch.Tensor, torch.Tensor, torch.Tensor, dict]:
+        log = self._logs[self._num_steps % len(self._logs)]
+        self._num_steps += 1
+        extras = {"observations": self._obs, "time_outs": torch.zeros(NUM_ENVS, dtype=torch.bool), "log": log}
+        return self._obs["policy"], torch.zeros(NUM_ENVS), torch.zeros(NUM_ENVS, dtype=torch.bool), extras
+
+
+def test_env_logs_averaged_per_key(monkeypatch: pytest.MonkeyPatch):
+    # the episodic values are only logged in some steps, e.g. the steps with resets
+    logs = [
+        {"Episode_Reward/a": torch.tensor(1.0), "Metrics/b": 2.0},
+        {},
+        {"Episode_Reward/a": torch.tensor(3.0)},
+        {},
+    ]
+    cfg = PPOCfg(
+        num_steps_per_env=len(logs),
+        logger="console",
+        policy=ActorCriticCfg(actor_hidden_dims=[8], critic_hidden_dims=[8]),
+        algorithm=PPOAlgorithmCfg(num_learning_epochs=1, num_mini_batches=1),
+    )
+    runner = OnPolicyRunner(_LoggingEnv(logs), cfg)
+    env_logs = []
+    monkeypatch.setattr(runner, "_log", lambda *args: env_logs.append(args[-1]))
+
+    runner.learn(num_learning_iterations=2)
+
+    assert len(env_logs) == 2
+    for env_log in env_logs:
+        # averaged over the steps that logged the key, not over the steps of the rollout
+        assert env_log.keys() == {"Episode_Reward/a", "Metrics/b"}
+        assert float(env_log["Episode_Reward/a"]) == pytest.approx(2.0)
+        assert float(env_log["Metrics/b"]) == pytest.approx(2.0)
@@ -0,0 +1,57 @@
+# Copyright 2025 genesis_lab Developers (https://github.com/Atticlmr/genesis_lab)
+#
+# Licensed under the Apache License, Version 2.0 , January 2004
+
+"""Smoke test of the Stable-Baselines3 wrapper on the direct-workflow cartpole environment.
+
+The test is skipped when ``stable-baselines3`` is not installed:
+
+.. code-block:: bash
+
+    python -m pytest source/genesislab/test/test_sb3_wrapper.py
+
+"""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+pytest.importorskip("stable_baselines3")
+
+from genesislab_rl.sb3 import Sb3VecEnvWrapper  # noqa: E402
+from genesislab_tasks.direct.cartpole import CartpoleEnv, CartpoleEnvCfg  # noqa: E402
+
+NUM_ENVS = 8
+
+
+def test_reset_and_step_wait():
+    cfg = CartpoleEnvCfg()
+    cfg.scene.num_envs = NUM_ENVS
+    # short episodes, so that every sub-environment is done within the test
+    cfg.episode_length_s = 0.2
+    env = Sb3VecEnvWrapper(CartpoleEnv(cfg), clip_actions=1.0)
+    obs_shape = env.observation_space.shape
+    # the learners of stable-baselines3 require a bounded action space
+    assert np.isfinite(env.action_space.low).all() and np.isfinite(env.action_space.high).all()
+
+    obs = env.reset()
+    assert isinstance(obs, np.ndarray) and obs.shape == (NUM_ENVS, *obs_shape)
+
+    done_env_ids = set()
+    for _ in range(env.unwrapped.max_episode_length + 1):
+        env.step_async(np.stack([env.action_space.sample() for _ in range(NUM_ENVS)]))
+        obs, rewards, dones, infos = env.step_wait()
+        assert obs.shape == (NUM_ENVS, *obs_shape) and np.isfinite(obs).all()
+        assert rewards.shape == (NUM_ENVS,) and dones.shape == (NUM_ENVS,) and dones.dtype == bool
+        assert len(infos) == NUM_ENVS
+        for env_id, (done, info) in enumerate(zip(dones, infos)):
+            # only the information of the done sub-environments is filled
+            assert done == ("terminal_observation" in info)
+            if done:
+                assert info["terminal_observation"].shape == obs_shape
+                assert info["episode"]["l"] > 0
+                assert isinstance(info["TimeLimit.truncated"], bool)
+                done_env_ids.add(env_id)
+    assert done_env_ids == set(range(NUM_ENVS))
+    env.close()
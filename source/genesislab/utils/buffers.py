@@ -0,0 +1,158 @@
+# Copyright 2025 genesis_lab Developers (https://github.com/Atticlmr/genesis_lab)
+#
+# Licensed under the Apache License, Version 2.0 , January 2004
+
+"""Preallocated buffers for batched data."""
+
+from __future__ import annotations
+
+import torch
+
+
+class CircularBuffer:
+    """Circular buffer for storing a history of batched tensor data.
+
+    The buffer stores the last :attr:`max_length` entries of a ``(batch_size, *data_shape)`` tensor in a
+    preallocated ``(batch_size, max_length, *data_shape)`` storage. Appending writes into the slot of the current
+    pointer, so the history is never rolled or re-allocated. The ordered history (oldest first) can be written
+    into an output tensor with :meth:`read_into`, which costs two slice copies.
+
+    When a batch index is appended to for the first time after a reset, all of its history slots are filled
+    with the appended data. This avoids feeding zeros or data from the previous episode to the consumers.
+    """
+
+    def __init__(self, max_length: int, batch_size: int, data_shape: tuple[int, ...], device: str | torch.device):
+        """Initialize the circular buffer.
+
+        Args:
+            max_length: The maximum number of entries kept in the history.
+            batch_size: The batch dimension of the data.
+            data_shape: The shape of a single entry of the data, excluding the batch dimension.
+            device: The device used for processing.
+
+        Raises:
+            ValueError: If the maximum length is smaller than 1.
+        """
+        if max_length < 1:
+            raise ValueError(f"The maximum length of the circular buffer must be positive. Received: {max_length}.")
+        self._max_length = max_length
+        self._batch_size = batch_size
+        self._device = device
+        # the storage of the history and the slot that holds the latest entry
+        self._storage = torch.zeros((batch_size, max_length, *data_shape), device=device)
+        self._pointer = -1
+        # batch indices whose history has to be filled at the next append
+        self._reset_ids: torch.Tensor | slice | None = slice(None)
+
+    """
+    Properties.
+    """
+
+    @property
+    def max_length(self) -> int:
+        """The maximum number of entries kept in the history."""
+        return self._max_length
+
+    @property
+    def batch_size(self) -> int:
+        """The batch dimension of the data."""
+        return self._batch_size
+
+    @property
+    def device(self) -> str | torch.device:
+        """The device used for processing."""
+        return self._device
+
+    @property
+    def current(self) -> torch.Tensor:
+        """The latest entry of the history. Shape is (batch_size, *data_shape).
+
+        This is a view of the storage and is overwritten after :attr:`max_length` appends.
+        """
+        return self._storage[:, self._pointer]
+
+    @property
+    def buffer(self) -> torch.Tensor:
+        """The ordered history (oldest first). Shape is (batch_size, max_length, *data_shape).
+
+        This allocates a new tensor. Prefer :meth:`read_into` on the step path.
+        """
+        out = torch.empty_like(self._storage)
+        self.read_into(out)
+        return out
+
+    """
+    Operations.
+    """
+
+    def reset(self, batch_ids: torch.Tensor | None = None):
+        """Mark the history of the given batch indices to be refilled at the next append.
+
+        Args:
+            batch_ids: The batch indices to reset. Defaults to None, in which case all indices are reset.
+        """
+        if batch_ids is None or isinstance(self._reset_ids, slice):
+            self._reset_ids = slice(None)
+        elif self._reset_ids is None:
+            self._reset_ids = batch_ids
+        else:
+            self._reset_ids = torch.cat((self._reset_ids, batch_ids))
+
+    def append(self, data: torch.Tensor):
+        """Append the data as the latest entry of the history.
+
+        Args:
+            data: The data to append. Shape is (batch_size, *data_shape).
+        """
+        # move the pointer to the oldest slot and overwrite it
+        self._pointer = (self._pointer + 1) % self._max_length
+        self._storage[:, self._pointer].copy_(data)
+        # fill the complete history of the freshly reset indices
+        if self._reset_ids is not None:
+            self._storage[self._reset_ids] = self._storage[self._reset_ids, self._pointer].unsqueeze(1)
+            self._reset_ids = None
+
+    def read(self, batch_ids: torch.Tensor | None = None) -> torch.Tensor:
+        """Returns the ordered history (oldest first) of the given batch indices.
+
+        Args:
+            batch_ids: The batch indices to read. Defaults to None, in which case all indices are read.
+
+        Returns:
+            A copy of the history. Shape is (num_ids, max_length, *data_shape).
+        """
+        storage = self._storage if batch_ids is None else self._storage[batch_ids]
+        return storage.roll(-(self._pointer + 1), dims=1)
+
+    def write(self, data: torch.Tensor, batch_ids: torch.Tensor | None = None):
+        """Overwrite the history of the given batch indices with an ordered history (oldest first).
+
+        The indices are no longer refilled at the next append, if they were reset.
+
+        Args:
+            data: The ordered history. Shape is (num_ids, max_length, *data_shape).
+            batch_ids: The batch indices to write. Defaults to None, in which case all indices are written.
+        """
+        # the oldest entry goes to the slot after the pointer
+        storage = data.roll(self._pointer + 1, dims=1)
+        if batch_ids is None:
+            self._storage.copy_(storage)
+            self._reset_ids = None
+            return
+        self._storage[batch_ids] = storage
+        if self._reset_ids is not None:
+            pending = torch.zeros(self._batch_size, dtype=torch.bool, device=self._storage.device)
+            pending[self._reset_ids] = True
+            pending[batch_ids] = False
+            self._reset_ids = pending.nonzero().squeeze(-1) if pending.any() else None
+
+    def read_into(self, out: torch.Tensor):
+        """Write the ordered history (oldest first) into the given tensor.
+
+        Args:
+            out: The output tensor. Shape is (batch_size, max_length, *data_shape).
+        """
+        # the oldest entry is the one after the pointer
+        num_old = self._max_length - self._pointer - 1
+        out[:, :num_old].copy_(self._storage[:, self._pointer + 1 :])
+        out[:, num_old:].copy_(self._storage[:, : self._pointer + 1])
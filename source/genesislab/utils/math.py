@@ -1837,31 +1837,145 @@ def interpolate_poses(
     return pose_steps, num_steps - 1
 
 
+def interpolate_poses_batched(pose_1: torch.Tensor, pose_2: torch.Tensor, num_steps: int) -> torch.Tensor:
+    """Performs linear interpolation between batches of poses with a fixed number of steps.
+
+    Unlike :func:`interpolate_poses`, all the pairs of poses are interpolated at once: the positions are
+    interpolated linearly and the rotations along the axis of their relative rotation, like the axis-angle
+    interpolation of :func:`interpolate_rotations`.
+
+    Args:
+        pose_1: Start poses. Shape is (..., 4, 4).
+        pose_2: End poses. Shape is (..., 4, 4).
+        num_steps: The number of interpolated poses between the start and end poses.
+
+    Returns:
+        The interpolated pose paths, including the start and end poses. Shape is (..., num_steps + 2, 4, 4).
+    """
+    pos1, rot1 = unmake_pose(pose_1)
+    pos2, rot2 = unmake_pose(pose_2)
+    tau = torch.linspace(0.0, 1.0, num_steps + 2, dtype=pose_1.dtype, device=pose_1.device)
+    # linear interpolation of the positions
+    pos_steps = pos1.unsqueeze(-2) + tau.unsqueeze(-1) * (pos2 - pos1).unsqueeze(-2)
+    # fractions of the relative rotation, applied to the start rotations
+    delta_axis_angle = axis_angle_from_quat(quat_from_matrix(torch.matmul(rot2, rot1.transpose(-1, -2))))
+    axis_angle_steps = tau.unsqueeze(-1) * delta_axis_angle.unsqueeze(-2)
+    angle_steps = torch.linalg.norm(axis_angle_steps, dim=-1)
+    delta_rot_steps = matrix_from_quat(quat_from_angle_axis(angle_steps, axis_angle_steps))
+    rot_steps = torch.matmul(delta_rot_steps, rot1.unsqueeze(-3))
+    return make_pose(pos_steps, rot_steps)
+
+
+def trajectory_basis(
+    tau: torch.Tensor, method: Literal["cubic", "quintic", "min_jerk"] = "quintic"
+) -> tuple[torch.Tensor, torch.Tensor]:
+    """Computes the Hermite basis functions of a polynomial trajectory and their derivatives.
+
+    The basis functions weight the start position, the start velocity, the end position and the end velocity of
+    a trajectory segment, in this order:
+
+    * ``"cubic"``: cubic Hermite polynomials, which match the positions and the velocities at both ends.
+    * ``"quintic"``: quintic Hermite polynomials, which also have zero accelerations at both ends.
+    * ``"min_jerk"``: minimum-jerk polynomial between two rest states. The velocity weights are zero.
+
+    Args:
+        tau: Normalized times of the evaluation points in [0, 1]. Shape is (T,).
+        method: The type of the polynomial. Defaults to "quintic".
+
+    Returns:
+        A tuple containing the basis functions and their derivatives with respect to the normalized time.
+        Shapes are (T, 4).
+
+    Raises:
+        ValueError: If the method is not supported.
+    """
+    tau2 = tau * tau
+    tau3 = tau2 * tau
+    zeros = torch.zeros_like(tau)
+    if method == "cubic":
+        basis = (2 * tau3 - 3 * tau2 + 1, tau3 - 2 * tau2 + tau, -2 * tau3 + 3 * tau2, tau3 - tau2)
+        basis_dot = (6 * tau2 - 6 * tau, 3 * tau2 - 4 * tau + 1, -6 * tau2 + 6 * tau, 3 * tau2 - 2 * tau)
+    elif method in ("quintic", "min_jerk"):
+        tau4 = tau3 * tau
+        tau5 = tau4 * tau
+        s = 10 * tau3 - 15 * tau4 + 6 * tau5
+        s_dot = 30 * tau2 - 60 * tau3 + 30 * tau4
+        if method == "quintic":
+            basis = (1 - s, tau - 6 * tau3 + 8 * tau4 - 3 * tau5, s, -4 * tau3 + 7 * tau4 - 3 * tau5)
+            basis_dot = (-s_dot, 1 - 18 * tau2 + 32 * tau3 - 15 * tau4, s_dot, -12 * tau2 + 28 * tau3 - 15 * tau4)
+        else:
+            basis = (1 - s, zeros, s, zeros)
+            basis_dot = (-s_dot, zeros, s_dot, zeros)
+    else:
+        raise ValueError(f"Unsupported trajectory method: '{method}'. Please use 'cubic', 'quintic' or 'min_jerk'.")
+    return torch.stack(basis, dim=-1), torch.stack(basis_dot, dim=-1)
+
+
+def interpolate_trajectories(
+    start_pos: torch.Tensor,
+    end_pos: torch.Tensor,
+    tau: torch.Tensor,
+    duration: float,
+    start_vel: torch.Tensor | None = None,
+    end_vel: torch.Tensor | None = None,
+    method: Literal["cubic", "quintic", "min_jerk"] = "quintic",
+    out: tuple[torch.Tensor, torch.Tensor] | None = None,
+) -> tuple[torch.Tensor, torch.Tensor]:
+    """Evaluates a batch of polynomial trajectory segments at several times with one tensor contraction.
+
+    Unlike :func:`interpolate_poses`, the function is batched: every segment goes from a row of ``start_pos`` to
+    the same row of ``end_pos`` and all the segments are evaluated at all the normalized times ``tau``. This is
+    used, for instance, to compute the joint targets of all the environments over the physics steps of a control
+    step at once.
+
+    Args:
+        start_pos: The start positions. Shape is (..., D).
+        end_pos: The end positions. Shape is (..., D).
+        tau: Normalized times of the evaluation points in [0, 1]. Shape is (T,).
+        duration: The duration of the segments (in s). Used to scale the velocities.
+        start_vel: The start velocities. Shape is (..., D). Defaults to None, in which case they are zero.
+        end_vel: The end velocities. Shape is (..., D). Defaults to None, in which case they are zero.
+        method: The type of the polynomial. See :func:`trajectory_basis`. Defaults to "quintic".
+        out: The preallocated position and velocity tensors to write the results into. Shapes are (T, ..., D).
+            Defaults to None, in which case new tensors are allocated.
+
+    Returns:
+        A tuple containing the positions and the velocities along the segments. Shapes are (T, ..., D).
+    """
+    basis, basis_dot = trajectory_basis(tau, method)
+    start_vel = torch.zeros_like(start_pos) if start_vel is None else start_vel
+    end_vel = torch.zeros_like(end_pos) if end_vel is None else end_vel
+    # the velocities are expressed in normalized time
+    coeffs = torch.stack((start_pos, start_vel * duration, end_pos, end_vel * duration))
+    if out is None:
+        return torch.tensordot(basis, coeffs, dims=1), torch.tensordot(basis_dot, coeffs, dims=1) / duration
+    pos, vel = out
+    torch.tensordot(basis, coeffs, dims=1, out=pos)
+    torch.tensordot(basis_dot, coeffs, dims=1, out=vel).div_(duration)
+    return pos, vel
+
+
 def transform_poses_from_frame_A_to_frame_B(
     src_poses: torch.Tensor, frame_A: torch.Tensor, frame_B: torch.Tensor
 ) -> torch.Tensor:
     """Transforms poses from one coordinate frame to another preserving relative poses.
 
+    The poses are expressed relative to frame B and re-applied relative to frame A, i.e. the function returns
+    ``frame_A @ inv(frame_B) @ src_poses``. The transform between the frames is composed once per sequence, so a
+    batch of sequences (e.g. the segments of a source demonstration retargeted to the object poses of all the
+    environments) is transformed with a single batched matrix product.
+
     Args:
-        src_poses: Input pose sequence (shape [T, 4, 4]) from source demonstration.
-        frame_A: 4x4 frame A pose.
-        frame_B: 4x4 frame B pose.
+        src_poses: Input pose sequences from the source demonstrations. Shape is (..., T, 4, 4).
+        frame_A: Pose of frame A of each sequence. Shape is (..., 4, 4).
+        frame_B: Pose of frame B of each sequence. Shape is (..., 4, 4).
 
     Returns:
-        Transformed pose sequence of shape [T, 4, 4].
+        Transformed pose sequences. Shape is (..., T, 4, 4).
     """
-    # Transform source end effector poses to be relative to source object frame
-    src_poses_rel_frame_B = pose_in_A_to_pose_in_B(
-        pose_in_A=src_poses,
-        pose_A_in_B=pose_inv(frame_B[None]),
-    )
-
-    # Apply relative poses to current object frame to obtain new target eef poses
-    transformed_poses = pose_in_A_to_pose_in_B(
-        pose_in_A=src_poses_rel_frame_B,
-        pose_A_in_B=frame_A[None],
-    )
-    return transformed_poses
+    # transform from the source object frame to the current object frame, applied to all the poses of a sequence
+    frame_B_to_frame_A = pose_in_A_to_pose_in_B(pose_in_A=pose_inv(frame_B), pose_A_in_B=frame_A)
+    return pose_in_A_to_pose_in_B(pose_in_A=src_poses, pose_A_in_B=frame_B_to_frame_A.unsqueeze(-3))
 
 
 def generate_random_rotation(rot_boundary: float = (2 * math.pi)) -> torch.Tensor:
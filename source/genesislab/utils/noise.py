@@ -0,0 +1,40 @@
+# Copyright 2025 genesis_lab Developers (https://github.com/Atticlmr/genesis_lab)
+#
+# Licensed under the Apache License, Version 2.0 , January 2004
+
+"""Configuration classes for the additive noise models used to corrupt observations.
+
+The noise models are described by their parameters only. The observation manager expands the parameters of all
+the terms of a group into per-column tensors, so that the noise of the whole group is drawn and added at once.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+
+@dataclass(kw_only=True)
+class NoiseCfg:
+    """Base configuration for an additive noise term."""
+
+
+@dataclass(kw_only=True)
+class UniformNoiseCfg(NoiseCfg):
+    """Configuration for an additive uniform noise term."""
+
+    n_min: float = -1.0
+    """The minimum value of the noise. Defaults to -1.0."""
+
+    n_max: float = 1.0
+    """The maximum value of the noise. Defaults to 1.0."""
+
+
+@dataclass(kw_only=True)
+class GaussianNoiseCfg(NoiseCfg):
+    """Configuration for an additive gaussian noise term."""
+
+    mean: float = 0.0
+    """The mean of the noise. Defaults to 0.0."""
+
+    std: float = 1.0
+    """The standard deviation of the noise. Defaults to 1.0."""
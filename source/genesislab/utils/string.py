@@ -0,0 +1,162 @@
+# Copyright 2025 genesis_lab Developers (https://github.com/Atticlmr/genesis_lab)
+#
+# Licensed under the Apache License, Version 2.0 , January 2004
+
+"""Sub-module containing utilities for resolving names with regular expressions and loading objects by name."""
+
+from __future__ import annotations
+
+import importlib
+import re
+from collections.abc import Sequence
+
+
+def resolve_matching_names(
+    keys: str | Sequence[str], list_of_strings: Sequence[str], preserve_order: bool = False
+) -> tuple[list[int], list[str]]:
+    """Match a list of query regular expressions against a list of strings and return the matched indices and names.
+
+    When a list of query regular expressions is provided, the function checks each target string against each
+    query regular expression and returns the indices of the matched strings and the matched strings.
+
+    If :attr:`preserve_order` is True, the ordering of the matched indices and names is the same as the order
+    of the provided list of keys. Otherwise, the ordering follows the list of strings.
+
+    Args:
+        keys: A regular expression or a list of regular expressions to match the strings in the list.
+        list_of_strings: A list of strings to match.
+        preserve_order: Whether to preserve the order of the query keys in the returned values. Defaults to False.
+
+    Returns:
+        A tuple of lists containing the matched indices and names.
+
+    Raises:
+        ValueError: When multiple matches are found for a string in the list.
+        ValueError: When not all regular expressions are matched.
+    """
+    # resolve name keys
+    if isinstance(keys, str):
+        keys = [keys]
+    # find matching patterns
+    index_list = []
+    names_list = []
+    key_idx_list = []
+    # book-keeping to check that we always have a one-to-one mapping
+    # i.e. each target string should match only one regular expression
+    target_strings_match_found = [None for _ in range(len(list_of_strings))]
+    keys_match_found = [[] for _ in range(len(keys))]
+    # loop over all target strings
+    for target_index, potential_match_string in enumerate(list_of_strings):
+        for key_index, re_key in enumerate(keys):
+            if re.fullmatch(re_key, potential_match_string):
+                # check if match already found
+                if target_strings_match_found[target_index]:
+                    raise ValueError(
+                        f"Multiple matches for '{potential_match_string}':"
+                        f" '{target_strings_match_found[target_index]}' and '{re_key}'!"
+                    )
+                # add to list
+                target_strings_match_found[target_index] = re_key
+                index_list.append(target_index)
+                names_list.append(potential_match_string)
+                key_idx_list.append(key_index)
+                # add for regex key
+                keys_match_found[key_index].append(potential_match_string)
+    # reorder keys if they should be returned in order of the query keys
+    if preserve_order:
+        reordered_index_list = [None] * len(index_list)
+        global_index = 0
+        for key_index in range(len(keys)):
+            for key_idx_position, key_idx_entry in enumerate(key_idx_list):
+                if key_idx_entry == key_index:
+                    reordered_index_list[key_idx_position] = global_index
+                    global_index += 1
+        # reorder index and names list
+        index_list_reorder = [None] * len(index_list)
+        names_list_reorder = [None] * len(index_list)
+        for idx, reorder_idx in enumerate(reordered_index_list):
+            index_list_reorder[reorder_idx] = index_list[idx]
+            names_list_reorder[reorder_idx] = names_list[idx]
+        # update
+        index_list = index_list_reorder
+        names_list = names_list_reorder
+    # check that all regular expressions are matched
+    if not all(keys_match_found):
+        # make this print nicely aligned for debugging
+        msg = "\n"
+        for key, value in zip(keys, keys_match_found):
+            msg += f"\t{key}: {value}\n"
+        msg += f"Available strings: {list_of_strings}\n"
+        # raise error
+        raise ValueError(
+            f"Not all regular expressions are matched! Please check that the regular expressions are correct: {msg}"
+        )
+    # return
+    return index_list, names_list
+
+
+def resolve_matching_names_values(
+    data: dict[str, float], list_of_strings: Sequence[str]
+) -> tuple[list[int], list[str], list[float]]:
+    """Match a dictionary of regular expressions against a list of strings and return the matched indices, names
+    and values.
+
+    Args:
+        data: A dictionary of regular expressions and values to match the strings in the list.
+        list_of_strings: A list of strings to match.
+
+    Returns:
+        A tuple of lists containing the matched indices, names, and values.
+
+    Raises:
+        ValueError: When multiple matches are found for a string in the list.
+        ValueError: When not all regular expressions are matched.
+    """
+    index_list, names_list, values_list = [], [], []
+    keys = list(data.keys())
+    index_list_key = []
+    for target_index, potential_match_string in enumerate(list_of_strings):
+        matched_key = None
+        for re_key in keys:
+            if re.fullmatch(re_key, potential_match_string):
+                if matched_key is not None:
+                    raise ValueError(
+                        f"Multiple matches for '{potential_match_string}': '{matched_key}' and '{re_key}'!"
+                    )
+                matched_key = re_key
+        if matched_key is not None:
+            index_list.append(target_index)
+            names_list.append(potential_match_string)
+            values_list.append(data[matched_key])
+            index_list_key.append(matched_key)
+    # check that all regular expressions are matched
+    unmatched_keys = [key for key in keys if key not in index_list_key]
+    if len(unmatched_keys) > 0:
+        raise ValueError(
+            f"Not all regular expressions are matched! Unmatched keys: {unmatched_keys}."
+            f" Available strings: {list_of_strings}"
+        )
+    return index_list, names_list, values_list
+
+
+def string_to_callable(name: str):
+    """Resolve the module and the attribute of a string of the form ``"module.path:attribute_name"``.
+
+    The module is imported when the function is called, which is what makes the entry points of the task registry
+    lazy: registering a task only stores the string.
+
+    Args:
+        name: The name of the attribute, with the module path and the attribute name separated by a colon.
+
+    Returns:
+        The attribute of the module, e.g. a class or a function.
+
+    Raises:
+        ValueError: If the string is not of the form ``"module.path:attribute_name"``.
+        AttributeError: If the module does not have the attribute.
+    """
+    module_name, sep, attr_name = name.partition(":")
+    if not sep or not module_name or not attr_name:
+        raise ValueError(f"Expected a string of the form 'module.path:attribute_name'. Received: '{name}'.")
+    module = importlib.import_module(module_name)
+    return getattr(module, attr_name)
@@ -0,0 +1,10 @@
+# Copyright 2025 genesis_lab Developers (https://github.com/Atticlmr/genesis_lab)
+#
+# Licensed under the Apache License, Version 2.0 , January 2004
+
+"""Package containing the asset files shipped with genesislab."""
+
+import os
+
+GENESISLAB_ASSETS_DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+"""Path to the directory containing the asset files."""
@@ -0,0 +1,19 @@
+# Copyright 2025 genesis_lab Developers (https://github.com/Atticlmr/genesis_lab)
+#
+# Licensed under the Apache License, Version 2.0 , January 2004
+
+"""Recording and reading of demonstration datasets.
+
+* :class:`DatasetRecorder`: streams the episodes of all the environments into an HDF5 file, buffering the steps on
+  the device and writing them on a background thread.
+* :class:`DatasetReader`: reads the episodes of a dataset lazily, with memory maps or chunk-aligned windows.
+* :class:`DataGenerator`: generates demonstrations in the environments implementing :class:`MimicEnv` by
+  retargeting the subtask segments of source demonstrations to new object poses.
+"""
+
+from .data_generator import DataGenerator, SourceSegments, load_source_segments
+from .datagen_cfg import DataGeneratorCfg, SubTaskCfg
+from .mimic_env import MimicEnv
+from .reader import DatasetReader
+from .recorder import DatasetRecorder
+from .recorder_cfg import DatasetRecorderCfg
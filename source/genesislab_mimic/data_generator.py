@@ -0,0 +1,283 @@
+# Copyright 2025 genesis_lab Developers (https://github.com/Atticlmr/genesis_lab)
+#
+# Licensed under the Apache License, Version 2.0 , January 2004
+
+"""Generation of demonstrations by retargeting the subtask segments of source demonstrations to new object poses."""
+
+from __future__ import annotations
+
+import torch
+from dataclasses import dataclass
+
+from genesislab.envs import DirectRLEnv, ManagerBasedRLEnv
+from genesislab.utils.math import interpolate_poses_batched, transform_poses_from_frame_A_to_frame_B
+
+from .datagen_cfg import DataGeneratorCfg, SubTaskCfg
+from .mimic_env import MimicEnv
+from .reader import DatasetReader
+from .recorder import DatasetRecorder
+
+
+@dataclass
+class SourceSegments:
+    """The segments of a subtask in the source demonstrations, padded to the length of the longest one.
+
+    The padded steps repeat the last step of the segments, so that a segment can be indexed past its end.
+    """
+
+    target_eef_poses: torch.Tensor
+    """The target poses of the end-effector. Shape is (num_segments, max_length, 4, 4)."""
+
+    gripper_actions: torch.Tensor
+    """The actions of the gripper. Shape is (num_segments, max_length, gripper_action_dim)."""
+
+    lengths: torch.Tensor
+    """The number of steps of the segments. Shape is (num_segments,)."""
+
+    object_poses: torch.Tensor
+    """The pose of the reference object at the start of the segments. Shape is (num_segments, 4, 4)."""
+
+
+def load_source_segments(
+    reader: DatasetReader,
+    subtasks: list[SubTaskCfg],
+    env: MimicEnv,
+    success_only: bool = True,
+    device: str | torch.device = "cpu",
+) -> list[SourceSegments]:
+    """Split the source demonstrations of a dataset into the segments of the subtasks.
+
+    A subtask ends at the first step at which its termination signal is set, and the next subtask starts at the
+    following step. The demonstrations in which a signal is never set are skipped.
+
+    Args:
+        reader: The reader of the source dataset.
+        subtasks: The subtasks of the demonstrations, in order.
+        env: The environment, which extracts the gripper actions from the actions.
+        success_only: Whether to only use the successful demonstrations. Defaults to True.
+        device: The device of the segments. Defaults to "cpu".
+
+    Returns:
+        The segments of each subtask.
+
+    Raises:
+        ValueError: If no source demonstration contains all the subtasks.
+    """
+    keys = ["actions", "datagen_info/target_eef_pose"]
+    keys += [f"datagen_info/object_pose/{subtask.object_ref}" for subtask in subtasks if subtask.object_ref]
+    keys += [
+        f"datagen_info/subtask_term_signals/{subtask.subtask_term_signal}"
+        for subtask in subtasks
+        if subtask.subtask_term_signal
+    ]
+    segments: list[list[tuple[torch.Tensor, torch.Tensor, torch.Tensor]]] = [[] for _ in subtasks]
+    for _, episode in reader.iter_episodes(list(dict.fromkeys(keys)), success_only=success_only, device=device):
+        num_steps = len(episode["actions"])
+        episode_segments = []
+        start = 0
+        for subtask in subtasks:
+            if subtask.subtask_term_signal is None:
+                end = num_steps
+            else:
+                signal = episode[f"datagen_info/subtask_term_signals/{subtask.subtask_term_signal}"][start:]
+                term_steps = torch.nonzero(signal.bool()).squeeze(-1)
+                if len(term_steps) == 0 or start >= num_steps:
+                    break
+                end = start + int(term_steps[0]) + 1
+            if subtask.object_ref is None:
+                object_pose = torch.eye(4, device=device)
+            else:
+                object_pose = episode[f"datagen_info/object_pose/{subtask.object_ref}"][start]
+            episode_segments.append((
+                episode["datagen_info/target_eef_pose"][start:end],
+                env.actions_to_gripper_actions(episode["actions"][start:end]),
+                object_pose,
+            ))
+            start = end
+        if len(episode_segments) == len(subtasks):
+            for subtask_segments, segment in zip(segments, episode_segments):
+                subtask_segments.append(segment)
+    if len(segments[0]) == 0:
+        raise ValueError(f"No source demonstration of '{reader.file_path}' contains all the {len(subtasks)} subtasks.")
+
+    def pad(sequences: list[torch.Tensor], length: int) -> torch.Tensor:
+        return torch.stack([torch.cat((x, x[-1:].expand(length - len(x), *x.shape[1:]))) for x in sequences])
+
+    source_segments = []
+    for subtask_segments in segments:
+        poses, gripper_actions, object_poses = zip(*subtask_segments)
+        lengths = torch.tensor([len(x) for x in poses], device=device)
+        max_length = int(lengths.max())
+        source_segments.append(
+            SourceSegments(
+                target_eef_poses=pad(poses, max_length),
+                gripper_actions=pad(gripper_actions, max_length),
+                lengths=lengths,
+                object_poses=torch.stack(object_poses),
+            )
+        )
+    return source_segments
+
+
+class DataGenerator:
+    """Generates demonstrations by retargeting the subtask segments of source demonstrations to new object poses.
+
+    Every generation round runs one trial in each environment. At the start of each subtask, a source segment is
+    selected for every environment, transformed from the object pose of the source demonstration to the current
+    object pose and prefixed with an interpolation from the end of the previous subtask. These operations are done
+    for all the environments with batched tensor operations on the padded segments, and the trajectories are then
+    executed in lockstep: the environments whose trajectory is shorter hold their last target pose.
+
+    The steps are recorded by a :class:`~genesislab_mimic.DatasetRecorder` and the trials are ended with their
+    success, so that the recorder can drop the failed ones (see :attr:`DatasetRecorderCfg.export_failed`). A trial
+    fails if the episode of its environment ends before the end of the trial.
+    """
+
+    def __init__(
+        self,
+        env: DirectRLEnv | ManagerBasedRLEnv,
+        cfg: DataGeneratorCfg,
+        source: DatasetReader,
+        recorder: DatasetRecorder | None = None,
+    ):
+        """Initialize the generator and load the source segments.
+
+        Args:
+            env: The environment, which implements the :class:`~genesislab_mimic.MimicEnv` interface.
+            cfg: The configuration of the generator.
+            source: The reader of the source dataset.
+            recorder: The recorder of the generated demonstrations. Defaults to None, in which case nothing is
+                recorded.
+
+        Raises:
+            TypeError: If the environment does not implement the :class:`~genesislab_mimic.MimicEnv` interface.
+            ValueError: If a subtask other than the last one has no termination signal, or if a selection strategy
+                is not supported.
+        """
+        if not isinstance(env, MimicEnv):
+            raise TypeError(f"The environment {type(env).__name__} does not implement the MimicEnv interface.")
+        for index, subtask in enumerate(cfg.subtasks):
+            if subtask.subtask_term_signal is None and index != len(cfg.subtasks) - 1:
+                raise ValueError(f"The subtask {index} has no termination signal, but it is not the last subtask.")
+            if subtask.selection_strategy not in ("random", "nearest_neighbor_object"):
+                raise ValueError(
+                    f"Unsupported selection strategy: '{subtask.selection_strategy}'. Please use 'random' or"
+                    " 'nearest_neighbor_object'."
+                )
+        self.env = env
+        self.cfg = cfg
+        self.recorder = recorder
+        self.device = env.device
+        self.segments = load_source_segments(source, cfg.subtasks, env, cfg.source_success_only, self.device)
+        self.num_trials = 0
+        self.num_successes = 0
+        self._env_ids = torch.arange(env.num_envs, device=self.device)
+
+    """
+    Operations.
+    """
+
+    def generate(self, num_successes: int, max_num_rounds: int | None = None) -> int:
+        """Run generation rounds until enough successful demonstrations are generated.
+
+        Args:
+            num_successes: The number of successful demonstrations to generate.
+            max_num_rounds: The maximum number of rounds. Defaults to None (no limit).
+
+        Returns:
+            The number of successful demonstrations generated by the call.
+        """
+        start_num_successes = self.num_successes
+        num_rounds = 0
+        while self.num_successes - start_num_successes < num_successes:
+            if max_num_rounds is not None and num_rounds >= max_num_rounds:
+                break
+            self.generate_round()
+            num_rounds += 1
+        return self.num_successes - start_num_successes
+
+    def generate_round(self) -> torch.Tensor:
+        """Run one trial in every environment.
+
+        Returns:
+            Whether the trial of each environment succeeded. Shape is (num_envs,).
+        """
+        env = self.env
+        obs, _ = env.reset()
+        success = torch.zeros(env.num_envs, dtype=torch.bool, device=self.device)
+        ended = torch.zeros_like(success)
+        last_target_pose = env.get_robot_eef_pose()
+        for index, subtask in enumerate(self.cfg.subtasks):
+            trajectories, gripper_actions, lengths = self.retarget(index, last_target_pose)
+            # the trajectories are executed in lockstep, the shorter ones holding their last pose
+            for step in range(int(lengths.max())):
+                step_ids = torch.clamp(lengths - 1, max=step)
+                target_eef_pose = trajectories[self._env_ids, step_ids]
+                gripper_action = gripper_actions[self._env_ids, step_ids]
+                actions = env.target_eef_pose_to_action(target_eef_pose, gripper_action, subtask.action_noise)
+                if self.recorder is not None:
+                    datagen_info = env.get_datagen_info(actions)
+                    self.recorder.record({"obs": obs, "actions": actions, "datagen_info": datagen_info})
+                obs, _, terminated, truncated, _ = env.step(actions)
+                success |= env.get_success()
+                ended |= terminated | truncated
+            last_target_pose = trajectories[self._env_ids, lengths - 1]
+        success &= ~ended
+        if self.recorder is not None:
+            self.recorder.end_episodes(self._env_ids, success)
+        self.num_trials += env.num_envs
+        self.num_successes += int(success.sum())
+        return success
+
+    def retarget(
+        self, subtask_index: int, start_pose: torch.Tensor
+    ) -> tuple[torch.Tensor, torch.Tensor, torch.Tensor]:
+        """Compute the trajectories of a subtask for all the environments.
+
+        Args:
+            subtask_index: The index of the subtask.
+            start_pose: The poses of the end-effector at the start of the subtask. Shape is (num_envs, 4, 4).
+
+        Returns:
+            A tuple containing the target poses of the end-effector, the gripper actions and the number of steps of
+            the trajectories. Shapes are (num_envs, max_length, 4, 4), (num_envs, max_length, gripper_action_dim)
+            and (num_envs,). The steps past the end of a trajectory repeat its last step.
+        """
+        subtask = self.cfg.subtasks[subtask_index]
+        segments = self.segments[subtask_index]
+        object_pose = None if subtask.object_ref is None else self.env.get_object_poses()[subtask.object_ref]
+        source_ids = self._select_sources(subtask, segments, object_pose)
+        # transform the segments from the source object poses to the current ones
+        poses = segments.target_eef_poses[source_ids]
+        if object_pose is not None:
+            poses = transform_poses_from_frame_A_to_frame_B(poses, object_pose, segments.object_poses[source_ids])
+        # move from the start poses to the start of the segments, without repeating them
+        interpolation = interpolate_poses_batched(start_pose, poses[:, 0], subtask.num_interpolation_steps)
+        fixed = poses[:, :1].expand(-1, subtask.num_fixed_steps, -1, -1)
+        trajectories = torch.cat((interpolation[:, 1:-1], fixed, poses), dim=1)
+        # the gripper keeps the first action of the segments until their start
+        gripper_actions = segments.gripper_actions[source_ids]
+        num_prefix_steps = subtask.num_interpolation_steps + subtask.num_fixed_steps
+        gripper_actions = torch.cat((gripper_actions[:, :1].expand(-1, num_prefix_steps, -1), gripper_actions), dim=1)
+        return trajectories, gripper_actions, segments.lengths[source_ids] + num_prefix_steps
+
+    """
+    Helper functions.
+    """
+
+    def _select_sources(
+        self, subtask: SubTaskCfg, segments: SourceSegments, object_pose: torch.Tensor | None
+    ) -> torch.Tensor:
+        """Select the source segment of every environment."""
+        num_segments = len(segments.lengths)
+        if subtask.selection_strategy == "random" or object_pose is None:
+            return torch.randint(num_segments, (self.env.num_envs,), device=self.device)
+        # distances between the current object poses and the object poses of the segments
+        position_distance = torch.cdist(object_pose[:, :3, 3], segments.object_poses[:, :3, 3])
+        cos_angle = (torch.einsum("nij,dij->nd", object_pose[:, :3, :3], segments.object_poses[:, :3, :3]) - 1) / 2
+        distance = position_distance + subtask.nearest_neighbor_rotation_weight * torch.acos(cos_angle.clamp(-1, 1))
+        # draw among the nearest segments
+        num_neighbors = min(subtask.num_nearest_neighbors, num_segments)
+        nearest_ids = torch.topk(distance, num_neighbors, dim=1, largest=False).indices
+        draws = torch.randint(num_neighbors, (self.env.num_envs,), device=self.device)
+        return nearest_ids[self._env_ids, draws]
@@ -0,0 +1,65 @@
+# Copyright 2025 genesis_lab Developers (https://github.com/Atticlmr/genesis_lab)
+#
+# Licensed under the Apache License, Version 2.0 , January 2004
+
+"""Configuration for the generation of demonstrations from source demonstrations."""
+
+from __future__ import annotations
+
+from dataclasses import MISSING, dataclass
+from typing import Literal
+
+
+@dataclass(kw_only=True)
+class SubTaskCfg:
+    """Configuration for a subtask of the demonstrations.
+
+    A subtask is a segment of the demonstrations whose end-effector motion is defined relative to one object, e.g.
+    grasping a cube or placing it on another one.
+    """
+
+    object_ref: str | None = None
+    """The name of the object the motion of the subtask is relative to. Defaults to None.
+
+    If None, the motion is replayed in the frame of the environment.
+    """
+
+    subtask_term_signal: str | None = None
+    """The name of the signal that ends the subtask in the source demonstrations. Defaults to None.
+
+    The subtask ends at the first step at which the signal is set. Only the last subtask, which ends with the
+    demonstrations, has no signal.
+    """
+
+    selection_strategy: Literal["random", "nearest_neighbor_object"] = "random"
+    """The strategy to select the source segment of each environment. Defaults to "random".
+
+    With "nearest_neighbor_object", the segment is drawn among the :attr:`num_nearest_neighbors` segments whose
+    object pose at the start of the segment is the closest to the current object pose.
+    """
+
+    num_nearest_neighbors: int = 3
+    """The number of nearest segments the source segment is drawn from. Defaults to 3."""
+
+    nearest_neighbor_rotation_weight: float = 1.0
+    """The weight of the rotation distance (in rad) relative to the position distance (in m). Defaults to 1.0."""
+
+    num_interpolation_steps: int = 5
+    """The number of steps from the end of the previous subtask to the start of the segment. Defaults to 5."""
+
+    num_fixed_steps: int = 0
+    """The number of steps holding the start pose of the segment after the interpolation. Defaults to 0."""
+
+    action_noise: float = 0.03
+    """The standard deviation of the noise added to the arm actions. Defaults to 0.03."""
+
+
+@dataclass(kw_only=True)
+class DataGeneratorCfg:
+    """Configuration for the :class:`~genesislab_mimic.DataGenerator`."""
+
+    subtasks: list[SubTaskCfg] = MISSING
+    """The subtasks of the demonstrations, in order."""
+
+    source_success_only: bool = True
+    """Whether to only use the successful source demonstrations. Defaults to True."""
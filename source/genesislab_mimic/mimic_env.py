@@ -0,0 +1,101 @@
+# Copyright 2025 genesis_lab Developers (https://github.com/Atticlmr/genesis_lab)
+#
+# Licensed under the Apache License, Version 2.0 , January 2004
+
+"""Interface of the environments used to generate demonstrations."""
+
+from __future__ import annotations
+
+import torch
+from abc import abstractmethod
+
+
+class MimicEnv:
+    """Interface that an environment implements to generate demonstrations with the
+    :class:`~genesislab_mimic.DataGenerator`.
+
+    The class is mixed into a :class:`~genesislab.envs.DirectRLEnv` or a :class:`~genesislab.envs.ManagerBasedRLEnv`
+    of the task. All the methods operate on all the environments at once, and all the poses are ``(num_envs, 4, 4)``
+    homogeneous transforms expressed in the frame of the origin of each environment, so that the demonstrations
+    recorded in an environment can be replayed in any other one.
+
+    The source demonstrations are recorded with the :class:`~genesislab_mimic.DatasetRecorder` and must contain the
+    ``actions`` and the information returned by :meth:`get_datagen_info` under the key ``datagen_info``.
+    """
+
+    @abstractmethod
+    def get_robot_eef_pose(self) -> torch.Tensor:
+        """Returns the current poses of the end-effector. Shape is (num_envs, 4, 4)."""
+        raise NotImplementedError(f"Please implement the 'get_robot_eef_pose' method for {self.__class__.__name__}.")
+
+    @abstractmethod
+    def target_eef_pose_to_action(
+        self, target_eef_pose: torch.Tensor, gripper_action: torch.Tensor, action_noise: float = 0.0
+    ) -> torch.Tensor:
+        """Computes the actions that move the end-effector to target poses.
+
+        Args:
+            target_eef_pose: The target poses of the end-effector. Shape is (num_envs, 4, 4).
+            gripper_action: The actions of the gripper. Shape is (num_envs, gripper_action_dim).
+            action_noise: The standard deviation of the Gaussian noise added to the arm actions. Defaults to 0.0.
+
+        Returns:
+            The actions of the environment. Shape is (num_envs, action_dim).
+        """
+        raise NotImplementedError(
+            f"Please implement the 'target_eef_pose_to_action' method for {self.__class__.__name__}."
+        )
+
+    @abstractmethod
+    def action_to_target_eef_pose(self, actions: torch.Tensor) -> torch.Tensor:
+        """Returns the target poses of the end-effector of actions, the inverse of :meth:`target_eef_pose_to_action`.
+
+        Args:
+            actions: The actions applied at the current step. Shape is (num_envs, action_dim).
+
+        Returns:
+            The target poses of the end-effector. Shape is (num_envs, 4, 4).
+        """
+        raise NotImplementedError(
+            f"Please implement the 'action_to_target_eef_pose' method for {self.__class__.__name__}."
+        )
+
+    @abstractmethod
+    def actions_to_gripper_actions(self, actions: torch.Tensor) -> torch.Tensor:
+        """Returns the gripper part of actions. Shape is (..., gripper_action_dim), which may be zero."""
+        raise NotImplementedError(
+            f"Please implement the 'actions_to_gripper_actions' method for {self.__class__.__name__}."
+        )
+
+    @abstractmethod
+    def get_object_poses(self) -> dict[str, torch.Tensor]:
+        """Returns the current poses of the objects the subtasks refer to, by name. Shapes are (num_envs, 4, 4)."""
+        raise NotImplementedError(f"Please implement the 'get_object_poses' method for {self.__class__.__name__}.")
+
+    @abstractmethod
+    def get_subtask_term_signals(self) -> dict[str, torch.Tensor]:
+        """Returns whether the subtasks are completed, by name of the signal. Shapes are (num_envs,)."""
+        raise NotImplementedError(
+            f"Please implement the 'get_subtask_term_signals' method for {self.__class__.__name__}."
+        )
+
+    @abstractmethod
+    def get_success(self) -> torch.Tensor:
+        """Returns whether the task is achieved in the current state. Shape is (num_envs,)."""
+        raise NotImplementedError(f"Please implement the 'get_success' method for {self.__class__.__name__}.")
+
+    def get_datagen_info(self, actions: torch.Tensor) -> dict[str, torch.Tensor | dict[str, torch.Tensor]]:
+        """Returns the information recorded with the demonstrations to generate new ones from them.
+
+        Args:
+            actions: The actions applied at the current step. Shape is (num_envs, action_dim).
+
+        Returns:
+            The poses of the end-effector, its target poses, the poses of the objects and the subtask signals.
+        """
+        return {
+            "eef_pose": self.get_robot_eef_pose(),
+            "target_eef_pose": self.action_to_target_eef_pose(actions),
+            "object_pose": self.get_object_poses(),
+            "subtask_term_signals": self.get_subtask_term_signals(),
+        }
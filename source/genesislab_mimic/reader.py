@@ -0,0 +1,197 @@
+# Copyright 2025 genesis_lab Developers (https://github.com/Atticlmr/genesis_lab)
+#
+# Licensed under the Apache License, Version 2.0 , January 2004
+
+"""Reader of the episodes of HDF5 datasets written by the :class:`~genesislab_mimic.DatasetRecorder`."""
+
+from __future__ import annotations
+
+import h5py
+import json
+import numpy as np
+import torch
+from collections.abc import Iterator, Sequence
+from typing import Any
+
+
+class DatasetReader:
+    """Reads the episodes of an HDF5 dataset without loading the whole file.
+
+    Only the index of the episodes is read when the file is opened. The steps are read on demand:
+    :meth:`load_episode` reads the steps of a single episode, and :meth:`iter_chunks` and :meth:`iter_episodes`
+    stream the file in windows aligned with the HDF5 chunks, so that every chunk is read (and decompressed) once.
+    The chunks of uncompressed datasets are memory-mapped instead of read.
+    """
+
+    def __init__(self, file_path: str):
+        """Initialize the reader and read the index of the episodes.
+
+        Args:
+            file_path: The path of the HDF5 file of the dataset.
+
+        Raises:
+            KeyError: If the file has no ``data`` or ``episodes`` group.
+        """
+        self.file_path = file_path
+        self._file = h5py.File(file_path, "r")
+        if "data" not in self._file or "episodes" not in self._file:
+            self._file.close()
+            raise KeyError(f"The file '{file_path}' is not a dataset: it has no 'data' or 'episodes' group.")
+        self._data = self._file["data"]
+        index = self._file["episodes"]
+        self.episode_starts: np.ndarray = index["start"][:]
+        """The index of the first step of each episode in the step datasets."""
+        self.episode_lengths: np.ndarray = index["length"][:]
+        """The number of steps of each episode."""
+        self.episode_success: np.ndarray = index["success"][:]
+        """Whether each episode succeeded."""
+        self.episode_env_ids: np.ndarray = index["env_id"][:]
+        """The environment that recorded each episode."""
+        # keys of the step datasets
+        self._keys = []
+        self._data.visititems(lambda name, item: self._keys.append(name) if isinstance(item, h5py.Dataset) else None)
+
+    def __len__(self) -> int:
+        return len(self.episode_starts)
+
+    def __enter__(self) -> DatasetReader:
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    """
+    Properties.
+    """
+
+    @property
+    def keys(self) -> list[str]:
+        """The ``/``-separated keys of the step datasets, e.g. ``obs/policy``."""
+        return self._keys
+
+    @property
+    def env_args(self) -> dict[str, Any] | None:
+        """The information about the environment stored with the dataset, or None."""
+        env_args = self._file.attrs.get("env_args")
+        return None if env_args is None else json.loads(env_args)
+
+    @property
+    def total_samples(self) -> int:
+        """The total number of recorded steps."""
+        return int(self._data.attrs.get("total", 0))
+
+    """
+    Operations.
+    """
+
+    def get_dataset(self, key: str) -> h5py.Dataset:
+        """Returns the (lazy) dataset of the steps of all the episodes for a key, e.g. ``actions``."""
+        return self._data[key]
+
+    def load_episode(
+        self, index: int, keys: Sequence[str] | None = None, device: str | torch.device | None = None
+    ) -> dict[str, torch.Tensor]:
+        """Read the steps of an episode.
+
+        Args:
+            index: The index of the episode.
+            keys: The keys of the datasets to read. Defaults to None, in which case all the datasets are read.
+            device: The device of the tensors. Defaults to None, in which case they are on the CPU.
+
+        Returns:
+            The steps of the episode, with the step as first dimension.
+        """
+        start = int(self.episode_starts[index])
+        stop = start + int(self.episode_lengths[index])
+        keys = self._keys if keys is None else keys
+        return {key: torch.as_tensor(self._data[key][start:stop], device=device) for key in keys}
+
+    def iter_chunks(
+        self, keys: Sequence[str] | None = None, start: int = 0, stop: int | None = None
+    ) -> Iterator[tuple[int, dict[str, np.ndarray]]]:
+        """Stream the steps chunk by chunk.
+
+        The windows of the datasets are read-only memory maps if the datasets are not compressed.
+
+        Args:
+            keys: The keys of the datasets to read. Defaults to None, in which case all the datasets are read.
+            start: The first step to read. Defaults to 0.
+            stop: The step to stop reading at. Defaults to None, in which case all the steps are read.
+
+        Yields:
+            The index of the first step of the window and the windows of the datasets.
+        """
+        keys = self._keys if keys is None else keys
+        stop = self.total_samples if stop is None else min(stop, self.total_samples)
+        if not keys or start >= stop:
+            return
+        chunk_steps = self._data[keys[0]].chunks[0]
+        window_start = start
+        while window_start < stop:
+            window_stop = min((window_start // chunk_steps + 1) * chunk_steps, stop)
+            yield window_start, {key: self._read(self._data[key], window_start, window_stop) for key in keys}
+            window_start = window_stop
+
+    def iter_episodes(
+        self,
+        keys: Sequence[str] | None = None,
+        success_only: bool = False,
+        device: str | torch.device | None = None,
+    ) -> Iterator[tuple[int, dict[str, torch.Tensor]]]:
+        """Stream the episodes in the order of the file, reading every chunk once.
+
+        Args:
+            keys: The keys of the datasets to read. Defaults to None, in which case all the datasets are read.
+            success_only: Whether to skip the episodes that did not succeed. Defaults to False.
+            device: The device of the tensors. Defaults to None, in which case they are on the CPU.
+
+        Yields:
+            The index of the episode and its steps, with the step as first dimension.
+        """
+        keys = self._keys if keys is None else keys
+        order = np.argsort(self.episode_starts, kind="stable")
+        if success_only:
+            order = order[self.episode_success[order]]
+        # windows read from the file and their first steps, the last window ending at the step windows_stop
+        windows: list[tuple[int, dict[str, np.ndarray]]] = []
+        windows_stop = 0
+        chunks = iter(())
+        for index in order.tolist():
+            start = int(self.episode_starts[index])
+            stop = start + int(self.episode_lengths[index])
+            if start >= windows_stop:
+                # the steps between the episodes (the skipped episodes) are not read
+                chunks = self.iter_chunks(keys, start=start)
+                windows, windows_stop = [], start
+            # drop the windows that end before the episode and read the windows until its end
+            while windows and windows[0][0] + len(windows[0][1][keys[0]]) <= start:
+                windows.pop(0)
+            while windows_stop < stop:
+                window_start, window = next(chunks)
+                windows.append((window_start, window))
+                windows_stop = window_start + len(window[keys[0]])
+            episode = {}
+            for key in keys:
+                parts = [window[key][max(start - s, 0) : stop - s] for s, window in windows if s < stop]
+                episode[key] = torch.as_tensor(np.concatenate(parts), device=device)
+            yield index, episode
+
+    def close(self):
+        """Close the file."""
+        self._file.close()
+
+    """
+    Helper functions.
+    """
+
+    def _read(self, dataset: h5py.Dataset, start: int, stop: int) -> np.ndarray:
+        """Read steps within a chunk of a dataset, through a memory map of the chunk if it is not compressed."""
+        if dataset.id.get_create_plist().get_nfilters() == 0:
+            chunk_start = start - start % dataset.chunks[0]
+            info = dataset.id.get_chunk_info_by_coord((chunk_start,) + (0,) * (dataset.ndim - 1))
+            if info.byte_offset is not None:
+                chunk = np.memmap(
+                    self.file_path, dtype=dataset.dtype, mode="r", shape=dataset.chunks, offset=info.byte_offset
+                )
+                return chunk[start - chunk_start : stop - chunk_start]
+        return dataset[start:stop]
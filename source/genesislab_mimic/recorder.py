@@ -0,0 +1,309 @@
+# Copyright 2025 genesis_lab Developers (https://github.com/Atticlmr/genesis_lab)
+#
+# Licensed under the Apache License, Version 2.0 , January 2004
+
+"""Recorder streaming the episodes of all the environments into an HDF5 dataset."""
+
+from __future__ import annotations
+
+import h5py
+import json
+import numpy as np
+import queue
+import threading
+import torch
+from collections.abc import Mapping
+
+from .recorder_cfg import DatasetRecorderCfg
+
+EPISODE_FIELDS = {"start": np.int64, "length": np.int64, "success": np.bool_, "env_id": np.int64}
+"""The datasets of the ``episodes`` group of a dataset file, which index the episodes in the step datasets."""
+
+
+class DatasetRecorder:
+    """Records the episodes of all the environments into an HDF5 file.
+
+    The steps of all the episodes are stored one after the other in chunked datasets, one per recorded key, e.g.
+    ``data/obs/policy``, ``data/actions`` or ``data/states/robot``, whose first dimension is the step. The episodes
+    are indexed by the datasets ``episodes/start``, ``episodes/length``, ``episodes/success`` and
+    ``episodes/env_id``. Storing the episodes in shared datasets rather than in one HDF5 group each keeps the cost of
+    an episode in the file independent of its length, which matters when thousands of environments end short
+    episodes at every step.
+
+    The recording is split between the simulation thread and a background writer thread:
+
+    1. :meth:`record` copies the tensors of a step into ``(num_envs, buffer_steps, ...)`` buffers on the device and
+       :meth:`end_episodes` marks the ends of episodes in a boolean buffer, without synchronizing with the device.
+    2. Once :attr:`DatasetRecorderCfg.buffer_steps` steps are buffered, they are copied to the host with one
+       (asynchronous on CUDA) copy per key into one of two host buffers, and handed over to the writer thread.
+    3. The writer thread splits the buffered steps into the episodes of the environments, queues the finished
+       episodes and writes them in whole HDF5 chunks of :attr:`DatasetRecorderCfg.chunk_steps` steps, with one
+       write per key.
+
+    If the writer thread falls behind by two flushes, :meth:`flush` waits for a host buffer to be free, so no step
+    is ever dropped. The steps of the episodes that have not ended are kept on the host.
+    """
+
+    def __init__(self, cfg: DatasetRecorderCfg, num_envs: int, device: str | torch.device = "cpu"):
+        """Initialize the recorder and open the dataset file.
+
+        Args:
+            cfg: The configuration of the recorder.
+            num_envs: The number of environments.
+            device: The device of the recorded tensors. Defaults to "cpu".
+
+        Raises:
+            ValueError: If the number of buffered steps or of steps per chunk is not positive.
+        """
+        if cfg.buffer_steps < 1 or cfg.chunk_steps < 1:
+            raise ValueError(
+                f"The numbers of buffered steps and of steps per chunk must be positive. Received: {cfg.buffer_steps}"
+                f" and {cfg.chunk_steps}."
+            )
+        self.cfg = cfg
+        self.num_envs = num_envs
+        self.device = torch.device(device)
+        self.num_episodes = 0
+        self.num_discarded_episodes = 0
+
+        # dataset file, to which the episodes are appended
+        self._file = h5py.File(cfg.file_path, "w" if cfg.overwrite else "a")
+        self._data = self._file.require_group("data")
+        self._episode_index = self._file.require_group("episodes")
+        for name, dtype in EPISODE_FIELDS.items():
+            if name not in self._episode_index:
+                self._episode_index.create_dataset(name, shape=(0,), maxshape=(None,), dtype=dtype, chunks=(4096,))
+        if cfg.env_args is not None:
+            self._file.attrs["env_args"] = json.dumps(cfg.env_args)
+        self._num_written_steps = int(self._data.attrs.get("total", 0))
+
+        # device buffers, allocated at the first recorded step
+        self._buffers: dict[str, torch.Tensor] = {}
+        self._ends = torch.zeros(num_envs, cfg.buffer_steps, dtype=torch.bool, device=self.device)
+        self._success = torch.zeros_like(self._ends)
+        self._step = 0
+        # two host buffers, handed over to the writer thread in turn
+        self._pin_memory = self.device.type == "cuda"
+        self._host_buffers: list[dict[str, torch.Tensor]] = [{}, {}]
+        self._free_slots: queue.Queue[int] = queue.Queue()
+        for slot in range(len(self._host_buffers)):
+            self._free_slots.put(slot)
+
+        # writer thread
+        # -- steps of the episodes that have not ended, per environment
+        self._pending: list[list[dict[str, np.ndarray]]] = [[] for _ in range(num_envs)]
+        self._num_pending_steps = np.zeros(num_envs, dtype=np.int64)
+        # -- steps and index rows of the ended episodes that are not written yet
+        self._queued: list[dict[str, np.ndarray]] = []
+        self._num_queued_steps = 0
+        self._queued_episodes: list[tuple[int, int, bool, int]] = []
+        self._jobs: queue.Queue[tuple[int, int, torch.cuda.Event | None] | None] = queue.Queue()
+        self._error: BaseException | None = None
+        self._thread = threading.Thread(target=self._run, name="DatasetRecorder", daemon=True)
+        self._thread.start()
+        self._closed = False
+
+    def __enter__(self) -> DatasetRecorder:
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    """
+    Operations.
+    """
+
+    def record(self, data: Mapping[str, torch.Tensor | Mapping]):
+        """Record a step of all the environments.
+
+        Args:
+            data: The tensors of the step, possibly in nested dictionaries, e.g. ``{"obs": {"policy": obs},
+                "actions": actions}``. The first dimension of the tensors is the environment. The keys must be the
+                same at every step.
+        """
+        self._check_error()
+        if self._step == self.cfg.buffer_steps:
+            self.flush()
+        flat_data = _flatten(data)
+        if not self._buffers:
+            for key, value in flat_data.items():
+                self._buffers[key] = torch.zeros(
+                    self.num_envs, self.cfg.buffer_steps, *value.shape[1:], dtype=value.dtype, device=self.device
+                )
+        for key, value in flat_data.items():
+            self._buffers[key][:, self._step].copy_(value)
+        self._step += 1
+
+    def end_episodes(self, env_ids: torch.Tensor, success: torch.Tensor | bool | None = None):
+        """Mark the end of the episodes of some environments after their last recorded step.
+
+        Args:
+            env_ids: The environments whose episodes ended, either as a boolean mask of shape (num_envs,) or as
+                indices.
+            success: Whether the episodes succeeded, with the shape of ``env_ids``. Defaults to None, in which case
+                the episodes are considered successful.
+        """
+        if self._step == 0:
+            return
+        ends, successes = self._ends[:, self._step - 1], self._success[:, self._step - 1]
+        success = True if success is None else success
+        if env_ids.dtype == torch.bool:
+            # masked updates, which do not synchronize with the device unlike boolean indexing
+            ends.logical_or_(env_ids)
+            if isinstance(success, torch.Tensor):
+                torch.where(env_ids, success, successes, out=successes)
+            else:
+                successes.masked_fill_(env_ids, success)
+        else:
+            ends[env_ids] = True
+            successes[env_ids] = success
+
+    def flush(self):
+        """Hand the buffered steps over to the writer thread."""
+        if self._step == 0:
+            return
+        slot = self._free_slots.get()
+        host_buffers = self._host_buffers[slot]
+        for key, buffer in (*self._buffers.items(), ("_ends", self._ends), ("_success", self._success)):
+            if key not in host_buffers:
+                host_buffers[key] = torch.empty(buffer.shape, dtype=buffer.dtype, pin_memory=self._pin_memory)
+            host_buffers[key].copy_(buffer, non_blocking=self._pin_memory)
+        event = None
+        if self._pin_memory:
+            event = torch.cuda.Event()
+            event.record()
+        self._jobs.put((slot, self._step, event))
+        self._ends.zero_()
+        self._step = 0
+
+    def close(self):
+        """Write the buffered steps and close the file.
+
+        The episodes that have not ended are not written.
+        """
+        if self._closed:
+            return
+        self.flush()
+        self._jobs.put(None)
+        self._thread.join()
+        self._closed = True
+        try:
+            if self._error is None:
+                self._write_queued(final=True)
+        finally:
+            self._file.close()
+        self._check_error()
+
+    """
+    Helper functions - Writer thread.
+    """
+
+    def _run(self):
+        """Write the flushed steps until the stop signal."""
+        while True:
+            job = self._jobs.get()
+            if job is None:
+                break
+            slot, num_steps, event = job
+            if event is not None:
+                event.synchronize()
+            try:
+                if self._error is None:
+                    arrays = {key: buffer.numpy() for key, buffer in self._host_buffers[slot].items()}
+                    self._split_episodes(arrays, num_steps)
+                    if self._num_queued_steps >= self.cfg.chunk_steps:
+                        self._write_queued()
+            except BaseException as e:
+                self._error = e
+            finally:
+                self._free_slots.put(slot)
+
+    def _split_episodes(self, arrays: dict[str, np.ndarray], num_steps: int):
+        """Split the flushed steps into the episodes of the environments and queue the ended episodes."""
+        ends, success = arrays.pop("_ends")[:, :num_steps], arrays.pop("_success")
+        end_env_ids, end_steps = np.nonzero(ends)
+        starts = np.zeros(self.num_envs, dtype=np.int64)
+        for env_id, end_step in zip(end_env_ids.tolist(), end_steps.tolist()):
+            start, stop = starts[env_id], end_step + 1
+            segments = self._pending[env_id]
+            segments.append({key: array[env_id, start:stop].copy() for key, array in arrays.items()})
+            length = int(self._num_pending_steps[env_id]) + stop - start
+            episode_success = bool(success[env_id, end_step])
+            if episode_success or self.cfg.export_failed:
+                self._queued.extend(segments)
+                episode_start = self._num_written_steps + self._num_queued_steps
+                self._queued_episodes.append((episode_start, length, episode_success, env_id))
+                self._num_queued_steps += length
+                self.num_episodes += 1
+            else:
+                self.num_discarded_episodes += 1
+            self._pending[env_id] = []
+            self._num_pending_steps[env_id] = 0
+            starts[env_id] = stop
+        # keep the steps of the episodes that have not ended
+        for env_id in np.nonzero(starts < num_steps)[0].tolist():
+            start = starts[env_id]
+            self._pending[env_id].append({key: array[env_id, start:num_steps].copy() for key, array in arrays.items()})
+            self._num_pending_steps[env_id] += num_steps - start
+
+    def _write_queued(self, final: bool = False):
+        """Append the steps of the queued episodes to the file.
+
+        Only whole chunks are written, and the remaining steps stay queued, unless ``final`` is True. The index rows
+        of the episodes are written once all their steps are.
+        """
+        if not self._queued:
+            return
+        data = {key: np.concatenate([segment[key] for segment in self._queued]) for key in self._queued[0]}
+        num_steps = self._num_queued_steps
+        if not final:
+            num_steps -= num_steps % self.cfg.chunk_steps
+        start = self._num_written_steps
+        for key, array in data.items():
+            if key not in self._data:
+                self._data.create_dataset(
+                    key,
+                    shape=(0, *array.shape[1:]),
+                    maxshape=(None, *array.shape[1:]),
+                    dtype=array.dtype,
+                    chunks=(self.cfg.chunk_steps, *array.shape[1:]),
+                    compression=self.cfg.compression,
+                    compression_opts=self.cfg.compression_opts,
+                )
+            dataset = self._data[key]
+            dataset.resize(start + num_steps, axis=0)
+            dataset[start:] = array[:num_steps]
+        self._num_written_steps += num_steps
+        self._num_queued_steps -= num_steps
+        self._queued = [{key: array[num_steps:] for key, array in data.items()}] if self._num_queued_steps else []
+        self._data.attrs["total"] = self._num_written_steps
+
+        # index of the episodes whose steps are all written
+        num_written_episodes = 0
+        for episode_start, length, _, _ in self._queued_episodes:
+            if episode_start + length > self._num_written_steps:
+                break
+            num_written_episodes += 1
+        if num_written_episodes > 0:
+            rows = list(zip(*self._queued_episodes[:num_written_episodes]))
+            for (name, dtype), values in zip(EPISODE_FIELDS.items(), rows):
+                dataset = self._episode_index[name]
+                dataset.resize(dataset.shape[0] + num_written_episodes, axis=0)
+                dataset[-num_written_episodes:] = np.asarray(values, dtype=dtype)
+            del self._queued_episodes[:num_written_episodes]
+
+    def _check_error(self):
+        """Raise the error of the writer thread, if any."""
+        if self._error is not None:
+            raise RuntimeError(f"The writer thread of the dataset '{self.cfg.file_path}' failed.") from self._error
+
+
+def _flatten(data: Mapping[str, torch.Tensor | Mapping], prefix: str = "") -> dict[str, torch.Tensor]:
+    """Flatten nested dictionaries of tensors into a dictionary with ``/``-separated keys."""
+    flat_data = {}
+    for key, value in data.items():
+        if isinstance(value, Mapping):
+            flat_data.update(_flatten(value, f"{prefix}{key}/"))
+        else:
+            flat_data[f"{prefix}{key}"] = value
+    return flat_data
@@ -0,0 +1,45 @@
+# Copyright 2025 genesis_lab Developers (https://github.com/Atticlmr/genesis_lab)
+#
+# Licensed under the Apache License, Version 2.0 , January 2004
+
+"""Configuration for the recorder of demonstration datasets."""
+
+from __future__ import annotations
+
+from dataclasses import MISSING, dataclass
+from typing import Any, Literal
+
+
+@dataclass(kw_only=True)
+class DatasetRecorderCfg:
+    """Configuration for the :class:`~genesislab_mimic.DatasetRecorder`."""
+
+    file_path: str = MISSING
+    """The path of the HDF5 file of the dataset."""
+
+    overwrite: bool = False
+    """Whether to overwrite an existing file. Defaults to False, in which case the episodes are appended to it."""
+
+    buffer_steps: int = 64
+    """The number of steps buffered on the device before they are copied to the host. Defaults to 64."""
+
+    chunk_steps: int = 1000
+    """The number of steps per HDF5 chunk. Defaults to 1000.
+
+    The steps of the ended episodes are queued on the host and written in whole chunks.
+    """
+
+    compression: Literal["gzip", "lzf"] | None = "lzf"
+    """The compression filter of the datasets. Defaults to "lzf".
+
+    The :class:`~genesislab_mimic.DatasetReader` memory-maps the chunks of uncompressed datasets.
+    """
+
+    compression_opts: int | None = None
+    """The level of the "gzip" compression, from 0 to 9. Defaults to None (level 4)."""
+
+    export_failed: bool = True
+    """Whether to write the episodes that ended without success. Defaults to True."""
+
+    env_args: dict[str, Any] | None = None
+    """Information about the environment stored as JSON in the attributes of the file. Defaults to None."""
@@ -0,0 +1,20 @@
+# Copyright 2025 genesis_lab Developers (https://github.com/Atticlmr/genesis_lab)
+#
+# Licensed under the Apache License, Version 2.0 , January 2004
+
+"""Wrappers and learners to train policies on the environments with RL libraries.
+
+The wrappers for the libraries written in torch hand the tensors of the environments over without copies:
+
+* :class:`RslRlVecEnvWrapper`: the ``VecEnv`` interface of RSL-RL.
+* :class:`GymVectorEnvWrapper`: the :class:`gymnasium.vector.VectorEnv` API, optionally with numpy arrays.
+
+The :class:`MetricsLogger` writes the training metrics to the console, TensorBoard or SwanLab on a background
+thread. The built-in PPO learner is in :mod:`genesislab_rl.ppo`. The wrapper for Stable-Baselines3 lives in
+:mod:`genesislab_rl.sb3`, which requires the ``stable-baselines3`` package.
+"""
+
+from .gym_vector import GymVectorEnvWrapper
+from .metrics_logger import HistogramData, MetricsLogger
+from .rsl_rl import RslRlVecEnvWrapper
+from .utils import HostStagingBuffer
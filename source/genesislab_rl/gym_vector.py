@@ -0,0 +1,131 @@
+# Copyright 2025 genesis_lab Developers (https://github.com/Atticlmr/genesis_lab)
+#
+# Licensed under the Apache License, Version 2.0 , January 2004
+
+"""Wrapper exposing the environments through the vectorized environment API of gymnasium."""
+
+from __future__ import annotations
+
+import gymnasium as gym
+import numpy as np
+import torch
+from typing import Any
+
+from genesislab.envs import DirectRLEnv, ManagerBasedRLEnv
+from genesislab.envs.common import VecEnvObs
+
+from .utils import HostStagingBuffer
+
+
+class GymVectorEnvWrapper(gym.vector.VectorEnv):
+    """Wraps an environment as a :class:`gymnasium.vector.VectorEnv`.
+
+    The sub-environments are reset within the step in which they terminate or time out, which corresponds to the
+    :attr:`~gymnasium.vector.AutoresetMode.SAME_STEP` autoreset mode. The final observations of the reset
+    sub-environments are not available.
+
+    By default, the observations, rewards, terminations and truncations are returned as the tensors of the environment,
+    without any copy, for learners written in torch. These tensors are overwritten in place at the next step. With
+    ``to_numpy=True``, they are copied at every step into reusable host buffers (see :class:`HostStagingBuffer`) and
+    returned as numpy arrays. The actions may be given either as tensors or as numpy arrays.
+    """
+
+    metadata = {"autoreset_mode": gym.vector.AutoresetMode.SAME_STEP}
+
+    def __init__(self, env: ManagerBasedRLEnv | DirectRLEnv | gym.Wrapper, to_numpy: bool = False, num_slots: int = 2):
+        """Initialize the wrapper.
+
+        Args:
+            env: The environment to wrap, possibly wrapped by gymnasium wrappers.
+            to_numpy: Whether to return the signals as numpy arrays. Defaults to False.
+            num_slots: The number of steps after which the returned numpy arrays are overwritten. Defaults to 2.
+
+        Raises:
+            ValueError: If the environment is not a manager-based or a direct RL environment.
+        """
+        if not isinstance(env.unwrapped, (ManagerBasedRLEnv, DirectRLEnv)):
+            raise ValueError(
+                "The environment must be inherited from ManagerBasedRLEnv or DirectRLEnv. Environment type:"
+                f" {type(env)}"
+            )
+        self.env = env
+        self.to_numpy = to_numpy
+        base_env: ManagerBasedRLEnv | DirectRLEnv = env.unwrapped
+        self.device = base_env.device
+        self.num_envs = base_env.num_envs
+        self.single_observation_space = base_env.single_observation_space
+        self.single_action_space = base_env.single_action_space
+        self.observation_space = base_env.observation_space
+        self.action_space = base_env.action_space
+        self.render_mode = base_env.render_mode
+
+        # buffers for the actions given as numpy arrays and for the conversion to numpy
+        self._actions = torch.zeros(self.action_space.shape, device=self.device)
+        self._staging = HostStagingBuffer(self.device, num_slots) if to_numpy else None
+
+    """
+    Operations.
+    """
+
+    def reset(self, *, seed: int | None = None, options: dict[str, Any] | None = None) -> tuple[Any, dict[str, Any]]:
+        """Reset all the sub-environments and return their observations and the extras."""
+        obs, extras = self.env.reset(seed=seed, options=options)
+        if self._staging is not None:
+            obs = self._unflatten(self._staging.stage(self._flatten(obs)))
+        return obs, extras
+
+    def step(self, actions: torch.Tensor | np.ndarray) -> tuple[Any, Any, Any, Any, dict[str, Any]]:
+        """Step all the sub-environments.
+
+        Args:
+            actions: The actions of all the sub-environments. Shape is (num_envs, action_dim).
+
+        Returns:
+            The observations, rewards, terminations, truncations and extras.
+        """
+        if isinstance(actions, np.ndarray):
+            self._actions.copy_(torch.from_numpy(actions))
+            actions = self._actions
+        obs, rewards, terminated, truncated, extras = self.env.step(actions)
+        if self._staging is None:
+            return obs, rewards, terminated, truncated, extras
+        # copy all the signals to the host with a single synchronization
+        signals = self._flatten(obs)
+        signals["_rewards"] = rewards
+        signals["_terminated"] = terminated
+        signals["_truncated"] = truncated
+        arrays = self._staging.stage(signals)
+        rewards, terminated, truncated = arrays.pop("_rewards"), arrays.pop("_terminated"), arrays.pop("_truncated")
+        return self._unflatten(arrays), rewards, terminated, truncated, extras
+
+    def close_extras(self, **kwargs):
+        """Close the environment."""
+        self.env.close()
+
+    """
+    Helper functions.
+    """
+
+    @staticmethod
+    def _flatten(obs: VecEnvObs) -> dict[str, torch.Tensor]:
+        """Flatten the observation groups whose terms are not concatenated, with ``group/term`` names."""
+        tensors = {}
+        for group_name, group_obs in obs.items():
+            if isinstance(group_obs, dict):
+                for term_name, term_obs in group_obs.items():
+                    tensors[f"{group_name}/{term_name}"] = term_obs
+            else:
+                tensors[group_name] = group_obs
+        return tensors
+
+    @staticmethod
+    def _unflatten(arrays: dict[str, np.ndarray]) -> dict[str, np.ndarray | dict[str, np.ndarray]]:
+        """Restore the observation groups flattened by :meth:`_flatten`."""
+        obs = {}
+        for name, array in arrays.items():
+            group_name, _, term_name = name.partition("/")
+            if term_name:
+                obs.setdefault(group_name, {})[term_name] = array
+            else:
+                obs[group_name] = array
+        return obs
@@ -0,0 +1,404 @@
+# Copyright 2025 genesis_lab Developers (https://github.com/Atticlmr/genesis_lab)
+#
+# Licensed under the Apache License, Version 2.0 , January 2004
+
+"""Asynchronous logging of the training metrics to the console, TensorBoard and SwanLab."""
+
+from __future__ import annotations
+
+import importlib.util
+import math
+import queue
+import threading
+import torch
+import traceback
+import warnings
+from collections.abc import Mapping, Sequence
+from typing import Any, NamedTuple
+
+
+class HistogramData(NamedTuple):
+    """Summary of the values of a histogram metric, in the layout of :meth:`SummaryWriter.add_histogram_raw`."""
+
+    min: float
+    max: float
+    num: float
+    sum: float
+    sum_squares: float
+    bucket_limits: list[float]
+    bucket_counts: list[float]
+
+
+class _Record(NamedTuple):
+    """The metrics of a logging interval, handed over to the background thread."""
+
+    step: int
+    layout: list[tuple[str, str, int]]
+    values: torch.Tensor
+    event: Any
+    host_scalars: dict[str, float]
+
+
+class MetricsLogger:
+    """Logger collecting scalar and histogram metrics on the device and writing them on a background thread.
+
+    The metrics are accumulated on the device where they are computed: the scalars added during a logging interval
+    are averaged and the histograms are binned with scatter operations that do not synchronize with the device. At
+    the end of every logging interval, all the metrics are concatenated into a single tensor which is copied to the
+    host with one transfer, and handed over to a background thread through a bounded queue. On CUDA, the transfer
+    is asynchronous: it targets a page-locked staging buffer, which the thread hands back for reuse once it has
+    waited for the transfer. The thread unpacks the metrics and writes them to the backends:
+
+    * ``"console"``: prints the metrics of every interval.
+    * ``"tensorboard"``: writes TensorBoard event files to the log directory.
+    * ``"swanlab"``: logs to SwanLab. The ``"local"`` and ``"offline"`` modes only write to the log directory and do
+      not need a network connection.
+
+    The training loop never waits for the backends: the backends are opened on the background thread, and if the
+    queue is full because the backends are slower than the training, the metrics of the interval are dropped and
+    counted in :attr:`num_dropped`. Scalars that are not finite, such as the mean of an empty set of episodes, are
+    skipped when they are written.
+    """
+
+    def __init__(
+        self,
+        log_dir: str | None = None,
+        backends: Sequence[str] = ("console",),
+        log_interval: int = 1,
+        max_queue_size: int = 16,
+        device: str | torch.device = "cpu",
+        experiment_name: str = "default",
+        swanlab_project: str | None = None,
+        swanlab_mode: str = "local",
+        config: Mapping[str, Any] | None = None,
+    ):
+        """Initialize the logger and start the background thread.
+
+        Args:
+            log_dir: The directory of the logs. Defaults to None, which is only valid with the console backend.
+            backends: The names of the backends. Defaults to ("console",).
+            log_interval: The number of calls to :meth:`step` per logging interval. Defaults to 1.
+            max_queue_size: The maximum number of intervals waiting to be written. Defaults to 16.
+            device: The device on which the metrics are accumulated. Defaults to "cpu".
+            experiment_name: The name of the experiment, used by SwanLab. Defaults to "default".
+            swanlab_project: The SwanLab project. Defaults to None, in which case the experiment name is used.
+            swanlab_mode: The SwanLab mode, e.g. "local", "offline" or "cloud". Defaults to "local".
+            config: The configuration of the experiment, recorded by SwanLab. Defaults to None.
+
+        Raises:
+            ValueError: If a backend is unknown, or if a backend writing files is requested without log directory.
+            ModuleNotFoundError: If the package of a backend is not installed.
+        """
+        if log_interval < 1:
+            raise ValueError(f"The log interval must be a positive integer. Received: {log_interval}.")
+        self.log_interval = log_interval
+        self.device = torch.device(device)
+        self.num_dropped = 0
+        # the device-to-host copies are only asynchronous into page-locked memory
+        self._pin_memory = self.device.type == "cuda"
+        self._free_buffers: queue.SimpleQueue[torch.Tensor] = queue.SimpleQueue()
+        self._backends = [
+            _create_backend(name, log_dir, experiment_name, swanlab_project, swanlab_mode, config) for name in backends
+        ]
+
+        # metrics of the current interval, on the device
+        self._scalar_sums: dict[str, torch.Tensor | float] = {}
+        self._scalar_counts: dict[str, int] = {}
+        self._histograms: dict[str, torch.Tensor] = {}
+        self._num_steps = 0
+
+        # background thread writing to the backends
+        self._queue: queue.Queue[_Record | None] = queue.Queue(maxsize=max_queue_size)
+        self._thread = threading.Thread(target=self._run, name="MetricsLogger", daemon=True)
+        self._thread.start()
+        self._closed = False
+
+    def __enter__(self) -> MetricsLogger:
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    """
+    Operations.
+    """
+
+    def add_scalar(self, name: str, value: torch.Tensor | float):
+        """Add a value of a scalar metric. The values added during a logging interval are averaged.
+
+        Args:
+            name: The name of the metric, e.g. ``"Loss/surrogate"``.
+            value: The value, as a number or as a tensor with a single element on any device.
+        """
+        if isinstance(value, torch.Tensor):
+            value = value.detach().reshape(()).to(device=self.device, dtype=torch.float)
+        previous = self._scalar_sums.get(name)
+        if previous is None:
+            self._scalar_sums[name] = value.clone() if isinstance(value, torch.Tensor) else float(value)
+            self._scalar_counts[name] = 1
+        else:
+            if isinstance(previous, torch.Tensor):
+                previous += value
+            else:
+                self._scalar_sums[name] = previous + value
+            self._scalar_counts[name] += 1
+
+    def add_scalars(self, scalars: Mapping[str, torch.Tensor | float]):
+        """Add values of several scalar metrics. See :meth:`add_scalar`."""
+        for name, value in scalars.items():
+            self.add_scalar(name, value)
+
+    def add_histogram(self, name: str, values: torch.Tensor, bins: int = 64):
+        """Set the values of a histogram metric for the current logging interval.
+
+        The values are binned on the device between their minimum and maximum, without synchronization. Empty
+        values are ignored, since their range is undefined.
+
+        Args:
+            name: The name of the metric, e.g. ``"Policy/actions"``.
+            values: The values, of any shape.
+            bins: The number of bins. Defaults to 64.
+        """
+        if values.numel() == 0:
+            return
+        values = values.detach().reshape(-1).to(device=self.device, dtype=torch.float)
+        value_min, value_max = torch.aminmax(values)
+        scale = bins / torch.clamp(value_max - value_min, min=1e-12)
+        bin_ids = ((values - value_min) * scale).long().clamp_(0, bins - 1)
+        counts = torch.zeros(bins, device=self.device).index_add_(0, bin_ids, torch.ones_like(values))
+        num = values.new_tensor(values.numel())
+        summary = torch.stack((value_min, value_max, num, values.sum(), values.square().sum()))
+        self._histograms[name] = torch.cat((summary, counts))
+
+    def step(self, global_step: int) -> bool:
+        """Mark the end of a step of the training loop and hand the metrics over at the end of a logging interval.
+
+        Args:
+            global_step: The step recorded with the metrics, e.g. the learning iteration.
+
+        Returns:
+            True if the logging interval ended and the metrics were handed over (or dropped), False otherwise.
+        """
+        self._num_steps += 1
+        if self._num_steps % self.log_interval != 0:
+            return False
+        # a single tensor holding the averaged scalars and the histograms
+        layout, tensors, host_scalars = [], [], {}
+        for name, value in self._scalar_sums.items():
+            if isinstance(value, torch.Tensor):
+                layout.append(("scalar", name, 1))
+                tensors.append((value / self._scalar_counts[name]).reshape(1))
+            else:
+                layout.append(("host_scalar", name, 0))
+                host_scalars[name] = value / self._scalar_counts[name]
+        for name, histogram in self._histograms.items():
+            layout.append(("histogram", name, histogram.numel()))
+            tensors.append(histogram)
+        self._scalar_sums, self._scalar_counts, self._histograms = {}, {}, {}
+
+        values, event = torch.zeros(0), None
+        if tensors:
+            values = torch.cat(tensors)
+            if self._pin_memory:
+                values = self._staging_buffer(values.numel()).copy_(values, non_blocking=True)
+                event = torch.cuda.Event()
+                event.record()
+            else:
+                values = values.cpu()
+        try:
+            self._queue.put_nowait(_Record(global_step, layout, values, event, host_scalars))
+        except queue.Full:
+            self.num_dropped += 1
+            # the copy into the buffer is ordered on the stream before any later copy into it
+            if event is not None:
+                self._free_buffers.put(values)
+        return True
+
+    def close(self):
+        """Write the pending metrics, close the backends and stop the background thread."""
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(None)
+        self._thread.join()
+
+    """
+    Helper functions.
+    """
+
+    def _staging_buffer(self, numel: int) -> torch.Tensor:
+        """Return a free page-locked host buffer with the given number of elements, allocating it if needed.
+
+        The buffers of the records in the queue are in use. The layout of the metrics is usually the same at every
+        interval, so a free buffer of another size is released rather than kept.
+        """
+        try:
+            buffer = self._free_buffers.get_nowait()
+            if buffer.numel() == numel:
+                return buffer
+        except queue.Empty:
+            pass
+        return torch.empty(numel, pin_memory=True)
+
+    def _run(self):
+        """Open the backends and write the records of the queue until the stop signal."""
+        backends = [backend for backend in self._backends if self._call(backend, "open")]
+        while True:
+            record = self._queue.get()
+            if record is None:
+                break
+            scalars, histograms = self._unpack(record)
+            if record.event is not None:
+                self._free_buffers.put(record.values)
+            backends = [
+                backend for backend in backends if self._call(backend, "write", record.step, scalars, histograms)
+            ]
+        for backend in backends:
+            self._call(backend, "close")
+
+    @staticmethod
+    def _unpack(record: _Record) -> tuple[dict[str, float], dict[str, HistogramData]]:
+        """Wait for the transfer of a record and split it into the scalars and histograms."""
+        if record.event is not None:
+            record.event.synchronize()
+        values = record.values.tolist()
+        scalars, histograms = {}, {}
+        offset = 0
+        for kind, name, size in record.layout:
+            if kind != "histogram":
+                value = values[offset] if kind == "scalar" else record.host_scalars[name]
+                if math.isfinite(value):
+                    scalars[name] = value
+            else:
+                value_min, value_max, num, value_sum, sum_squares = values[offset : offset + 5]
+                counts = values[offset + 5 : offset + size]
+                width = (value_max - value_min) / len(counts)
+                limits = [value_min + width * (index + 1) for index in range(len(counts))]
+                histograms[name] = HistogramData(value_min, value_max, num, value_sum, sum_squares, limits, counts)
+            offset += size
+        return scalars, histograms
+
+    @staticmethod
+    def _call(backend: _Backend, method: str, *args) -> bool:
+        """Call a method of a backend, and report and disable the backend if it fails."""
+        try:
+            getattr(backend, method)(*args)
+            return True
+        except Exception:
+            warnings.warn(
+                f"The '{backend.name}' logging backend failed and is disabled:\n{traceback.format_exc()}", stacklevel=1
+            )
+            return False
+
+
+"""
+Backends.
+"""
+
+
+class _Backend:
+    """Base class of the backends, whose methods are called on the background thread."""
+
+    name: str
+
+    def open(self):
+        pass
+
+    def write(self, step: int, scalars: dict[str, float], histograms: dict[str, HistogramData]):
+        raise NotImplementedError
+
+    def close(self):
+        pass
+
+
+class _ConsoleBackend(_Backend):
+    name = "console"
+
+    def write(self, step: int, scalars: dict[str, float], histograms: dict[str, HistogramData]):
+        lines = [f"{'Iteration:':>40} {step}"]
+        lines += [f"{f'{name}:':>40} {value:.6g}" for name, value in scalars.items()]
+        for name, histogram in histograms.items():
+            mean = histogram.sum / max(histogram.num, 1.0)
+            lines.append(f"{f'{name}:':>40} mean {mean:.4f} [{histogram.min:.4f}, {histogram.max:.4f}]")
+        print("\n".join(lines) + "\n", flush=True)
+
+
+class _TensorBoardBackend(_Backend):
+    name = "tensorboard"
+
+    def __init__(self, log_dir: str):
+        self.log_dir = log_dir
+        self._writer = None
+
+    def open(self):
+        from torch.utils.tensorboard import SummaryWriter
+
+        self._writer = SummaryWriter(log_dir=self.log_dir)
+
+    def write(self, step: int, scalars: dict[str, float], histograms: dict[str, HistogramData]):
+        for name, value in scalars.items():
+            self._writer.add_scalar(name, value, global_step=step)
+        for name, histogram in histograms.items():
+            self._writer.add_histogram_raw(name, *histogram, global_step=step)
+
+    def close(self):
+        self._writer.close()
+
+
+class _SwanLabBackend(_Backend):
+    name = "swanlab"
+
+    def __init__(self, log_dir: str, project: str, experiment_name: str, mode: str, config: Mapping[str, Any] | None):
+        self.log_dir = log_dir
+        self.project = project
+        self.experiment_name = experiment_name
+        self.mode = mode
+        self.config = dict(config) if config is not None else None
+        self._run = None
+
+    def open(self):
+        import swanlab
+
+        self._run = swanlab.init(
+            project=self.project,
+            experiment_name=self.experiment_name,
+            logdir=self.log_dir,
+            mode=self.mode,
+            config=self.config,
+        )
+
+    def write(self, step: int, scalars: dict[str, float], histograms: dict[str, HistogramData]):
+        data = dict(scalars)
+        # SwanLab has no raw histograms, the moments of the values are logged instead
+        for name, histogram in histograms.items():
+            mean = histogram.sum / max(histogram.num, 1.0)
+            data[f"{name}/mean"] = mean
+            data[f"{name}/std"] = math.sqrt(max(histogram.sum_squares / max(histogram.num, 1.0) - mean**2, 0.0))
+            data[f"{name}/min"] = histogram.min
+            data[f"{name}/max"] = histogram.max
+        self._run.log(data, step=step)
+
+    def close(self):
+        self._run.finish()
+
+
+def _create_backend(
+    name: str,
+    log_dir: str | None,
+    experiment_name: str,
+    swanlab_project: str | None,
+    swanlab_mode: str,
+    config: Mapping[str, Any] | None,
+) -> _Backend:
+    """Create a backend by name, checking that its package is installed without importing it."""
+    if name == "console":
+        return _ConsoleBackend()
+    if name not in ("tensorboard", "swanlab"):
+        raise ValueError(f"Unknown logging backend '{name}'. Available backends: console, tensorboard, swanlab.")
+    if log_dir is None:
+        raise ValueError(f"The '{name}' logging backend requires a log directory.")
+    if importlib.util.find_spec(name) is None:
+        raise ModuleNotFoundError(f"The '{name}' logging backend requires the '{name}' package.")
+    if name == "tensorboard":
+        return _TensorBoardBackend(log_dir)
+    return _SwanLabBackend(log_dir, swanlab_project or experiment_name, experiment_name, swanlab_mode, config)
@@ -0,0 +1,17 @@
+# Copyright 2025 genesis_lab Developers (https://github.com/Atticlmr/genesis_lab)
+#
+# Licensed under the Apache License, Version 2.0 , January 2004
+
+"""Built-in PPO learner.
+
+The learner keeps the whole training loop on the simulation device: the rollouts are written into a preallocated
+:class:`RolloutStorage`, the advantages are computed with a vectorized reverse scan and the mini-batches are drawn
+by index permutation. Training is driven by the :class:`OnPolicyRunner`, configured with a :class:`PPOCfg`.
+"""
+
+from .actor_critic import ActorCritic
+from .normalizer import EmpiricalNormalization
+from .on_policy_runner import OnPolicyRunner
+from .ppo import PPO
+from .ppo_cfg import ActorCriticCfg, PPOAlgorithmCfg, PPOCfg
+from .rollout_storage import MiniBatch, RolloutStorage
@@ -0,0 +1,90 @@
+# Copyright 2025 genesis_lab Developers (https://github.com/Atticlmr/genesis_lab)
+#
+# Licensed under the Apache License, Version 2.0 , January 2004
+
+"""Actor-critic networks with a Gaussian policy."""
+
+from __future__ import annotations
+
+import math
+import torch
+from torch import nn
+
+from .ppo_cfg import ActorCriticCfg
+
+_HALF_LOG_2PI = 0.5 * math.log(2.0 * math.pi)
+
+
+class ActorCritic(nn.Module):
+    """Actor and critic multi-layer perceptrons with a state-independent Gaussian action noise.
+
+    The log-probabilities, the entropy and the KL divergence of the diagonal Gaussian policy are computed in closed
+    form on the tensors instead of through :mod:`torch.distributions` objects.
+    """
+
+    def __init__(self, num_actor_obs: int, num_critic_obs: int, num_actions: int, cfg: ActorCriticCfg):
+        """Initialize the networks.
+
+        Args:
+            num_actor_obs: The dimension of the observations of the actor.
+            num_critic_obs: The dimension of the observations of the critic.
+            num_actions: The dimension of the actions.
+            cfg: The configuration of the networks.
+        """
+        super().__init__()
+        self.actor = _build_mlp(num_actor_obs, cfg.actor_hidden_dims, num_actions, cfg.activation)
+        self.critic = _build_mlp(num_critic_obs, cfg.critic_hidden_dims, 1, cfg.activation)
+        self.log_std = nn.Parameter(torch.full((num_actions,), math.log(cfg.init_noise_std)))
+
+    @property
+    def action_std(self) -> torch.Tensor:
+        """The standard deviation of the action noise. Shape is (num_actions,)."""
+        return self.log_std.exp()
+
+    def act(self, obs: torch.Tensor) -> tuple[torch.Tensor, torch.Tensor]:
+        """Sample actions from the policy.
+
+        Args:
+            obs: The observations of the actor. Shape is (N, num_actor_obs).
+
+        Returns:
+            The sampled actions and the mean actions. Shape is (N, num_actions).
+        """
+        mean = self.actor(obs)
+        return torch.addcmul(mean, self.action_std, torch.randn_like(mean)), mean
+
+    def act_inference(self, obs: torch.Tensor) -> torch.Tensor:
+        """Returns the mean actions of the policy for the observations of the actor."""
+        return self.actor(obs)
+
+    def evaluate(self, critic_obs: torch.Tensor) -> torch.Tensor:
+        """Returns the values of the observations of the critic. Shape is (N,)."""
+        return self.critic(critic_obs).squeeze(-1)
+
+    def log_prob(self, actions: torch.Tensor, mean: torch.Tensor) -> torch.Tensor:
+        """Returns the log-probabilities of the actions under the policy with the given mean actions. Shape is (N,)."""
+        normalized = (actions - mean) * torch.exp(-self.log_std)
+        return -(0.5 * normalized.square() + self.log_std + _HALF_LOG_2PI).sum(dim=-1)
+
+    def entropy(self) -> torch.Tensor:
+        """Returns the entropy of the policy, which is the same for all the observations."""
+        return (self.log_std + 0.5 + _HALF_LOG_2PI).sum()
+
+    def kl_divergence(self, old_mean: torch.Tensor, old_std: torch.Tensor, mean: torch.Tensor) -> torch.Tensor:
+        """Returns the KL divergence from the old policy to the current policy. Shape is (N,)."""
+        var = torch.exp(2.0 * self.log_std)
+        kl = self.log_std - torch.log(old_std) + (old_std.square() + (old_mean - mean).square()) / (2.0 * var) - 0.5
+        return kl.sum(dim=-1)
+
+
+def _build_mlp(input_dim: int, hidden_dims: list[int], output_dim: int, activation: str) -> nn.Sequential:
+    """Create a multi-layer perceptron with the given activation after every hidden layer."""
+    activations = {"elu": nn.ELU, "relu": nn.ReLU, "tanh": nn.Tanh, "selu": nn.SELU, "leaky_relu": nn.LeakyReLU}
+    if activation not in activations:
+        raise ValueError(f"Unknown activation '{activation}'. Available activations: {list(activations)}.")
+    layers = []
+    dims = [input_dim, *hidden_dims]
+    for in_dim, out_dim in zip(dims[:-1], dims[1:]):
+        layers += [nn.Linear(in_dim, out_dim), activations[activation]()]
+    layers.append(nn.Linear(dims[-1], output_dim))
+    return nn.Sequential(*layers)
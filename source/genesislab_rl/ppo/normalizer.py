@@ -0,0 +1,53 @@
+# Copyright 2025 genesis_lab Developers (https://github.com/Atticlmr/genesis_lab)
+#
+# Licensed under the Apache License, Version 2.0 , January 2004
+
+"""Running normalization of the observations."""
+
+from __future__ import annotations
+
+import torch
+from torch import nn
+
+
+class EmpiricalNormalization(nn.Module):
+    """Normalizes the inputs with the running mean and variance of all the inputs seen so far.
+
+    The statistics of a batch are obtained with a single :func:`torch.var_mean` reduction and merged into the running
+    statistics with the parallel algorithm of Chan et al., so the update does not depend on the batch size and does
+    not synchronize with the device. The statistics are buffers of the module and are saved with its state.
+    """
+
+    def __init__(self, shape: int | tuple[int, ...], eps: float = 1e-2):
+        """Initialize the normalizer.
+
+        Args:
+            shape: The shape of a single input.
+            eps: A small value added to the variance for numerical stability. Defaults to 1e-2.
+        """
+        super().__init__()
+        self.eps = eps
+        self.register_buffer("mean", torch.zeros(shape))
+        self.register_buffer("var", torch.ones(shape))
+        self.register_buffer("count", torch.zeros((), dtype=torch.long))
+
+    def forward(self, x: torch.Tensor) -> torch.Tensor:
+        """Normalize the inputs with the running statistics."""
+        return (x - self.mean) * torch.rsqrt(self.var + self.eps)
+
+    @torch.no_grad()
+    def update(self, x: torch.Tensor):
+        """Update the running statistics with a batch of inputs.
+
+        Args:
+            x: The inputs. Shape is (batch_size, *shape).
+        """
+        batch_var, batch_mean = torch.var_mean(x, dim=0, unbiased=False)
+        batch_count = x.shape[0]
+        total_count = self.count + batch_count
+        batch_ratio = batch_count / total_count
+        delta = batch_mean - self.mean
+        self.mean.add_(delta * batch_ratio)
+        # merge the sums of squared deviations of the running and of the batch statistics
+        self.var.mul_(1.0 - batch_ratio).add_(batch_ratio * (batch_var + (1.0 - batch_ratio) * delta.square()))
+        self.count.copy_(total_count)
@@ -0,0 +1,273 @@
+# Copyright 2025 genesis_lab Developers (https://github.com/Atticlmr/genesis_lab)
+#
+# Licensed under the Apache License, Version 2.0 , January 2004
+
+"""Runner collecting the rollouts and training the policy with PPO."""
+
+from __future__ import annotations
+
+import dataclasses
+import os
+import time
+import torch
+from collections.abc import Callable
+from torch import nn
+
+from genesislab.envs import DirectRLEnv, ManagerBasedRLEnv
+
+from ..metrics_logger import MetricsLogger
+from ..rsl_rl import RslRlVecEnvWrapper
+from .actor_critic import ActorCritic
+from .normalizer import EmpiricalNormalization
+from .ppo import PPO
+from .ppo_cfg import PPOCfg
+
+
+class OnPolicyRunner:
+    """Runner of the PPO learner on a vectorized environment.
+
+    Every learning iteration collects a rollout of :attr:`PPOCfg.num_steps_per_env` steps of all the environments
+    under :func:`torch.inference_mode`, computes the returns and advantages and updates the networks. The
+    environment is accessed through the :class:`~genesislab_rl.RslRlVecEnvWrapper`, so the observations and rewards
+    stay on the simulation device. The episode statistics and the logs of the environment are accumulated on the
+    device during the rollout and handed over to a :class:`~genesislab_rl.MetricsLogger`, which transfers them to
+    the host once per logging interval and writes them on a background thread. The environments only log a value
+    in the steps that produce it, e.g. the episodic sums in the steps with resets, so each logged value is averaged
+    over the steps that logged it.
+    """
+
+    def __init__(
+        self,
+        env: ManagerBasedRLEnv | DirectRLEnv | RslRlVecEnvWrapper,
+        cfg: PPOCfg,
+        log_dir: str | None = None,
+        device: str | torch.device = "cpu",
+    ):
+        """Initialize the runner.
+
+        Args:
+            env: The environment, or the environment wrapped by :class:`~genesislab_rl.RslRlVecEnvWrapper`.
+            cfg: The configuration of the runner.
+            log_dir: The directory of the checkpoints. Defaults to None, in which case nothing is saved.
+            device: The device of the learner. Defaults to "cpu".
+        """
+        if not isinstance(env, RslRlVecEnvWrapper):
+            env = RslRlVecEnvWrapper(env, clip_actions=cfg.clip_actions)
+        self.env = env
+        self.cfg = cfg
+        self.log_dir = log_dir
+        self.device = torch.device(device)
+        torch.manual_seed(cfg.seed)
+
+        # networks, normalizers and algorithm
+        num_obs = env.num_obs
+        num_critic_obs = env.num_privileged_obs if env.num_privileged_obs > 0 else num_obs
+        actor_critic = ActorCritic(num_obs, num_critic_obs, env.num_actions, cfg.policy).to(self.device)
+        self.alg = PPO(actor_critic, cfg.algorithm, device=self.device)
+        if cfg.empirical_normalization:
+            self.obs_normalizer = EmpiricalNormalization(num_obs).to(self.device)
+            self.critic_obs_normalizer = EmpiricalNormalization(num_critic_obs).to(self.device)
+        else:
+            self.obs_normalizer = nn.Identity().to(self.device)
+            self.critic_obs_normalizer = nn.Identity().to(self.device)
+        critic_obs_shape = (num_critic_obs,) if env.num_privileged_obs > 0 else None
+        self.alg.init_storage(env.num_envs, cfg.num_steps_per_env, (num_obs,), critic_obs_shape, (env.num_actions,))
+
+        self.current_learning_iteration = 0
+        self.total_timesteps = 0
+        self.total_time = 0.0
+        self.logger: MetricsLogger | None = None
+
+    """
+    Operations.
+    """
+
+    def learn(self, num_learning_iterations: int, init_at_random_ep_len: bool = False):
+        """Train the policy.
+
+        Args:
+            num_learning_iterations: The number of learning iterations.
+            init_at_random_ep_len: Whether to start the episodes at random lengths to spread the resets of the
+                environments over the episode length. Defaults to False.
+        """
+        env = self.env
+        if init_at_random_ep_len:
+            env.episode_length_buf = torch.randint_like(env.episode_length_buf, high=int(env.max_episode_length))
+        obs, critic_obs = self._process_observations(*env.get_observations(), update=False)
+        self.train_mode()
+
+        # the console output and the logs of the training are written on a background thread
+        backends = ["console"]
+        if self.log_dir is not None and self.cfg.logger != "console":
+            backends.append(self.cfg.logger)
+        self.logger = MetricsLogger(
+            self.log_dir,
+            backends,
+            log_interval=self.cfg.log_interval,
+            device=self.device,
+            experiment_name=self.cfg.experiment_name,
+            swanlab_project=self.cfg.swanlab_project,
+            swanlab_mode=self.cfg.swanlab_mode,
+            config=dataclasses.asdict(self.cfg),
+        )
+
+        # episode statistics, accumulated on the device
+        current_return = torch.zeros(env.num_envs, device=self.device)
+        current_length = torch.zeros(env.num_envs, device=self.device)
+        # sums of the returns and lengths of the finished episodes and their number
+        episode_sums = torch.zeros(3, device=self.device)
+
+        start_iteration = self.current_learning_iteration
+        try:
+            for iteration in range(start_iteration, start_iteration + num_learning_iterations):
+                start_time = time.perf_counter()
+                episode_sums.zero_()
+                # sums of the logs of the environment and number of steps that logged each key
+                log_sums, log_counts = {}, {}
+                # rollout
+                with torch.inference_mode():
+                    for _ in range(self.cfg.num_steps_per_env):
+                        actions = self.alg.act(obs, critic_obs)
+                        obs, rewards, dones, extras = env.step(actions)
+                        obs, critic_obs = self._process_observations(obs, extras)
+                        rewards, dones = rewards.to(self.device), dones.to(self.device)
+                        self.alg.process_env_step(rewards, dones, extras["time_outs"].to(self.device))
+                        # bookkeeping of the finished episodes and of the logs of the environment
+                        current_return += rewards
+                        current_length += 1.0
+                        episode_sums[0] += torch.sum(current_return * dones)
+                        episode_sums[1] += torch.sum(current_length * dones)
+                        episode_sums[2] += torch.sum(dones)
+                        current_return.masked_fill_(dones, 0.0)
+                        current_length.masked_fill_(dones, 0.0)
+                        for key, value in extras.get("log", {}).items():
+                            log_sums[key] = log_sums.get(key, 0.0) + value
+                            log_counts[key] = log_counts.get(key, 0) + 1
+                    collection_time = time.perf_counter() - start_time
+
+                    start_time = time.perf_counter()
+                    self.alg.compute_returns(critic_obs)
+                losses = self.alg.update()
+                learn_time = time.perf_counter() - start_time
+
+                self.current_learning_iteration = iteration + 1
+                self._log(
+                    iteration,
+                    collection_time,
+                    learn_time,
+                    losses,
+                    episode_sums,
+                    {key: value / log_counts[key] for key, value in log_sums.items()},
+                )
+                if self.log_dir is not None and self.current_learning_iteration % self.cfg.save_interval == 0:
+                    self.save(os.path.join(self.log_dir, f"model_{self.current_learning_iteration}.pt"))
+
+            if self.log_dir is not None:
+                self.save(os.path.join(self.log_dir, f"model_{self.current_learning_iteration}.pt"))
+        finally:
+            self.logger.close()
+
+    def save(self, path: str):
+        """Save the networks, the normalizers and the optimizer to a checkpoint."""
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        checkpoint = {
+            "model_state_dict": self.alg.actor_critic.state_dict(),
+            "optimizer_state_dict": self.alg.optimizer.state_dict(),
+            "obs_norm_state_dict": self.obs_normalizer.state_dict(),
+            "critic_obs_norm_state_dict": self.critic_obs_normalizer.state_dict(),
+            "iter": self.current_learning_iteration,
+        }
+        torch.save(checkpoint, path)
+
+    def load(self, path: str, load_optimizer: bool = True):
+        """Load the networks, the normalizers and optionally the optimizer from a checkpoint."""
+        checkpoint = torch.load(path, map_location=self.device, weights_only=True)
+        self.alg.actor_critic.load_state_dict(checkpoint["model_state_dict"])
+        self.obs_normalizer.load_state_dict(checkpoint["obs_norm_state_dict"])
+        self.critic_obs_normalizer.load_state_dict(checkpoint["critic_obs_norm_state_dict"])
+        if load_optimizer:
+            self.alg.optimizer.load_state_dict(checkpoint["optimizer_state_dict"])
+        self.current_learning_iteration = checkpoint["iter"]
+
+    def get_inference_policy(self, device: str | torch.device | None = None) -> Callable[[torch.Tensor], torch.Tensor]:
+        """Returns the deterministic policy, which maps the observations of the actor to the mean actions.
+
+        Args:
+            device: The device to move the networks to. Defaults to None, in which case they are not moved.
+        """
+        self.eval_mode()
+        if device is not None:
+            self.alg.actor_critic.to(device)
+            self.obs_normalizer.to(device)
+        actor_critic, obs_normalizer = self.alg.actor_critic, self.obs_normalizer
+        return lambda obs: actor_critic.act_inference(obs_normalizer(obs))
+
+    def train_mode(self):
+        """Set the networks and the normalizers to training mode."""
+        self.alg.actor_critic.train()
+        self.obs_normalizer.train()
+        self.critic_obs_normalizer.train()
+
+    def eval_mode(self):
+        """Set the networks and the normalizers to evaluation mode."""
+        self.alg.actor_critic.eval()
+        self.obs_normalizer.eval()
+        self.critic_obs_normalizer.eval()
+
+    """
+    Helper functions.
+    """
+
+    def _process_observations(
+        self, obs: torch.Tensor, extras: dict, update: bool = True
+    ) -> tuple[torch.Tensor, torch.Tensor]:
+        """Move the observations of the actor and of the critic to the device and normalize them.
+
+        The running statistics of the normalizers are updated with the raw observations if ``update`` is True.
+        """
+        obs = obs.to(self.device)
+        critic_obs = extras["observations"].get("critic")
+        critic_obs = obs if critic_obs is None else critic_obs.to(self.device)
+        if self.cfg.empirical_normalization and update:
+            self.obs_normalizer.update(obs)
+            if critic_obs is not obs:
+                self.critic_obs_normalizer.update(critic_obs)
+        normalized_obs = self.obs_normalizer(obs)
+        if critic_obs is obs:
+            return normalized_obs, normalized_obs
+        return normalized_obs, self.critic_obs_normalizer(critic_obs)
+
+    def _log(
+        self,
+        iteration: int,
+        collection_time: float,
+        learn_time: float,
+        losses: dict[str, float],
+        episode_sums: torch.Tensor,
+        env_logs: dict,
+    ):
+        """Hand the metrics of the iteration over to the logger, without synchronizing with the device."""
+        num_steps = self.cfg.num_steps_per_env * self.env.num_envs
+        self.total_timesteps += num_steps
+        self.total_time += collection_time + learn_time
+        # the means over the finished episodes are not defined (and not logged) if no episode finished
+        return_sum, length_sum, num_episodes = episode_sums
+        no_episode = num_episodes == 0
+        mean_return = torch.where(no_episode, float("nan"), return_sum / num_episodes.clamp(min=1.0))
+        mean_length = torch.where(no_episode, float("nan"), length_sum / num_episodes.clamp(min=1.0))
+
+        self.logger.add_scalars({
+            "Train/mean_reward": mean_return,
+            "Train/mean_episode_length": mean_length,
+            **{f"Loss/{name}": value for name, value in losses.items()},
+            "Loss/learning_rate": self.alg.learning_rate,
+            "Policy/mean_noise_std": self.alg.actor_critic.action_std.mean(),
+            "Perf/total_fps": num_steps / (collection_time + learn_time),
+            "Perf/collection_time": collection_time,
+            "Perf/learning_time": learn_time,
+            "Perf/total_timesteps": self.total_timesteps,
+            "Perf/total_time": self.total_time,
+            **env_logs,
+        })
+        self.logger.add_histogram("Policy/actions", self.alg.storage.actions)
+        self.logger.step(iteration + 1)
@@ -0,0 +1,166 @@
+# Copyright 2025 genesis_lab Developers (https://github.com/Atticlmr/genesis_lab)
+#
+# Licensed under the Apache License, Version 2.0 , January 2004
+
+"""Proximal policy optimization algorithm."""
+
+from __future__ import annotations
+
+import torch
+from torch import nn
+
+from .actor_critic import ActorCritic
+from .ppo_cfg import PPOAlgorithmCfg
+from .rollout_storage import RolloutStorage
+
+
+class PPO:
+    """Proximal policy optimization with clipped surrogate objective and generalized advantage estimation.
+
+    During the rollout, :meth:`act` and :meth:`process_env_step` write the transitions directly into the
+    preallocated :class:`RolloutStorage`. The losses of the update are accumulated on the device and transferred to the
+    host once at the end of :meth:`update`. The only other synchronization is the read of the KL divergence of every
+    mini-batch by the adaptive learning rate schedule.
+    """
+
+    def __init__(self, actor_critic: ActorCritic, cfg: PPOAlgorithmCfg, device: str | torch.device = "cpu"):
+        """Initialize the algorithm.
+
+        Args:
+            actor_critic: The actor-critic networks, on the device of the algorithm.
+            cfg: The configuration of the algorithm.
+            device: The device of the algorithm. Defaults to "cpu".
+
+        Raises:
+            ValueError: If the learning rate schedule is not supported.
+        """
+        if cfg.schedule not in ("adaptive", "fixed"):
+            raise ValueError(f"Unknown learning rate schedule '{cfg.schedule}'. Expected 'adaptive' or 'fixed'.")
+        self.cfg = cfg
+        self.device = torch.device(device)
+        self.actor_critic = actor_critic
+        self.learning_rate = cfg.learning_rate
+        self.optimizer = torch.optim.Adam(self.actor_critic.parameters(), lr=self.learning_rate)
+        self.storage: RolloutStorage | None = None
+
+    def init_storage(
+        self,
+        num_envs: int,
+        num_steps: int,
+        obs_shape: tuple[int, ...],
+        critic_obs_shape: tuple[int, ...] | None,
+        actions_shape: tuple[int, ...],
+    ):
+        """Allocate the rollout storage. See :class:`RolloutStorage` for the arguments."""
+        self.storage = RolloutStorage(num_envs, num_steps, obs_shape, critic_obs_shape, actions_shape, self.device)
+
+    """
+    Operations - Rollout.
+    """
+
+    def act(self, obs: torch.Tensor, critic_obs: torch.Tensor) -> torch.Tensor:
+        """Sample the actions of the current step and record the transition in the storage.
+
+        Args:
+            obs: The observations of the actor. Shape is (num_envs, num_actor_obs).
+            critic_obs: The observations of the critic. Shape is (num_envs, num_critic_obs).
+
+        Returns:
+            The sampled actions, which are a view of the storage. Shape is (num_envs, num_actions).
+        """
+        storage = self.storage
+        step = storage.step
+        actions, mean = self.actor_critic.act(obs)
+        storage.observations[step].copy_(obs)
+        if storage.critic_observations is not None:
+            storage.critic_observations[step].copy_(critic_obs)
+        storage.actions[step].copy_(actions)
+        storage.action_mean[step].copy_(mean)
+        storage.action_std[step].copy_(self.actor_critic.action_std)
+        storage.actions_log_prob[step].copy_(self.actor_critic.log_prob(actions, mean))
+        storage.values[step].copy_(self.actor_critic.evaluate(critic_obs))
+        return storage.actions[step]
+
+    def process_env_step(self, rewards: torch.Tensor, dones: torch.Tensor, time_outs: torch.Tensor | None = None):
+        """Record the outcome of the current step in the storage and move to the next step.
+
+        The rewards of the environments that timed out are bootstrapped with the values of their last observations,
+        since the episodes were cut by the time limit and not by a terminal state.
+
+        Args:
+            rewards: The rewards. Shape is (num_envs,).
+            dones: Whether the environments terminated or timed out. Shape is (num_envs,).
+            time_outs: Whether the environments timed out. Defaults to None. Shape is (num_envs,).
+        """
+        storage = self.storage
+        step = storage.step
+        storage.rewards[step].copy_(rewards)
+        if time_outs is not None:
+            storage.rewards[step].addcmul_(storage.values[step], time_outs, value=self.cfg.gamma)
+        storage.dones[step].copy_(dones)
+        storage.step += 1
+
+    def compute_returns(self, last_critic_obs: torch.Tensor):
+        """Compute the returns and advantages of the rollout from the observations of the critic after its last step."""
+        last_values = self.actor_critic.evaluate(last_critic_obs)
+        self.storage.compute_returns(last_values, self.cfg.gamma, self.cfg.lam, self.cfg.normalize_advantage)
+
+    """
+    Operations - Update.
+    """
+
+    def update(self) -> dict[str, float]:
+        """Update the actor-critic networks on the rollout and clear the storage.
+
+        Returns:
+            The mean value loss, surrogate loss and entropy over the mini-batches.
+        """
+        cfg = self.cfg
+        loss_sums = torch.zeros(3, device=self.device)
+        num_updates = 0
+        for batch in self.storage.mini_batch_generator(cfg.num_mini_batches, cfg.num_learning_epochs):
+            actions, mean = batch.actions, self.actor_critic.act_inference(batch.observations)
+            log_prob = self.actor_critic.log_prob(actions, mean)
+            values = self.actor_critic.evaluate(batch.critic_observations)
+            entropy = self.actor_critic.entropy()
+
+            # adapt the learning rate to the KL divergence from the policy of the rollout
+            if cfg.schedule == "adaptive" and cfg.desired_kl is not None:
+                with torch.no_grad():
+                    kl = self.actor_critic.kl_divergence(batch.action_mean, batch.action_std, mean.detach()).mean()
+                kl = kl.item()
+                if kl > cfg.desired_kl * 2.0:
+                    self.learning_rate = max(1e-5, self.learning_rate / 1.5)
+                elif 0.0 < kl < cfg.desired_kl / 2.0:
+                    self.learning_rate = min(1e-2, self.learning_rate * 1.5)
+                for param_group in self.optimizer.param_groups:
+                    param_group["lr"] = self.learning_rate
+
+            # clipped surrogate loss
+            ratio = torch.exp(log_prob - batch.actions_log_prob)
+            surrogate = -batch.advantages * ratio
+            surrogate_clipped = -batch.advantages * torch.clamp(ratio, 1.0 - cfg.clip_param, 1.0 + cfg.clip_param)
+            surrogate_loss = torch.max(surrogate, surrogate_clipped).mean()
+
+            # value function loss
+            if cfg.use_clipped_value_loss:
+                values_clipped = batch.values + (values - batch.values).clamp(-cfg.clip_param, cfg.clip_param)
+                value_losses = (values - batch.returns).square()
+                value_losses_clipped = (values_clipped - batch.returns).square()
+                value_loss = torch.max(value_losses, value_losses_clipped).mean()
+            else:
+                value_loss = (batch.returns - values).square().mean()
+
+            loss = surrogate_loss + cfg.value_loss_coef * value_loss - cfg.entropy_coef * entropy
+
+            self.optimizer.zero_grad(set_to_none=True)
+            loss.backward()
+            nn.utils.clip_grad_norm_(self.actor_critic.parameters(), cfg.max_grad_norm)
+            self.optimizer.step()
+
+            loss_sums += torch.stack((value_loss, surrogate_loss, entropy)).detach()
+            num_updates += 1
+
+        self.storage.clear()
+        value_loss, surrogate_loss, entropy = (loss_sums / num_updates).tolist()
+        return {"value_function": value_loss, "surrogate": surrogate_loss, "entropy": entropy}
@@ -0,0 +1,128 @@
+# Copyright 2025 genesis_lab Developers (https://github.com/Atticlmr/genesis_lab)
+#
+# Licensed under the Apache License, Version 2.0 , January 2004
+
+"""Configuration for the PPO learner."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Literal
+
+
+@dataclass(kw_only=True)
+class ActorCriticCfg:
+    """Configuration for the actor-critic networks."""
+
+    init_noise_std: float = 1.0
+    """The initial standard deviation of the Gaussian action noise. Defaults to 1.0."""
+
+    actor_hidden_dims: list[int] = field(default_factory=lambda: [256, 256, 256])
+    """The hidden dimensions of the actor network. Defaults to [256, 256, 256]."""
+
+    critic_hidden_dims: list[int] = field(default_factory=lambda: [256, 256, 256])
+    """The hidden dimensions of the critic network. Defaults to [256, 256, 256]."""
+
+    activation: str = "elu"
+    """The activation function of the hidden layers, e.g. "elu", "relu" or "tanh". Defaults to "elu"."""
+
+
+@dataclass(kw_only=True)
+class PPOAlgorithmCfg:
+    """Configuration for the PPO algorithm."""
+
+    value_loss_coef: float = 1.0
+    """The coefficient of the value function loss. Defaults to 1.0."""
+
+    use_clipped_value_loss: bool = True
+    """Whether to clip the value function updates like the policy updates. Defaults to True."""
+
+    clip_param: float = 0.2
+    """The clipping parameter of the probability ratio and of the value updates. Defaults to 0.2."""
+
+    entropy_coef: float = 0.005
+    """The coefficient of the entropy bonus. Defaults to 0.005."""
+
+    num_learning_epochs: int = 5
+    """The number of passes over the rollout per update. Defaults to 5."""
+
+    num_mini_batches: int = 4
+    """The number of mini-batches the rollout is split into at every epoch. Defaults to 4."""
+
+    learning_rate: float = 1.0e-3
+    """The (initial) learning rate. Defaults to 1e-3."""
+
+    schedule: Literal["adaptive", "fixed"] = "adaptive"
+    """The learning rate schedule. Defaults to "adaptive".
+
+    With the adaptive schedule, the learning rate is adapted after every mini-batch to keep the KL divergence
+    between the old and the new policy close to :attr:`desired_kl`.
+    """
+
+    gamma: float = 0.99
+    """The discount factor. Defaults to 0.99."""
+
+    lam: float = 0.95
+    """The lambda parameter of the generalized advantage estimation. Defaults to 0.95."""
+
+    desired_kl: float = 0.01
+    """The target KL divergence of the adaptive learning rate schedule. Defaults to 0.01."""
+
+    max_grad_norm: float = 1.0
+    """The maximum norm of the gradients. Defaults to 1.0."""
+
+    normalize_advantage: bool = True
+    """Whether to normalize the advantages over the whole rollout. Defaults to True."""
+
+
+@dataclass(kw_only=True)
+class PPOCfg:
+    """Configuration for the on-policy runner of the PPO learner.
+
+    Please refer to the :class:`genesislab_rl.ppo.OnPolicyRunner` class for more details.
+    """
+
+    seed: int = 42
+    """The seed of the initialization of the networks and of the sampling. Defaults to 42."""
+
+    num_steps_per_env: int = 24
+    """The number of environment steps per environment in a rollout. Defaults to 24."""
+
+    max_iterations: int = 1500
+    """The number of learning iterations. Defaults to 1500."""
+
+    empirical_normalization: bool = False
+    """Whether to normalize the observations with their running mean and variance. Defaults to False."""
+
+    clip_actions: float | None = None
+    """The bound to clip the actions to before stepping the environment. Defaults to None (no clipping)."""
+
+    save_interval: int = 50
+    """The number of iterations between two checkpoints. Defaults to 50."""
+
+    experiment_name: str = "default"
+    """The name of the experiment. Defaults to "default"."""
+
+    logger: Literal["console", "tensorboard", "swanlab"] = "tensorboard"
+    """The backend of the training metrics, besides the console. Defaults to "tensorboard".
+
+    The metrics are only written to the console if the runner has no log directory.
+    """
+
+    log_interval: int = 1
+    """The number of iterations per logging interval, over which the metrics are averaged. Defaults to 1."""
+
+    swanlab_project: str | None = None
+    """The SwanLab project. Defaults to None, in which case the experiment name is used."""
+
+    swanlab_mode: str = "local"
+    """The SwanLab mode. Defaults to "local", which logs to the log directory without network connection.
+
+    Viewing the local runs with ``swanlab watch`` requires the ``swanlab[dashboard]`` extra.
+    """
+
+    policy: ActorCriticCfg = field(default_factory=ActorCriticCfg)
+    """The configuration of the actor-critic networks."""
+
+    algorithm: PPOAlgorithmCfg = field(default_factory=PPOAlgorithmCfg)
+    """The configuration of the PPO algorithm."""
@@ -0,0 +1,142 @@
+# Copyright 2025 genesis_lab Developers (https://github.com/Atticlmr/genesis_lab)
+#
+# Licensed under the Apache License, Version 2.0 , January 2004
+
+"""On-device storage of the rollouts of the on-policy learners."""
+
+from __future__ import annotations
+
+import torch
+from collections.abc import Iterator
+from typing import NamedTuple
+
+
+class MiniBatch(NamedTuple):
+    """A mini-batch of transitions sampled from the :class:`RolloutStorage`."""
+
+    observations: torch.Tensor
+    critic_observations: torch.Tensor
+    actions: torch.Tensor
+    values: torch.Tensor
+    advantages: torch.Tensor
+    returns: torch.Tensor
+    actions_log_prob: torch.Tensor
+    action_mean: torch.Tensor
+    action_std: torch.Tensor
+
+
+class RolloutStorage:
+    """Preallocated storage of the transitions of all the environments over a rollout.
+
+    Every field is a single ``(num_steps, num_envs, ...)`` tensor on the device of the learner, which the learner
+    writes into at the current :attr:`step`. The returns and advantages are computed for the whole rollout with a
+    reverse scan over the steps that is vectorized over the environments. The mini-batches are drawn by indexing
+    flattened views of the fields with a random permutation, so the storage itself is never copied or reshuffled.
+    """
+
+    def __init__(
+        self,
+        num_envs: int,
+        num_steps: int,
+        obs_shape: tuple[int, ...],
+        critic_obs_shape: tuple[int, ...] | None,
+        actions_shape: tuple[int, ...],
+        device: str | torch.device = "cpu",
+    ):
+        """Initialize the storage.
+
+        Args:
+            num_envs: The number of environments.
+            num_steps: The number of steps of a rollout.
+            obs_shape: The shape of the observations of the actor.
+            critic_obs_shape: The shape of the observations of the critic. Defaults to None, in which case the
+                critic uses the observations of the actor.
+            actions_shape: The shape of the actions.
+            device: The device of the storage. Defaults to "cpu".
+        """
+        self.num_envs = num_envs
+        self.num_steps = num_steps
+        self.device = torch.device(device)
+        self.step = 0
+
+        def zeros(*shape: int) -> torch.Tensor:
+            return torch.zeros(num_steps, num_envs, *shape, device=self.device)
+
+        self.observations = zeros(*obs_shape)
+        self.critic_observations = zeros(*critic_obs_shape) if critic_obs_shape is not None else None
+        self.actions = zeros(*actions_shape)
+        self.action_mean = zeros(*actions_shape)
+        self.action_std = zeros(*actions_shape)
+        self.actions_log_prob = zeros()
+        self.values = zeros()
+        self.rewards = zeros()
+        self.dones = zeros()
+        self.returns = zeros()
+        self.advantages = zeros()
+
+    def clear(self):
+        """Start a new rollout."""
+        self.step = 0
+
+    def compute_returns(self, last_values: torch.Tensor, gamma: float, lam: float, normalize_advantage: bool = True):
+        """Compute the returns and the generalized advantage estimates of the rollout.
+
+        The temporal-difference errors of all the steps are computed at once. The advantages then follow from the
+        reverse recursion :math:`A_t = \\delta_t + \\gamma \\lambda (1 - d_t) A_{t+1}`, with one fused operation on
+        the ``(num_envs,)`` slices per step.
+
+        Args:
+            last_values: The values of the observations after the last step of the rollout. Shape is (num_envs,).
+            gamma: The discount factor.
+            lam: The lambda parameter of the generalized advantage estimation.
+            normalize_advantage: Whether to normalize the advantages over the rollout. Defaults to True.
+        """
+        not_done = 1.0 - self.dones
+        next_values = torch.cat((self.values[1:], last_values.unsqueeze(0)))
+        # temporal-difference errors of all the steps, written into the advantages
+        deltas = self.advantages
+        torch.mul(next_values, not_done, out=deltas).mul_(gamma).add_(self.rewards).sub_(self.values)
+        # reverse scan over the steps
+        discounts = not_done.mul_(gamma * lam)
+        for step in reversed(range(self.num_steps - 1)):
+            torch.addcmul(deltas[step], discounts[step], deltas[step + 1], out=self.advantages[step])
+        torch.add(self.advantages, self.values, out=self.returns)
+        if normalize_advantage:
+            std, mean = torch.std_mean(self.advantages)
+            self.advantages.sub_(mean).div_(std + 1e-8)
+
+    def mini_batch_generator(self, num_mini_batches: int, num_epochs: int) -> Iterator[MiniBatch]:
+        """Iterate over random mini-batches of the transitions of the rollout.
+
+        Args:
+            num_mini_batches: The number of mini-batches per epoch.
+            num_epochs: The number of passes over the rollout.
+
+        Yields:
+            The mini-batches of transitions.
+        """
+        batch_size = self.num_envs * self.num_steps
+        mini_batch_size = batch_size // num_mini_batches
+        # flattened views of the fields, which share the memory of the storage
+        observations = self.observations.flatten(0, 1)
+        critic_observations = (
+            self.critic_observations.flatten(0, 1) if self.critic_observations is not None else observations
+        )
+        fields = (
+            self.actions.flatten(0, 1),
+            self.values.flatten(),
+            self.advantages.flatten(),
+            self.returns.flatten(),
+            self.actions_log_prob.flatten(),
+            self.action_mean.flatten(0, 1),
+            self.action_std.flatten(0, 1),
+        )
+        for _ in range(num_epochs):
+            indices = torch.randperm(num_mini_batches * mini_batch_size, device=self.device)
+            for start in range(0, num_mini_batches * mini_batch_size, mini_batch_size):
+                batch_ids = indices[start : start + mini_batch_size]
+                batch_obs = observations[batch_ids]
+                batch_critic_obs = (
+                    critic_observations[batch_ids] if critic_observations is not observations else batch_obs
+                )
+                yield MiniBatch(batch_obs, batch_critic_obs, *(field[batch_ids] for field in fields))
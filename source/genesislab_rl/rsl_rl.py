@@ -0,0 +1,147 @@
+# Copyright 2025 genesis_lab Developers (https://github.com/Atticlmr/genesis_lab)
+#
+# Licensed under the Apache License, Version 2.0 , January 2004
+
+"""Wrapper exposing the environments through the vectorized environment interface of RSL-RL."""
+
+from __future__ import annotations
+
+import gymnasium as gym
+import torch
+
+from genesislab.envs import DirectRLEnv, ManagerBasedRLEnv
+from genesislab.envs.common import VecEnvObs
+
+
+class RslRlVecEnvWrapper:
+    """Wraps an environment for on-policy learners following the ``VecEnv`` interface of RSL-RL.
+
+    The environments already run batched on the simulation device, so the wrapper hands the observation, reward and
+    done tensors over to the learner without any copy or conversion. The main observations are those of the
+    ``"policy"`` group. All the observation groups are passed in ``extras["observations"]``, where the learner finds
+    the privileged observations of the ``"critic"`` group if the environment has one, and the time-outs are passed in
+    ``extras["time_outs"]`` for bootstrapping.
+
+    .. note::
+        The tensors returned by :meth:`step` are the buffers of the environment, which are overwritten in place at the
+        next step. A learner that keeps them across steps must copy them, which rollout storages do anyway.
+
+    The wrapper duck-types the interface and does not import RSL-RL, so it is also used by the PPO learner of this
+    package.
+    """
+
+    def __init__(self, env: ManagerBasedRLEnv | DirectRLEnv | gym.Wrapper, clip_actions: float | None = None):
+        """Initialize the wrapper and reset the environment.
+
+        Args:
+            env: The environment to wrap, possibly wrapped by gymnasium wrappers.
+            clip_actions: The bound to clip the actions to before stepping the environment. Defaults to None,
+                in which case the actions are not clipped.
+
+        Raises:
+            ValueError: If the environment is not a manager-based or a direct RL environment.
+        """
+        if not isinstance(env.unwrapped, (ManagerBasedRLEnv, DirectRLEnv)):
+            raise ValueError(
+                "The environment must be inherited from ManagerBasedRLEnv or DirectRLEnv. Environment type:"
+                f" {type(env)}"
+            )
+        self.env = env
+        self.unwrapped: ManagerBasedRLEnv | DirectRLEnv = env.unwrapped
+        self.clip_actions = clip_actions
+
+        # dimensions of the spaces
+        self.num_envs = self.unwrapped.num_envs
+        self.device = self.unwrapped.device
+        self.max_episode_length = self.unwrapped.max_episode_length
+        self.num_actions = gym.spaces.flatdim(self.unwrapped.single_action_space)
+        observation_space = self.unwrapped.single_observation_space
+        self.num_obs = gym.spaces.flatdim(observation_space["policy"])
+        self.num_privileged_obs = 0
+        if "critic" in observation_space:
+            self.num_privileged_obs = gym.spaces.flatdim(observation_space["critic"])
+
+        # buffers for the clipped actions and the dones
+        self._actions = torch.zeros(self.num_envs, self.num_actions, device=self.device)
+        self._dones = torch.zeros(self.num_envs, dtype=torch.bool, device=self.device)
+
+        # reset the environment once, so that the observations are available to the learner
+        self._obs: VecEnvObs = self.env.reset()[0]
+
+    def __str__(self):
+        """Returns the wrapper name and the :attr:`env` representation string."""
+        return f"<{type(self).__name__}{self.env}>"
+
+    def __repr__(self):
+        """Returns the string representation of the wrapper."""
+        return str(self)
+
+    """
+    Properties.
+    """
+
+    @property
+    def cfg(self) -> object:
+        """The configuration of the environment."""
+        return self.unwrapped.cfg
+
+    @property
+    def observation_space(self) -> gym.Space:
+        """The batched observation space of the environment."""
+        return self.unwrapped.observation_space
+
+    @property
+    def action_space(self) -> gym.Space:
+        """The batched action space of the environment."""
+        return self.unwrapped.action_space
+
+    @property
+    def episode_length_buf(self) -> torch.Tensor:
+        """The current episode lengths of the environments.
+
+        RSL-RL sets it to random values to spread the resets of the environments over the episode length.
+        """
+        return self.unwrapped.episode_length_buf
+
+    @episode_length_buf.setter
+    def episode_length_buf(self, value: torch.Tensor):
+        self.unwrapped.episode_length_buf.copy_(value)
+
+    """
+    Operations.
+    """
+
+    def seed(self, seed: int = -1) -> int:
+        """Set the seed of the environment and return it."""
+        return self.unwrapped.seed(seed)
+
+    def get_observations(self) -> tuple[torch.Tensor, dict]:
+        """Returns the current observations of the policy and all the observation groups, without recomputing them."""
+        return self._obs["policy"], {"observations": self._obs}
+
+    def reset(self) -> tuple[torch.Tensor, dict]:
+        """Reset all the environments and return the observations of the policy and all the observation groups."""
+        self._obs, _ = self.env.reset()
+        return self.get_observations()
+
+    def step(self, actions: torch.Tensor) -> tuple[torch.Tensor, torch.Tensor, torch.Tensor, dict]:
+        """Step the environments.
+
+        Args:
+            actions: The actions of all the environments. Shape is (num_envs, num_actions).
+
+        Returns:
+            The observations of the policy, the rewards, the dones (terminated or timed out) and the extras.
+        """
+        if self.clip_actions is not None:
+            actions = torch.clamp(actions, -self.clip_actions, self.clip_actions, out=self._actions)
+        obs, rewards, terminated, truncated, extras = self.env.step(actions)
+        self._obs = obs
+        torch.logical_or(terminated, truncated, out=self._dones)
+        extras["observations"] = obs
+        extras["time_outs"] = truncated
+        return obs["policy"], rewards, self._dones, extras
+
+    def close(self):
+        """Close the environment."""
+        return self.env.close()
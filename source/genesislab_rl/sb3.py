@@ -0,0 +1,175 @@
+# Copyright 2025 genesis_lab Developers (https://github.com/Atticlmr/genesis_lab)
+#
+# Licensed under the Apache License, Version 2.0 , January 2004
+
+"""Wrapper exposing the environments through the vectorized environment interface of Stable-Baselines3.
+
+This module requires the ``stable-baselines3`` package.
+"""
+
+from __future__ import annotations
+
+import gymnasium as gym
+import numpy as np
+import torch
+from typing import Any
+
+from stable_baselines3.common.vec_env.base_vec_env import VecEnv, VecEnvIndices, VecEnvObs, VecEnvStepReturn
+
+from genesislab.envs import DirectRLEnv, ManagerBasedRLEnv
+
+from .utils import HostStagingBuffer
+
+
+class Sb3VecEnvWrapper(VecEnv):
+    """Wraps an environment as a Stable-Baselines3 :class:`VecEnv`.
+
+    Stable-Baselines3 works with numpy arrays on the host, so the observations of the ``"policy"`` group, the rewards
+    and the dones must be converted at every step. The wrapper copies them, together with the episode statistics
+    that are tracked on the device, into reusable host buffers with a single synchronization per step (see
+    :class:`HostStagingBuffer`). Two slots of buffers are used, since the learner still reads the observations of the
+    previous step after stepping. The actions are copied into a preallocated device buffer.
+
+    The per-environment information dictionaries are also reused: only those of the sub-environments that are done
+    are filled, with the ``"episode"`` statistics, the ``"TimeLimit.truncated"`` flag and the
+    ``"terminal_observation"``, and they are cleared at the next step.
+
+    The on-policy and off-policy algorithms of Stable-Baselines3 require a bounded continuous action space, so the
+    actions are usually clipped with :attr:`clip_actions`, which also bounds the action space seen by the learner.
+
+    .. note::
+        The sub-environments are reset within the step in which they are done, so the ``"terminal_observation"`` is
+        the first observation of the new episode.
+    """
+
+    def __init__(self, env: ManagerBasedRLEnv | DirectRLEnv | gym.Wrapper, clip_actions: float | None = None):
+        """Initialize the wrapper.
+
+        Args:
+            env: The environment to wrap, possibly wrapped by gymnasium wrappers.
+            clip_actions: The bound to clip the actions to before stepping the environment. Defaults to None,
+                in which case the actions are not clipped and the action space of the environment is kept.
+
+        Raises:
+            ValueError: If the environment is not a manager-based or a direct RL environment.
+        """
+        if not isinstance(env.unwrapped, (ManagerBasedRLEnv, DirectRLEnv)):
+            raise ValueError(
+                "The environment must be inherited from ManagerBasedRLEnv or DirectRLEnv. Environment type:"
+                f" {type(env)}"
+            )
+        self.env = env
+        self.clip_actions = clip_actions
+        self.device = self.unwrapped.device
+        num_envs = self.unwrapped.num_envs
+        observation_space = self.unwrapped.single_observation_space["policy"]
+        action_space = self.unwrapped.single_action_space
+        if clip_actions is not None:
+            action_space = gym.spaces.Box(-clip_actions, clip_actions, shape=action_space.shape, dtype=np.float32)
+        super().__init__(num_envs, observation_space, action_space)
+
+        # device buffers for the actions, the dones and the episode statistics
+        self._actions = torch.zeros(num_envs, *action_space.shape, device=self.device)
+        self._dones = torch.zeros(num_envs, dtype=torch.bool, device=self.device)
+        self._episode_return = torch.zeros(num_envs, device=self.device)
+        self._episode_length = torch.zeros(num_envs, dtype=torch.long, device=self.device)
+        # host buffers and reusable information dictionaries
+        self._staging = HostStagingBuffer(self.device, num_slots=2)
+        self._infos: list[dict[str, Any]] = [{} for _ in range(num_envs)]
+        self._filled_info_ids = np.zeros(0, dtype=np.int64)
+
+    def __str__(self):
+        """Returns the wrapper name and the :attr:`env` representation string."""
+        return f"<{type(self).__name__}{self.env}>"
+
+    def __repr__(self):
+        """Returns the string representation of the wrapper."""
+        return str(self)
+
+    """
+    Properties.
+    """
+
+    @property
+    def unwrapped(self) -> ManagerBasedRLEnv | DirectRLEnv:
+        """The base environment of the wrapper."""
+        return self.env.unwrapped
+
+    """
+    Operations - MDP.
+    """
+
+    def seed(self, seed: int | None = None) -> list[int | None]:
+        return [self.unwrapped.seed(-1 if seed is None else seed)] * self.num_envs
+
+    def reset(self) -> VecEnvObs:
+        obs, _ = self.env.reset()
+        self._episode_return.zero_()
+        self._episode_length.zero_()
+        return self._staging.stage({"obs": obs["policy"]})["obs"]
+
+    def step_async(self, actions: np.ndarray):
+        self._actions.copy_(torch.from_numpy(np.asarray(actions)))
+        if self.clip_actions is not None:
+            self._actions.clamp_(-self.clip_actions, self.clip_actions)
+
+    def step_wait(self) -> VecEnvStepReturn:
+        obs, rewards, terminated, truncated, _ = self.env.step(self._actions)
+        torch.logical_or(terminated, truncated, out=self._dones)
+        self._episode_return += rewards
+        self._episode_length += 1
+        arrays = self._staging.stage({
+            "obs": obs["policy"],
+            "rewards": rewards,
+            "dones": self._dones,
+            "terminated": terminated,
+            "truncated": truncated,
+            "episode_return": self._episode_return,
+            "episode_length": self._episode_length,
+        })
+        # the statistics were copied before this point, since the staging synchronizes the device
+        self._episode_return.masked_fill_(self._dones, 0.0)
+        self._episode_length.masked_fill_(self._dones, 0)
+        return arrays["obs"], arrays["rewards"], arrays["dones"], self._fill_infos(arrays)
+
+    def close(self):
+        self.env.close()
+
+    """
+    Operations - Attributes.
+    """
+
+    def get_attr(self, attr_name: str, indices: VecEnvIndices = None) -> list[Any]:
+        value = getattr(self.unwrapped, attr_name)
+        return [value] * len(self._get_indices(indices))
+
+    def set_attr(self, attr_name: str, value: Any, indices: VecEnvIndices = None):
+        raise NotImplementedError("Setting attributes is not supported, the sub-environments share a single scene.")
+
+    def env_method(self, method_name: str, *method_args, indices: VecEnvIndices = None, **method_kwargs) -> list[Any]:
+        result = getattr(self.unwrapped, method_name)(*method_args, **method_kwargs)
+        return [result] * len(self._get_indices(indices))
+
+    def env_is_wrapped(self, wrapper_class: type[gym.Wrapper], indices: VecEnvIndices = None) -> list[bool]:
+        return [False] * len(self._get_indices(indices))
+
+    def get_images(self) -> list[np.ndarray]:
+        raise NotImplementedError("Rendering the sub-environments is not supported.")
+
+    """
+    Helper functions.
+    """
+
+    def _fill_infos(self, arrays: dict[str, np.ndarray]) -> list[dict[str, Any]]:
+        """Clear the information dictionaries filled at the previous step and fill those of the done environments."""
+        for env_id in self._filled_info_ids:
+            self._infos[env_id].clear()
+        self._filled_info_ids = np.flatnonzero(arrays["dones"])
+        obs, terminated, truncated = arrays["obs"], arrays["terminated"], arrays["truncated"]
+        episode_return, episode_length = arrays["episode_return"], arrays["episode_length"]
+        for env_id in self._filled_info_ids:
+            info = self._infos[env_id]
+            info["episode"] = {"r": float(episode_return[env_id]), "l": int(episode_length[env_id])}
+            info["TimeLimit.truncated"] = bool(truncated[env_id] and not terminated[env_id])
+            info["terminal_observation"] = obs[env_id]
+        return self._infos
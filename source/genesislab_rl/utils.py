@@ -0,0 +1,69 @@
+# Copyright 2025 genesis_lab Developers (https://github.com/Atticlmr/genesis_lab)
+#
+# Licensed under the Apache License, Version 2.0 , January 2004
+
+"""Utilities shared by the wrappers for the RL libraries."""
+
+from __future__ import annotations
+
+import numpy as np
+import torch
+from collections.abc import Mapping
+
+
+class HostStagingBuffer:
+    """Reusable host buffers to convert batches of device tensors to numpy arrays.
+
+    Converting the signals of a vectorized environment with ``tensor.cpu().numpy()`` allocates new host memory for
+    every tensor at every step and, on GPU, synchronizes the device once per tensor. This class instead keeps a ring
+    of host buffers (page-locked when the tensors live on a CUDA device). At every call to :meth:`stage`, the tensors
+    are copied into the buffers of the next slot of the ring with asynchronous copies, the device is synchronized
+    once, and numpy views of the buffers are returned. The buffers are allocated at the first call with a given name
+    and reused afterwards.
+
+    The returned arrays are overwritten when their slot comes around again, that is after :attr:`num_slots` calls.
+    Two slots are enough for learners that keep the observations of the previous step while stepping the
+    environment, which is the case of Stable-Baselines3.
+    """
+
+    def __init__(self, device: str | torch.device, num_slots: int = 2):
+        """Initialize the staging buffer.
+
+        Args:
+            device: The device of the tensors to convert.
+            num_slots: The number of slots of the ring of host buffers. Defaults to 2.
+
+        Raises:
+            ValueError: If the number of slots is not a positive integer.
+        """
+        if num_slots < 1:
+            raise ValueError(f"The number of slots must be a positive integer. Received: {num_slots}.")
+        self.device = torch.device(device)
+        self.num_slots = num_slots
+        self._pin_memory = self.device.type == "cuda"
+        self._slots: list[dict[str, tuple[torch.Tensor, np.ndarray]]] = [{} for _ in range(num_slots)]
+        self._slot_index = num_slots - 1
+
+    def stage(self, tensors: Mapping[str, torch.Tensor]) -> dict[str, np.ndarray]:
+        """Copy the tensors into the host buffers of the next slot and return numpy views of them.
+
+        Args:
+            tensors: The tensors to convert, by name.
+
+        Returns:
+            The numpy arrays holding the values of the tensors, by name.
+        """
+        self._slot_index = (self._slot_index + 1) % self.num_slots
+        slot = self._slots[self._slot_index]
+        arrays = {}
+        for name, tensor in tensors.items():
+            entry = slot.get(name)
+            if entry is None or entry[0].shape != tensor.shape or entry[0].dtype != tensor.dtype:
+                host = torch.empty(tensor.shape, dtype=tensor.dtype, pin_memory=self._pin_memory)
+                entry = slot[name] = (host, host.numpy())
+            entry[0].copy_(tensor, non_blocking=self._pin_memory)
+            arrays[name] = entry[1]
+        # a single synchronization for all the asynchronous copies
+        if self._pin_memory:
+            torch.cuda.current_stream(self.device).synchronize()
+        return arrays
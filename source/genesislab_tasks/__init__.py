@@ -0,0 +1,23 @@
+# Copyright 2025 genesis_lab Developers (https://github.com/Atticlmr/genesis_lab)
+#
+# Licensed under the Apache License, Version 2.0 , January 2004
+
+"""Package containing the task implementations of genesis_lab.
+
+Importing the package registers all the tasks in the :mod:`gymnasium` registry. Only the strings of the entry
+points are registered, so that importing the package does not import Genesis, the robots, the terrains or the
+sensors. The modules of a task are imported when it is created:
+
+.. code-block:: python
+
+    import gymnasium as gym
+
+    import genesislab_tasks  # noqa: F401
+    from genesislab_tasks.utils import parse_env_cfg
+
+    env_cfg = parse_env_cfg("Genesis-Cartpole-Direct-v0", num_envs=64)
+    env = gym.make("Genesis-Cartpole-Direct-v0", cfg=env_cfg)
+
+"""
+
+from . import direct, manager_base  # noqa: F401
@@ -0,0 +1,95 @@
+# Copyright 2025 genesis_lab Developers (https://github.com/Atticlmr/genesis_lab)
+#
+# Licensed under the Apache License, Version 2.0 , January 2004
+
+"""Direct-workflow environments.
+
+The environments are registered in the :mod:`gymnasium` registry with the strings of their entry points. The
+module of an environment and of its configuration are only imported when the environment is created with
+:func:`gymnasium.make` or when its configuration is loaded with :func:`genesislab_tasks.utils.parse_env_cfg`.
+"""
+
+import gymnasium as gym
+
+##
+# Register Gym environments.
+##
+
+gym.register(
+    id="Genesis-Cartpole-Direct-v0",
+    entry_point=f"{__name__}.cartpole.cartpole_env:CartpoleEnv",
+    disable_env_checker=True,
+    kwargs={
+        "env_cfg_entry_point": f"{__name__}.cartpole.cartpole_env_cfg:CartpoleEnvCfg",
+        "ppo_cfg_entry_point": f"{__name__}.cartpole.agents.ppo_cfg:CartpolePPOCfg",
+    },
+)
+
+gym.register(
+    id="Genesis-Velocity-Flat-Anymal-C-Direct-v0",
+    entry_point=f"{__name__}.anymal.anymal_env:AnymalCEnv",
+    disable_env_checker=True,
+    kwargs={
+        "env_cfg_entry_point": f"{__name__}.anymal.anymal_env_cfg:AnymalCFlatEnvCfg",
+        "ppo_cfg_entry_point": f"{__name__}.anymal.agents.ppo_cfg:AnymalCFlatPPOCfg",
+    },
+)
+
+gym.register(
+    id="Genesis-Velocity-Rough-Anymal-C-Direct-v0",
+    entry_point=f"{__name__}.anymal.anymal_env:AnymalCEnv",
+    disable_env_checker=True,
+    kwargs={
+        "env_cfg_entry_point": f"{__name__}.anymal.anymal_env_cfg:AnymalCRoughEnvCfg",
+        "ppo_cfg_entry_point": f"{__name__}.anymal.agents.ppo_cfg:AnymalCRoughPPOCfg",
+    },
+)
+
+gym.register(
+    id="Genesis-Reach-Franka-Direct-v0",
+    entry_point=f"{__name__}.franka.franka_reach_env:FrankaReachEnv",
+    disable_env_checker=True,
+    kwargs={
+        "env_cfg_entry_point": f"{__name__}.franka.franka_reach_env_cfg:FrankaReachEnvCfg",
+        "ppo_cfg_entry_point": f"{__name__}.franka.agents.ppo_cfg:FrankaReachPPOCfg",
+    },
+)
+
+gym.register(
+    id="Genesis-Reach-Franka-Mimic-Direct-v0",
+    entry_point=f"{__name__}.franka.franka_reach_mimic_env:FrankaReachMimicEnv",
+    disable_env_checker=True,
+    kwargs={
+        "env_cfg_entry_point": f"{__name__}.franka.franka_reach_mimic_env_cfg:FrankaReachMimicEnvCfg",
+    },
+)
+
+gym.register(
+    id="Genesis-Reach-UR5e-Direct-v0",
+    entry_point=f"{__name__}.ur.ur_reach_env:URReachEnv",
+    disable_env_checker=True,
+    kwargs={
+        "env_cfg_entry_point": f"{__name__}.ur.ur_reach_env_cfg:URReachEnvCfg",
+        "ppo_cfg_entry_point": f"{__name__}.ur.agents.ppo_cfg:URReachPPOCfg",
+    },
+)
+
+gym.register(
+    id="Genesis-Repose-Cube-Shadow-Direct-v0",
+    entry_point=f"{__name__}.hand.inhand_env:InHandCubeEnv",
+    disable_env_checker=True,
+    kwargs={
+        "env_cfg_entry_point": f"{__name__}.hand.inhand_env_cfg:InHandCubeEnvCfg",
+        "ppo_cfg_entry_point": f"{__name__}.hand.agents.ppo_cfg:InHandCubePPOCfg",
+    },
+)
+
+gym.register(
+    id="Genesis-Quadrotor-Hover-Direct-v0",
+    entry_point=f"{__name__}.hover.hover_env:QuadrotorHoverEnv",
+    disable_env_checker=True,
+    kwargs={
+        "env_cfg_entry_point": f"{__name__}.hover.hover_env_cfg:QuadrotorHoverEnvCfg",
+        "ppo_cfg_entry_point": f"{__name__}.hover.agents.ppo_cfg:QuadrotorHoverPPOCfg",
+    },
+)
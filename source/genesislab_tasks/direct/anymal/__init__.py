@@ -0,0 +1,8 @@
+# Copyright 2025 genesis_lab Developers (https://github.com/Atticlmr/genesis_lab)
+#
+# Licensed under the Apache License, Version 2.0 , January 2004
+
+"""ANYmal-C locomotion environments with the direct workflow."""
+
+from .anymal_env import AnymalCEnv
+from .anymal_env_cfg import ANYMAL_C_CFG, ANYMAL_C_CONTACT_SENSOR_CFG, AnymalCFlatEnvCfg, AnymalCRoughEnvCfg
@@ -0,0 +1,5 @@
+# Copyright 2025 genesis_lab Developers (https://github.com/Atticlmr/genesis_lab)
+#
+# Licensed under the Apache License, Version 2.0 , January 2004
+
+"""Configurations of the learners for the ANYmal-C velocity tracking environments."""
@@ -0,0 +1,75 @@
+# Copyright 2025 genesis_lab Developers (https://github.com/Atticlmr/genesis_lab)
+#
+# Licensed under the Apache License, Version 2.0 , January 2004
+
+"""PPO configurations for the ANYmal-C velocity tracking environments."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+
+from genesislab_rl.ppo import ActorCriticCfg, PPOAlgorithmCfg, PPOCfg
+
+
+@dataclass(kw_only=True)
+class AnymalCFlatPPOCfg(PPOCfg):
+    """PPO configuration for velocity tracking on flat terrain."""
+
+    num_steps_per_env: int = 24
+    max_iterations: int = 500
+    save_interval: int = 50
+    experiment_name: str = "anymal_c_flat"
+    empirical_normalization: bool = False
+    policy: ActorCriticCfg = field(
+        default_factory=lambda: ActorCriticCfg(
+            init_noise_std=1.0, actor_hidden_dims=[128, 128, 128], critic_hidden_dims=[128, 128, 128], activation="elu"
+        )
+    )
+    algorithm: PPOAlgorithmCfg = field(
+        default_factory=lambda: PPOAlgorithmCfg(
+            value_loss_coef=1.0,
+            use_clipped_value_loss=True,
+            clip_param=0.2,
+            entropy_coef=0.005,
+            num_learning_epochs=5,
+            num_mini_batches=4,
+            learning_rate=1.0e-3,
+            schedule="adaptive",
+            gamma=0.99,
+            lam=0.95,
+            desired_kl=0.01,
+            max_grad_norm=1.0,
+        )
+    )
+
+
+@dataclass(kw_only=True)
+class AnymalCRoughPPOCfg(PPOCfg):
+    """PPO configuration for velocity tracking on rough terrain."""
+
+    num_steps_per_env: int = 24
+    max_iterations: int = 1500
+    save_interval: int = 50
+    experiment_name: str = "anymal_c_rough"
+    empirical_normalization: bool = False
+    policy: ActorCriticCfg = field(
+        default_factory=lambda: ActorCriticCfg(
+            init_noise_std=1.0, actor_hidden_dims=[512, 256, 128], critic_hidden_dims=[512, 256, 128], activation="elu"
+        )
+    )
+    algorithm: PPOAlgorithmCfg = field(
+        default_factory=lambda: PPOAlgorithmCfg(
+            value_loss_coef=1.0,
+            use_clipped_value_loss=True,
+            clip_param=0.2,
+            entropy_coef=0.005,
+            num_learning_epochs=5,
+            num_mini_batches=4,
+            learning_rate=1.0e-3,
+            schedule="adaptive",
+            gamma=0.99,
+            lam=0.95,
+            desired_kl=0.01,
+            max_grad_norm=1.0,
+        )
+    )
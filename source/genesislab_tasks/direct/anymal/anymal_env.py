@@ -0,0 +1,19 @@
+# Copyright 2025 genesis_lab Developers (https://github.com/Atticlmr/genesis_lab)
+#
+# Licensed under the Apache License, Version 2.0 , January 2004
+
+"""Direct-workflow ANYmal-C locomotion environment."""
+
+from __future__ import annotations
+
+from ..locomotion import LocomotionEnv
+from .anymal_env_cfg import AnymalCFlatEnvCfg, AnymalCRoughEnvCfg
+
+
+class AnymalCEnv(LocomotionEnv):
+    """ANYmal-C tracking a velocity command on flat ground or on the rough-terrain curriculum.
+
+    The task logic is the one of :class:`LocomotionEnv`; the configuration selects the terrain.
+    """
+
+    cfg: AnymalCFlatEnvCfg | AnymalCRoughEnvCfg
@@ -0,0 +1,88 @@
+# Copyright 2025 genesis_lab Developers (https://github.com/Atticlmr/genesis_lab)
+#
+# Licensed under the Apache License, Version 2.0 , January 2004
+
+"""Configuration for the direct-workflow ANYmal-C locomotion environments."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+
+from genesislab.envs import EntityCfg, InteractiveSceneCfg
+from genesislab.sensors import ContactSensorCfg
+from genesislab.terrains import TerrainImporterCfg
+
+from ..locomotion import ROUGH_TERRAINS_CFG, LocomotionEnvCfg
+
+ANYMAL_C_CFG = EntityCfg(
+    morph="URDF",
+    morph_kwargs=dict(file="urdf/anymal_c/urdf/anymal_c.urdf"),
+    init_pos=(0.0, 0.0, 0.6),
+    init_joint_pos={".*HAA": 0.0, ".*F_HFE": 0.4, ".*H_HFE": -0.4, ".*F_KFE": -0.8, ".*H_KFE": 0.8},
+)
+"""Configuration of the ANYmal-C robot from the Genesis assets."""
+
+ANYMAL_C_CONTACT_SENSOR_CFG = ContactSensorCfg(
+    entity_name="robot", history_length=4, track_air_time=True, lazy_update=False
+)
+"""Configuration of the contact sensor on the links of the ANYmal-C robot.
+
+The forces of the four physics steps of an environment step are kept, so that the contacts between two environment
+steps are not missed.
+"""
+
+
+@dataclass(kw_only=True)
+class AnymalCFlatEnvCfg(LocomotionEnvCfg):
+    """Configuration for the ANYmal-C robot tracking a velocity command on flat ground."""
+
+    action_space: int = 12
+    observation_space: int = 48
+    state_space: int = 0
+
+    # scene
+    scene: InteractiveSceneCfg = field(
+        default_factory=lambda: InteractiveSceneCfg(
+            num_envs=4096,
+            env_spacing=(4.0, 4.0),
+            terrain=TerrainImporterCfg(terrain_type="plane"),
+            entities={"robot": ANYMAL_C_CFG},
+            sensors={"contact_forces": ANYMAL_C_CONTACT_SENSOR_CFG},
+        )
+    )
+
+    # reward scales
+    flat_orientation_reward_scale: float = -5.0
+
+
+@dataclass(kw_only=True)
+class AnymalCRoughEnvCfg(LocomotionEnvCfg):
+    """Configuration for the ANYmal-C robot tracking a velocity command on rough terrain with a curriculum.
+
+    The environments start on the first five levels of :data:`ROUGH_TERRAINS_CFG` and are promoted or demoted on
+    every reset depending on the distance walked. The collision surface of the terrain is subsampled to 0.4 m, since
+    Genesis cannot pre-process the full 120 m x 200 m height field at the generation resolution in reasonable memory.
+    """
+
+    action_space: int = 12
+    observation_space: int = 48
+    state_space: int = 0
+
+    # scene
+    scene: InteractiveSceneCfg = field(
+        default_factory=lambda: InteractiveSceneCfg(
+            num_envs=4096,
+            env_spacing=(4.0, 4.0),
+            terrain=TerrainImporterCfg(
+                terrain_type="generator",
+                terrain_generator=ROUGH_TERRAINS_CFG,
+                max_init_terrain_level=5,
+                horizontal_scale=0.4,
+            ),
+            entities={"robot": ANYMAL_C_CFG},
+            sensors={"contact_forces": ANYMAL_C_CONTACT_SENSOR_CFG},
+        )
+    )
+
+    # reward scales
+    flat_orientation_reward_scale: float = 0.0
@@ -0,0 +1,8 @@
+# Copyright 2025 genesis_lab Developers (https://github.com/Atticlmr/genesis_lab)
+#
+# Licensed under the Apache License, Version 2.0 , January 2004
+
+"""Cartpole balancing environment with the direct workflow."""
+
+from .cartpole_env import CartpoleEnv
+from .cartpole_env_cfg import CartpoleEnvCfg
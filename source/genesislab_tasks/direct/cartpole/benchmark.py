@@ -0,0 +1,60 @@
+# Copyright 2025 genesis_lab Developers (https://github.com/Atticlmr/genesis_lab)
+#
+# Licensed under the Apache License, Version 2.0 , January 2004
+
+"""Throughput benchmark of the direct-workflow cartpole environment.
+
+The script measures the environment steps per second of :class:`CartpoleEnv` for an increasing number of
+environments and compares it with stepping the same Genesis scene directly, which gives the overhead of the
+framework on top of the physics. The environment numbers include the observation, reward and termination
+computations and the resets of the terminated sub-environments, which the raw stepping does not perform.
+
+.. code-block:: bash
+
+    python -m genesislab_tasks.direct.cartpole.benchmark --num_envs 1 16 256 4096 16384 --num_steps 200
+
+"""
+
+from __future__ import annotations
+
+import torch
+
+from genesislab_tasks.utils.benchmark import measure_throughput, run_benchmark
+
+from .cartpole_env import CartpoleEnv
+from .cartpole_env_cfg import CartpoleEnvCfg
+
+DEFAULT_NUM_ENVS = [1, 4, 16, 64, 256, 1024, 4096, 16384]
+
+
+def benchmark_env(num_envs: int, num_steps: int, num_warmup_steps: int) -> tuple[float, float]:
+    """Measure the throughput of the environment and of the raw Genesis stepping.
+
+    Args:
+        num_envs: The number of environments.
+        num_steps: The number of measured environment steps.
+        num_warmup_steps: The number of environment steps run before measuring (JIT compilation).
+
+    Returns:
+        The environment steps per second of the environment and of the raw Genesis stepping.
+    """
+    cfg = CartpoleEnvCfg()
+    cfg.scene.num_envs = num_envs
+    env = CartpoleEnv(cfg)
+    actions = torch.zeros(num_envs, cfg.action_space, device=env.device)
+    forces = actions * cfg.action_scale
+
+    def apply_raw_action():
+        env.cartpole.control_dofs_force(forces, dofs_idx_local=env._cart_dof_idx)
+
+    throughput = measure_throughput(env, actions, apply_raw_action, num_steps, num_warmup_steps)
+    env.close()
+    return throughput
+
+
+def main():
+    run_benchmark("Benchmark the throughput of the cartpole environment.", benchmark_env, DEFAULT_NUM_ENVS)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+# Copyright 2025 genesis_lab Developers (https://github.com/Atticlmr/genesis_lab)
+#
+# Licensed under the Apache License, Version 2.0 , January 2004
+
+"""Direct-workflow cartpole environment."""
+
+from __future__ import annotations
+
+import math
+import torch
+
+from genesislab.envs import DirectRLEnv
+from genesislab.envs.managers import SceneEntityCfg
+from genesislab.utils.math import sample_uniform
+
+from .cartpole_env_cfg import CartpoleEnvCfg
+
+
+class CartpoleEnv(DirectRLEnv):
+    """Cartpole balancing task with the direct workflow.
+
+    The cart is driven by a force along the rail and the pole has to be kept upright. All the quantities are
+    computed for all the sub-environments at once: the joint states are read with one batched Genesis call per
+    step and written into preallocated buffers, and resets only write the state of the reset sub-environments.
+    """
+
+    cfg: CartpoleEnvCfg
+
+    def __init__(self, cfg: CartpoleEnvCfg, render_mode: str | None = None, **kwargs):
+        super().__init__(cfg, render_mode, **kwargs)
+
+        self.cartpole = self.scene["cartpole"]
+        # resolve the DoFs of the cart and the pole
+        entity_cfg = SceneEntityCfg("cartpole", joint_names=[cfg.cart_dof_name, cfg.pole_dof_name], preserve_order=True)
+        entity_cfg.resolve(self.scene)
+        self._dof_ids = entity_cfg.joint_ids
+        self._cart_dof_idx = self._dof_ids[0:1]
+        self.action_scale = self.cfg.action_scale
+
+        # buffers of the joint state, the actions and the observations
+        self.joint_pos = torch.zeros(self.num_envs, 2, device=self.device)
+        self.joint_vel = torch.zeros_like(self.joint_pos)
+        self.actions = torch.zeros(self.num_envs, self.cfg.action_space, device=self.device)
+        self._obs_buf = torch.zeros(self.num_envs, self.cfg.observation_space, device=self.device)
+        self._obs = {"policy": self._obs_buf}
+
+    def _pre_physics_step(self, actions: torch.Tensor) -> None:
+        torch.mul(actions, self.action_scale, out=self.actions)
+
+    def _apply_action(self) -> None:
+        self.cartpole.control_dofs_force(self.actions, dofs_idx_local=self._cart_dof_idx)
+
+    def _get_observations(self) -> dict:
+        # (pole_pos, pole_vel, cart_pos, cart_vel)
+        self._obs_buf[:, 0] = self.joint_pos[:, 1]
+        self._obs_buf[:, 1] = self.joint_vel[:, 1]
+        self._obs_buf[:, 2] = self.joint_pos[:, 0]
+        self._obs_buf[:, 3] = self.joint_vel[:, 0]
+        return self._obs
+
+    def _get_rewards(self) -> torch.Tensor:
+        total_reward = compute_rewards(
+            self.cfg.rew_scale_alive,
+            self.cfg.rew_scale_terminated,
+            self.cfg.rew_scale_pole_pos,
+            self.cfg.rew_scale_cart_vel,
+            self.cfg.rew_scale_pole_vel,
+            self.joint_pos[:, 1],
+            self.joint_vel[:, 1],
+            self.joint_vel[:, 0],
+            self.reset_terminated,
+        )
+        return total_reward
+
+    def _get_dones(self) -> tuple[torch.Tensor, torch.Tensor]:
+        # read the joint state once per step
+        self.joint_pos.copy_(self.cartpole.get_dofs_position(self._dof_ids))
+        self.joint_vel.copy_(self.cartpole.get_dofs_velocity(self._dof_ids))
+
+        time_out = self.episode_length_buf >= self.max_episode_length - 1
+        out_of_bounds = torch.abs(self.joint_pos[:, 0]) > self.cfg.max_cart_pos
+        out_of_bounds |= torch.abs(self.joint_pos[:, 1]) > math.pi / 2
+        return out_of_bounds, time_out
+
+    def _reset_idx(self, env_ids: torch.Tensor):
+        super()._reset_idx(env_ids)
+
+        # sample the pole angle and write the joint state of the reset environments
+        joint_pos = torch.zeros(len(env_ids), 2, device=self.device)
+        joint_pos[:, 1] = sample_uniform(*self.cfg.initial_pole_angle_range, len(env_ids), device=self.device)
+        self.cartpole.set_dofs_position(joint_pos, dofs_idx_local=self._dof_ids, envs_idx=env_ids)
+
+        self.joint_pos[env_ids] = joint_pos
+        self.joint_vel[env_ids] = 0.0
+
+    def _get_state_buffers(self) -> dict[str, torch.Tensor]:
+        return {"joint_pos": self.joint_pos, "joint_vel": self.joint_vel, "actions": self.actions}
+
+
+@torch.jit.script
+def compute_rewards(
+    rew_scale_alive: float,
+    rew_scale_terminated: float,
+    rew_scale_pole_pos: float,
+    rew_scale_cart_vel: float,
+    rew_scale_pole_vel: float,
+    pole_pos: torch.Tensor,
+    pole_vel: torch.Tensor,
+    cart_vel: torch.Tensor,
+    reset_terminated: torch.Tensor,
+):
+    rew_alive = rew_scale_alive * (1.0 - reset_terminated.float())
+    rew_termination = rew_scale_terminated * reset_terminated.float()
+    rew_pole_pos = rew_scale_pole_pos * torch.square(pole_pos)
+    rew_cart_vel = rew_scale_cart_vel * torch.abs(cart_vel)
+    rew_pole_vel = rew_scale_pole_vel * torch.abs(pole_vel)
+    total_reward = rew_alive + rew_termination + rew_pole_pos + rew_cart_vel + rew_pole_vel
+    return total_reward
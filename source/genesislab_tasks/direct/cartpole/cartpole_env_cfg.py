@@ -0,0 +1,68 @@
+# Copyright 2025 genesis_lab Developers (https://github.com/Atticlmr/genesis_lab)
+#
+# Licensed under the Apache License, Version 2.0 , January 2004
+
+"""Configuration for the direct-workflow cartpole environment."""
+
+from __future__ import annotations
+
+import math
+import os
+from dataclasses import dataclass, field
+
+from genesislab.envs import DirectRLEnvCfg, EntityCfg, InteractiveSceneCfg, SimCfg
+from genesislab_assets import GENESISLAB_ASSETS_DATA_DIR
+
+CARTPOLE_CFG = EntityCfg(
+    morph="URDF",
+    morph_kwargs=dict(
+        file=os.path.join(GENESISLAB_ASSETS_DATA_DIR, "cartpole", "cartpole.urdf"), pos=(0.0, 0.0, 2.0), fixed=True
+    ),
+    init_joint_pos={"slider_to_cart": 0.0, "cart_to_pole": 0.0},
+)
+"""Configuration for a simple cartpole with a prismatic cart joint and a passive pole joint."""
+
+
+@dataclass(kw_only=True)
+class CartpoleEnvCfg(DirectRLEnvCfg):
+    """Configuration for the cartpole environment."""
+
+    # env
+    decimation: int = 2
+    episode_length_s: float = 5.0
+    action_space: int = 1
+    observation_space: int = 4
+    state_space: int = 0
+
+    # simulation
+    sim: SimCfg = field(default_factory=lambda: SimCfg(dt=1 / 120))
+
+    # scene
+    scene: InteractiveSceneCfg = field(
+        default_factory=lambda: InteractiveSceneCfg(
+            num_envs=4096, env_spacing=(4.0, 4.0), entities={"cartpole": CARTPOLE_CFG}
+        )
+    )
+
+    cart_dof_name: str = "slider_to_cart"
+    """Name of the joint of the cart."""
+
+    pole_dof_name: str = "cart_to_pole"
+    """Name of the joint of the pole."""
+
+    action_scale: float = 100.0
+    """Scale of the action (in N)."""
+
+    # reset
+    max_cart_pos: float = 3.0
+    """The cart is reset if it exceeds that position (in m)."""
+
+    initial_pole_angle_range: tuple[float, float] = (-0.25 * math.pi, 0.25 * math.pi)
+    """The range in which the pole angle is sampled from on reset (in rad)."""
+
+    # reward scales
+    rew_scale_alive: float = 1.0
+    rew_scale_terminated: float = -2.0
+    rew_scale_pole_pos: float = -1.0
+    rew_scale_cart_vel: float = -0.01
+    rew_scale_pole_vel: float = -0.005
@@ -0,0 +1,10 @@
+# Copyright 2025 genesis_lab Developers (https://github.com/Atticlmr/genesis_lab)
+#
+# Licensed under the Apache License, Version 2.0 , January 2004
+
+"""Franka environments with the direct workflow."""
+
+from .franka_reach_env import FrankaReachEnv
+from .franka_reach_env_cfg import FRANKA_PANDA_CFG, FrankaReachEnvCfg
+from .franka_reach_mimic_env import FrankaReachMimicEnv
+from .franka_reach_mimic_env_cfg import FrankaReachMimicEnvCfg
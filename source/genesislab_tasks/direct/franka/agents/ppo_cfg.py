@@ -0,0 +1,43 @@
+# Copyright 2025 genesis_lab Developers (https://github.com/Atticlmr/genesis_lab)
+#
+# Licensed under the Apache License, Version 2.0 , January 2004
+
+"""PPO configuration for the Franka reach environment."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+
+from genesislab_rl.ppo import ActorCriticCfg, PPOAlgorithmCfg, PPOCfg
+
+
+@dataclass(kw_only=True)
+class FrankaReachPPOCfg(PPOCfg):
+    """PPO configuration for the Franka reach environment."""
+
+    num_steps_per_env: int = 24
+    max_iterations: int = 1000
+    save_interval: int = 50
+    experiment_name: str = "franka_reach"
+    empirical_normalization: bool = False
+    policy: ActorCriticCfg = field(
+        default_factory=lambda: ActorCriticCfg(
+            init_noise_std=1.0, actor_hidden_dims=[64, 64], critic_hidden_dims=[64, 64], activation="elu"
+        )
+    )
+    algorithm: PPOAlgorithmCfg = field(
+        default_factory=lambda: PPOAlgorithmCfg(
+            value_loss_coef=1.0,
+            use_clipped_value_loss=True,
+            clip_param=0.2,
+            entropy_coef=0.001,
+            num_learning_epochs=8,
+            num_mini_batches=4,
+            learning_rate=1.0e-3,
+            schedule="adaptive",
+            gamma=0.99,
+            lam=0.95,
+            desired_kl=0.01,
+            max_grad_norm=1.0,
+        )
+    )
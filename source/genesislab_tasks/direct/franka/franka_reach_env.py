@@ -0,0 +1,231 @@
+# Copyright 2025 genesis_lab Developers (https://github.com/Atticlmr/genesis_lab)
+#
+# Licensed under the Apache License, Version 2.0 , January 2004
+
+"""Direct-workflow Franka reach environment with a differential IK action."""
+
+from __future__ import annotations
+
+import math
+import torch
+
+from genesislab.controllers import DifferentialIKController
+from genesislab.envs import DirectRLEnv
+from genesislab.envs.managers import SceneEntityCfg
+from genesislab.utils.math import quat_apply, quat_error_magnitude, quat_from_euler_xyz, sample_uniform
+
+from .franka_reach_env_cfg import FrankaReachEnvCfg
+
+
+class FrankaReachEnv(DirectRLEnv):
+    """Franka arm moving its end-effector to a target pose.
+
+    The actions are end-effector displacements that are turned into arm joint targets by the batched
+    :class:`~genesislab.controllers.DifferentialIKController` once per control step, and the physics steps only track
+    these targets with the PD controllers of Genesis. The controller solves the
+    damped least-squares problem of all the environments in a single batched solve over the ``(num_envs, 6, 7)``
+    Jacobians returned by Genesis, so the cost of the action grows linearly with the number of environments.
+    """
+
+    cfg: FrankaReachEnvCfg
+
+    reward_terms: tuple[str, ...] = (
+        "end_effector_position_tracking",
+        "end_effector_position_tracking_fine_grained",
+        "end_effector_orientation_tracking",
+        "action_rate",
+        "joint_vel",
+    )
+    """Names of the reward terms, in the order of the columns of :attr:`step_reward`."""
+
+    def __init__(self, cfg: FrankaReachEnvCfg, render_mode: str | None = None, **kwargs):
+        super().__init__(cfg, render_mode, **kwargs)
+
+        self.robot = self.scene["robot"]
+        self._ee_body = self.robot.get_link(cfg.ee_body_name)
+        arm_cfg = SceneEntityCfg("robot", joint_names=cfg.arm_joint_names, preserve_order=True)
+        arm_cfg.resolve(self.scene)
+        self._arm_dof_ids = arm_cfg.joint_ids
+        self._ee_offset = torch.tensor(cfg.ee_body_offset, device=self.device)
+        self._ee_offset_w = torch.zeros(self.num_envs, 3, device=self.device)
+
+        # joint position controllers of all the joints
+        self.robot.set_dofs_kp(torch.tensor(cfg.joint_stiffness, device=self.device))
+        self.robot.set_dofs_kv(torch.tensor(cfg.joint_damping, device=self.device))
+        self._default_qpos = self.scene.default_qpos["robot"]
+        self._default_arm_pos = self._default_qpos[:, arm_cfg.joint_qpos_ids]
+
+        # differential IK controller
+        self.ik_controller = DifferentialIKController(cfg.controller, num_envs=self.num_envs, device=self.device)
+
+        # actions and targets
+        self._actions = torch.zeros(self.num_envs, cfg.action_space, device=self.device)
+        self._previous_actions = torch.zeros_like(self._actions)
+        self._processed_actions = torch.zeros_like(self._actions)
+        self._arm_joint_pos_des = self._default_arm_pos.clone()
+        self.target_pos = torch.zeros(self.num_envs, 3, device=self.device)
+        self.target_quat = torch.zeros(self.num_envs, 4, device=self.device)
+        self.target_quat[:, 0] = 1.0
+        self._target_time_left = torch.zeros(self.num_envs, device=self.device)
+        self._target_lower = torch.tensor(
+            (cfg.target_pos_x_range[0], cfg.target_pos_y_range[0], cfg.target_pos_z_range[0], cfg.target_yaw_range[0]),
+            device=self.device,
+        )
+        self._target_upper = torch.tensor(
+            (cfg.target_pos_x_range[1], cfg.target_pos_y_range[1], cfg.target_pos_z_range[1], cfg.target_yaw_range[1]),
+            device=self.device,
+        )
+
+        # state of the robot, read once per step
+        self.ee_pos = torch.zeros(self.num_envs, 3, device=self.device)
+        self.ee_quat = torch.zeros(self.num_envs, 4, device=self.device)
+        self.arm_joint_pos = self._default_arm_pos.clone()
+        self.arm_joint_vel = torch.zeros_like(self.arm_joint_pos)
+
+        # observation and reward buffers
+        self._obs_buf = torch.zeros(self.num_envs, cfg.observation_space, device=self.device)
+        self._obs = {"policy": self._obs_buf}
+        self.step_reward = torch.zeros(self.num_envs, len(self.reward_terms), device=self.device)
+        self._reward_buf = torch.zeros(self.num_envs, device=self.device)
+        self._episode_sums = torch.zeros_like(self.step_reward)
+        reward_scales = (
+            cfg.rew_scale_position,
+            cfg.rew_scale_position_tanh,
+            cfg.rew_scale_orientation,
+            cfg.rew_scale_action_rate,
+            cfg.rew_scale_joint_vel,
+        )
+        self._reward_scales = torch.tensor(reward_scales, device=self.device) * self.step_dt
+
+    """
+    Operations.
+    """
+
+    def _pre_physics_step(self, actions: torch.Tensor):
+        self._actions.copy_(actions)
+        torch.mul(self._actions, self.cfg.action_scale, out=self._processed_actions)
+        self._update_ee_pose()
+        self.ik_controller.set_command(self._processed_actions, self.ee_pos, self.ee_quat)
+        # solve the IK once per control step with the Jacobian of the current configuration
+        jacobian = self.robot.get_jacobian(self._ee_body, local_point=self._ee_offset)[:, :, self._arm_dof_ids]
+        joint_pos = self.robot.get_dofs_position(self._arm_dof_ids)
+        self._arm_joint_pos_des.copy_(self.ik_controller.compute(self.ee_pos, self.ee_quat, jacobian, joint_pos))
+
+    def _apply_action(self):
+        self.robot.control_dofs_position(self._arm_joint_pos_des, self._arm_dof_ids)
+
+    def _get_observations(self) -> dict:
+        self._previous_actions.copy_(self._actions)
+        torch.cat(
+            (
+                self.arm_joint_pos - self._default_arm_pos,
+                self.arm_joint_vel,
+                self.target_pos - self.ee_pos,
+                self.target_quat,
+                self.ee_quat,
+                self._actions,
+            ),
+            dim=-1,
+            out=self._obs_buf,
+        )
+        return self._obs
+
+    def _get_rewards(self) -> torch.Tensor:
+        compute_reward_terms(
+            self.step_reward,
+            self.ee_pos,
+            self.target_pos,
+            quat_error_magnitude(self.ee_quat, self.target_quat),
+            self._actions,
+            self._previous_actions,
+            self.arm_joint_vel,
+            self.cfg.position_tanh_std,
+        )
+        self.step_reward.mul_(self._reward_scales)
+        torch.sum(self.step_reward, dim=1, out=self._reward_buf)
+        self._episode_sums += self.step_reward
+        return self._reward_buf
+
+    def _get_dones(self) -> tuple[torch.Tensor, torch.Tensor]:
+        # read the state once per step
+        self._update_ee_pose()
+        self.arm_joint_pos.copy_(self.robot.get_dofs_position(self._arm_dof_ids))
+        self.arm_joint_vel.copy_(self.robot.get_dofs_velocity(self._arm_dof_ids))
+        # resample the targets whose time is up
+        self._target_time_left -= self.step_dt
+        resample_ids = (self._target_time_left <= 0.0).nonzero().squeeze(-1)
+        if len(resample_ids) > 0:
+            self._resample_targets(resample_ids)
+
+        time_out = self.episode_length_buf >= self.max_episode_length - 1
+        return torch.zeros_like(time_out), time_out
+
+    def _reset_idx(self, env_ids: torch.Tensor):
+        super()._reset_idx(env_ids)
+
+        self._log_episodic_sums(env_ids, self._episode_sums, self.reward_terms)
+
+        # reset the robot to its default configuration and hold it there
+        qpos = self._default_qpos[env_ids]
+        self.robot.set_qpos(qpos, envs_idx=env_ids)
+        self.robot.control_dofs_position(qpos, envs_idx=env_ids)
+        self.arm_joint_pos[env_ids] = self._default_arm_pos[env_ids]
+        self.arm_joint_vel[env_ids] = 0.0
+        self._actions[env_ids] = 0.0
+        self._previous_actions[env_ids] = 0.0
+        self.ik_controller.reset(env_ids)
+        self._resample_targets(env_ids)
+        # the end-effector pose is read for all the environments with one call
+        self._update_ee_pose()
+
+    def _get_state_buffers(self) -> dict[str, torch.Tensor]:
+        return {
+            "actions": self._actions,
+            "previous_actions": self._previous_actions,
+            "processed_actions": self._processed_actions,
+            "target_pos": self.target_pos,
+            "target_quat": self.target_quat,
+            "target_time_left": self._target_time_left,
+            "ee_pos": self.ee_pos,
+            "ee_quat": self.ee_quat,
+            "arm_joint_pos": self.arm_joint_pos,
+            "arm_joint_vel": self.arm_joint_vel,
+            "episode_sums": self._episode_sums,
+        }
+
+    """
+    Helper functions.
+    """
+
+    def _update_ee_pose(self):
+        """Read the pose of the controlled point of the end-effector."""
+        self.ee_quat.copy_(self._ee_body.get_quat())
+        self.ee_pos.copy_(self._ee_body.get_pos())
+        self.ee_pos += quat_apply(self.ee_quat, self._ee_offset.expand_as(self.ee_pos))
+
+    def _resample_targets(self, env_ids: torch.Tensor):
+        """Sample new target poses, pointing downwards with a random yaw, for the given environments."""
+        samples = sample_uniform(self._target_lower, self._target_upper, (len(env_ids), 4), device=self.device)
+        self.target_pos[env_ids] = samples[:, 0:3] + self.scene.env_origins[env_ids]
+        zeros = torch.zeros_like(samples[:, 3])
+        self.target_quat[env_ids] = quat_from_euler_xyz(zeros, zeros + math.pi, samples[:, 3])
+        self._target_time_left[env_ids] = self.cfg.target_resampling_time_s
+
+
+@torch.jit.script
+def compute_reward_terms(
+    out: torch.Tensor,
+    ee_pos: torch.Tensor,
+    target_pos: torch.Tensor,
+    orientation_error: torch.Tensor,
+    actions: torch.Tensor,
+    previous_actions: torch.Tensor,
+    joint_vel: torch.Tensor,
+    position_tanh_std: float,
+):
+    position_error = torch.norm(target_pos - ee_pos, dim=1)
+    out[:, 0] = position_error
+    out[:, 1] = 1.0 - torch.tanh(position_error / position_tanh_std)
+    out[:, 2] = orientation_error
+    out[:, 3] = torch.sum(torch.square(actions - previous_actions), dim=1)
+    out[:, 4] = torch.sum(torch.square(joint_vel), dim=1)
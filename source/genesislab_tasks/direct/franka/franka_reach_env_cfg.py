@@ -0,0 +1,104 @@
+# Copyright 2025 genesis_lab Developers (https://github.com/Atticlmr/genesis_lab)
+#
+# Licensed under the Apache License, Version 2.0 , January 2004
+
+"""Configuration for the direct-workflow Franka reach environment."""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass, field
+
+from genesislab.controllers import DifferentialIKControllerCfg
+from genesislab.envs import DirectRLEnvCfg, EntityCfg, InteractiveSceneCfg, SimCfg
+from genesislab.terrains import TerrainImporterCfg
+
+FRANKA_PANDA_CFG = EntityCfg(
+    morph="MJCF",
+    morph_kwargs=dict(file="xml/franka_emika_panda/panda.xml"),
+    init_joint_pos={
+        "joint1": 0.0,
+        "joint2": -0.569,
+        "joint3": 0.0,
+        "joint4": -2.810,
+        "joint5": 0.0,
+        "joint6": 3.037,
+        "joint7": 0.741,
+        "finger_joint.*": 0.04,
+    },
+)
+"""Configuration of the Franka Emika Panda robot from the Genesis assets."""
+
+
+@dataclass(kw_only=True)
+class FrankaReachEnvCfg(DirectRLEnvCfg):
+    """Configuration for the Franka end-effector pose reaching environment."""
+
+    # env
+    decimation: int = 2
+    episode_length_s: float = 12.0
+    action_space: int = 6
+    observation_space: int = 31
+    state_space: int = 0
+
+    # simulation
+    sim: SimCfg = field(default_factory=lambda: SimCfg(dt=1 / 60))
+
+    # scene
+    scene: InteractiveSceneCfg = field(
+        default_factory=lambda: InteractiveSceneCfg(
+            num_envs=4096,
+            env_spacing=(2.5, 2.5),
+            terrain=TerrainImporterCfg(terrain_type="plane"),
+            entities={"robot": FRANKA_PANDA_CFG},
+        )
+    )
+
+    # robot
+    arm_joint_names: str | list[str] = "joint[1-7]"
+    """Names of the arm joints driven by the IK controller."""
+
+    ee_body_name: str = "hand"
+    """Name of the end-effector body."""
+
+    ee_body_offset: tuple[float, float, float] = (0.0, 0.0, 0.107)
+    """Position of the controlled point in the frame of the end-effector body (in m)."""
+
+    joint_stiffness: tuple[float, ...] = (4500.0, 4500.0, 3500.0, 3500.0, 2000.0, 2000.0, 2000.0, 100.0, 100.0)
+    """Stiffness of the joint position controllers of all the joints (in N.m/rad or N/m)."""
+
+    joint_damping: tuple[float, ...] = (450.0, 450.0, 350.0, 350.0, 200.0, 200.0, 200.0, 10.0, 10.0)
+    """Damping of the joint position controllers of all the joints (in N.m.s/rad or N.s/m)."""
+
+    # controller
+    controller: DifferentialIKControllerCfg = field(
+        default_factory=lambda: DifferentialIKControllerCfg(command_type="pose", use_relative_mode=True, damping=0.05)
+    )
+    """The differential IK controller that maps the actions to the arm joint targets."""
+
+    action_scale: float = 0.05
+    """Scale of the actions, which are position (in m) and axis-angle (in rad) displacements of the end-effector."""
+
+    # target
+    target_pos_x_range: tuple[float, float] = (0.35, 0.65)
+    """Range of the target position along x (in m)."""
+
+    target_pos_y_range: tuple[float, float] = (-0.2, 0.2)
+    """Range of the target position along y (in m)."""
+
+    target_pos_z_range: tuple[float, float] = (0.15, 0.5)
+    """Range of the target position along z (in m)."""
+
+    target_yaw_range: tuple[float, float] = (-math.pi / 2, math.pi / 2)
+    """Range of the yaw of the downward-pointing target orientation (in rad)."""
+
+    target_resampling_time_s: float = 4.0
+    """Time after which the target of an environment is resampled (in s)."""
+
+    # reward scales
+    rew_scale_position: float = -0.2
+    rew_scale_position_tanh: float = 0.1
+    position_tanh_std: float = 0.1
+    rew_scale_orientation: float = -0.1
+    rew_scale_action_rate: float = -1.0e-4
+    rew_scale_joint_vel: float = -1.0e-4
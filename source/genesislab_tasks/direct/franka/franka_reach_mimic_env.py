@@ -0,0 +1,70 @@
+# Copyright 2025 genesis_lab Developers (https://github.com/Atticlmr/genesis_lab)
+#
+# Licensed under the Apache License, Version 2.0 , January 2004
+
+"""Franka reach environment implementing the interface to generate demonstrations."""
+
+from __future__ import annotations
+
+import torch
+
+from genesislab.utils.math import (
+    apply_delta_pose,
+    make_pose,
+    matrix_from_quat,
+    quat_box_minus,
+    quat_error_magnitude,
+    quat_from_matrix,
+    unmake_pose,
+)
+from genesislab_mimic import MimicEnv
+
+from .franka_reach_env import FrankaReachEnv
+from .franka_reach_mimic_env_cfg import FrankaReachMimicEnvCfg
+
+
+class FrankaReachMimicEnv(FrankaReachEnv, MimicEnv):
+    """Franka reach environment whose demonstrations can be retargeted to new targets.
+
+    The reach is a single subtask relative to the object ``"target"``, the target pose of the end-effector. The arm
+    actions are the end-effector displacements of :class:`FrankaReachEnv`, and the robot has no gripper action.
+    """
+
+    cfg: FrankaReachMimicEnvCfg
+
+    def get_robot_eef_pose(self) -> torch.Tensor:
+        self._update_ee_pose()
+        return make_pose(self.ee_pos - self.scene.env_origins, matrix_from_quat(self.ee_quat))
+
+    def target_eef_pose_to_action(
+        self, target_eef_pose: torch.Tensor, gripper_action: torch.Tensor, action_noise: float = 0.0
+    ) -> torch.Tensor:
+        target_pos, target_rot = unmake_pose(target_eef_pose)
+        self._update_ee_pose()
+        delta_pos = target_pos + self.scene.env_origins - self.ee_pos
+        delta_rot = quat_box_minus(quat_from_matrix(target_rot), self.ee_quat)
+        actions = torch.cat((delta_pos, delta_rot), dim=-1) / self.cfg.action_scale
+        if action_noise > 0.0:
+            actions += action_noise * torch.randn_like(actions)
+        return torch.cat((actions.clamp(-1.0, 1.0), gripper_action), dim=-1)
+
+    def action_to_target_eef_pose(self, actions: torch.Tensor) -> torch.Tensor:
+        target_pos, target_quat = apply_delta_pose(self.ee_pos, self.ee_quat, actions[:, :6] * self.cfg.action_scale)
+        return make_pose(target_pos - self.scene.env_origins, matrix_from_quat(target_quat))
+
+    def actions_to_gripper_actions(self, actions: torch.Tensor) -> torch.Tensor:
+        return actions[..., 6:]
+
+    def get_object_poses(self) -> dict[str, torch.Tensor]:
+        return {"target": make_pose(self.target_pos - self.scene.env_origins, matrix_from_quat(self.target_quat))}
+
+    def get_subtask_term_signals(self) -> dict[str, torch.Tensor]:
+        return {}
+
+    def get_success(self) -> torch.Tensor:
+        self._update_ee_pose()
+        position_error = torch.norm(self.target_pos - self.ee_pos, dim=-1)
+        orientation_error = quat_error_magnitude(self.ee_quat, self.target_quat)
+        return (position_error < self.cfg.success_position_threshold) & (
+            orientation_error < self.cfg.success_orientation_threshold
+        )
@@ -0,0 +1,28 @@
+# Copyright 2025 genesis_lab Developers (https://github.com/Atticlmr/genesis_lab)
+#
+# Licensed under the Apache License, Version 2.0 , January 2004
+
+"""Configuration for the Franka reach environment used to generate demonstrations."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from .franka_reach_env_cfg import FrankaReachEnvCfg
+
+
+@dataclass(kw_only=True)
+class FrankaReachMimicEnvCfg(FrankaReachEnvCfg):
+    """Configuration for the Franka reach environment used to generate demonstrations.
+
+    The target is kept for the whole episode, so that a demonstration reaches a single target.
+    """
+
+    target_resampling_time_s: float = 1.0e9
+    """Time after which the target of an environment is resampled (in s). Defaults to never."""
+
+    success_position_threshold: float = 0.02
+    """Maximum distance between the end-effector and the target for success (in m)."""
+
+    success_orientation_threshold: float = 0.1
+    """Maximum orientation error between the end-effector and the target for success (in rad)."""
@@ -0,0 +1,8 @@
+# Copyright 2025 genesis_lab Developers (https://github.com/Atticlmr/genesis_lab)
+#
+# Licensed under the Apache License, Version 2.0 , January 2004
+
+"""In-hand manipulation environments with the direct workflow."""
+
+from .inhand_env import InHandCubeEnv
+from .inhand_env_cfg import CUBE_CFG, SHADOW_HAND_CFG, InHandCubeEnvCfg
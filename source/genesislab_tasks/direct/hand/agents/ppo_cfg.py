@@ -0,0 +1,46 @@
+# Copyright 2025 genesis_lab Developers (https://github.com/Atticlmr/genesis_lab)
+#
+# Licensed under the Apache License, Version 2.0 , January 2004
+
+"""PPO configuration for the in-hand cube reorientation environment."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+
+from genesislab_rl.ppo import ActorCriticCfg, PPOAlgorithmCfg, PPOCfg
+
+
+@dataclass(kw_only=True)
+class InHandCubePPOCfg(PPOCfg):
+    """PPO configuration for the in-hand cube reorientation environment."""
+
+    num_steps_per_env: int = 16
+    max_iterations: int = 5000
+    save_interval: int = 250
+    experiment_name: str = "shadow_hand_repose"
+    empirical_normalization: bool = True
+    policy: ActorCriticCfg = field(
+        default_factory=lambda: ActorCriticCfg(
+            init_noise_std=1.0,
+            actor_hidden_dims=[512, 512, 256, 128],
+            critic_hidden_dims=[512, 512, 256, 128],
+            activation="elu",
+        )
+    )
+    algorithm: PPOAlgorithmCfg = field(
+        default_factory=lambda: PPOAlgorithmCfg(
+            value_loss_coef=1.0,
+            use_clipped_value_loss=True,
+            clip_param=0.2,
+            entropy_coef=0.005,
+            num_learning_epochs=5,
+            num_mini_batches=4,
+            learning_rate=1.0e-3,
+            schedule="adaptive",
+            gamma=0.99,
+            lam=0.95,
+            desired_kl=0.016,
+            max_grad_norm=1.0,
+        )
+    )
@@ -0,0 +1,282 @@
+# Copyright 2025 genesis_lab Developers (https://github.com/Atticlmr/genesis_lab)
+#
+# Licensed under the Apache License, Version 2.0 , January 2004
+
+"""Direct-workflow in-hand cube reorientation environment."""
+
+from __future__ import annotations
+
+import torch
+
+from genesislab.envs import DirectRLEnv
+from genesislab.envs.managers import SceneEntityCfg
+from genesislab.markers import VisualizationMarkers
+from genesislab.utils.math import (
+    quat_conjugate,
+    quat_error_magnitude,
+    quat_mul,
+    random_orientation,
+    sample_uniform,
+)
+
+from .inhand_env_cfg import InHandCubeEnvCfg
+
+
+class InHandCubeEnv(DirectRLEnv):
+    """Shadow Hand reorienting a cube to a goal orientation.
+
+    Every time the cube is within :attr:`InHandCubeEnvCfg.success_tolerance` of the goal orientation, the environment
+    receives a bonus, its success counter is incremented and a new goal is sampled, without ending the episode.
+
+    The step is written for tens of thousands of environments:
+
+    * the joint targets, the observations and the rewards are written into buffers allocated in ``__init__``; the
+      observation terms are column views of the observation buffer.
+    * the goals of the environments that reached them are resampled with a masked in-place update, so that the
+      step does not synchronize with the host.
+    * the running average of the consecutive successes stays on the device.
+    * the goal markers of all the environments are drawn as one instanced mesh.
+    """
+
+    cfg: InHandCubeEnvCfg
+
+    def __init__(self, cfg: InHandCubeEnvCfg, render_mode: str | None = None, **kwargs):
+        super().__init__(cfg, render_mode, **kwargs)
+
+        self.hand = self.scene["robot"]
+        self.object = self.scene["object"]
+        joint_cfg = SceneEntityCfg("robot", joint_names=".*")
+        joint_cfg.resolve(self.scene)
+        self._dof_ids = joint_cfg.joint_ids
+        self._joint_qpos_ids = joint_cfg.joint_qpos_ids
+        num_dofs = len(self._dof_ids)
+
+        # joint position controllers and joint limits
+        self.hand.set_dofs_kp(torch.full((num_dofs,), cfg.joint_stiffness, device=self.device), self._dof_ids)
+        self.hand.set_dofs_kv(torch.full((num_dofs,), cfg.joint_damping, device=self.device), self._dof_ids)
+        lower, upper = self.hand.get_dofs_limit(self._dof_ids)
+        self._dof_lower = lower.to(self.device)
+        self._dof_upper = upper.to(self.device)
+        self._dof_mid = 0.5 * (self._dof_upper + self._dof_lower)
+        self._dof_half_range = 0.5 * (self._dof_upper - self._dof_lower)
+        self._default_joint_pos = self.scene.default_qpos["robot"][:, self._joint_qpos_ids]
+
+        # joint targets
+        self.actions = torch.zeros(self.num_envs, num_dofs, device=self.device)
+        self._cur_targets = torch.zeros(self.num_envs, num_dofs, device=self.device)
+        self._prev_targets = torch.zeros_like(self._cur_targets)
+
+        # goal: the default cube position and a random orientation
+        self._default_object_pose = self.scene.default_qpos["object"][:, 0:7]
+        self.goal_pos = self._default_object_pose[:, 0:3] + self.scene.env_origins
+        self.goal_rot = random_orientation(self.num_envs, device=str(self.device))
+        self._goal_rot_samples = torch.zeros_like(self.goal_rot)
+        self._goal_reached = torch.zeros(self.num_envs, dtype=torch.bool, device=self.device)
+        self.goal_markers = None
+        if cfg.goal_marker is not None:
+            self.goal_markers = VisualizationMarkers(cfg.goal_marker, self.scene.sim)
+            self._goal_marker_pos = self.goal_pos + torch.tensor(cfg.goal_marker_offset, device=self.device)
+            self._goal_marker_pos += torch.as_tensor(self.scene.sim.envs_offset, device=self.device)
+
+        # success counters
+        self.successes = torch.zeros(self.num_envs, device=self.device)
+        self.consecutive_successes = torch.zeros(1, device=self.device)
+
+        # state of the hand and the cube, read once per step
+        self.joint_pos = torch.zeros(self.num_envs, num_dofs, device=self.device)
+        self.joint_vel = torch.zeros_like(self.joint_pos)
+        self.object_pos = torch.zeros(self.num_envs, 3, device=self.device)
+        self.object_rot = torch.zeros(self.num_envs, 4, device=self.device)
+        self.object_lin_vel = torch.zeros(self.num_envs, 3, device=self.device)
+        self.object_ang_vel = torch.zeros(self.num_envs, 3, device=self.device)
+
+        # observation buffer and the column views of the observation terms
+        self._obs_buf = torch.zeros(self.num_envs, cfg.observation_space, device=self.device)
+        self._obs = {"policy": self._obs_buf}
+        self._obs_views = self._obs_buf.split((num_dofs, num_dofs, 3, 4, 3, 3, 4, 4, num_dofs), dim=1)
+
+        # reward buffers
+        self._reward_buf = torch.zeros(self.num_envs, device=self.device)
+        self._goal_dist = torch.zeros(self.num_envs, device=self.device)
+        self._compute_rewards = torch.compile(compute_rewards) if cfg.compile_rewards else compute_rewards
+
+    """
+    Operations.
+    """
+
+    def _pre_physics_step(self, actions: torch.Tensor):
+        self.actions.copy_(actions)
+        # map the actions from [-1, 1] to the joint ranges, smooth and saturate them
+        torch.addcmul(self._dof_mid, self.actions, self._dof_half_range, out=self._cur_targets)
+        self._cur_targets.mul_(self.cfg.act_moving_average)
+        self._cur_targets.add_(self._prev_targets, alpha=1.0 - self.cfg.act_moving_average)
+        torch.clamp(self._cur_targets, self._dof_lower, self._dof_upper, out=self._cur_targets)
+        self._prev_targets.copy_(self._cur_targets)
+
+    def _apply_action(self):
+        self.hand.control_dofs_position(self._cur_targets, self._dof_ids)
+
+    def _get_observations(self) -> dict:
+        dof_pos, dof_vel, obj_pos, obj_rot, obj_lin_vel, obj_ang_vel, goal_rot, rel_rot, actions = self._obs_views
+        # hand
+        torch.sub(self.joint_pos, self._dof_mid, out=dof_pos).div_(self._dof_half_range)
+        torch.mul(self.joint_vel, self.cfg.vel_obs_scale, out=dof_vel)
+        # object
+        torch.sub(self.object_pos, self.scene.env_origins, out=obj_pos)
+        obj_rot.copy_(self.object_rot)
+        obj_lin_vel.copy_(self.object_lin_vel)
+        torch.mul(self.object_ang_vel, self.cfg.vel_obs_scale, out=obj_ang_vel)
+        # goal
+        goal_rot.copy_(self.goal_rot)
+        rel_rot.copy_(quat_mul(self.object_rot, quat_conjugate(self.goal_rot)))
+        # actions
+        actions.copy_(self.actions)
+        # goal markers
+        if self.goal_markers is not None:
+            self.goal_markers.visualize(self._goal_marker_pos, self.goal_rot)
+        return self._obs
+
+    def _get_rewards(self) -> torch.Tensor:
+        self._compute_rewards(
+            self._reward_buf,
+            self._goal_dist,
+            self._goal_reached,
+            self.successes,
+            self.object_pos,
+            self.object_rot,
+            self.goal_pos,
+            self.goal_rot,
+            self.actions,
+            self.cfg.dist_reward_scale,
+            self.cfg.rot_reward_scale,
+            self.cfg.rot_eps,
+            self.cfg.action_penalty_scale,
+            self.cfg.success_tolerance,
+            self.cfg.reach_goal_bonus,
+            self.cfg.fall_dist,
+            self.cfg.fall_penalty,
+        )
+        # running average of the successes of the finished episodes
+        num_resets = self.reset_buf.sum()
+        finished_successes = torch.sum(self.successes * self.reset_buf)
+        self.consecutive_successes.copy_(
+            torch.where(
+                num_resets > 0,
+                self.cfg.av_factor * finished_successes / num_resets.clamp_min(1)
+                + (1.0 - self.cfg.av_factor) * self.consecutive_successes,
+                self.consecutive_successes,
+            )
+        )
+        self.extras["log"]["consecutive_successes"] = self.consecutive_successes
+        # resample the goals that were reached, without reading the mask on the host
+        self._goal_rot_samples.normal_()
+        torch.nn.functional.normalize(self._goal_rot_samples, dim=-1, out=self._goal_rot_samples)
+        torch.where(self._goal_reached.unsqueeze(-1), self._goal_rot_samples, self.goal_rot, out=self.goal_rot)
+        self._goal_reached.zero_()
+        return self._reward_buf
+
+    def _get_dones(self) -> tuple[torch.Tensor, torch.Tensor]:
+        self._update_state()
+        # the cube fell off the hand
+        out_of_reach = torch.linalg.vector_norm(self.object_pos - self.goal_pos, dim=1) >= self.cfg.fall_dist
+        time_out = self.episode_length_buf >= self.max_episode_length - 1
+        if self.cfg.max_consecutive_success > 0:
+            time_out |= self.successes >= self.cfg.max_consecutive_success
+        return out_of_reach, time_out
+
+    def _reset_idx(self, env_ids: torch.Tensor):
+        super()._reset_idx(env_ids)
+        num_resets = len(env_ids)
+
+        # reset the goals
+        self.goal_rot[env_ids] = random_orientation(num_resets, device=str(self.device))
+
+        # reset the cube with a random orientation around its default position
+        object_pose = self._default_object_pose[env_ids].clone()
+        object_pose[:, 0:3] += self.scene.env_origins[env_ids]
+        object_pose[:, 0:3] += sample_uniform(
+            -self.cfg.reset_position_noise, self.cfg.reset_position_noise, (num_resets, 3), device=self.device
+        )
+        object_pose[:, 3:7] = random_orientation(num_resets, device=str(self.device))
+        self.object.set_qpos(object_pose, envs_idx=env_ids)
+
+        # reset the hand joints around their default positions
+        noise = sample_uniform(-1.0, 1.0, (num_resets, len(self._dof_ids)), device=self.device)
+        joint_pos = self._default_joint_pos[env_ids] + self.cfg.reset_dof_pos_noise * noise * self._dof_half_range
+        joint_pos = torch.clamp(joint_pos, self._dof_lower, self._dof_upper)
+        self.hand.set_dofs_position(joint_pos, self._dof_ids, envs_idx=env_ids)
+        self.hand.control_dofs_position(joint_pos, self._dof_ids, envs_idx=env_ids)
+        self._prev_targets[env_ids] = joint_pos
+        self._cur_targets[env_ids] = joint_pos
+
+        self.successes[env_ids] = 0.0
+        # the state is read for all the environments with one call per quantity
+        self._update_state()
+
+    def _get_state_buffers(self) -> dict[str, torch.Tensor]:
+        return {
+            "actions": self.actions,
+            "prev_targets": self._prev_targets,
+            "goal_rot": self.goal_rot,
+            "successes": self.successes,
+            "joint_pos": self.joint_pos,
+            "joint_vel": self.joint_vel,
+            "object_pos": self.object_pos,
+            "object_rot": self.object_rot,
+            "object_lin_vel": self.object_lin_vel,
+            "object_ang_vel": self.object_ang_vel,
+        }
+
+    """
+    Helper functions.
+    """
+
+    def _update_state(self):
+        """Read the state of the hand and the cube from the simulation into the state buffers."""
+        self.joint_pos.copy_(self.hand.get_dofs_position(self._dof_ids))
+        self.joint_vel.copy_(self.hand.get_dofs_velocity(self._dof_ids))
+        self.object_pos.copy_(self.object.get_pos())
+        self.object_rot.copy_(self.object.get_quat())
+        self.object_lin_vel.copy_(self.object.get_vel())
+        self.object_ang_vel.copy_(self.object.get_ang())
+
+
+def compute_rewards(
+    reward_buf: torch.Tensor,
+    goal_dist: torch.Tensor,
+    goal_reached: torch.Tensor,
+    successes: torch.Tensor,
+    object_pos: torch.Tensor,
+    object_rot: torch.Tensor,
+    target_pos: torch.Tensor,
+    target_rot: torch.Tensor,
+    actions: torch.Tensor,
+    dist_reward_scale: float,
+    rot_reward_scale: float,
+    rot_eps: float,
+    action_penalty_scale: float,
+    success_tolerance: float,
+    reach_goal_bonus: float,
+    fall_dist: float,
+    fall_penalty: float,
+):
+    """Compute the reward and the goal and success flags into the given buffers.
+
+    The function only writes into its buffer arguments, so that it can be compiled into fused kernels.
+    """
+    torch.linalg.vector_norm(object_pos - target_pos, dim=1, out=goal_dist)
+    rot_dist = quat_error_magnitude(object_rot, target_rot)
+
+    dist_rew = goal_dist * dist_reward_scale
+    rot_rew = 1.0 / (torch.abs(rot_dist) + rot_eps) * rot_reward_scale
+    action_penalty = torch.sum(actions**2, dim=-1)
+    reward = dist_rew + rot_rew + action_penalty * action_penalty_scale
+
+    # find out which envs hit the goal and update the successes count
+    torch.le(torch.abs(rot_dist), success_tolerance, out=goal_reached)
+    successes.add_(goal_reached.float())
+
+    # success bonus and fall penalty
+    reward = reward + goal_reached.float() * reach_goal_bonus
+    reward = reward + (goal_dist >= fall_dist).float() * fall_penalty
+    reward_buf.copy_(reward)
@@ -0,0 +1,96 @@
+# Copyright 2025 genesis_lab Developers (https://github.com/Atticlmr/genesis_lab)
+#
+# Licensed under the Apache License, Version 2.0 , January 2004
+
+"""Configuration for the direct-workflow in-hand cube reorientation environment."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+
+from genesislab.envs import DirectRLEnvCfg, EntityCfg, InteractiveSceneCfg, SimCfg
+from genesislab.markers import VisualizationMarkersCfg
+
+SHADOW_HAND_CFG = EntityCfg(
+    morph="URDF",
+    # the palm faces upwards and the fingers point along +y
+    morph_kwargs=dict(file="urdf/shadow_hand/shadow_hand.urdf", pos=(0.0, 0.0, 0.5), euler=(-90.0, 0.0, 0.0), fixed=True),
+)
+"""Configuration of the Shadow Hand from the Genesis assets, mounted with the palm facing upwards."""
+
+CUBE_CFG = EntityCfg(
+    morph="Box",
+    morph_kwargs=dict(size=(0.05, 0.05, 0.05), pos=(0.0, 0.31, 0.56)),
+    init_pos=(0.0, 0.31, 0.56),
+)
+"""Configuration of the cube resting on the palm."""
+
+
+@dataclass(kw_only=True)
+class InHandCubeEnvCfg(DirectRLEnvCfg):
+    """Configuration for the in-hand cube reorientation environment."""
+
+    # env
+    decimation: int = 2
+    episode_length_s: float = 10.0
+    action_space: int = 24
+    observation_space: int = 93
+    state_space: int = 0
+
+    # simulation
+    sim: SimCfg = field(default_factory=lambda: SimCfg(dt=1 / 120))
+
+    # scene
+    scene: InteractiveSceneCfg = field(
+        default_factory=lambda: InteractiveSceneCfg(
+            num_envs=8192,
+            env_spacing=(0.75, 0.75),
+            entities={"robot": SHADOW_HAND_CFG, "object": CUBE_CFG},
+        )
+    )
+
+    # robot
+    joint_stiffness: float = 5.0
+    """Stiffness of the joint position controllers (in N.m/rad)."""
+
+    joint_damping: float = 0.2
+    """Damping of the joint position controllers (in N.m.s/rad)."""
+
+    act_moving_average: float = 1.0
+    """Weight of the new joint targets in the moving average with the previous ones."""
+
+    vel_obs_scale: float = 0.2
+    """Scale of the joint and object angular velocities in the observations."""
+
+    # goal
+    goal_marker: VisualizationMarkersCfg | None = None
+    """The markers showing the goal orientations. Defaults to None, in which case the goals are not drawn."""
+
+    goal_marker_offset: tuple[float, float, float] = (-0.2, 0.0, 0.0)
+    """Offset of the goal markers from the default cube position, so that they do not hide the cube (in m)."""
+
+    # reset
+    reset_position_noise: float = 0.01
+    """Range of the position noise of the cube on reset (in m)."""
+
+    reset_dof_pos_noise: float = 0.2
+    """Range of the joint position noise on reset, as a fraction of the joint ranges."""
+
+    # reward scales
+    dist_reward_scale: float = -10.0
+    rot_reward_scale: float = 1.0
+    rot_eps: float = 0.1
+    action_penalty_scale: float = -0.0002
+    reach_goal_bonus: float = 250.0
+    fall_penalty: float = 0.0
+    fall_dist: float = 0.24
+    success_tolerance: float = 0.1
+    max_consecutive_success: int = 0
+    """Number of successes after which the episode ends. Defaults to 0, in which case the episodes only end when the
+    cube falls or the time is up."""
+
+    av_factor: float = 0.1
+    """Weight of the latest episodes in the running average of the consecutive successes."""
+
+    compile_rewards: bool = False
+    """Whether the reward computation is compiled with :func:`torch.compile` into fused kernels. Defaults to False."""
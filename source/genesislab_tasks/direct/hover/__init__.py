@@ -0,0 +1,8 @@
+# Copyright 2025 genesis_lab Developers (https://github.com/Atticlmr/genesis_lab)
+#
+# Licensed under the Apache License, Version 2.0 , January 2004
+
+"""Quadrotor hover and trajectory tracking environment with the direct workflow."""
+
+from .hover_env import QuadrotorHoverEnv
+from .hover_env_cfg import CRAZYFLIE_CFG, QuadrotorHoverEnvCfg
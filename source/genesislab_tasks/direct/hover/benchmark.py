@@ -0,0 +1,63 @@
+# Copyright 2025 genesis_lab Developers (https://github.com/Atticlmr/genesis_lab)
+#
+# Licensed under the Apache License, Version 2.0 , January 2004
+
+"""Throughput benchmark of the direct-workflow quadrotor hover environment.
+
+The quadrotor is the cheapest workload for a high number of environments: one rigid body per environment, no
+joints and no contacts. The script measures the environment steps per second of :class:`QuadrotorHoverEnv` and
+compares it with stepping the same Genesis scene directly with a constant external wrench, which gives the overhead
+of the force model and of the MDP computations on top of the physics.
+
+.. code-block:: bash
+
+    python -m genesislab_tasks.direct.hover.benchmark --num_envs 8192 --num_steps 200
+
+"""
+
+from __future__ import annotations
+
+import torch
+
+from genesislab_tasks.utils.benchmark import measure_throughput, run_benchmark
+
+from .hover_env import QuadrotorHoverEnv
+from .hover_env_cfg import QuadrotorHoverEnvCfg
+
+DEFAULT_NUM_ENVS = [1, 64, 1024, 8192]
+
+
+def benchmark_env(num_envs: int, num_steps: int, num_warmup_steps: int) -> tuple[float, float]:
+    """Measure the throughput of the environment and of the raw Genesis stepping.
+
+    Args:
+        num_envs: The number of environments.
+        num_steps: The number of measured environment steps.
+        num_warmup_steps: The number of environment steps run before measuring (JIT compilation).
+
+    Returns:
+        The environment steps per second of the environment and of the raw Genesis stepping.
+    """
+    cfg = QuadrotorHoverEnvCfg()
+    cfg.scene.num_envs = num_envs
+    env = QuadrotorHoverEnv(cfg)
+    # the rotor thrusts that compensate the weight of the quadrotor
+    actions = torch.full((num_envs, cfg.action_space), 2.0 / cfg.thrust_to_weight - 1.0, device=env.device)
+    # the raw stepping applies a constant wrench instead
+    force = torch.zeros(num_envs, 1, 3, device=env.device)
+    force[..., 2] = env._robot_weight
+
+    def apply_raw_action():
+        env.robot.apply_links_external_wrench(force, links_idx_local=env._body_ids)
+
+    throughput = measure_throughput(env, actions, apply_raw_action, num_steps, num_warmup_steps)
+    env.close()
+    return throughput
+
+
+def main():
+    run_benchmark("Benchmark the throughput of the quadrotor hover environment.", benchmark_env, DEFAULT_NUM_ENVS)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,245 @@
+# Copyright 2025 genesis_lab Developers (https://github.com/Atticlmr/genesis_lab)
+#
+# Licensed under the Apache License, Version 2.0 , January 2004
+
+"""Direct-workflow quadrotor hover environment."""
+
+from __future__ import annotations
+
+import math
+import torch
+
+from genesislab.envs import DirectRLEnv
+from genesislab.utils.math import quat_apply, quat_apply_inverse, sample_uniform
+
+from .hover_env_cfg import QuadrotorHoverEnvCfg
+
+
+class QuadrotorHoverEnv(DirectRLEnv):
+    """Quadrotor flying to a goal position and holding it, or tracking a circular trajectory.
+
+    The quadrotor is a single free rigid body driven by a custom force model instead of the propeller model of
+    Genesis. The actions are the normalized thrusts of the four rotors. At every physics step:
+
+    1. the rotor thrusts are mixed into the collective thrust and the body torques with one matrix product.
+    2. the linear drag is computed from the velocity in the body frame, obtained with :func:`quat_apply_inverse`.
+    3. the body-frame wrench is rotated into the world frame with :func:`quat_apply` and applied to the base link of
+       all the quadrotors with a single call to :meth:`apply_links_external_wrench`.
+
+    The state of the quadrotors is read once per step with batched Genesis calls into preallocated buffers and the
+    reward terms are written into the columns of a ``(num_envs, num_terms)`` buffer.
+    """
+
+    cfg: QuadrotorHoverEnvCfg
+
+    reward_terms: tuple[str, ...] = ("lin_vel_l2", "ang_vel_l2", "distance_to_goal")
+    """Names of the reward terms, in the order of the columns of :attr:`step_reward`."""
+
+    def __init__(self, cfg: QuadrotorHoverEnvCfg, render_mode: str | None = None, **kwargs):
+        super().__init__(cfg, render_mode, **kwargs)
+
+        self.robot = self.scene["robot"]
+        self._body_ids = [0]
+
+        # force model: the mixer maps the rotor thrusts to (thrust, torque_x, torque_y, torque_z) in the body frame
+        mass = float(self.robot.get_links_mass().reshape(-1, self.robot.n_links)[0].sum())
+        gravity = torch.tensor(cfg.sim.gravity, device=self.device)
+        self._robot_weight = mass * float(torch.linalg.vector_norm(gravity))
+        num_rotors = len(cfg.rotor_positions)
+        self._max_rotor_thrust = cfg.thrust_to_weight * self._robot_weight / num_rotors
+        rotor_xy = torch.tensor(cfg.rotor_positions, device=self.device)
+        rotor_dirs = torch.tensor(cfg.rotor_directions, device=self.device)
+        mixer = torch.stack((
+            torch.ones(num_rotors, device=self.device),
+            rotor_xy[:, 1],
+            -rotor_xy[:, 0],
+            rotor_dirs * cfg.torque_to_thrust,
+        ))
+        self._mixer_t = mixer.T.contiguous()
+        self._drag_coeffs = torch.tensor(cfg.drag_coeffs, device=self.device)
+
+        # actions and wrench buffers
+        self._actions = torch.zeros(self.num_envs, num_rotors, device=self.device)
+        self._rotor_thrusts = torch.zeros_like(self._actions)
+        self._body_wrench = torch.zeros(self.num_envs, 4, device=self.device)
+        self._force_b = torch.zeros(self.num_envs, 3, device=self.device)
+        self._torque_b = torch.zeros(self.num_envs, 3, device=self.device)
+        self._force_w = torch.zeros(self.num_envs, 1, 3, device=self.device)
+        self._torque_w = torch.zeros(self.num_envs, 1, 3, device=self.device)
+        self._substep = 0
+
+        # goals
+        self._goal_lower = torch.tensor([r[0] for r in cfg.goal_pos_range], device=self.device)
+        self._goal_upper = torch.tensor([r[1] for r in cfg.goal_pos_range], device=self.device)
+        self._goal_center_w = self.scene.env_origins + 0.5 * (self._goal_lower + self._goal_upper)
+        self._goal_phase = torch.zeros(self.num_envs, device=self.device)
+        self.goal_pos_w = self._goal_center_w.clone()
+        self.goal_vel_w = torch.zeros(self.num_envs, 3, device=self.device)
+
+        # state of the quadrotor, read once per step
+        self.root_pos_w = self.scene.env_origins.clone()
+        self.root_quat_w = torch.zeros(self.num_envs, 4, device=self.device)
+        self.root_quat_w[:, 0] = 1.0
+        self.root_lin_vel_w = torch.zeros(self.num_envs, 3, device=self.device)
+        self.root_lin_vel_b = torch.zeros_like(self.root_lin_vel_w)
+        self.root_ang_vel_b = torch.zeros_like(self.root_lin_vel_w)
+        self._gravity_dir_w = torch.tensor([0.0, 0.0, -1.0], device=self.device).repeat(self.num_envs, 1)
+        self.projected_gravity_b = self._gravity_dir_w.clone()
+
+        # observation and reward buffers
+        self._obs_buf = torch.zeros(self.num_envs, self.cfg.observation_space, device=self.device)
+        self._obs = {"policy": self._obs_buf}
+        self.step_reward = torch.zeros(self.num_envs, len(self.reward_terms), device=self.device)
+        self._reward_buf = torch.zeros(self.num_envs, device=self.device)
+        self._episode_sums = torch.zeros_like(self.step_reward)
+        reward_scales = (cfg.lin_vel_reward_scale, cfg.ang_vel_reward_scale, cfg.distance_to_goal_reward_scale)
+        self._reward_scales = torch.tensor(reward_scales, device=self.device) * self.step_dt
+
+    """
+    Operations.
+    """
+
+    def _pre_physics_step(self, actions: torch.Tensor):
+        self._actions.copy_(actions)
+        # map the actions from [-1, 1] to the thrusts of the rotors
+        torch.clamp(self._actions, -1.0, 1.0, out=self._rotor_thrusts)
+        self._rotor_thrusts.add_(1.0).mul_(0.5 * self._max_rotor_thrust)
+        torch.matmul(self._rotor_thrusts, self._mixer_t, out=self._body_wrench)
+        self._torque_b.copy_(self._body_wrench[:, 1:4])
+        self._substep = 0
+
+    def _apply_action(self):
+        # the drag and the world-frame wrench depend on the state at the current physics step. At the first physics
+        # step, it is the state read at the end of the previous environment step.
+        if self._substep == 0:
+            quat_w, lin_vel_b = self.root_quat_w, self.root_lin_vel_b
+        else:
+            quat_w = self.robot.get_quat()
+            lin_vel_b = quat_apply_inverse(quat_w, self.robot.get_vel())
+        self._substep += 1
+        torch.mul(lin_vel_b, self._drag_coeffs, out=self._force_b).neg_()
+        self._force_b[:, 2] += self._body_wrench[:, 0]
+        self._force_w[:, 0] = quat_apply(quat_w, self._force_b)
+        self._torque_w[:, 0] = quat_apply(quat_w, self._torque_b)
+        self.robot.apply_links_external_wrench(self._force_w, self._torque_w, links_idx_local=self._body_ids)
+
+    def _get_observations(self) -> dict:
+        torch.cat(
+            (
+                self.root_lin_vel_b,
+                self.root_ang_vel_b,
+                self.projected_gravity_b,
+                quat_apply_inverse(self.root_quat_w, self.goal_pos_w - self.root_pos_w),
+                quat_apply_inverse(self.root_quat_w, self.goal_vel_w),
+            ),
+            dim=-1,
+            out=self._obs_buf,
+        )
+        return self._obs
+
+    def _get_rewards(self) -> torch.Tensor:
+        compute_reward_terms(
+            self.step_reward, self.root_lin_vel_b, self.root_ang_vel_b, self.root_pos_w, self.goal_pos_w
+        )
+        self.step_reward.mul_(self._reward_scales)
+        torch.sum(self.step_reward, dim=1, out=self._reward_buf)
+        self._episode_sums += self.step_reward
+        return self._reward_buf
+
+    def _get_dones(self) -> tuple[torch.Tensor, torch.Tensor]:
+        self._update_state()
+        self._update_goals()
+        time_out = self.episode_length_buf >= self.max_episode_length - 1
+        height = self.root_pos_w[:, 2] - self.scene.env_origins[:, 2]
+        died = (height < self.cfg.height_range[0]) | (height > self.cfg.height_range[1])
+        return died, time_out
+
+    def _reset_idx(self, env_ids: torch.Tensor):
+        super()._reset_idx(env_ids)
+
+        # log the episodic reward sums and the final distance to the goal
+        self._log_episodic_sums(env_ids, self._episode_sums, self.reward_terms)
+        self.extras["log"]["Metrics/final_distance_to_goal"] = torch.linalg.vector_norm(
+            self.goal_pos_w[env_ids] - self.root_pos_w[env_ids], dim=1
+        ).mean()
+        self._actions[env_ids] = 0.0
+
+        # sample new goals
+        num_resets = len(env_ids)
+        self._goal_center_w[env_ids] = self.scene.env_origins[env_ids] + sample_uniform(
+            self._goal_lower, self._goal_upper, (num_resets, 3), device=self.device
+        )
+        self._goal_phase[env_ids] = sample_uniform(0.0, 2.0 * math.pi, num_resets, device=self.device)
+
+        # respawn the quadrotors at rest
+        qpos = self.scene.default_qpos["robot"][env_ids].clone()
+        qpos[:, 0:3] += self.scene.env_origins[env_ids]
+        self.robot.set_qpos(qpos, envs_idx=env_ids)
+        self.robot.zero_all_dofs_velocity(envs_idx=env_ids)
+
+        # keep the state buffers consistent with the respawned quadrotors
+        self.root_pos_w[env_ids] = qpos[:, 0:3]
+        self.root_quat_w[env_ids] = qpos[:, 3:7]
+        self.root_lin_vel_w[env_ids] = 0.0
+        self.root_lin_vel_b[env_ids] = 0.0
+        self.root_ang_vel_b[env_ids] = 0.0
+        self.projected_gravity_b[env_ids] = quat_apply_inverse(qpos[:, 3:7], self._gravity_dir_w[env_ids])
+        self._update_goals()
+
+    def _get_state_buffers(self) -> dict[str, torch.Tensor]:
+        return {
+            "actions": self._actions,
+            "goal_center_w": self._goal_center_w,
+            "goal_phase": self._goal_phase,
+            "goal_pos_w": self.goal_pos_w,
+            "goal_vel_w": self.goal_vel_w,
+            "root_pos_w": self.root_pos_w,
+            "root_quat_w": self.root_quat_w,
+            "root_lin_vel_w": self.root_lin_vel_w,
+            "root_lin_vel_b": self.root_lin_vel_b,
+            "root_ang_vel_b": self.root_ang_vel_b,
+            "projected_gravity_b": self.projected_gravity_b,
+            "episode_sums": self._episode_sums,
+        }
+
+    """
+    Helper functions.
+    """
+
+    def _update_state(self):
+        """Read the state of the quadrotors from the simulation into the state buffers."""
+        self.root_pos_w.copy_(self.robot.get_pos())
+        self.root_quat_w.copy_(self.robot.get_quat())
+        self.root_lin_vel_w.copy_(self.robot.get_vel())
+        self.root_lin_vel_b.copy_(quat_apply_inverse(self.root_quat_w, self.root_lin_vel_w))
+        self.root_ang_vel_b.copy_(quat_apply_inverse(self.root_quat_w, self.robot.get_ang()))
+        self.projected_gravity_b.copy_(quat_apply_inverse(self.root_quat_w, self._gravity_dir_w))
+
+    def _update_goals(self):
+        """Compute the goal positions and velocities of all the environments at the current episode time."""
+        if self.cfg.goal_mode == "hover":
+            self.goal_pos_w.copy_(self._goal_center_w)
+            return
+        omega = 2.0 * math.pi / self.cfg.circle_period
+        angle = self.episode_length_buf * (omega * self.step_dt) + self._goal_phase
+        cos_angle, sin_angle = torch.cos(angle), torch.sin(angle)
+        radius = self.cfg.circle_radius
+        self.goal_pos_w[:, 0] = self._goal_center_w[:, 0] + radius * cos_angle
+        self.goal_pos_w[:, 1] = self._goal_center_w[:, 1] + radius * sin_angle
+        self.goal_pos_w[:, 2] = self._goal_center_w[:, 2]
+        self.goal_vel_w[:, 0] = -radius * omega * sin_angle
+        self.goal_vel_w[:, 1] = radius * omega * cos_angle
+
+
+@torch.jit.script
+def compute_reward_terms(
+    out: torch.Tensor,
+    lin_vel_b: torch.Tensor,
+    ang_vel_b: torch.Tensor,
+    root_pos_w: torch.Tensor,
+    goal_pos_w: torch.Tensor,
+):
+    out[:, 0] = torch.sum(torch.square(lin_vel_b), dim=1)
+    out[:, 1] = torch.sum(torch.square(ang_vel_b), dim=1)
+    distance_to_goal = torch.linalg.vector_norm(goal_pos_w - root_pos_w, dim=1)
+    out[:, 2] = 1.0 - torch.tanh(distance_to_goal / 0.8)
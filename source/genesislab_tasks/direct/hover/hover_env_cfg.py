@@ -0,0 +1,84 @@
+# Copyright 2025 genesis_lab Developers (https://github.com/Atticlmr/genesis_lab)
+#
+# Licensed under the Apache License, Version 2.0 , January 2004
+
+"""Configuration for the direct-workflow quadrotor hover environment."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Literal
+
+from genesislab.envs import DirectRLEnvCfg, EntityCfg, InteractiveSceneCfg, SimCfg
+
+CRAZYFLIE_CFG = EntityCfg(
+    morph="URDF",
+    morph_kwargs=dict(file="urdf/drones/cf2x.urdf"),
+    init_pos=(0.0, 0.0, 1.0),
+)
+"""Configuration of the Crazyflie 2.x quadrotor (X configuration) from the Genesis assets."""
+
+
+@dataclass(kw_only=True)
+class QuadrotorHoverEnvCfg(DirectRLEnvCfg):
+    """Configuration for the quadrotor reaching and holding a goal position or tracking a circular trajectory."""
+
+    # env
+    decimation: int = 2
+    episode_length_s: float = 10.0
+    action_space: int = 4
+    observation_space: int = 15
+    state_space: int = 0
+
+    # simulation
+    sim: SimCfg = field(default_factory=lambda: SimCfg(dt=0.01))
+
+    # scene
+    scene: InteractiveSceneCfg = field(
+        default_factory=lambda: InteractiveSceneCfg(
+            num_envs=8192, env_spacing=(5.0, 5.0), entities={"robot": CRAZYFLIE_CFG}
+        )
+    )
+
+    # rotors
+    rotor_positions: tuple[tuple[float, float], ...] = (
+        (0.028, -0.028),
+        (-0.028, -0.028),
+        (-0.028, 0.028),
+        (0.028, 0.028),
+    )
+    """Positions of the rotors in the x-y plane of the body frame (in m)."""
+
+    rotor_directions: tuple[float, ...] = (-1.0, 1.0, -1.0, 1.0)
+    """Sign of the yaw torque produced by each rotor, given by its spinning direction."""
+
+    thrust_to_weight: float = 2.25
+    """Ratio between the maximum total thrust of the rotors and the weight of the quadrotor."""
+
+    torque_to_thrust: float = 0.0251
+    """Ratio between the drag torque about the rotor axis and the thrust of a rotor (in m)."""
+
+    drag_coeffs: tuple[float, float, float] = (0.01, 0.01, 0.015)
+    """Linear drag coefficients along the x, y and z axes of the body frame (in N.s/m)."""
+
+    # goal
+    goal_mode: Literal["hover", "circle"] = "hover"
+    """Whether the goal is a fixed position ("hover") or moves along a horizontal circle ("circle")."""
+
+    goal_pos_range: tuple[tuple[float, float], ...] = ((-2.0, 2.0), (-2.0, 2.0), (0.5, 1.5))
+    """Ranges of the goal position (or of the center of the circle) relative to the environment origin (in m)."""
+
+    circle_radius: float = 0.5
+    """Radius of the circular trajectory (in m). Only used with the "circle" goal mode."""
+
+    circle_period: float = 5.0
+    """Period of the circular trajectory (in s). Only used with the "circle" goal mode."""
+
+    # termination
+    height_range: tuple[float, float] = (0.1, 2.0)
+    """The episode terminates if the height of the quadrotor above the environment origin leaves this range (in m)."""
+
+    # reward scales
+    lin_vel_reward_scale: float = -0.05
+    ang_vel_reward_scale: float = -0.01
+    distance_to_goal_reward_scale: float = 15.0
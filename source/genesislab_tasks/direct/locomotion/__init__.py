@@ -0,0 +1,8 @@
+# Copyright 2025 genesis_lab Developers (https://github.com/Atticlmr/genesis_lab)
+#
+# Licensed under the Apache License, Version 2.0 , January 2004
+
+"""Base environment for legged robots tracking a velocity command with the direct workflow."""
+
+from .locomotion_env import LocomotionEnv
+from .locomotion_env_cfg import ROUGH_TERRAINS_CFG, LocomotionEnvCfg
@@ -0,0 +1,296 @@
+# Copyright 2025 genesis_lab Developers (https://github.com/Atticlmr/genesis_lab)
+#
+# Licensed under the Apache License, Version 2.0 , January 2004
+
+"""Direct-workflow base environment for legged robots tracking a velocity command."""
+
+from __future__ import annotations
+
+import torch
+
+from genesislab.envs import DirectRLEnv
+from genesislab.envs.managers import SceneEntityCfg
+from genesislab.utils.math import quat_apply_inverse, sample_uniform
+
+from .locomotion_env_cfg import LocomotionEnvCfg
+
+
+class LocomotionEnv(DirectRLEnv):
+    """Legged robot tracking a planar velocity command on flat or generated terrain.
+
+    The actions are offsets to the default joint positions, tracked by the joint position controllers of Genesis.
+    The state of the robot is read once per step with batched Genesis calls into preallocated buffers and the
+    reward terms are written into the columns of a ``(num_envs, num_terms)`` buffer. The contacts are read from the
+    contact sensor of the scene (see :attr:`LocomotionEnvCfg.contact_sensor_name`), whose history and air times are
+    shared by the rewards and the terminations.
+
+    If the scene has a generated terrain and :attr:`LocomotionEnvCfg.terrain_curriculum` is enabled, every reset
+    promotes the environments whose robot walked out of its sub-terrain and demotes the ones that covered less than
+    half of the commanded distance. The levels and the origins are updated by the scene's
+    :class:`~genesislab.terrains.TerrainImporter` with batched tensor operations, and the robots are respawned at
+    the new origins.
+    """
+
+    cfg: LocomotionEnvCfg
+
+    reward_terms: tuple[str, ...] = (
+        "track_lin_vel_xy_exp",
+        "track_ang_vel_z_exp",
+        "lin_vel_z_l2",
+        "ang_vel_xy_l2",
+        "dof_torques_l2",
+        "dof_acc_l2",
+        "action_rate_l2",
+        "undesired_contacts",
+        "flat_orientation_l2",
+        "feet_air_time",
+    )
+    """Names of the reward terms, in the order of the columns of :attr:`step_reward`."""
+
+    def __init__(self, cfg: LocomotionEnvCfg, render_mode: str | None = None, **kwargs):
+        super().__init__(cfg, render_mode, **kwargs)
+
+        self.robot = self.scene[cfg.robot_name]
+        # resolve the actuated joints and the bodies
+        joint_cfg = SceneEntityCfg(cfg.robot_name, joint_names=cfg.joint_names)
+        joint_cfg.resolve(self.scene)
+        self._dof_ids = joint_cfg.joint_ids
+        self._joint_qpos_ids = joint_cfg.joint_qpos_ids
+        # the bodies are indexed in the data of the contact sensor
+        self._contact_sensor = self.scene[cfg.contact_sensor_name]
+        base_cfg = SceneEntityCfg(cfg.contact_sensor_name, body_names=cfg.base_body_name)
+        base_cfg.resolve(self.scene)
+        self._base_id = base_cfg.body_ids[0]
+        contact_cfg = SceneEntityCfg(cfg.contact_sensor_name, body_names=cfg.undesired_contact_body_names)
+        contact_cfg.resolve(self.scene)
+        self._undesired_contact_body_ids = contact_cfg.body_ids
+        feet_cfg = SceneEntityCfg(cfg.contact_sensor_name, body_names=cfg.feet_body_names)
+        feet_cfg.resolve(self.scene)
+        self._feet_ids = feet_cfg.body_ids
+        num_joints = len(self._dof_ids)
+
+        # joint position controllers
+        self.robot.set_dofs_kp(torch.full((num_joints,), cfg.joint_stiffness, device=self.device), self._dof_ids)
+        self.robot.set_dofs_kv(torch.full((num_joints,), cfg.joint_damping, device=self.device), self._dof_ids)
+        self._default_joint_pos = self.scene.default_qpos[cfg.robot_name][:, self._joint_qpos_ids]
+
+        # actions and commands
+        self._actions = torch.zeros(self.num_envs, num_joints, device=self.device)
+        self._previous_actions = torch.zeros_like(self._actions)
+        self._processed_actions = torch.zeros_like(self._actions)
+        self._commands = torch.zeros(self.num_envs, 3, device=self.device)
+        ranges = (cfg.lin_vel_x_range, cfg.lin_vel_y_range, cfg.ang_vel_z_range)
+        self._command_lower = torch.tensor([r[0] for r in ranges], device=self.device)
+        self._command_upper = torch.tensor([r[1] for r in ranges], device=self.device)
+
+        # state of the robot, read once per step
+        self.root_pos_w = self.scene.env_origins.clone()
+        self.root_quat_w = torch.zeros(self.num_envs, 4, device=self.device)
+        self.root_quat_w[:, 0] = 1.0
+        self.root_lin_vel_b = torch.zeros(self.num_envs, 3, device=self.device)
+        self.root_ang_vel_b = torch.zeros_like(self.root_lin_vel_b)
+        self._gravity_dir_w = torch.tensor([0.0, 0.0, -1.0], device=self.device).repeat(self.num_envs, 1)
+        self.projected_gravity_b = self._gravity_dir_w.clone()
+        self.joint_pos = self._default_joint_pos.clone()
+        self.joint_vel = torch.zeros_like(self._actions)
+        self.joint_acc = torch.zeros_like(self._actions)
+        self.applied_torque = torch.zeros_like(self._actions)
+        self._last_joint_vel = torch.zeros_like(self._actions)
+
+        # observation and reward buffers
+        self._obs_buf = torch.zeros(self.num_envs, self.cfg.observation_space, device=self.device)
+        self._obs = {"policy": self._obs_buf}
+        self.step_reward = torch.zeros(self.num_envs, len(self.reward_terms), device=self.device)
+        self._reward_buf = torch.zeros(self.num_envs, device=self.device)
+        self._episode_sums = torch.zeros_like(self.step_reward)
+        reward_scales = (
+            cfg.lin_vel_reward_scale,
+            cfg.yaw_rate_reward_scale,
+            cfg.z_vel_reward_scale,
+            cfg.ang_vel_reward_scale,
+            cfg.joint_torque_reward_scale,
+            cfg.joint_accel_reward_scale,
+            cfg.action_rate_reward_scale,
+            cfg.undesired_contact_reward_scale,
+            cfg.flat_orientation_reward_scale,
+            cfg.feet_air_time_reward_scale,
+        )
+        self._reward_scales = torch.tensor(reward_scales, device=self.device) * self.step_dt
+
+    """
+    Operations.
+    """
+
+    def _pre_physics_step(self, actions: torch.Tensor):
+        self._actions.copy_(actions)
+        torch.add(self._default_joint_pos, self._actions, alpha=self.cfg.action_scale, out=self._processed_actions)
+
+    def _apply_action(self):
+        self.robot.control_dofs_position(self._processed_actions, self._dof_ids)
+
+    def _get_observations(self) -> dict:
+        self._previous_actions.copy_(self._actions)
+        torch.cat(
+            (
+                self.root_lin_vel_b,
+                self.root_ang_vel_b,
+                self.projected_gravity_b,
+                self._commands,
+                self.joint_pos - self._default_joint_pos,
+                self.joint_vel,
+                self._actions,
+            ),
+            dim=-1,
+            out=self._obs_buf,
+        )
+        return self._obs
+
+    def _get_rewards(self) -> torch.Tensor:
+        contact_data = self._contact_sensor.data
+        net_forces = contact_data.net_forces_w_history[:, self._undesired_contact_body_ids]
+        undesired_contacts = torch.amax(torch.norm(net_forces, dim=-1), dim=2)
+        first_contact = self._contact_sensor.compute_first_contact(self.step_dt)[:, self._feet_ids]
+        compute_reward_terms(
+            self.step_reward,
+            self._commands,
+            self.root_lin_vel_b,
+            self.root_ang_vel_b,
+            self.projected_gravity_b,
+            self.applied_torque,
+            self.joint_acc,
+            self._actions,
+            self._previous_actions,
+            undesired_contacts,
+            self.cfg.contact_force_threshold,
+            contact_data.last_air_time[:, self._feet_ids],
+            first_contact,
+            self.cfg.feet_air_time_threshold,
+        )
+        self.step_reward.mul_(self._reward_scales)
+        torch.sum(self.step_reward, dim=1, out=self._reward_buf)
+        self._episode_sums += self.step_reward
+        return self._reward_buf
+
+    def _get_dones(self) -> tuple[torch.Tensor, torch.Tensor]:
+        self._update_state()
+        time_out = self.episode_length_buf >= self.max_episode_length - 1
+        base_forces = self._contact_sensor.data.net_forces_w_history[:, self._base_id]
+        died = torch.amax(torch.norm(base_forces, dim=-1), dim=1) > self.cfg.contact_force_threshold
+        return died, time_out
+
+    def _reset_idx(self, env_ids: torch.Tensor):
+        # the curriculum reads the distance walked in the episode, before the robot is respawned
+        terrain = self.scene.terrain
+        if self.cfg.terrain_curriculum and terrain is not None and terrain.terrain_origins is not None:
+            self._update_terrain_curriculum(env_ids)
+            self.extras["log"]["Curriculum/terrain_levels"] = terrain.terrain_levels.float().mean()
+        super()._reset_idx(env_ids)
+
+        self._log_episodic_sums(env_ids, self._episode_sums, self.reward_terms)
+
+        # sample new commands
+        self._actions[env_ids] = 0.0
+        self._previous_actions[env_ids] = 0.0
+        self._commands[env_ids] = sample_uniform(
+            self._command_lower, self._command_upper, (len(env_ids), 3), device=self.device
+        )
+
+        # respawn the robots at the origins of their sub-terrains
+        qpos = self.scene.default_qpos[self.cfg.robot_name][env_ids].clone()
+        qpos[:, 0:3] += self.scene.env_origins[env_ids]
+        self.robot.set_qpos(qpos, envs_idx=env_ids)
+
+        # keep the state buffers consistent with the respawned robots
+        self.root_pos_w[env_ids] = qpos[:, 0:3]
+        self.root_quat_w[env_ids] = qpos[:, 3:7]
+        self.root_lin_vel_b[env_ids] = 0.0
+        self.root_ang_vel_b[env_ids] = 0.0
+        self.projected_gravity_b[env_ids] = quat_apply_inverse(qpos[:, 3:7], self._gravity_dir_w[env_ids])
+        self.joint_pos[env_ids] = qpos[:, self._joint_qpos_ids]
+        self.joint_vel[env_ids] = 0.0
+        self._last_joint_vel[env_ids] = 0.0
+
+    def _get_state_buffers(self) -> dict[str, torch.Tensor]:
+        return {
+            "actions": self._actions,
+            "previous_actions": self._previous_actions,
+            "commands": self._commands,
+            "root_pos_w": self.root_pos_w,
+            "root_quat_w": self.root_quat_w,
+            "root_lin_vel_b": self.root_lin_vel_b,
+            "root_ang_vel_b": self.root_ang_vel_b,
+            "projected_gravity_b": self.projected_gravity_b,
+            "joint_pos": self.joint_pos,
+            "joint_vel": self.joint_vel,
+            "joint_acc": self.joint_acc,
+            "applied_torque": self.applied_torque,
+            "last_joint_vel": self._last_joint_vel,
+            "episode_sums": self._episode_sums,
+        }
+
+    """
+    Helper functions.
+    """
+
+    def _update_state(self):
+        """Read the state of the robot from the simulation into the state buffers."""
+        self.root_pos_w.copy_(self.robot.get_pos())
+        self.root_quat_w.copy_(self.robot.get_quat())
+        self.root_lin_vel_b.copy_(quat_apply_inverse(self.root_quat_w, self.robot.get_vel()))
+        self.root_ang_vel_b.copy_(quat_apply_inverse(self.root_quat_w, self.robot.get_ang()))
+        self.projected_gravity_b.copy_(quat_apply_inverse(self.root_quat_w, self._gravity_dir_w))
+        self.joint_pos.copy_(self.robot.get_dofs_position(self._dof_ids))
+        self._last_joint_vel.copy_(self.joint_vel)
+        self.joint_vel.copy_(self.robot.get_dofs_velocity(self._dof_ids))
+        torch.sub(self.joint_vel, self._last_joint_vel, out=self.joint_acc).div_(self.step_dt)
+        self.applied_torque.copy_(self.robot.get_dofs_control_force(self._dof_ids))
+
+    def _update_terrain_curriculum(self, env_ids: torch.Tensor):
+        """Promote or demote the given environments based on the distance walked by their robot.
+
+        The robots that walked farther than half the size of a sub-terrain are promoted. The robots that walked less
+        than half the distance required by their command are demoted.
+        """
+        terrain = self.scene.terrain
+        distance = torch.norm(self.root_pos_w[env_ids, :2] - self.scene.env_origins[env_ids, :2], dim=1)
+        move_up = distance > terrain.terrain_generator.cfg.size[0] / 2
+        move_down = distance < torch.norm(self._commands[env_ids, :2], dim=1) * self.max_episode_length_s * 0.5
+        move_down &= ~move_up
+        terrain.update_env_origins(env_ids, move_up, move_down)
+
+
+@torch.jit.script
+def compute_reward_terms(
+    out: torch.Tensor,
+    commands: torch.Tensor,
+    lin_vel_b: torch.Tensor,
+    ang_vel_b: torch.Tensor,
+    projected_gravity_b: torch.Tensor,
+    applied_torque: torch.Tensor,
+    joint_acc: torch.Tensor,
+    actions: torch.Tensor,
+    previous_actions: torch.Tensor,
+    undesired_contact_forces: torch.Tensor,
+    contact_force_threshold: float,
+    feet_last_air_time: torch.Tensor,
+    feet_first_contact: torch.Tensor,
+    feet_air_time_threshold: float,
+):
+    # velocity tracking
+    lin_vel_error = torch.sum(torch.square(commands[:, :2] - lin_vel_b[:, :2]), dim=1)
+    out[:, 0] = torch.exp(-lin_vel_error / 0.25)
+    yaw_rate_error = torch.square(commands[:, 2] - ang_vel_b[:, 2])
+    out[:, 1] = torch.exp(-yaw_rate_error / 0.25)
+    # base motion
+    out[:, 2] = torch.square(lin_vel_b[:, 2])
+    out[:, 3] = torch.sum(torch.square(ang_vel_b[:, :2]), dim=1)
+    # joints and actions
+    out[:, 4] = torch.sum(torch.square(applied_torque), dim=1)
+    out[:, 5] = torch.sum(torch.square(joint_acc), dim=1)
+    out[:, 6] = torch.sum(torch.square(actions - previous_actions), dim=1)
+    # contacts and orientation
+    out[:, 7] = torch.sum((undesired_contact_forces > contact_force_threshold).float(), dim=1)
+    out[:, 8] = torch.sum(torch.square(projected_gravity_b[:, :2]), dim=1)
+    # steps of the feet, not rewarded for small commands
+    feet_air_time = torch.sum((feet_last_air_time - feet_air_time_threshold) * feet_first_contact.float(), dim=1)
+    out[:, 9] = feet_air_time * (torch.norm(commands[:, :2], dim=1) > 0.1).float()
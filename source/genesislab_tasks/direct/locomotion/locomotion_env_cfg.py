@@ -0,0 +1,145 @@
+# Copyright 2025 genesis_lab Developers (https://github.com/Atticlmr/genesis_lab)
+#
+# Licensed under the Apache License, Version 2.0 , January 2004
+
+"""Configuration for the direct-workflow velocity-tracking locomotion environments."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+
+from genesislab.envs import DirectRLEnvCfg, SimCfg
+from genesislab.terrains import SubTerrainCfg, TerrainGeneratorCfg
+from genesislab.terrains.height_field import hf_terrains
+from genesislab.terrains.height_field.hf_terrians_cfg import (
+    HfPyramidSlopedTerrainCfg,
+    HfPyramidStairsTerrainCfg,
+    HfRandomUniformTerrainCfg,
+)
+
+_HF_COMMON = dict(border_width=0.0, horizontal_scale=0.1, vertical_scale=0.005, slope_threshold=None)
+
+ROUGH_TERRAINS_CFG = TerrainGeneratorCfg(
+    size=(8.0, 8.0),
+    border_width=20.0,
+    num_rows=10,
+    num_cols=20,
+    curriculum=True,
+    sub_terrains={
+        "pyramid_stairs": SubTerrainCfg(
+            function=hf_terrains.hf_pyramid_stairs_terrain,
+            cfg=HfPyramidStairsTerrainCfg(
+                size=(8.0, 8.0), step_height_range=(0.05, 0.23), step_width=0.3, platform_width=3.0, **_HF_COMMON
+            ),
+            proportion=0.2,
+            curriculum_ranges=("step_height_range",),
+        ),
+        "pyramid_stairs_inv": SubTerrainCfg(
+            function=hf_terrains.hf_pyramid_stairs_terrain,
+            cfg=HfPyramidStairsTerrainCfg(
+                size=(8.0, 8.0),
+                step_height_range=(0.05, 0.23),
+                step_width=0.3,
+                platform_width=3.0,
+                inverted=True,
+                **_HF_COMMON,
+            ),
+            proportion=0.2,
+            curriculum_ranges=("step_height_range",),
+        ),
+        "random_rough": SubTerrainCfg(
+            function=hf_terrains.hf_random_uniform_terrain,
+            cfg=HfRandomUniformTerrainCfg(size=(8.0, 8.0), noise_range=(0.02, 0.10), noise_step=0.02, **_HF_COMMON),
+            proportion=0.2,
+        ),
+        "hf_pyramid_slope": SubTerrainCfg(
+            function=hf_terrains.hf_pyramid_sloped_terrain,
+            cfg=HfPyramidSlopedTerrainCfg(size=(8.0, 8.0), slope_range=(0.0, 0.4), platform_width=2.0, **_HF_COMMON),
+            proportion=0.1,
+            curriculum_ranges=("slope_range",),
+        ),
+        "hf_pyramid_slope_inv": SubTerrainCfg(
+            function=hf_terrains.hf_pyramid_sloped_terrain,
+            cfg=HfPyramidSlopedTerrainCfg(
+                size=(8.0, 8.0), slope_range=(0.0, 0.4), platform_width=2.0, inverted=True, **_HF_COMMON
+            ),
+            proportion=0.1,
+            curriculum_ranges=("slope_range",),
+        ),
+    },
+)
+"""Rough terrains with stairs, slopes and random roughness, sorted by difficulty along the rows."""
+
+
+@dataclass(kw_only=True)
+class LocomotionEnvCfg(DirectRLEnvCfg):
+    """Configuration for a legged robot tracking a planar velocity command."""
+
+    # env
+    decimation: int = 4
+    episode_length_s: float = 20.0
+
+    # simulation
+    sim: SimCfg = field(default_factory=lambda: SimCfg(dt=0.005))
+
+    # robot
+    robot_name: str = "robot"
+    """Name of the robot entity in the scene."""
+
+    joint_names: str | list[str] = ".*"
+    """Names of the actuated joints (regular expressions). Defaults to all the joints."""
+
+    joint_stiffness: float = 80.0
+    """Stiffness of the joint position controllers (in N.m/rad)."""
+
+    joint_damping: float = 2.0
+    """Damping of the joint position controllers (in N.m.s/rad)."""
+
+    action_scale: float = 0.5
+    """Scale of the actions applied as offsets to the default joint positions (in rad)."""
+
+    base_body_name: str = "base"
+    """Name of the base link. A contact on it terminates the episode."""
+
+    undesired_contact_body_names: str | list[str] = ".*THIGH"
+    """Names of the links whose contacts are penalized (regular expressions)."""
+
+    contact_force_threshold: float = 1.0
+    """Norm of the net contact force above which a link is in contact (in N)."""
+
+    contact_sensor_name: str = "contact_forces"
+    """Name of the contact sensor on the links of the robot in the scene. It must track the air time."""
+
+    feet_body_names: str | list[str] = ".*SHANK"
+    """Names of the feet links (regular expressions). Genesis merges the links attached by fixed joints, such as the
+    feet of ANYmal, into their parent link."""
+
+    feet_air_time_threshold: float = 0.5
+    """Air time of the feet above which their steps are rewarded (in s)."""
+
+    # commands
+    lin_vel_x_range: tuple[float, float] = (-1.0, 1.0)
+    """Range of the commanded forward velocity (in m/s)."""
+
+    lin_vel_y_range: tuple[float, float] = (-1.0, 1.0)
+    """Range of the commanded lateral velocity (in m/s)."""
+
+    ang_vel_z_range: tuple[float, float] = (-1.0, 1.0)
+    """Range of the commanded yaw rate (in rad/s)."""
+
+    # curriculum
+    terrain_curriculum: bool = True
+    """Whether the environments are promoted and demoted through the terrain levels on reset.
+    Only used if the scene has a generated terrain."""
+
+    # reward scales
+    lin_vel_reward_scale: float = 1.0
+    yaw_rate_reward_scale: float = 0.5
+    z_vel_reward_scale: float = -2.0
+    ang_vel_reward_scale: float = -0.05
+    joint_torque_reward_scale: float = -2.5e-5
+    joint_accel_reward_scale: float = -2.5e-7
+    action_rate_reward_scale: float = -0.01
+    undesired_contact_reward_scale: float = -1.0
+    feet_air_time_reward_scale: float = 0.5
+    flat_orientation_reward_scale: float = 0.0
@@ -0,0 +1,8 @@
+# Copyright 2025 genesis_lab Developers (https://github.com/Atticlmr/genesis_lab)
+#
+# Licensed under the Apache License, Version 2.0 , January 2004
+
+"""UR arm reaching environment with the direct workflow."""
+
+from .ur_reach_env import URReachEnv
+from .ur_reach_env_cfg import UR5E_CFG, URReachEnvCfg
@@ -0,0 +1,251 @@
+# Copyright 2025 genesis_lab Developers (https://github.com/Atticlmr/genesis_lab)
+#
+# Licensed under the Apache License, Version 2.0 , January 2004
+
+"""Direct-workflow UR reach environment with joint-space waypoint actions."""
+
+from __future__ import annotations
+
+import torch
+
+from genesislab.envs import DirectRLEnv
+from genesislab.envs.managers import SceneEntityCfg
+from genesislab.utils.math import (
+    interpolate_trajectories,
+    quat_error_magnitude,
+    quat_from_euler_xyz,
+    quat_mul,
+    sample_uniform,
+)
+
+from ..franka.franka_reach_env import compute_reward_terms
+from .ur_reach_env_cfg import URReachEnvCfg
+
+
+class URReachEnv(DirectRLEnv):
+    """UR arm moving its end-effector to a target pose with joint-space waypoints.
+
+    The actions are joint-space waypoints, as offsets to the default joint positions. At every control step, the
+    polynomial trajectories from the previous waypoints to the new ones are evaluated for all the environments at
+    all the physics steps of the control step with a single call to
+    :func:`~genesislab.utils.math.interpolate_trajectories`. The physics steps then only pick their slice of the
+    ``(decimation, num_envs, num_joints)`` position and velocity targets, which are tracked by the PD controllers of
+    Genesis.
+    """
+
+    cfg: URReachEnvCfg
+
+    reward_terms: tuple[str, ...] = (
+        "end_effector_position_tracking",
+        "end_effector_position_tracking_fine_grained",
+        "end_effector_orientation_tracking",
+        "action_rate",
+        "joint_vel",
+    )
+    """Names of the reward terms, in the order of the columns of :attr:`step_reward`."""
+
+    def __init__(self, cfg: URReachEnvCfg, render_mode: str | None = None, **kwargs):
+        super().__init__(cfg, render_mode, **kwargs)
+
+        self.robot = self.scene["robot"]
+        self._ee_body = self.robot.get_link(cfg.ee_body_name)
+        joint_cfg = SceneEntityCfg("robot", joint_names=cfg.joint_names, preserve_order=True)
+        joint_cfg.resolve(self.scene)
+        self._dof_ids = joint_cfg.joint_ids
+        num_joints = len(self._dof_ids)
+
+        # joint position controllers and joint limits
+        self.robot.set_dofs_kp(torch.tensor(cfg.joint_stiffness, device=self.device), self._dof_ids)
+        self.robot.set_dofs_kv(torch.tensor(cfg.joint_damping, device=self.device), self._dof_ids)
+        lower, upper = self.robot.get_dofs_limit(self._dof_ids)
+        self._joint_lower = lower.to(self.device)
+        self._joint_upper = upper.to(self.device)
+        self._default_qpos = self.scene.default_qpos["robot"]
+        self._default_joint_pos = self._default_qpos[:, joint_cfg.joint_qpos_ids]
+
+        # actions and joint trajectories
+        self._actions = torch.zeros(self.num_envs, num_joints, device=self.device)
+        self._previous_actions = torch.zeros_like(self._actions)
+        self._waypoints = self._default_joint_pos.clone()
+        self._waypoint_vel = torch.zeros_like(self._waypoints)
+        self._prev_waypoints = self._default_joint_pos.clone()
+        self._prev_waypoint_vel = torch.zeros_like(self._waypoints)
+        # normalized times of the physics steps within a control step
+        self._tau = torch.arange(1, cfg.decimation + 1, device=self.device, dtype=torch.float) / cfg.decimation
+        self._traj_pos = self._default_joint_pos.unsqueeze(0).repeat(cfg.decimation, 1, 1)
+        self._traj_vel = torch.zeros_like(self._traj_pos)
+        self._substep = 0
+
+        # the targets are sampled around the end-effector pose of the default configuration
+        self.robot.set_qpos(self._default_qpos)
+        self._default_ee_pos = self._ee_body.get_pos() - self.scene.env_origins
+        self._default_ee_quat = self._ee_body.get_quat().clone()
+        self.target_pos = self._default_ee_pos + self.scene.env_origins
+        self.target_quat = self._default_ee_quat.clone()
+        self._target_time_left = torch.zeros(self.num_envs, device=self.device)
+        ranges = (*cfg.target_pos_offset_range, cfg.target_yaw_range)
+        self._target_lower = torch.tensor([r[0] for r in ranges], device=self.device)
+        self._target_upper = torch.tensor([r[1] for r in ranges], device=self.device)
+
+        # state of the robot, read once per step
+        self.ee_pos = torch.zeros(self.num_envs, 3, device=self.device)
+        self.ee_quat = torch.zeros(self.num_envs, 4, device=self.device)
+        self.joint_pos = self._default_joint_pos.clone()
+        self.joint_vel = torch.zeros_like(self.joint_pos)
+
+        # observation and reward buffers
+        self._obs_buf = torch.zeros(self.num_envs, cfg.observation_space, device=self.device)
+        self._obs = {"policy": self._obs_buf}
+        self.step_reward = torch.zeros(self.num_envs, len(self.reward_terms), device=self.device)
+        self._reward_buf = torch.zeros(self.num_envs, device=self.device)
+        self._episode_sums = torch.zeros_like(self.step_reward)
+        reward_scales = (
+            cfg.rew_scale_position,
+            cfg.rew_scale_position_tanh,
+            cfg.rew_scale_orientation,
+            cfg.rew_scale_action_rate,
+            cfg.rew_scale_joint_vel,
+        )
+        self._reward_scales = torch.tensor(reward_scales, device=self.device) * self.step_dt
+
+    """
+    Operations.
+    """
+
+    def _pre_physics_step(self, actions: torch.Tensor):
+        self._actions.copy_(actions)
+        # the new waypoints and their velocities
+        self._prev_waypoints.copy_(self._waypoints)
+        self._prev_waypoint_vel.copy_(self._waypoint_vel)
+        torch.add(self._default_joint_pos, self._actions, alpha=self.cfg.action_scale, out=self._waypoints)
+        torch.clamp(self._waypoints, self._joint_lower, self._joint_upper, out=self._waypoints)
+        if self.cfg.trajectory_type != "min_jerk":
+            torch.sub(self._waypoints, self._prev_waypoints, out=self._waypoint_vel).div_(self.step_dt)
+        # the joint targets of all the physics steps of the control step
+        interpolate_trajectories(
+            self._prev_waypoints,
+            self._waypoints,
+            self._tau,
+            self.step_dt,
+            start_vel=self._prev_waypoint_vel,
+            end_vel=self._waypoint_vel,
+            method=self.cfg.trajectory_type,
+            out=(self._traj_pos, self._traj_vel),
+        )
+        self._substep = 0
+        # resample the targets whose time is up, without reading the mask on the host
+        self._target_time_left -= self.step_dt
+        expired = self._target_time_left <= 0.0
+        target_pos, target_quat = self._sample_targets()
+        torch.where(expired.unsqueeze(-1), target_pos, self.target_pos, out=self.target_pos)
+        torch.where(expired.unsqueeze(-1), target_quat, self.target_quat, out=self.target_quat)
+        self._target_time_left.masked_fill_(expired, self.cfg.target_resampling_time_s)
+
+    def _apply_action(self):
+        self.robot.control_dofs_position_velocity(
+            self._traj_pos[self._substep], self._traj_vel[self._substep], self._dof_ids
+        )
+        self._substep += 1
+
+    def _get_observations(self) -> dict:
+        self._previous_actions.copy_(self._actions)
+        torch.cat(
+            (
+                self.joint_pos - self._default_joint_pos,
+                self.joint_vel,
+                self.target_pos - self.ee_pos,
+                self.target_quat,
+                self.ee_quat,
+                self._actions,
+            ),
+            dim=-1,
+            out=self._obs_buf,
+        )
+        return self._obs
+
+    def _get_rewards(self) -> torch.Tensor:
+        compute_reward_terms(
+            self.step_reward,
+            self.ee_pos,
+            self.target_pos,
+            quat_error_magnitude(self.ee_quat, self.target_quat),
+            self._actions,
+            self._previous_actions,
+            self.joint_vel,
+            self.cfg.position_tanh_std,
+        )
+        self.step_reward.mul_(self._reward_scales)
+        torch.sum(self.step_reward, dim=1, out=self._reward_buf)
+        self._episode_sums += self.step_reward
+        return self._reward_buf
+
+    def _get_dones(self) -> tuple[torch.Tensor, torch.Tensor]:
+        # read the state once per step
+        self._update_ee_pose()
+        self.joint_pos.copy_(self.robot.get_dofs_position(self._dof_ids))
+        self.joint_vel.copy_(self.robot.get_dofs_velocity(self._dof_ids))
+
+        time_out = self.episode_length_buf >= self.max_episode_length - 1
+        return torch.zeros_like(time_out), time_out
+
+    def _reset_idx(self, env_ids: torch.Tensor):
+        super()._reset_idx(env_ids)
+
+        self._log_episodic_sums(env_ids, self._episode_sums, self.reward_terms)
+
+        # reset the robot to its default configuration and hold it there
+        qpos = self._default_qpos[env_ids]
+        self.robot.set_qpos(qpos, envs_idx=env_ids)
+        joint_pos = self._default_joint_pos[env_ids]
+        self.robot.control_dofs_position(joint_pos, self._dof_ids, envs_idx=env_ids)
+        self.joint_pos[env_ids] = joint_pos
+        self.joint_vel[env_ids] = 0.0
+        self._waypoints[env_ids] = joint_pos
+        self._waypoint_vel[env_ids] = 0.0
+        self._actions[env_ids] = 0.0
+        self._previous_actions[env_ids] = 0.0
+        self.target_pos[env_ids], self.target_quat[env_ids] = self._sample_targets(env_ids)
+        self._target_time_left[env_ids] = self.cfg.target_resampling_time_s
+        # the end-effector pose is read for all the environments with one call
+        self._update_ee_pose()
+
+    def _get_state_buffers(self) -> dict[str, torch.Tensor]:
+        return {
+            "actions": self._actions,
+            "previous_actions": self._previous_actions,
+            "waypoints": self._waypoints,
+            "waypoint_vel": self._waypoint_vel,
+            "target_pos": self.target_pos,
+            "target_quat": self.target_quat,
+            "target_time_left": self._target_time_left,
+            "ee_pos": self.ee_pos,
+            "ee_quat": self.ee_quat,
+            "joint_pos": self.joint_pos,
+            "joint_vel": self.joint_vel,
+            "episode_sums": self._episode_sums,
+        }
+
+    """
+    Helper functions.
+    """
+
+    def _update_ee_pose(self):
+        """Read the pose of the end-effector."""
+        self.ee_pos.copy_(self._ee_body.get_pos())
+        self.ee_quat.copy_(self._ee_body.get_quat())
+
+    def _sample_targets(self, env_ids: torch.Tensor | slice = slice(None)) -> tuple[torch.Tensor, torch.Tensor]:
+        """Sample target poses around the default end-effector pose for the given environments.
+
+        Args:
+            env_ids: The environment ids. Defaults to all the environments.
+
+        Returns:
+            A tuple containing the target positions in the world frame and the target orientations (w, x, y, z).
+        """
+        default_ee_pos = self._default_ee_pos[env_ids]
+        samples = sample_uniform(self._target_lower, self._target_upper, (default_ee_pos.shape[0], 4), self.device)
+        target_pos = default_ee_pos + samples[:, 0:3] + self.scene.env_origins[env_ids]
+        zeros = torch.zeros_like(samples[:, 3])
+        yaw_quat = quat_from_euler_xyz(zeros, zeros, samples[:, 3])
+        return target_pos, quat_mul(yaw_quat, self._default_ee_quat[env_ids])
@@ -0,0 +1,97 @@
+# Copyright 2025 genesis_lab Developers (https://github.com/Atticlmr/genesis_lab)
+#
+# Licensed under the Apache License, Version 2.0 , January 2004
+
+"""Configuration for the direct-workflow UR reach environment."""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass, field
+from typing import Literal
+
+from genesislab.envs import DirectRLEnvCfg, EntityCfg, InteractiveSceneCfg, SimCfg
+from genesislab.terrains import TerrainImporterCfg
+
+UR5E_CFG = EntityCfg(
+    morph="MJCF",
+    morph_kwargs=dict(file="xml/universal_robots_ur5e/ur5e.xml"),
+    init_joint_pos={
+        "shoulder_pan": 0.0,
+        "shoulder_lift": -1.712,
+        "elbow": 1.712,
+        "wrist_1": 0.0,
+        "wrist_2": 0.0,
+        "wrist_3": 0.0,
+    },
+)
+"""Configuration of the Universal Robots UR5e arm from the Genesis assets."""
+
+
+@dataclass(kw_only=True)
+class URReachEnvCfg(DirectRLEnvCfg):
+    """Configuration for the UR end-effector pose reaching environment with joint-space waypoint actions."""
+
+    # env
+    decimation: int = 4
+    episode_length_s: float = 12.0
+    action_space: int = 6
+    observation_space: int = 29
+    state_space: int = 0
+
+    # simulation
+    sim: SimCfg = field(default_factory=lambda: SimCfg(dt=1 / 120))
+
+    # scene
+    scene: InteractiveSceneCfg = field(
+        default_factory=lambda: InteractiveSceneCfg(
+            num_envs=4096,
+            env_spacing=(2.5, 2.5),
+            terrain=TerrainImporterCfg(terrain_type="plane"),
+            entities={"robot": UR5E_CFG},
+        )
+    )
+
+    # robot
+    joint_names: str | list[str] = ".*"
+    """Names of the arm joints (regular expressions)."""
+
+    ee_body_name: str = "ee_virtual_link"
+    """Name of the end-effector body."""
+
+    joint_stiffness: tuple[float, ...] = (2000.0, 2000.0, 2000.0, 500.0, 500.0, 500.0)
+    """Stiffness of the joint position controllers (in N.m/rad)."""
+
+    joint_damping: tuple[float, ...] = (100.0, 100.0, 100.0, 25.0, 25.0, 25.0)
+    """Damping of the joint position controllers (in N.m.s/rad)."""
+
+    # actions
+    action_scale: float = 1.0
+    """Scale of the actions, which are joint-space waypoints as offsets to the default joint positions (in rad)."""
+
+    trajectory_type: Literal["cubic", "quintic", "min_jerk"] = "quintic"
+    """Polynomial of the joint trajectory from the previous waypoint to the new one over a control step.
+
+    The "cubic" and "quintic" trajectories pass through the waypoints with the velocity of the finite differences of
+    the waypoints, so that consecutive segments are continuous in velocity. The "min_jerk" trajectory stops at every
+    waypoint.
+    """
+
+    # target
+    target_pos_offset_range: tuple[tuple[float, float], ...] = ((-0.15, 0.15), (-0.2, 0.2), (-0.2, 0.15))
+    """Ranges of the offset of the target position from the default end-effector position (in m)."""
+
+    target_yaw_range: tuple[float, float] = (-math.pi / 4, math.pi / 4)
+    """Range of the rotation of the target orientation about the world z-axis, with respect to the default
+    end-effector orientation (in rad)."""
+
+    target_resampling_time_s: float = 4.0
+    """Time after which the target of an environment is resampled (in s)."""
+
+    # reward scales
+    rew_scale_position: float = -0.2
+    rew_scale_position_tanh: float = 0.1
+    position_tanh_std: float = 0.1
+    rew_scale_orientation: float = -0.1
+    rew_scale_action_rate: float = -1.0e-4
+    rew_scale_joint_vel: float = -1.0e-4
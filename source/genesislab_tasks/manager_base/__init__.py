@@ -0,0 +1,26 @@
+# Copyright 2025 genesis_lab Developers (https://github.com/Atticlmr/genesis_lab)
+#
+# Licensed under the Apache License, Version 2.0 , January 2004
+
+"""Manager-based environments.
+
+The environments are instances of :class:`genesislab.envs.ManagerBasedRLEnv` and only differ by their
+configuration. They are registered in the :mod:`gymnasium` registry with the string of the configuration class,
+which is only imported when the configuration is loaded.
+"""
+
+import gymnasium as gym
+
+##
+# Register Gym environments.
+##
+
+gym.register(
+    id="Genesis-Cartpole-v0",
+    entry_point="genesislab.envs:ManagerBasedRLEnv",
+    disable_env_checker=True,
+    kwargs={
+        "env_cfg_entry_point": f"{__name__}.cartpole.cartpole_env_cfg:CartpoleEnvCfg",
+        "ppo_cfg_entry_point": "genesislab_tasks.direct.cartpole.agents.ppo_cfg:CartpolePPOCfg",
+    },
+)
@@ -0,0 +1,7 @@
+# Copyright 2025 genesis_lab Developers (https://github.com/Atticlmr/genesis_lab)
+#
+# Licensed under the Apache License, Version 2.0 , January 2004
+
+"""Cartpole balancing environment with the manager-based workflow."""
+
+from .cartpole_env_cfg import CartpoleEnvCfg
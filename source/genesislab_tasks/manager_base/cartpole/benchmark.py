@@ -0,0 +1,68 @@
+# Copyright 2025 genesis_lab Developers (https://github.com/Atticlmr/genesis_lab)
+#
+# Licensed under the Apache License, Version 2.0 , January 2004
+
+"""Throughput benchmark of the manager-based cartpole environment.
+
+The script measures the environment steps per second of the :class:`~genesislab.envs.ManagerBasedRLEnv` built from
+:class:`CartpoleEnvCfg` and compares it with stepping the same Genesis scene directly, which gives the overhead of
+the managers on top of the physics. The numbers can be compared with the direct-workflow cartpole benchmark
+(:mod:`genesislab_tasks.direct.cartpole.benchmark`).
+
+.. code-block:: bash
+
+    python -m genesislab_tasks.manager_base.cartpole.benchmark --num_envs 1 16 256 4096 --num_steps 200
+
+For a breakdown of the step time by manager, use ``genesis-lab bench-env --task Genesis-Cartpole-v0``.
+"""
+
+from __future__ import annotations
+
+import torch
+
+from genesislab.envs import ManagerBasedRLEnv
+from genesislab.envs.managers import SceneEntityCfg
+from genesislab_tasks.utils.benchmark import measure_throughput, run_benchmark
+
+from .cartpole_env_cfg import CART_JOINT_CFG, CartpoleEnvCfg
+
+DEFAULT_NUM_ENVS = [1, 4, 16, 64, 256, 1024, 4096, 16384]
+
+
+def benchmark_env(num_envs: int, num_steps: int, num_warmup_steps: int) -> tuple[float, float]:
+    """Measure the throughput of the environment and of the raw Genesis stepping.
+
+    Args:
+        num_envs: The number of environments.
+        num_steps: The number of measured environment steps.
+        num_warmup_steps: The number of environment steps run before measuring (JIT compilation).
+
+    Returns:
+        The environment steps per second of the environment and of the raw Genesis stepping.
+    """
+    cfg = CartpoleEnvCfg()
+    cfg.scene.num_envs = num_envs
+    env = ManagerBasedRLEnv(cfg)
+    actions = torch.zeros(num_envs, env.action_manager.total_action_dim, device=env.device)
+    # the raw stepping applies the same efforts to the cart joint as the action term
+    cart_cfg = SceneEntityCfg(CART_JOINT_CFG.name, joint_names=CART_JOINT_CFG.joint_names)
+    cart_cfg.resolve(env.scene)
+    cartpole = env.scene[cart_cfg.name]
+    forces = torch.zeros(num_envs, len(cart_cfg.joint_ids), device=env.device)
+
+    def apply_raw_action():
+        cartpole.control_dofs_force(forces, dofs_idx_local=cart_cfg.joint_ids)
+
+    throughput = measure_throughput(env, actions, apply_raw_action, num_steps, num_warmup_steps)
+    env.close()
+    return throughput
+
+
+def main():
+    run_benchmark(
+        "Benchmark the throughput of the manager-based cartpole environment.", benchmark_env, DEFAULT_NUM_ENVS
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+# Copyright 2025 genesis_lab Developers (https://github.com/Atticlmr/genesis_lab)
+#
+# Licensed under the Apache License, Version 2.0 , January 2004
+
+"""Configuration for the manager-based cartpole environment."""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass, field
+
+import genesislab.envs.mdp as mdp
+from genesislab.envs import InteractiveSceneCfg, ManagerBasedRLEnvCfg, SimCfg
+from genesislab.envs.managers import (
+    ActionTermCfg,
+    EventTermCfg,
+    ObservationGroupCfg,
+    ObservationTermCfg,
+    RewardTermCfg,
+    SceneEntityCfg,
+    TerminationTermCfg,
+)
+
+from ...direct.cartpole.cartpole_env_cfg import CARTPOLE_CFG
+
+CART_JOINT_CFG = SceneEntityCfg("cartpole", joint_names=["slider_to_cart"])
+POLE_JOINT_CFG = SceneEntityCfg("cartpole", joint_names=["cart_to_pole"])
+JOINTS_CFG = SceneEntityCfg("cartpole", joint_names=["slider_to_cart", "cart_to_pole"], preserve_order=True)
+
+
+def _observations() -> dict[str, ObservationGroupCfg]:
+    return {
+        "policy": ObservationGroupCfg(
+            terms={
+                "joint_pos_rel": ObservationTermCfg(func=mdp.joint_pos_rel, params={"asset_cfg": JOINTS_CFG}),
+                "joint_vel": ObservationTermCfg(func=mdp.joint_vel, params={"asset_cfg": JOINTS_CFG}),
+            }
+        )
+    }
+
+
+def _actions() -> dict[str, ActionTermCfg]:
+    return {
+        "joint_effort": mdp.JointEffortActionCfg(asset_name="cartpole", joint_names=["slider_to_cart"], scale=100.0)
+    }
+
+
+def _events() -> dict[str, EventTermCfg]:
+    return {
+        "reset_cart_position": EventTermCfg(
+            func=mdp.reset_joints_by_offset,
+            mode="reset",
+            params={"asset_cfg": CART_JOINT_CFG, "position_range": (-1.0, 1.0), "velocity_range": (-0.5, 0.5)},
+        ),
+        "reset_pole_position": EventTermCfg(
+            func=mdp.reset_joints_by_offset,
+            mode="reset",
+            params={
+                "asset_cfg": POLE_JOINT_CFG,
+                "position_range": (-0.25 * math.pi, 0.25 * math.pi),
+                "velocity_range": (-0.25 * math.pi, 0.25 * math.pi),
+            },
+        ),
+    }
+
+
+def _rewards() -> dict[str, RewardTermCfg]:
+    return {
+        # (1) constant running reward
+        "alive": RewardTermCfg(func=mdp.is_alive, weight=1.0),
+        # (2) failure penalty
+        "terminating": RewardTermCfg(func=mdp.is_terminated, weight=-2.0),
+        # (3) primary task: keep the pole upright
+        "pole_pos": RewardTermCfg(
+            func=mdp.joint_pos_target_l2, weight=-1.0, params={"asset_cfg": POLE_JOINT_CFG, "target": 0.0}
+        ),
+        # (4) shaping tasks: lower cart and pole velocities
+        "cart_vel": RewardTermCfg(func=mdp.joint_vel_l2, weight=-0.01, params={"asset_cfg": CART_JOINT_CFG}),
+        "pole_vel": RewardTermCfg(func=mdp.joint_vel_l2, weight=-0.005, params={"asset_cfg": POLE_JOINT_CFG}),
+    }
+
+
+def _terminations() -> dict[str, TerminationTermCfg]:
+    return {
+        "time_out": TerminationTermCfg(func=mdp.time_out, time_out=True),
+        "cart_out_of_bounds": TerminationTermCfg(
+            func=mdp.joint_pos_out_of_manual_limit, params={"asset_cfg": CART_JOINT_CFG, "bounds": (-3.0, 3.0)}
+        ),
+    }
+
+
+@dataclass(kw_only=True)
+class CartpoleEnvCfg(ManagerBasedRLEnvCfg):
+    """Configuration for the cartpole balancing environment with the manager-based workflow."""
+
+    # env
+    decimation: int = 2
+    episode_length_s: float = 5.0
+
+    # simulation
+    sim: SimCfg = field(default_factory=lambda: SimCfg(dt=1 / 120))
+
+    # scene
+    scene: InteractiveSceneCfg = field(
+        default_factory=lambda: InteractiveSceneCfg(
+            num_envs=4096, env_spacing=(4.0, 4.0), entities={"cartpole": CARTPOLE_CFG}
+        )
+    )
+
+    # managers
+    observations: dict[str, ObservationGroupCfg] = field(default_factory=_observations)
+    actions: dict[str, ActionTermCfg] = field(default_factory=_actions)
+    events: dict[str, EventTermCfg] = field(default_factory=_events)
+    rewards: dict[str, RewardTermCfg] = field(default_factory=_rewards)
+    terminations: dict[str, TerminationTermCfg] = field(default_factory=_terminations)
@@ -0,0 +1,7 @@
+# Copyright 2025 genesis_lab Developers (https://github.com/Atticlmr/genesis_lab)
+#
+# Licensed under the Apache License, Version 2.0 , January 2004
+
+"""Utilities for the registered tasks."""
+
+from .parse_cfg import get_task_names, load_cfg_from_registry, parse_env_cfg
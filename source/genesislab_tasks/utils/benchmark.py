@@ -0,0 +1,88 @@
+# Copyright 2025 genesis_lab Developers (https://github.com/Atticlmr/genesis_lab)
+#
+# Licensed under the Apache License, Version 2.0 , January 2004
+
+"""Shared harness of the throughput benchmarks of the tasks.
+
+A benchmark compares the environment steps per second of a task with stepping the same Genesis scene directly, which
+gives the overhead of the framework on top of the physics. The task-specific parts are passed as parameters: the
+construction of the environment, its actions and the raw actuation of the scene applied before every physics step.
+The environment numbers include the observation, reward and termination computations and the resets of the
+terminated sub-environments, which the raw stepping does not perform.
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from collections.abc import Callable, Sequence
+
+import genesis as gs
+import torch
+
+
+def measure_throughput(
+    env, actions: torch.Tensor, apply_raw_action: Callable[[], None], num_steps: int, num_warmup_steps: int
+) -> tuple[float, float]:
+    """Measure the throughput of an environment and of the raw Genesis stepping of its scene.
+
+    Args:
+        env: The unwrapped environment. Its scene is stepped :attr:`cfg.decimation` times per environment step.
+        actions: The constant actions of the environment. Shape is (num_envs, action_dim).
+        apply_raw_action: The function that actuates the scene before every raw physics step, e.g. with the
+            joint efforts or the external wrench that the actions would produce.
+        num_steps: The number of measured environment steps.
+        num_warmup_steps: The number of environment steps run before measuring (JIT compilation).
+
+    Returns:
+        The environment steps per second of the environment and of the raw Genesis stepping.
+    """
+    num_envs = env.num_envs
+
+    # -- environment stepping
+    env.reset()
+    for _ in range(num_warmup_steps):
+        env.step(actions)
+    start_time = time.perf_counter()
+    for _ in range(num_steps):
+        env.step(actions)
+    env_steps_per_s = num_envs * num_steps / (time.perf_counter() - start_time)
+
+    # -- raw genesis stepping of the same scene with the same decimation
+    start_time = time.perf_counter()
+    for _ in range(num_steps):
+        for _ in range(env.cfg.decimation):
+            apply_raw_action()
+            env.scene.step()
+    raw_steps_per_s = num_envs * num_steps / (time.perf_counter() - start_time)
+
+    return env_steps_per_s, raw_steps_per_s
+
+
+def run_benchmark(
+    description: str,
+    benchmark_env: Callable[[int, int, int], tuple[float, float]],
+    default_num_envs: Sequence[int],
+):
+    """Parse the command line, run the benchmark for every number of environments and print the table.
+
+    Args:
+        description: The description of the command line.
+        benchmark_env: The function that builds the environment with the given number of environments and returns
+            the result of :func:`measure_throughput` for the given numbers of measured and warm-up steps.
+        default_num_envs: The numbers of environments benchmarked by default.
+    """
+    parser = argparse.ArgumentParser(description=description)
+    parser.add_argument("--num_envs", type=int, nargs="+", default=default_num_envs, help="Numbers of environments.")
+    parser.add_argument("--num_steps", type=int, default=200, help="Number of measured steps per run.")
+    parser.add_argument("--num_warmup_steps", type=int, default=20, help="Number of warm-up steps per run.")
+    parser.add_argument("--device", type=str, default="cpu", choices=["cpu", "gpu"], help="Genesis backend.")
+    args = parser.parse_args()
+
+    gs.init(backend=gs.gpu if args.device == "gpu" else gs.cpu, logging_level="warning")
+
+    print(f"{'num_envs':>10} {'env steps/s':>14} {'raw steps/s':>14} {'overhead':>10}")
+    for num_envs in args.num_envs:
+        env_fps, raw_fps = benchmark_env(num_envs, args.num_steps, args.num_warmup_steps)
+        overhead = raw_fps / env_fps - 1.0
+        print(f"{num_envs:>10d} {env_fps:>14.0f} {raw_fps:>14.0f} {overhead:>9.1%}")
@@ -0,0 +1,82 @@
+# Copyright 2025 genesis_lab Developers (https://github.com/Atticlmr/genesis_lab)
+#
+# Licensed under the Apache License, Version 2.0 , January 2004
+
+"""Sub-module with utilities for loading the configurations of the registered tasks."""
+
+from __future__ import annotations
+
+import fnmatch
+from typing import Any
+
+import gymnasium as gym
+
+from genesislab.utils.string import string_to_callable
+
+TASK_PREFIX = "Genesis-"
+"""Prefix of the names of the tasks registered by genesis_lab."""
+
+
+def get_task_names(pattern: str | None = None) -> list[str]:
+    """Get the sorted names of the registered tasks, without importing their modules.
+
+    Args:
+        pattern: A shell-style wildcard pattern, e.g. ``"*Anymal*"``, that the names have to match. Defaults to None,
+            in which case all the tasks registered by genesis_lab are returned.
+
+    Returns:
+        The names of the tasks.
+    """
+    names = [name for name in gym.registry if name.startswith(TASK_PREFIX)]
+    if pattern is not None:
+        names = fnmatch.filter(names, pattern)
+    return sorted(names)
+
+
+def load_cfg_from_registry(task_name: str, entry_point_key: str) -> Any:
+    """Load the configuration of a task from the gymnasium registry.
+
+    The entry point of the configuration is stored in the keyword arguments of the task's registration, either as
+    a string of the form ``"module.path:ClassName"`` or as the configuration class itself. The module is imported
+    and the class is instantiated with its default values when this function is called.
+
+    Args:
+        task_name: The name of the registered task.
+        entry_point_key: The key of the entry point in the keyword arguments of the registration,
+            e.g. ``"env_cfg_entry_point"``.
+
+    Returns:
+        The configuration object.
+
+    Raises:
+        ValueError: If the task is not registered or has no entry point for the key.
+    """
+    if task_name not in gym.registry:
+        raise ValueError(f"Task '{task_name}' is not registered. Available tasks: {get_task_names()}.")
+    cfg_entry_point = gym.spec(task_name).kwargs.get(entry_point_key)
+    if cfg_entry_point is None:
+        raise ValueError(
+            f"Could not find configuration for the task '{task_name}' with the key '{entry_point_key}'."
+            " Please check that the task registers this entry point."
+        )
+    cfg_cls = string_to_callable(cfg_entry_point) if isinstance(cfg_entry_point, str) else cfg_entry_point
+    return cfg_cls() if callable(cfg_cls) else cfg_cls
+
+
+def parse_env_cfg(task_name: str, num_envs: int | None = None, seed: int | None = None) -> Any:
+    """Load the environment configuration of a task and override its number of environments and seed.
+
+    Args:
+        task_name: The name of the registered task.
+        num_envs: The number of environments. Defaults to None, in which case the configured value is kept.
+        seed: The seed of the environment. Defaults to None, in which case the configured value is kept.
+
+    Returns:
+        The environment configuration object.
+    """
+    cfg = load_cfg_from_registry(task_name, "env_cfg_entry_point")
+    if num_envs is not None:
+        cfg.scene.num_envs = num_envs
+    if seed is not None:
+        cfg.seed = seed
+    return cfg